@@ -12,3 +12,39 @@ export async function fetchJSON<T>(endpoint: string): Promise<T> {
   }
   return json.data;
 }
+
+function parseLine<T>(line: string): T {
+  const json = JSON.parse(line) as APIResponse<T>;
+  if (!json.success) {
+    throw new Error(json.error);
+  }
+  return json.data;
+}
+
+// yields the data of each line of a newline-delimited JSON response as soon as the line is received
+export async function* fetchNDJSON<T>(endpoint: string): AsyncGenerator<T> {
+  const response = await fetch(endpoint);
+  if (!response.ok || !response.body) {
+    const json = (await response.json()) as APIResponse<T>;
+    throw new Error(json.error);
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) {
+      break;
+    }
+    buffer += value;
+    const lines = buffer.split("\n");
+    // the last line is incomplete, or empty if the chunk ended with a newline
+    buffer = lines.pop() ?? "";
+    for (const line of lines) {
+      yield parseLine<T>(line);
+    }
+  }
+  if (buffer) {
+    yield parseLine<T>(buffer);
+  }
+}
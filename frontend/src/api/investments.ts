@@ -1,6 +1,6 @@
-import { useQuery, UseQueryResult } from "@tanstack/react-query";
+import { useQuery, useQueryClient, UseQueryResult } from "@tanstack/react-query";
 import { useFavaFilterSearchParams } from "../routes/__root";
-import { fetchJSON } from "./api";
+import { fetchNDJSON } from "./api";
 import { InvestmentId } from "./config";
 
 interface InvestmentsRequest {
@@ -28,14 +28,28 @@ export interface InvestmentsResponse {
   investments: Investment[];
 }
 
+// streams the investments: on the initial load, the query data is updated with every received row,
+// and isFetching is true until all rows are received.
+// A refetch (e.g. on window focus) keeps the previous table until all rows are received.
 export function useInvestments(request: InvestmentsRequest): UseQueryResult<InvestmentsResponse> {
+  const queryClient = useQueryClient();
   const params = useFavaFilterSearchParams();
   params.set("currency", request.targetCurrency);
   params.set("group_by", request.groupBy);
-  const url = `investments?${params}`;
+  const url = `investments_stream?${params}`;
 
   return useQuery({
     queryKey: [url],
-    queryFn: () => fetchJSON<InvestmentsResponse>(url),
+    queryFn: async () => {
+      const initialLoad = queryClient.getQueryData([url]) === undefined;
+      const investments: Investment[] = [];
+      for await (const investment of fetchNDJSON<Investment>(url)) {
+        investments.push(investment);
+        if (initialLoad) {
+          queryClient.setQueryData<InvestmentsResponse>([url], { investments: [...investments] });
+        }
+      }
+      return { investments };
+    },
   });
 }
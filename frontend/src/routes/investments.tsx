@@ -60,7 +60,7 @@ export function InvestmentsTable({ groupBy, includeLiquidated, setIncludeLiquida
   const { targetCurrency } = useToolbarContext();
   const numberFormatter = useNumberFormatter();
   const fixedPercentFormatter = usePercentFormatter({ fixed: true });
-  const { isPending, error, data } = useInvestments({ targetCurrency, groupBy });
+  const { isPending, isFetching, error, data } = useInvestments({ targetCurrency, groupBy });
   const metricNames = useMetrics();
 
   if (isPending) {
@@ -217,6 +217,13 @@ export function InvestmentsTable({ groupBy, includeLiquidated, setIncludeLiquida
         getRowHeight={() => "auto"}
         getRowClassName={(params) => (params.indexRelativeToCurrentPage % 2 === 0 ? "even" : "odd")}
         rowSelection={false}
+        loading={isFetching}
+        slotProps={{
+          loadingOverlay: {
+            // show the received rows, and a progress bar until all rows are received
+            variant: "linear-progress",
+          },
+        }}
         initialState={{
           sorting: {
             sortModel: [{ field: "name", sort: "asc" }],
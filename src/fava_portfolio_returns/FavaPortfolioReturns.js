@@ -274,7 +274,7 @@ To suppress this warning, you need to explicitly provide the \`palette.${t}Chann
                 ${(e.vars||e).palette.action.hover},
                 transparent
               )`,content:'""',position:"absolute",transform:"translateX(-100%)",bottom:0,left:0,right:0,top:0}}},{props:{animation:"wave"},style:Tmt||{"&::after":{animation:`${UQ} 2s linear 0.5s infinite`}}}]}})),_mt=QCe.forwardRef(function(t,r){let o=et({props:t,name:"MuiSkeleton"}),{animation:n="pulse",className:i,component:a="span",height:s,style:l,variant:u="text",width:c,...p}=o,f={...o,animation:n,component:a,variant:u,hasChildren:!!p.children},d=bmt(f);return(0,JCe.jsx)(wmt,{as:a,ref:r,className:le(d.root,i),ownerState:f,...p,style:{width:c,height:s,...l}})}),VQ=_mt;var Ki=z(K(),1);gt();function ePe(e){return We("MuiTooltip",e)}var Cmt=Be("MuiTooltip",["popper","popperInteractive","popperArrow","popperClose","tooltip","tooltipArrow","touch","tooltipPlacementLeft","tooltipPlacementRight","tooltipPlacementTop","tooltipPlacementBottom","arrow"]),mi=Cmt;var Ly=z(Q(),1);function Pmt(e){return Math.round(e*1e5)/1e5}var Rmt=e=>{let{classes:t,disableInteractive:r,arrow:o,touch:n,placement:i}=e,a={popper:["popper",!r&&"popperInteractive",o&&"popperArrow"],tooltip:["tooltip",o&&"tooltipArrow",n&&"touch",`tooltipPlacement${Te(i.split("-")[0])}`],arrow:["arrow"]};return ce(a,ePe,t)},Emt=ne(mg,{name:"MuiTooltip",slot:"Popper",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.popper,!r.disableInteractive&&t.popperInteractive,r.arrow&&t.popperArrow,!r.open&&t.popperClose]}})(nt(({theme:e})=>({zIndex:(e.vars||e).zIndex.tooltip,pointerEvents:"none",variants:[{props:({ownerState:t})=>!t.disableInteractive,style:{pointerEvents:"auto"}},{props:({open:t})=>!t,style:{pointerEvents:"none"}},{props:({ownerState:t})=>t.arrow,style:{[`&[data-popper-placement*="bottom"] .${mi.arrow}`]:{top:0,marginTop:"-0.71em","&::before":{transformOrigin:"0 100%"}},[`&[data-popper-placement*="top"] .${mi.arrow}`]:{bottom:0,marginBottom:"-0.71em","&::before":{transformOrigin:"100% 0"}},[`&[data-popper-placement*="right"] .${mi.arrow}`]:{height:"1em",width:"0.71em","&::before":{transformOrigin:"100% 100%"}},[`&[data-popper-placement*="left"] .${mi.arrow}`]:{height:"1em",width:"0.71em","&::before":{transformOrigin:"0 0"}}}},{props:({ownerState:t})=>t.arrow&&!t.isRtl,style:{[`&[data-popper-placement*="right"] .${mi.arrow}`]:{left:0,marginLeft:"-0.71em"}}},{props:({ownerState:t})=>t.arrow&&!!t.isRtl,style:{[`&[data-popper-placement*="right"] .${mi.arrow}`]:{right:0,marginRight:"-0.71em"}}},{props:({ownerState:t})=>t.arrow&&!t.isRtl,style:{[`&[data-popper-placement*="left"] .${mi.arrow}`]:{right:0,marginRight:"-0.71em"}}},{props:({ownerState:t})=>t.arrow&&!!t.isRtl,style:{[`&[data-popper-placement*="left"] .${mi.arrow}`]:{left:0,marginLeft:"-0.71em"}}}]}))),Mmt=ne("div",{name:"MuiTooltip",slot:"Tooltip",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.tooltip,r.touch&&t.touch,r.arrow&&t.tooltipArrow,t[`tooltipPlacement${Te(r.placement.split("-")[0])}`]]}})(nt(({theme:e})=>({backgroundColor:e.vars?e.vars.palette.Tooltip.bg:e.alpha(e.palette.grey[700],.92),borderRadius:(e.vars||e).shape.borderRadius,color:(e.vars||e).palette.common.white,fontFamily:e.typography.fontFamily,padding:"4px 8px",fontSize:e.typography.pxToRem(11),maxWidth:300,margin:2,wordWrap:"break-word",fontWeight:e.typography.fontWeightMedium,[`.${mi.popper}[data-popper-placement*="left"] &`]:{transformOrigin:"right center"},[`.${mi.popper}[data-popper-placement*="right"] &`]:{transformOrigin:"left center"},[`.${mi.popper}[data-popper-placement*="top"] &`]:{transformOrigin:"center bottom",marginBottom:"14px"},[`.${mi.popper}[data-popper-placement*="bottom"] &`]:{transformOrigin:"center top",marginTop:"14px"},variants:[{props:({ownerState:t})=>t.arrow,style:{position:"relative",margin:0}},{props:({ownerState:t})=>t.touch,style:{padding:"8px 16px",fontSize:e.typography.pxToRem(14),lineHeight:`${Pmt(16/14)}em`,fontWeight:e.typography.fontWeightRegular}},{props:({ownerState:t})=>!t.isRtl,style:{[`.${mi.popper}[data-popper-placement*="left"] &`]:{marginRight:"14px"},[`.${mi.popper}[data-popper-placement*="right"] &`]:{marginLeft:"14px"}}},{props:({ownerState:t})=>!t.isRtl&&t.touch,style:{[`.${mi.popper}[data-popper-placement*="left"] &`]:{marginRight:"24px"},[`.${mi.popper}[data-popper-placement*="right"] &`]:{marginLeft:"24px"}}},{props:({ownerState:t})=>!!t.isRtl,style:{[`.${mi.popper}[data-popper-placement*="left"] &`]:{marginLeft:"14px"},[`.${mi.popper}[data-popper-placement*="right"] &`]:{marginRight:"14px"}}},{props:({ownerState:t})=>!!t.isRtl&&t.touch,style:{[`.${mi.popper}[data-popper-placement*="left"] &`]:{marginLeft:"24px"},[`.${mi.popper}[data-popper-placement*="right"] &`]:{marginRight:"24px"}}},{props:({ownerState:t})=>t.touch,style:{[`.${mi.popper}[data-popper-placement*="top"] &`]:{marginBottom:"24px"}}},{props:({ownerState:t})=>t.touch,style:{[`.${mi.popper}[data-popper-placement*="bottom"] &`]:{marginTop:"24px"}}}]}))),Imt=ne("span",{name:"MuiTooltip",slot:"Arrow"})(nt(({theme:e})=>({overflow:"hidden",position:"absolute",width:"1em",height:"0.71em",boxSizing:"border-box",color:e.vars?e.vars.palette.Tooltip.bg:e.alpha(e.palette.grey[700],.9),"&::before":{content:'""',margin:"auto",display:"block",width:"100%",height:"100%",backgroundColor:"currentColor",transform:"rotate(45deg)"}}))),pV=!1,tPe=new MC,dD={x:0,y:0};function fV(e,t){return(r,...o)=>{t&&t(r,...o),e(r,...o)}}var Dmt=Ki.forwardRef(function(t,r){let o=et({props:t,name:"MuiTooltip"}),{arrow:n=!1,children:i,classes:a,components:s={},componentsProps:l={},describeChild:u=!1,disableFocusListener:c=!1,disableHoverListener:p=!1,disableInteractive:f=!1,disableTouchListener:d=!1,enterDelay:m=100,enterNextDelay:h=0,enterTouchDelay:g=700,followCursor:v=!1,id:y,leaveDelay:x=0,leaveTouchDelay:b=1500,onClose:S,onOpen:T,open:w,placement:C="bottom",PopperComponent:P,PopperProps:R={},slotProps:M={},slots:E={},title:I,TransitionComponent:k,TransitionProps:N,...O}=o,F=Ki.isValidElement(i)?i:(0,Ly.jsx)("span",{children:i}),V=lo(),B=ro(),[$,G]=Ki.useState(),[W,j]=Ki.useState(null),X=Ki.useRef(!1),J=f||v,ee=Vn(),de=Vn(),fe=Vn(),ie=Vn(),[ue,pe]=M0({controlled:w,default:!1,name:"Tooltip",state:"open"}),ye=ue,ze=am(y),Ee=Ki.useRef(),Pe=gp(()=>{Ee.current!==void 0&&(document.body.style.WebkitUserSelect=Ee.current,Ee.current=void 0),ie.clear()});Ki.useEffect(()=>Pe,[Pe]);let Ye=Qt=>{tPe.clear(),pV=!0,pe(!0),T&&!ye&&T(Qt)},_e=gp(Qt=>{tPe.start(800+x,()=>{pV=!1}),pe(!1),S&&ye&&S(Qt),ee.start(V.transitions.duration.shortest,()=>{X.current=!1})}),be=Qt=>{X.current&&Qt.type!=="touchstart"||($&&$.removeAttribute("title"),de.clear(),fe.clear(),m||pV&&h?de.start(pV?h:m,()=>{Ye(Qt)}):Ye(Qt))},He=Qt=>{de.clear(),fe.start(x,()=>{_e(Qt)})},[,qe]=Ki.useState(!1),bt=Qt=>{Cy(Qt.target)||(qe(!1),He(Qt))},rt=Qt=>{$||G(Qt.currentTarget),Cy(Qt.target)&&(qe(!0),be(Qt))},mr=Qt=>{X.current=!0;let tr=F.props;tr.onTouchStart&&tr.onTouchStart(Qt)},Ze=Qt=>{mr(Qt),fe.clear(),ee.clear(),Pe(),Ee.current=document.body.style.WebkitUserSelect,document.body.style.WebkitUserSelect="none",ie.start(g,()=>{document.body.style.WebkitUserSelect=Ee.current,be(Qt)})},zt=Qt=>{F.props.onTouchEnd&&F.props.onTouchEnd(Qt),Pe(),fe.start(b,()=>{_e(Qt)})};Ki.useEffect(()=>{if(!ye)return;function Qt(tr){tr.key==="Escape"&&_e(tr)}return document.addEventListener("keydown",Qt),()=>{document.removeEventListener("keydown",Qt)}},[_e,ye]);let Lt=Zi(ol(F),G,r);!I&&I!==0&&(ye=!1);let qt=Ki.useRef(),Dt=Qt=>{let tr=F.props;tr.onMouseMove&&tr.onMouseMove(Qt),dD={x:Qt.clientX,y:Qt.clientY},qt.current&&qt.current.update()},ht={},Bt=typeof I=="string";u?(ht.title=!ye&&Bt&&!p?I:null,ht["aria-describedby"]=ye?ze:null):(ht["aria-label"]=Bt?I:null,ht["aria-labelledby"]=ye&&!Bt?ze:null);let je={...ht,...O,...F.props,className:le(O.className,F.props.className),onTouchStart:mr,ref:Lt,...v?{onMouseMove:Dt}:{}},Et={};d||(je.onTouchStart=Ze,je.onTouchEnd=zt),p||(je.onMouseOver=fV(be,je.onMouseOver),je.onMouseLeave=fV(He,je.onMouseLeave),J||(Et.onMouseOver=be,Et.onMouseLeave=He)),c||(je.onFocus=fV(rt,je.onFocus),je.onBlur=fV(bt,je.onBlur),J||(Et.onFocus=rt,Et.onBlur=bt));let ir={...o,isRtl:B,arrow:n,disableInteractive:J,placement:C,PopperComponentProp:P,touch:X.current},ar=typeof M.popper=="function"?M.popper(ir):M.popper,Ao=Ki.useMemo(()=>{let Qt=[{name:"arrow",enabled:!!W,options:{element:W,padding:4}}];return R.popperOptions?.modifiers&&(Qt=Qt.concat(R.popperOptions.modifiers)),ar?.popperOptions?.modifiers&&(Qt=Qt.concat(ar.popperOptions.modifiers)),{...R.popperOptions,...ar?.popperOptions,modifiers:Qt}},[W,R.popperOptions,ar?.popperOptions]),Yn=Rmt(ir),jo=typeof M.transition=="function"?M.transition(ir):M.transition,Ot={slots:{popper:s.Popper,transition:s.Transition??k,tooltip:s.Tooltip,arrow:s.Arrow,...E},slotProps:{arrow:M.arrow??l.arrow,popper:{...R,...ar??l.popper},tooltip:M.tooltip??l.tooltip,transition:{...N,...jo??l.transition}}},[sr,Ur]=At("popper",{elementType:Emt,externalForwardedProps:Ot,ownerState:ir,className:le(Yn.popper,R?.className)}),[dn,mn]=At("transition",{elementType:q0,externalForwardedProps:Ot,ownerState:ir}),[_t,Ui]=At("tooltip",{elementType:Mmt,className:Yn.tooltip,externalForwardedProps:Ot,ownerState:ir}),[Ts,On]=At("arrow",{elementType:Imt,className:Yn.arrow,externalForwardedProps:Ot,ownerState:ir,ref:j});return(0,Ly.jsxs)(Ki.Fragment,{children:[Ki.cloneElement(F,je),(0,Ly.jsx)(sr,{as:P??mg,placement:C,anchorEl:v?{getBoundingClientRect:()=>({top:dD.y,left:dD.x,right:dD.x,bottom:dD.y,width:0,height:0})}:$,popperRef:qt,open:$?ye:!1,id:ze,transition:!0,...Et,...Ur,popperOptions:Ao,children:({TransitionProps:Qt})=>(0,Ly.jsx)(dn,{timeout:V.transitions.duration.shorter,...Qt,...mn,children:(0,Ly.jsxs)(_t,{...Ui,children:[I,n?(0,Ly.jsx)(Ts,{...On}):null]})})})]})}),$Q=Dmt;var Omt=oU({createStyledComponent:ne("div",{name:"MuiStack",slot:"Root"}),useThemeProps:e=>et({props:e,name:"MuiStack"})}),Ny=Omt;var oPe=z(K(),1);gt();function rPe(e){return We("MuiSwitch",e)}var kmt=Be("MuiSwitch",["root","edgeStart","edgeEnd","switchBase","colorPrimary","colorSecondary","sizeSmall","sizeMedium","checked","disabled","input","thumb","track"]),sl=kmt;var JC=z(Q(),1),Amt=e=>{let{classes:t,edge:r,size:o,color:n,checked:i,disabled:a}=e,s={root:["root",r&&`edge${Te(r)}`,`size${Te(o)}`],switchBase:["switchBase",`color${Te(n)}`,i&&"checked",a&&"disabled"],thumb:["thumb"],track:["track"],input:["input"]},l=ce(s,rPe,t);return{...t,...l}},Lmt=ne("span",{name:"MuiSwitch",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.root,r.edge&&t[`edge${Te(r.edge)}`],t[`size${Te(r.size)}`]]}})({display:"inline-flex",width:58,height:38,overflow:"hidden",padding:12,boxSizing:"border-box",position:"relative",flexShrink:0,zIndex:0,verticalAlign:"middle","@media print":{colorAdjust:"exact"},variants:[{props:{edge:"start"},style:{marginLeft:-8}},{props:{edge:"end"},style:{marginRight:-8}},{props:{size:"small"},style:{width:40,height:24,padding:7,[`& .${sl.thumb}`]:{width:16,height:16},[`& .${sl.switchBase}`]:{padding:4,[`&.${sl.checked}`]:{transform:"translateX(16px)"}}}}]}),Nmt=ne(HU,{name:"MuiSwitch",slot:"SwitchBase",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.switchBase,{[`& .${sl.input}`]:t.input},r.color!=="default"&&t[`color${Te(r.color)}`]]}})(nt(({theme:e})=>({position:"absolute",top:0,left:0,zIndex:1,color:e.vars?e.vars.palette.Switch.defaultColor:`${e.palette.mode==="light"?e.palette.common.white:e.palette.grey[300]}`,transition:e.transitions.create(["left","transform"],{duration:e.transitions.duration.shortest}),[`&.${sl.checked}`]:{transform:"translateX(20px)"},[`&.${sl.disabled}`]:{color:e.vars?e.vars.palette.Switch.defaultDisabledColor:`${e.palette.mode==="light"?e.palette.grey[100]:e.palette.grey[600]}`},[`&.${sl.checked} + .${sl.track}`]:{opacity:.5},[`&.${sl.disabled} + .${sl.track}`]:{opacity:e.vars?e.vars.opacity.switchTrackDisabled:`${e.palette.mode==="light"?.12:.2}`},[`& .${sl.input}`]:{left:"-100%",width:"300%"}})),nt(({theme:e})=>({"&:hover":{backgroundColor:e.alpha((e.vars||e).palette.action.active,(e.vars||e).palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},variants:[...Object.entries(e.palette).filter(kr(["light"])).map(([t])=>({props:{color:t},style:{[`&.${sl.checked}`]:{color:(e.vars||e).palette[t].main,"&:hover":{backgroundColor:e.alpha((e.vars||e).palette[t].main,(e.vars||e).palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},[`&.${sl.disabled}`]:{color:e.vars?e.vars.palette.Switch[`${t}DisabledColor`]:`${e.palette.mode==="light"?e.lighten(e.palette[t].main,.62):e.darken(e.palette[t].main,.55)}`}},[`&.${sl.checked} + .${sl.track}`]:{backgroundColor:(e.vars||e).palette[t].main}}}))]}))),zmt=ne("span",{name:"MuiSwitch",slot:"Track"})(nt(({theme:e})=>({height:"100%",width:"100%",borderRadius:14/2,zIndex:-1,transition:e.transitions.create(["opacity","background-color"],{duration:e.transitions.duration.shortest}),backgroundColor:e.vars?e.vars.palette.common.onBackground:`${e.palette.mode==="light"?e.palette.common.black:e.palette.common.white}`,opacity:e.vars?e.vars.opacity.switchTrack:`${e.palette.mode==="light"?.38:.3}`}))),Fmt=ne("span",{name:"MuiSwitch",slot:"Thumb"})(nt(({theme:e})=>({boxShadow:(e.vars||e).shadows[1],backgroundColor:"currentColor",width:20,height:20,borderRadius:"50%"}))),Umt=oPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiSwitch"}),{className:n,color:i="primary",edge:a=!1,size:s="medium",sx:l,slots:u={},slotProps:c={},...p}=o,f={...o,color:i,edge:a,size:s},d=Amt(f),m={slots:u,slotProps:c},[h,g]=At("root",{className:le(d.root,n),elementType:Lmt,externalForwardedProps:m,ownerState:f,additionalProps:{sx:l}}),[v,y]=At("thumb",{className:d.thumb,elementType:Fmt,externalForwardedProps:m,ownerState:f}),x=(0,JC.jsx)(v,{...y}),[b,S]=At("track",{className:d.track,elementType:zmt,externalForwardedProps:m,ownerState:f});return(0,JC.jsxs)(h,{...g,children:[(0,JC.jsx)(Nmt,{type:"checkbox",icon:x,checkedIcon:x,ref:r,ownerState:f,...p,classes:{...d,root:d.switchBase},slots:{...u.switchBase&&{root:u.switchBase},...u.input&&{input:u.input}},slotProps:{...c.switchBase&&{root:typeof c.switchBase=="function"?c.switchBase(f):c.switchBase},input:{role:"switch"},...c.input&&{input:typeof c.input=="function"?c.input(f):c.input}}}),(0,JC.jsx)(b,{...S})]})}),pm=Umt;var bg=z(K(),1);gt();function nPe(e){return We("MuiTab",e)}var Vmt=Be("MuiTab",["root","labelIcon","textColorInherit","textColorPrimary","textColorSecondary","selected","disabled","fullWidth","wrapped","iconWrapper","icon"]),Cc=Vmt;var dV=z(Q(),1),$mt=e=>{let{classes:t,textColor:r,fullWidth:o,wrapped:n,icon:i,label:a,selected:s,disabled:l}=e,u={root:["root",i&&a&&"labelIcon",`textColor${Te(r)}`,o&&"fullWidth",n&&"wrapped",s&&"selected",l&&"disabled"],icon:["iconWrapper","icon"]};return ce(u,nPe,t)},Bmt=ne(ls,{name:"MuiTab",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.root,r.label&&r.icon&&t.labelIcon,t[`textColor${Te(r.textColor)}`],r.fullWidth&&t.fullWidth,r.wrapped&&t.wrapped,{[`& .${Cc.iconWrapper}`]:t.iconWrapper},{[`& .${Cc.icon}`]:t.icon}]}})(nt(({theme:e})=>({...e.typography.button,maxWidth:360,minWidth:90,position:"relative",minHeight:48,flexShrink:0,padding:"12px 16px",overflow:"hidden",whiteSpace:"normal",textAlign:"center",lineHeight:1.25,variants:[{props:({ownerState:t})=>t.label&&(t.iconPosition==="top"||t.iconPosition==="bottom"),style:{flexDirection:"column"}},{props:({ownerState:t})=>t.label&&t.iconPosition!=="top"&&t.iconPosition!=="bottom",style:{flexDirection:"row"}},{props:({ownerState:t})=>t.icon&&t.label,style:{minHeight:72,paddingTop:9,paddingBottom:9}},{props:({ownerState:t,iconPosition:r})=>t.icon&&t.label&&r==="top",style:{[`& > .${Cc.icon}`]:{marginBottom:6}}},{props:({ownerState:t,iconPosition:r})=>t.icon&&t.label&&r==="bottom",style:{[`& > .${Cc.icon}`]:{marginTop:6}}},{props:({ownerState:t,iconPosition:r})=>t.icon&&t.label&&r==="start",style:{[`& > .${Cc.icon}`]:{marginRight:e.spacing(1)}}},{props:({ownerState:t,iconPosition:r})=>t.icon&&t.label&&r==="end",style:{[`& > .${Cc.icon}`]:{marginLeft:e.spacing(1)}}},{props:{textColor:"inherit"},style:{color:"inherit",opacity:.6,[`&.${Cc.selected}`]:{opacity:1},[`&.${Cc.disabled}`]:{opacity:(e.vars||e).palette.action.disabledOpacity}}},{props:{textColor:"primary"},style:{color:(e.vars||e).palette.text.secondary,[`&.${Cc.selected}`]:{color:(e.vars||e).palette.primary.main},[`&.${Cc.disabled}`]:{color:(e.vars||e).palette.text.disabled}}},{props:{textColor:"secondary"},style:{color:(e.vars||e).palette.text.secondary,[`&.${Cc.selected}`]:{color:(e.vars||e).palette.secondary.main},[`&.${Cc.disabled}`]:{color:(e.vars||e).palette.text.disabled}}},{props:({ownerState:t})=>t.fullWidth,style:{flexShrink:1,flexGrow:1,flexBasis:0,maxWidth:"none"}},{props:({ownerState:t})=>t.wrapped,style:{fontSize:e.typography.pxToRem(12)}}]}))),Gmt=bg.forwardRef(function(t,r){let o=et({props:t,name:"MuiTab"}),{className:n,disabled:i=!1,disableFocusRipple:a=!1,fullWidth:s,icon:l,iconPosition:u="top",indicator:c,label:p,onChange:f,onClick:d,onFocus:m,selected:h,selectionFollowsFocus:g,textColor:v="inherit",value:y,wrapped:x=!1,...b}=o,S={...o,disabled:i,disableFocusRipple:a,selected:h,icon:!!l,iconPosition:u,label:!!p,fullWidth:s,textColor:v,wrapped:x},T=$mt(S),w=l&&p&&bg.isValidElement(l)?bg.cloneElement(l,{className:le(T.icon,l.props.className)}):l,C=R=>{!h&&f&&f(R,y),d&&d(R)},P=R=>{g&&!h&&f&&f(R,y),m&&m(R)};return(0,dV.jsxs)(Bmt,{focusRipple:!a,className:le(T.root,n),ref:r,role:"tab","aria-selected":h,disabled:i,onClick:C,onFocus:P,ownerState:S,tabIndex:h?0:-1,...b,children:[u==="top"||u==="start"?(0,dV.jsxs)(bg.Fragment,{children:[w,p]}):(0,dV.jsxs)(bg.Fragment,{children:[p,w]}),c]})}),BQ=Gmt;var iPe=z(K(),1),Hmt=iPe.createContext(),aPe=Hmt;var sPe=z(K(),1),jmt=sPe.createContext(),lPe=jmt;var mD=z(K(),1);gt();function uPe(e){return We("MuiTableCell",e)}var Wmt=Be("MuiTableCell",["root","head","body","footer","sizeSmall","sizeMedium","paddingCheckbox","paddingNone","alignLeft","alignCenter","alignRight","alignJustify","stickyHeader"]),cPe=Wmt;var pPe=z(Q(),1),Ymt=e=>{let{classes:t,variant:r,align:o,padding:n,size:i,stickyHeader:a}=e,s={root:["root",r,a&&"stickyHeader",o!=="inherit"&&`align${Te(o)}`,n!=="normal"&&`padding${Te(n)}`,`size${Te(i)}`]};return ce(s,uPe,t)},Zmt=ne("td",{name:"MuiTableCell",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.root,t[r.variant],t[`size${Te(r.size)}`],r.padding!=="normal"&&t[`padding${Te(r.padding)}`],r.align!=="inherit"&&t[`align${Te(r.align)}`],r.stickyHeader&&t.stickyHeader]}})(nt(({theme:e})=>({...e.typography.body2,display:"table-cell",verticalAlign:"inherit",borderBottom:e.vars?`1px solid ${e.vars.palette.TableCell.border}`:`1px solid
-    ${e.palette.mode==="light"?e.lighten(e.alpha(e.palette.divider,1),.88):e.darken(e.alpha(e.palette.divider,1),.68)}`,textAlign:"left",padding:16,variants:[{props:{variant:"head"},style:{color:(e.vars||e).palette.text.primary,lineHeight:e.typography.pxToRem(24),fontWeight:e.typography.fontWeightMedium}},{props:{variant:"body"},style:{color:(e.vars||e).palette.text.primary}},{props:{variant:"footer"},style:{color:(e.vars||e).palette.text.secondary,lineHeight:e.typography.pxToRem(21),fontSize:e.typography.pxToRem(12)}},{props:{size:"small"},style:{padding:"6px 16px",[`&.${cPe.paddingCheckbox}`]:{width:24,padding:"0 12px 0 16px","& > *":{padding:0}}}},{props:{padding:"checkbox"},style:{width:48,padding:"0 0 0 4px"}},{props:{padding:"none"},style:{padding:0}},{props:{align:"left"},style:{textAlign:"left"}},{props:{align:"center"},style:{textAlign:"center"}},{props:{align:"right"},style:{textAlign:"right",flexDirection:"row-reverse"}},{props:{align:"justify"},style:{textAlign:"justify"}},{props:({ownerState:t})=>t.stickyHeader,style:{position:"sticky",top:0,zIndex:2,backgroundColor:(e.vars||e).palette.background.default}}]}))),qmt=mD.forwardRef(function(t,r){let o=et({props:t,name:"MuiTableCell"}),{align:n="inherit",className:i,component:a,padding:s,scope:l,size:u,sortDirection:c,variant:p,...f}=o,d=mD.useContext(aPe),m=mD.useContext(lPe),h=m&&m.variant==="head",g;a?g=a:g=h?"th":"td";let v=l;g==="td"?v=void 0:!v&&h&&(v="col");let y=p||m&&m.variant,x={...o,align:n,component:g,padding:s||(d&&d.padding?d.padding:"normal"),size:u||(d&&d.size?d.size:"medium"),sortDirection:c,stickyHeader:y==="head"&&d&&d.stickyHeader,variant:y},b=Ymt(x),S=null;return c&&(S=c==="asc"?"ascending":"descending"),(0,pPe.jsx)(Zmt,{as:g,ref:r,className:le(b.root,i),"aria-sort":S,scope:v,ownerState:x,...f})}),hD=qmt;var SPe=z(K(),1);gt();var dPe=z(K(),1);gt();function fPe(e){return We("MuiToolbar",e)}var Twr=Be("MuiToolbar",["root","gutters","regular","dense"]);var mPe=z(Q(),1),Kmt=e=>{let{classes:t,disableGutters:r,variant:o}=e;return ce({root:["root",!r&&"gutters",o]},fPe,t)},Xmt=ne("div",{name:"MuiToolbar",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.root,!r.disableGutters&&t.gutters,t[r.variant]]}})(nt(({theme:e})=>({position:"relative",display:"flex",alignItems:"center",variants:[{props:({ownerState:t})=>!t.disableGutters,style:{paddingLeft:e.spacing(2),paddingRight:e.spacing(2),[e.breakpoints.up("sm")]:{paddingLeft:e.spacing(3),paddingRight:e.spacing(3)}}},{props:{variant:"dense"},style:{minHeight:48}},{props:{variant:"regular"},style:e.mixins.toolbar}]}))),Qmt=dPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiToolbar"}),{className:n,component:i="div",disableGutters:a=!1,variant:s="regular",...l}=o,u={...o,component:i,disableGutters:a,variant:s},c=Kmt(u);return(0,mPe.jsx)(Xmt,{as:i,className:le(c.root,n),ref:r,ownerState:u,...l})}),GQ=Qmt;var yPe=z(K(),1);gt();var hPe=z(Q(),1),mV=Xr((0,hPe.jsx)("path",{d:"M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"}),"KeyboardArrowLeft");var gPe=z(Q(),1),hV=Xr((0,gPe.jsx)("path",{d:"M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"}),"KeyboardArrowRight");function vPe(e){return We("MuiTablePaginationActions",e)}var Vwr=Be("MuiTablePaginationActions",["root"]);var Ul=z(Q(),1),Jmt=e=>{let{classes:t}=e;return ce({root:["root"]},vPe,t)},eht=ne("div",{name:"MuiTablePaginationActions",slot:"Root"})({}),tht=yPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiTablePaginationActions"}),{backIconButtonProps:n,className:i,count:a,disabled:s=!1,getItemAriaLabel:l,nextIconButtonProps:u,onPageChange:c,page:p,rowsPerPage:f,showFirstButton:d,showLastButton:m,slots:h={},slotProps:g={},...v}=o,y=ro(),b=Jmt(o),S=J=>{c(J,0)},T=J=>{c(J,p-1)},w=J=>{c(J,p+1)},C=J=>{c(J,Math.max(0,Math.ceil(a/f)-1))},P=h.firstButton??bc,R=h.lastButton??bc,M=h.nextButton??bc,E=h.previousButton??bc,I=h.firstButtonIcon??HCe,k=h.lastButtonIcon??WCe,N=h.nextButtonIcon??hV,O=h.previousButtonIcon??mV,F=y?R:P,V=y?M:E,B=y?E:M,$=y?P:R,G=y?g.lastButton:g.firstButton,W=y?g.nextButton:g.previousButton,j=y?g.previousButton:g.nextButton,X=y?g.firstButton:g.lastButton;return(0,Ul.jsxs)(eht,{ref:r,className:le(b.root,i),...v,children:[d&&(0,Ul.jsx)(F,{onClick:S,disabled:s||p===0,"aria-label":l("first",p),title:l("first",p),...G,children:y?(0,Ul.jsx)(k,{...g.lastButtonIcon}):(0,Ul.jsx)(I,{...g.firstButtonIcon})}),(0,Ul.jsx)(V,{onClick:T,disabled:s||p===0,color:"inherit","aria-label":l("previous",p),title:l("previous",p),...W??n,children:y?(0,Ul.jsx)(N,{...g.nextButtonIcon}):(0,Ul.jsx)(O,{...g.previousButtonIcon})}),(0,Ul.jsx)(B,{onClick:w,disabled:s||(a!==-1?p>=Math.ceil(a/f)-1:!1),color:"inherit","aria-label":l("next",p),title:l("next",p),...j??u,children:y?(0,Ul.jsx)(O,{...g.previousButtonIcon}):(0,Ul.jsx)(N,{...g.nextButtonIcon})}),m&&(0,Ul.jsx)($,{onClick:C,disabled:s||p>=Math.ceil(a/f)-1,"aria-label":l("last",p),title:l("last",p),...X,children:y?(0,Ul.jsx)(I,{...g.firstButtonIcon}):(0,Ul.jsx)(k,{...g.lastButtonIcon})})]})}),HQ=tht;function xPe(e){return We("MuiTablePagination",e)}var rht=Be("MuiTablePagination",["root","toolbar","spacer","selectLabel","selectRoot","select","selectIcon","input","menuItem","displayedRows","actions"]),fm=rht;var dm=z(Q(),1),TPe=z(K(),1),bPe,oht=ne(hD,{name:"MuiTablePagination",slot:"Root"})(nt(({theme:e})=>({overflow:"auto",color:(e.vars||e).palette.text.primary,fontSize:e.typography.pxToRem(14),"&:last-child":{padding:0}}))),nht=ne(GQ,{name:"MuiTablePagination",slot:"Toolbar",overridesResolver:(e,t)=>({[`& .${fm.actions}`]:t.actions,...t.toolbar})})(nt(({theme:e})=>({minHeight:52,paddingRight:2,[`${e.breakpoints.up("xs")} and (orientation: landscape)`]:{minHeight:52},[e.breakpoints.up("sm")]:{minHeight:52,paddingRight:2},[`& .${fm.actions}`]:{flexShrink:0,marginLeft:20}}))),iht=ne("div",{name:"MuiTablePagination",slot:"Spacer"})({flex:"1 1 100%"}),aht=ne("p",{name:"MuiTablePagination",slot:"SelectLabel"})(nt(({theme:e})=>({...e.typography.body2,flexShrink:0}))),sht=ne(wp,{name:"MuiTablePagination",slot:"Select",overridesResolver:(e,t)=>({[`& .${fm.selectIcon}`]:t.selectIcon,[`& .${fm.select}`]:t.select,...t.input,...t.selectRoot})})({color:"inherit",fontSize:"inherit",flexShrink:0,marginRight:32,marginLeft:8,[`& .${fm.select}`]:{paddingLeft:8,paddingRight:24,textAlign:"right",textAlignLast:"right"}}),lht=ne(Uf,{name:"MuiTablePagination",slot:"MenuItem"})({}),uht=ne("p",{name:"MuiTablePagination",slot:"DisplayedRows"})(nt(({theme:e})=>({...e.typography.body2,flexShrink:0})));function cht({from:e,to:t,count:r}){return`${e}\u2013${t} of ${r!==-1?r:`more than ${t}`}`}function pht(e){return`Go to ${e} page`}var fht=e=>{let{classes:t}=e;return ce({root:["root"],toolbar:["toolbar"],spacer:["spacer"],selectLabel:["selectLabel"],select:["select"],input:["input"],selectIcon:["selectIcon"],menuItem:["menuItem"],displayedRows:["displayedRows"],actions:["actions"]},xPe,t)},dht=SPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiTablePagination"}),{ActionsComponent:n=HQ,backIconButtonProps:i,colSpan:a,component:s=hD,count:l,disabled:u=!1,getItemAriaLabel:c=pht,labelDisplayedRows:p=cht,labelRowsPerPage:f="Rows per page:",nextIconButtonProps:d,onPageChange:m,onRowsPerPageChange:h,page:g,rowsPerPage:v,rowsPerPageOptions:y=[10,25,50,100],SelectProps:x={},showFirstButton:b=!1,showLastButton:S=!1,slotProps:T={},slots:w={},...C}=o,P=o,R=fht(P),M=T?.select??x,E=M.native?"option":lht,I;(s===hD||s==="td")&&(I=a||1e3);let k=am(M.id),N=am(M.labelId),O=()=>l===-1?(g+1)*v:v===-1?l:Math.min(l,(g+1)*v),F={slots:w,slotProps:T},[V,B]=At("root",{ref:r,className:R.root,elementType:oht,externalForwardedProps:{...F,component:s,...C},ownerState:P,additionalProps:{colSpan:I}}),[$,G]=At("toolbar",{className:R.toolbar,elementType:nht,externalForwardedProps:F,ownerState:P}),[W,j]=At("spacer",{className:R.spacer,elementType:iht,externalForwardedProps:F,ownerState:P}),[X,J]=At("selectLabel",{className:R.selectLabel,elementType:aht,externalForwardedProps:F,ownerState:P,additionalProps:{id:N}}),[ee,de]=At("select",{className:R.select,elementType:sht,externalForwardedProps:F,ownerState:P}),[fe,ie]=At("menuItem",{className:R.menuItem,elementType:E,externalForwardedProps:F,ownerState:P}),[ue,pe]=At("displayedRows",{className:R.displayedRows,elementType:uht,externalForwardedProps:F,ownerState:P});return(0,dm.jsx)(V,{...B,children:(0,dm.jsxs)($,{...G,children:[(0,dm.jsx)(W,{...j}),y.length>1&&(0,dm.jsx)(X,{...J,children:f}),y.length>1&&(0,dm.jsx)(ee,{variant:"standard",...!M.variant&&{input:bPe||(bPe=(0,dm.jsx)(Lf,{}))},value:v,onChange:h,id:k,labelId:N,...M,classes:{...M.classes,root:le(R.input,R.selectRoot,(M.classes||{}).root),select:le(R.select,(M.classes||{}).select),icon:le(R.selectIcon,(M.classes||{}).icon)},disabled:u,...de,children:y.map(ye=>(0,TPe.createElement)(fe,{...ie,key:ye.label?ye.label:ye,value:ye.value?ye.value:ye},ye.label?ye.label:ye))}),(0,dm.jsx)(ue,{...pe,children:p({from:l===0?0:g*v+1,to:O(),count:l===-1?-1:l,page:g})}),(0,dm.jsx)(n,{className:R.actions,backIconButtonProps:i,count:l,nextIconButtonProps:d,onPageChange:m,page:g,rowsPerPage:v,showFirstButton:b,showLastButton:S,slotProps:T.actions,slots:w.actions,getItemAriaLabel:c,disabled:u})]})})}),jQ=dht;var cn=z(K(),1);gt();function mht(e){return(1+Math.sin(Math.PI*e-Math.PI/2))/2}function WQ(e,t,r,o={},n=()=>{}){let{ease:i=mht,duration:a=300}=o,s=null,l=t[e],u=!1,c=()=>{u=!0},p=f=>{if(u){n(new Error("Animation cancelled"));return}s===null&&(s=f);let d=Math.min(1,(f-s)/a);if(t[e]=i(d)*(r-l)+l,d>=1){requestAnimationFrame(()=>{n(null)});return}requestAnimationFrame(p)};return l===r?(n(new Error("Element already at target position")),c):(requestAnimationFrame(p),c)}var gD=z(K(),1);var wPe=z(Q(),1),hht={width:99,height:99,position:"absolute",top:-9999,overflow:"scroll"};function YQ(e){let{onChange:t,...r}=e,o=gD.useRef(),n=gD.useRef(null),i=()=>{o.current=n.current.offsetHeight-n.current.clientHeight};return sg(()=>{let a=wC(()=>{let l=o.current;i(),l!==o.current&&t(o.current)}),s=im(n.current);return s.addEventListener("resize",a),()=>{a.clear(),s.removeEventListener("resize",a)}},[t]),gD.useEffect(()=>{i(),t(o.current)},[t]),(0,wPe.jsx)("div",{style:hht,...r,ref:n})}var PPe=z(K(),1);gt();function _Pe(e){return We("MuiTabScrollButton",e)}var ght=Be("MuiTabScrollButton",["root","vertical","horizontal","disabled"]),CPe=ght;var gV=z(Q(),1),vht=e=>{let{classes:t,orientation:r,disabled:o}=e;return ce({root:["root",r,o&&"disabled"]},_Pe,t)},yht=ne(ls,{name:"MuiTabScrollButton",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.root,r.orientation&&t[r.orientation]]}})({width:40,flexShrink:0,opacity:.8,[`&.${CPe.disabled}`]:{opacity:0},variants:[{props:{orientation:"vertical"},style:{width:"100%",height:40,"& svg":{transform:"var(--TabScrollButton-svgRotate)"}}}]}),xht=PPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiTabScrollButton"}),{className:n,slots:i={},slotProps:a={},direction:s,orientation:l,disabled:u,...c}=o,p=ro(),f={isRtl:p,...o},d=vht(f),m=i.StartScrollButtonIcon??mV,h=i.EndScrollButtonIcon??hV,g=Af({elementType:m,externalSlotProps:a.startScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:f}),v=Af({elementType:h,externalSlotProps:a.endScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:f});return(0,gV.jsx)(yht,{component:"div",className:le(d.root,n),ref:r,role:null,ownerState:f,tabIndex:null,...c,style:{...c.style,...l==="vertical"&&{"--TabScrollButton-svgRotate":`rotate(${p?-90:90}deg)`}},children:s==="left"?(0,gV.jsx)(m,{...g}):(0,gV.jsx)(h,{...v})})}),ZQ=xht;function RPe(e){return We("MuiTabs",e)}var bht=Be("MuiTabs",["root","vertical","list","flexContainer","flexContainerVertical","centered","scroller","fixed","scrollableX","scrollableY","hideScrollbar","scrollButtons","scrollButtonsHideMobile","indicator"]),vV=bht;var Sg=z(Q(),1),EPe=(e,t)=>e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:e.firstChild,MPe=(e,t)=>e===t?e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:e.lastChild,yV=(e,t,r)=>{let o=!1,n=r(e,t);for(;n;){if(n===e.firstChild){if(o)return;o=!0}let i=n.disabled||n.getAttribute("aria-disabled")==="true";if(!n.hasAttribute("tabindex")||i)n=r(e,n);else{n.focus();return}}},Sht=e=>{let{vertical:t,fixed:r,hideScrollbar:o,scrollableX:n,scrollableY:i,centered:a,scrollButtonsHideMobile:s,classes:l}=e;return ce({root:["root",t&&"vertical"],scroller:["scroller",r&&"fixed",o&&"hideScrollbar",n&&"scrollableX",i&&"scrollableY"],list:["list","flexContainer",t&&"flexContainerVertical",t&&"vertical",a&&"centered"],indicator:["indicator"],scrollButtons:["scrollButtons",s&&"scrollButtonsHideMobile"],scrollableX:[n&&"scrollableX"],hideScrollbar:[o&&"hideScrollbar"]},RPe,l)},Tht=ne("div",{name:"MuiTabs",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[{[`& .${vV.scrollButtons}`]:t.scrollButtons},{[`& .${vV.scrollButtons}`]:r.scrollButtonsHideMobile&&t.scrollButtonsHideMobile},t.root,r.vertical&&t.vertical]}})(nt(({theme:e})=>({overflow:"hidden",minHeight:48,WebkitOverflowScrolling:"touch",display:"flex",variants:[{props:({ownerState:t})=>t.vertical,style:{flexDirection:"column"}},{props:({ownerState:t})=>t.scrollButtonsHideMobile,style:{[`& .${vV.scrollButtons}`]:{[e.breakpoints.down("sm")]:{display:"none"}}}}]}))),wht=ne("div",{name:"MuiTabs",slot:"Scroller",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.scroller,r.fixed&&t.fixed,r.hideScrollbar&&t.hideScrollbar,r.scrollableX&&t.scrollableX,r.scrollableY&&t.scrollableY]}})({position:"relative",display:"inline-block",flex:"1 1 auto",whiteSpace:"nowrap",variants:[{props:({ownerState:e})=>e.fixed,style:{overflowX:"hidden",width:"100%"}},{props:({ownerState:e})=>e.hideScrollbar,style:{scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}},{props:({ownerState:e})=>e.scrollableX,style:{overflowX:"auto",overflowY:"hidden"}},{props:({ownerState:e})=>e.scrollableY,style:{overflowY:"auto",overflowX:"hidden"}}]}),_ht=ne("div",{name:"MuiTabs",slot:"List",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.list,t.flexContainer,r.vertical&&t.flexContainerVertical,r.centered&&t.centered]}})({display:"flex",variants:[{props:({ownerState:e})=>e.vertical,style:{flexDirection:"column"}},{props:({ownerState:e})=>e.centered,style:{justifyContent:"center"}}]}),Cht=ne("span",{name:"MuiTabs",slot:"Indicator"})(nt(({theme:e})=>({position:"absolute",height:2,bottom:0,width:"100%",transition:e.transitions.create(),variants:[{props:{indicatorColor:"primary"},style:{backgroundColor:(e.vars||e).palette.primary.main}},{props:{indicatorColor:"secondary"},style:{backgroundColor:(e.vars||e).palette.secondary.main}},{props:({ownerState:t})=>t.vertical,style:{height:"100%",width:2,right:0}}]}))),Pht=ne(YQ)({overflowX:"auto",overflowY:"hidden",scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}),IPe={};var Rht=cn.forwardRef(function(t,r){let o=et({props:t,name:"MuiTabs"}),n=lo(),i=ro(),{"aria-label":a,"aria-labelledby":s,action:l,centered:u=!1,children:c,className:p,component:f="div",allowScrollButtonsMobile:d=!1,indicatorColor:m="primary",onChange:h,orientation:g="horizontal",ScrollButtonComponent:v,scrollButtons:y="auto",selectionFollowsFocus:x,slots:b={},slotProps:S={},TabIndicatorProps:T={},TabScrollButtonProps:w={},textColor:C="primary",value:P,variant:R="standard",visibleScrollbar:M=!1,...E}=o,I=R==="scrollable",k=g==="vertical",N=k?"scrollTop":"scrollLeft",O=k?"top":"left",F=k?"bottom":"right",V=k?"clientHeight":"clientWidth",B=k?"height":"width",$={...o,component:f,allowScrollButtonsMobile:d,indicatorColor:m,orientation:g,vertical:k,scrollButtons:y,textColor:C,variant:R,visibleScrollbar:M,fixed:!I,hideScrollbar:I&&!M,scrollableX:I&&!k,scrollableY:I&&k,centered:u&&!I,scrollButtonsHideMobile:!d},G=Sht($),W=Af({elementType:b.StartScrollButtonIcon,externalSlotProps:S.startScrollButtonIcon,ownerState:$}),j=Af({elementType:b.EndScrollButtonIcon,externalSlotProps:S.endScrollButtonIcon,ownerState:$}),[X,J]=cn.useState(!1),[ee,de]=cn.useState(IPe),[fe,ie]=cn.useState(!1),[ue,pe]=cn.useState(!1),[ye,ze]=cn.useState(!1),[Ee,Pe]=cn.useState({overflow:"hidden",scrollbarWidth:0}),Ye=new Map,_e=cn.useRef(null),be=cn.useRef(null),He={slots:b,slotProps:{indicator:T,scrollButtons:w,...S}},qe=()=>{let Ut=_e.current,Tt;if(Ut){let Lr=Ut.getBoundingClientRect();Tt={clientWidth:Ut.clientWidth,scrollLeft:Ut.scrollLeft,scrollTop:Ut.scrollTop,scrollWidth:Ut.scrollWidth,top:Lr.top,bottom:Lr.bottom,left:Lr.left,right:Lr.right}}let Ir;if(Ut&&P!==!1){let Lr=be.current.children;if(Lr.length>0){let Ro=Lr[Ye.get(P)];Ir=Ro?Ro.getBoundingClientRect():null}}return{tabsMeta:Tt,tabMeta:Ir}},bt=gp(()=>{let{tabsMeta:Ut,tabMeta:Tt}=qe(),Ir=0,Lr;k?(Lr="top",Tt&&Ut&&(Ir=Tt.top-Ut.top+Ut.scrollTop)):(Lr=i?"right":"left",Tt&&Ut&&(Ir=(i?-1:1)*(Tt[Lr]-Ut[Lr]+Ut.scrollLeft)));let Ro={[Lr]:Ir,[B]:Tt?Tt[B]:0};if(typeof ee[Lr]!="number"||typeof ee[B]!="number")de(Ro);else{let Eo=Math.abs(ee[Lr]-Ro[Lr]),Vi=Math.abs(ee[B]-Ro[B]);(Eo>=1||Vi>=1)&&de(Ro)}}),rt=(Ut,{animation:Tt=!0}={})=>{Tt?WQ(N,_e.current,Ut,{duration:n.transitions.duration.standard}):_e.current[N]=Ut},mr=Ut=>{let Tt=_e.current[N];k?Tt+=Ut:Tt+=Ut*(i?-1:1),rt(Tt)},Ze=()=>{let Ut=_e.current[V],Tt=0,Ir=Array.from(be.current.children);for(let Lr=0;Lr<Ir.length;Lr+=1){let Ro=Ir[Lr];if(Tt+Ro[V]>Ut){Lr===0&&(Tt=Ut);break}Tt+=Ro[V]}return Tt},zt=()=>{mr(-1*Ze())},Lt=()=>{mr(Ze())},[qt,{onChange:Dt,...ht}]=At("scrollbar",{className:le(G.scrollableX,G.hideScrollbar),elementType:Pht,shouldForwardComponentProp:!0,externalForwardedProps:He,ownerState:$}),Bt=cn.useCallback(Ut=>{Dt?.(Ut),Pe({overflow:null,scrollbarWidth:Ut})},[Dt]),[je,Et]=At("scrollButtons",{className:le(G.scrollButtons,w.className),elementType:ZQ,externalForwardedProps:He,ownerState:$,additionalProps:{orientation:g,slots:{StartScrollButtonIcon:b.startScrollButtonIcon||b.StartScrollButtonIcon,EndScrollButtonIcon:b.endScrollButtonIcon||b.EndScrollButtonIcon},slotProps:{startScrollButtonIcon:W,endScrollButtonIcon:j}}}),ir=()=>{let Ut={};Ut.scrollbarSizeListener=I?(0,Sg.jsx)(qt,{...ht,onChange:Bt}):null;let Ir=I&&(y==="auto"&&(fe||ue)||y===!0);return Ut.scrollButtonStart=Ir?(0,Sg.jsx)(je,{direction:i?"right":"left",onClick:zt,disabled:!fe,...Et}):null,Ut.scrollButtonEnd=Ir?(0,Sg.jsx)(je,{direction:i?"left":"right",onClick:Lt,disabled:!ue,...Et}):null,Ut},ar=gp(Ut=>{let{tabsMeta:Tt,tabMeta:Ir}=qe();if(!(!Ir||!Tt)){if(Ir[O]<Tt[O]){let Lr=Tt[N]+(Ir[O]-Tt[O]);rt(Lr,{animation:Ut})}else if(Ir[F]>Tt[F]){let Lr=Tt[N]+(Ir[F]-Tt[F]);rt(Lr,{animation:Ut})}}}),Ao=gp(()=>{I&&y!==!1&&ze(!ye)});cn.useEffect(()=>{let Ut=wC(()=>{_e.current&&bt()}),Tt,Ir=Eo=>{Eo.forEach(Vi=>{Vi.removedNodes.forEach(ra=>{Tt?.unobserve(ra)}),Vi.addedNodes.forEach(ra=>{Tt?.observe(ra)})}),Ut(),Ao()},Lr=im(_e.current);Lr.addEventListener("resize",Ut);let Ro;return typeof ResizeObserver<"u"&&(Tt=new ResizeObserver(Ut),Array.from(be.current.children).forEach(Eo=>{Tt.observe(Eo)})),typeof MutationObserver<"u"&&(Ro=new MutationObserver(Ir),Ro.observe(be.current,{childList:!0})),()=>{Ut.clear(),Lr.removeEventListener("resize",Ut),Ro?.disconnect(),Tt?.disconnect()}},[bt,Ao]),cn.useEffect(()=>{let Ut=Array.from(be.current.children),Tt=Ut.length;if(typeof IntersectionObserver<"u"&&Tt>0&&I&&y!==!1){let Ir=Ut[0],Lr=Ut[Tt-1],Ro={root:_e.current,threshold:.99},Eo=$i=>{ie(!$i[0].isIntersecting)},Vi=new IntersectionObserver(Eo,Ro);Vi.observe(Ir);let ra=$i=>{pe(!$i[0].isIntersecting)},Sn=new IntersectionObserver(ra,Ro);return Sn.observe(Lr),()=>{Vi.disconnect(),Sn.disconnect()}}},[I,y,ye,c?.length]),cn.useEffect(()=>{J(!0)},[]),cn.useEffect(()=>{bt()}),cn.useEffect(()=>{ar(IPe!==ee)},[ar,ee]),cn.useImperativeHandle(l,()=>({updateIndicator:bt,updateScrollButtons:Ao}),[bt,Ao]);let[Yn,jo]=At("indicator",{className:le(G.indicator,T.className),elementType:Cht,externalForwardedProps:He,ownerState:$,additionalProps:{style:ee}}),Ot=(0,Sg.jsx)(Yn,{...jo}),sr=0,Ur=cn.Children.map(c,Ut=>{if(!cn.isValidElement(Ut))return null;let Tt=Ut.props.value===void 0?sr:Ut.props.value;Ye.set(Tt,sr);let Ir=Tt===P;return sr+=1,cn.cloneElement(Ut,{fullWidth:R==="fullWidth",indicator:Ir&&!X&&Ot,selected:Ir,selectionFollowsFocus:x,onChange:h,textColor:C,value:Tt,...sr===1&&P===!1&&!Ut.props.tabIndex?{tabIndex:0}:{}})}),dn=Ut=>{if(Ut.altKey||Ut.shiftKey||Ut.ctrlKey||Ut.metaKey)return;let Tt=be.current,Ir=gg(ag(Tt));if(Ir?.getAttribute("role")!=="tab")return;let Ro=g==="horizontal"?"ArrowLeft":"ArrowUp",Eo=g==="horizontal"?"ArrowRight":"ArrowDown";switch(g==="horizontal"&&i&&(Ro="ArrowRight",Eo="ArrowLeft"),Ut.key){case Ro:Ut.preventDefault(),yV(Tt,Ir,MPe);break;case Eo:Ut.preventDefault(),yV(Tt,Ir,EPe);break;case"Home":Ut.preventDefault(),yV(Tt,null,EPe);break;case"End":Ut.preventDefault(),yV(Tt,null,MPe);break;default:break}},mn=ir(),[_t,Ui]=At("root",{ref:r,className:le(G.root,p),elementType:Tht,externalForwardedProps:{...He,...E,component:f},ownerState:$}),[Ts,On]=At("scroller",{ref:_e,className:G.scroller,elementType:wht,externalForwardedProps:He,ownerState:$,additionalProps:{style:{overflow:Ee.overflow,[k?`margin${i?"Left":"Right"}`:"marginBottom"]:M?void 0:-Ee.scrollbarWidth}}}),[Qt,tr]=At("list",{ref:be,className:le(G.list,G.flexContainer),elementType:_ht,externalForwardedProps:He,ownerState:$,getSlotProps:Ut=>({...Ut,onKeyDown:Tt=>{dn(Tt),Ut.onKeyDown?.(Tt)}})});return(0,Sg.jsxs)(_t,{...Ui,children:[mn.scrollButtonStart,mn.scrollbarSizeListener,(0,Sg.jsxs)(Ts,{...On,children:[(0,Sg.jsx)(Qt,{"aria-label":a,"aria-labelledby":s,"aria-orientation":g==="vertical"?"vertical":null,role:"tablist",...tr,children:Ur}),X&&Ot]}),mn.scrollButtonEnd]})}),qQ=Rht;var OPe=z(K(),1);gt();function DPe(e){return We("MuiTextField",e)}var vCr=Be("MuiTextField",["root"]);var X0=z(Q(),1),Eht={standard:oD,filled:rD,outlined:pD},Mht=e=>{let{classes:t}=e;return ce({root:["root"]},DPe,t)},Iht=ne(Iy,{name:"MuiTextField",slot:"Root"})({}),Dht=OPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiTextField"}),{autoComplete:n,autoFocus:i=!1,children:a,className:s,color:l="primary",defaultValue:u,disabled:c=!1,error:p=!1,FormHelperTextProps:f,fullWidth:d=!1,helperText:m,id:h,InputLabelProps:g,inputProps:v,InputProps:y,inputRef:x,label:b,maxRows:S,minRows:T,multiline:w=!1,name:C,onBlur:P,onChange:R,onFocus:M,placeholder:E,required:I=!1,rows:k,select:N=!1,SelectProps:O,slots:F={},slotProps:V={},type:B,value:$,variant:G="outlined",...W}=o,j={...o,autoFocus:i,color:l,disabled:c,error:p,fullWidth:d,multiline:w,required:I,select:N,variant:G},X=Mht(j),J=Jt(h),ee=m&&J?`${J}-helper-text`:void 0,de=b&&J?`${J}-label`:void 0,fe=Eht[G],ie={slots:F,slotProps:{input:y,inputLabel:g,htmlInput:v,formHelperText:f,select:O,...V}},ue={},pe=ie.slotProps.inputLabel;G==="outlined"&&(pe&&typeof pe.shrink<"u"&&(ue.notched=pe.shrink),ue.label=b),N&&((!O||!O.native)&&(ue.id=void 0),ue["aria-describedby"]=void 0);let[ye,ze]=At("root",{elementType:Iht,shouldForwardComponentProp:!0,externalForwardedProps:{...ie,...W},ownerState:j,className:le(X.root,s),ref:r,additionalProps:{disabled:c,error:p,fullWidth:d,required:I,color:l,variant:G}}),[Ee,Pe]=At("input",{elementType:fe,externalForwardedProps:ie,additionalProps:ue,ownerState:j}),[Ye,_e]=At("inputLabel",{elementType:nD,externalForwardedProps:ie,ownerState:j}),[be,He]=At("htmlInput",{elementType:"input",externalForwardedProps:ie,ownerState:j}),[qe,bt]=At("formHelperText",{elementType:hQ,externalForwardedProps:ie,ownerState:j}),[rt,mr]=At("select",{elementType:wp,externalForwardedProps:ie,ownerState:j}),Ze=(0,X0.jsx)(Ee,{"aria-describedby":ee,autoComplete:n,autoFocus:i,defaultValue:u,fullWidth:d,multiline:w,name:C,rows:k,maxRows:S,minRows:T,type:B,value:$,id:J,inputRef:x,onBlur:P,onChange:R,onFocus:M,placeholder:E,inputProps:He,slots:{input:F.htmlInput?be:void 0},...Pe});return(0,X0.jsxs)(ye,{...ze,children:[b!=null&&b!==""&&(0,X0.jsx)(Ye,{htmlFor:J,id:de,..._e,children:b}),N?(0,X0.jsx)(rt,{"aria-describedby":ee,id:J,labelId:de,value:$,input:Ze,...mr,children:a}):Ze,m&&(0,X0.jsx)(qe,{id:ee,...bt,children:m})]})}),Q0=Dht;var vD=z(K(),1);gt();function kPe(e){return We("MuiToggleButton",e)}var Oht=Be("MuiToggleButton",["root","disabled","selected","standard","primary","secondary","sizeSmall","sizeMedium","sizeLarge","fullWidth"]),Tg=Oht;var APe=z(K(),1),kht=APe.createContext({}),xV=kht;var LPe=z(K(),1),Aht=LPe.createContext(void 0),bV=Aht;function KQ(e,t){return t===void 0||e===void 0?!1:Array.isArray(t)?t.includes(e):e===t}var NPe=z(Q(),1),Lht=e=>{let{classes:t,fullWidth:r,selected:o,disabled:n,size:i,color:a}=e,s={root:["root",o&&"selected",n&&"disabled",r&&"fullWidth",`size${Te(i)}`,a]};return ce(s,kPe,t)},Nht=ne(ls,{name:"MuiToggleButton",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.root,t[`size${Te(r.size)}`]]}})(nt(({theme:e})=>({...e.typography.button,borderRadius:(e.vars||e).shape.borderRadius,padding:11,border:`1px solid ${(e.vars||e).palette.divider}`,color:(e.vars||e).palette.action.active,[`&.${Tg.disabled}`]:{color:(e.vars||e).palette.action.disabled,border:`1px solid ${(e.vars||e).palette.action.disabledBackground}`},"&:hover":{textDecoration:"none",backgroundColor:e.alpha((e.vars||e).palette.text.primary,(e.vars||e).palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},variants:[{props:{color:"standard"},style:{[`&.${Tg.selected}`]:{color:(e.vars||e).palette.text.primary,backgroundColor:e.alpha((e.vars||e).palette.text.primary,(e.vars||e).palette.action.selectedOpacity),"&:hover":{backgroundColor:e.alpha((e.vars||e).palette.text.primary,`${(e.vars||e).palette.action.selectedOpacity} + ${(e.vars||e).palette.action.hoverOpacity}`),"@media (hover: none)":{backgroundColor:e.alpha((e.vars||e).palette.text.primary,(e.vars||e).palette.action.selectedOpacity)}}}}},...Object.entries(e.palette).filter(kr()).map(([t])=>({props:{color:t},style:{[`&.${Tg.selected}`]:{color:(e.vars||e).palette[t].main,backgroundColor:e.alpha((e.vars||e).palette[t].main,(e.vars||e).palette.action.selectedOpacity),"&:hover":{backgroundColor:e.alpha((e.vars||e).palette[t].main,`${(e.vars||e).palette.action.selectedOpacity} + ${(e.vars||e).palette.action.hoverOpacity}`),"@media (hover: none)":{backgroundColor:e.alpha((e.vars||e).palette[t].main,(e.vars||e).palette.action.selectedOpacity)}}}}})),{props:{fullWidth:!0},style:{width:"100%"}},{props:{size:"small"},style:{padding:7,fontSize:e.typography.pxToRem(13)}},{props:{size:"large"},style:{padding:15,fontSize:e.typography.pxToRem(15)}}]}))),zht=vD.forwardRef(function(t,r){let{value:o,...n}=vD.useContext(xV),i=vD.useContext(bV),a=_u({...n,selected:KQ(t.value,o)},t),s=et({props:a,name:"MuiToggleButton"}),{children:l,className:u,color:c="standard",disabled:p=!1,disableFocusRipple:f=!1,fullWidth:d=!1,onChange:m,onClick:h,selected:g,size:v="medium",value:y,...x}=s,b={...s,color:c,disabled:p,disableFocusRipple:f,fullWidth:d,size:v},S=Lht(b),T=C=>{h&&(h(C,y),C.defaultPrevented)||m&&m(C,y)},w=i||"";return(0,NPe.jsx)(Nht,{className:le(n.className,S.root,u,w),disabled:p,focusRipple:!f,ref:r,onClick:T,onChange:m,value:y,ownerState:b,"aria-pressed":g,...x,children:l})}),zy=zht;var J0=z(K(),1);gt();function zPe(e){return We("MuiToggleButtonGroup",e)}var Fht=Be("MuiToggleButtonGroup",["root","selected","horizontal","vertical","disabled","grouped","groupedHorizontal","groupedVertical","fullWidth","firstButton","lastButton","middleButton"]),Pn=Fht;var SV=z(Q(),1),Uht=e=>{let{classes:t,orientation:r,fullWidth:o,disabled:n}=e,i={root:["root",r,o&&"fullWidth"],grouped:["grouped",`grouped${Te(r)}`,n&&"disabled"],firstButton:["firstButton"],lastButton:["lastButton"],middleButton:["middleButton"]};return ce(i,zPe,t)},Vht=ne("div",{name:"MuiToggleButtonGroup",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[{[`& .${Pn.grouped}`]:t.grouped},{[`& .${Pn.grouped}`]:t[`grouped${Te(r.orientation)}`]},{[`& .${Pn.firstButton}`]:t.firstButton},{[`& .${Pn.lastButton}`]:t.lastButton},{[`& .${Pn.middleButton}`]:t.middleButton},t.root,r.orientation==="vertical"&&t.vertical,r.fullWidth&&t.fullWidth]}})(nt(({theme:e})=>({display:"inline-flex",borderRadius:(e.vars||e).shape.borderRadius,variants:[{props:{orientation:"vertical"},style:{flexDirection:"column",[`& .${Pn.grouped}`]:{[`&.${Pn.selected} + .${Pn.grouped}.${Pn.selected}`]:{borderTop:0,marginTop:0}},[`& .${Pn.firstButton},& .${Pn.middleButton}`]:{borderBottomLeftRadius:0,borderBottomRightRadius:0},[`& .${Pn.lastButton},& .${Pn.middleButton}`]:{marginTop:-1,borderTop:"1px solid transparent",borderTopLeftRadius:0,borderTopRightRadius:0},[`& .${Pn.lastButton}.${Tg.disabled},& .${Pn.middleButton}.${Tg.disabled}`]:{borderTop:"1px solid transparent"}}},{props:{fullWidth:!0},style:{width:"100%"}},{props:{orientation:"horizontal"},style:{[`& .${Pn.grouped}`]:{[`&.${Pn.selected} + .${Pn.grouped}.${Pn.selected}`]:{borderLeft:0,marginLeft:0}},[`& .${Pn.firstButton},& .${Pn.middleButton}`]:{borderTopRightRadius:0,borderBottomRightRadius:0},[`& .${Pn.lastButton},& .${Pn.middleButton}`]:{marginLeft:-1,borderLeft:"1px solid transparent",borderTopLeftRadius:0,borderBottomLeftRadius:0},[`& .${Pn.lastButton}.${Tg.disabled},& .${Pn.middleButton}.${Tg.disabled}`]:{borderLeft:"1px solid transparent"}}}]}))),$ht=J0.forwardRef(function(t,r){let o=et({props:t,name:"MuiToggleButtonGroup"}),{children:n,className:i,color:a="standard",disabled:s=!1,exclusive:l=!1,fullWidth:u=!1,onChange:c,orientation:p="horizontal",size:f="medium",value:d,...m}=o,h={...o,disabled:s,fullWidth:u,orientation:p,size:f},g=Uht(h),v=J0.useCallback((w,C)=>{if(!c)return;let P=d&&d.indexOf(C),R;d&&P>=0?(R=d.slice(),R.splice(P,1)):R=d?d.concat(C):[C],c(w,R)},[c,d]),y=J0.useCallback((w,C)=>{c&&c(w,d===C?null:C)},[c,d]),x=J0.useMemo(()=>({className:g.grouped,onChange:l?y:v,value:d,size:f,fullWidth:u,color:a,disabled:s}),[g.grouped,l,y,v,d,f,u,a,s]),b=$U(n),S=b.length,T=w=>{let C=w===0,P=w===S-1;return C&&P?"":C?g.firstButton:P?g.lastButton:g.middleButton};return(0,SV.jsx)(Vht,{role:"group",className:le(g.root,i),ref:r,ownerState:h,...m,children:(0,SV.jsx)(xV.Provider,{value:x,children:b.map((w,C)=>(0,SV.jsx)(bV.Provider,{value:T(C),children:w},C))})})}),eP=$ht;var Bht=XK({themeId:ka}),XQ=Bht;var tP=z(K());async function ll(e){let t=await fetch(e),r=await t.json();if(!t.ok||!r.success)throw new Error(r.error);return r.data}function FPe(){let t=`config?${ul()}`;return ws({queryKey:[t],queryFn:()=>ll(t)})}var yD=z(Q()),UPe=(0,tP.createContext)(void 0);function VPe({children:e}){let{i18n:t}=Nr(),{isPending:r,error:o,data:n}=FPe();return(0,tP.useEffect)(()=>{n?.language&&t.changeLanguage(n.language)},[t,n?.language]),r?(0,yD.jsx)(_c,{sx:{display:"flex",justifyContent:"center",my:5},children:(0,yD.jsx)(xp,{})}):o?(0,yD.jsx)(un,{severity:"error",children:o.message}):(0,yD.jsx)(UPe.Provider,{value:{config:n},children:e})}function Pc(){let e=(0,tP.useContext)(UPe);if(e===void 0)throw new Error("No ConfigContext found. Did you forget a ConfigProvider?");return e}var hi=z(Q());function $Pe(){let{t:e}=Nr();return(0,hi.jsxs)(_c,{className:"headerline",sx:{".active":{color:"inherit"}},children:[(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/portfolio",search:Rc,children:e("Portfolio")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/performance",search:Rc,children:e("Performance")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/returns",search:Rc,children:e("Returns")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/metrics",search:Rc,children:e("Metrics")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/dividends",search:Rc,children:e("Dividends")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/cash_flows",search:Rc,children:e("Cash Flows")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/groups",search:Rc,children:e("Groups")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/investments",search:Rc,children:e("Investments")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/missing_prices",search:Rc,children:e("Missing Prices")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/help",search:Rc,children:e("Help")})})]})}var oP=z(BPe());var _V=z(K());var JQ=z(K());function za(e,t){let r=e.useSearch({select:i=>i[t]}),o=e.useNavigate(),n=(0,JQ.useCallback)(i=>o({to:".",search:a=>({...a,[t]:i}),replace:!0}),[t,o]);return[r,n]}function TV(e){let t=Mv({strict:!1,select:n=>n[e]}),r=Iv(),o=(0,JQ.useCallback)(n=>r({to:".",search:i=>({...i,[e]:n}),replace:!0}),[e,r]);return[t,o]}function wV([e,t],r="~"){return[e?e.split(r):[],o=>t(o.length>0?o.join(r):void 0)]}var jPe=z(Q()),GPe=(0,_V.createContext)(void 0);function HPe({children:e}){let{config:t}=Pc(),[r,o]=wV(TV("investments")),[n,i]=TV("currency"),a=n??t?.operatingCurrencies[0]??"USD",s=f=>i(f!==t?.operatingCurrencies[0]?f:void 0),[l,u]=TV("time"),c=Ght(typeof l=="number"?String(l):l),p=f=>u(f==="MAX"?void 0:CV[f]);return(0,jPe.jsx)(GPe.Provider,{value:{investmentFilter:r,setInvestmentFilter:o,targetCurrency:a,setTargetCurrency:s,dateRange:c,setDateRange:p},children:e})}function gi(){let e=(0,_V.useContext)(GPe);if(e===void 0)throw new Error("No ToolbarContext found. Did you forget a ToolbarProvider?");return e}function Ght(e){if(!e)return"MAX";for(let[t,r]of Object.entries(CV))if(r===e)return t}var eJ=z(Q()),CV={"3M":(0,oP.default)().subtract(3,"months").format("YYYY-MM-DD")+" - day","6M":(0,oP.default)().subtract(6,"months").format("YYYY-MM-DD")+" - day",YTD:"year - day","1Y":(0,oP.default)().subtract(1,"years").format("YYYY-MM-DD")+" - day","3Y":(0,oP.default)().subtract(3,"years").format("YYYY-MM-DD")+" - day","5Y":(0,oP.default)().subtract(5,"years").format("YYYY-MM-DD")+" - day",MAX:void 0};function WPe(){let{dateRange:e,setDateRange:t}=gi();return(0,eJ.jsx)(eP,{value:e,onChange:(r,o)=>t(o),exclusive:!0,children:Object.keys(CV).map(r=>(0,eJ.jsx)(zy,{value:r,children:r},r))})}var YPe=z(Q(),1),ZPe=Xr((0,YPe.jsx)("path",{d:"M19 3H5c-1.11 0-2 .9-2 2v14c0 1.1.89 2 2 2h14c1.11 0 2-.9 2-2V5c0-1.1-.89-2-2-2m-9 14-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8z"}),"CheckBox");var qPe=z(Q(),1),KPe=Xr((0,qPe.jsx)("path",{d:"M19 5v14H5V5zm0-2H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2"}),"CheckBoxOutlineBlank");var Vf=z(Q());function PV({label:e,types:t,includeAllCurrencies:r,investments:o,setInvestments:n}){let{config:i}=Pc(),a=lo(),s=[];(!t||t.includes("Group"))&&s.push(...i.investmentsConfig.groups.map(p=>({type:"Group",id:p.id,label:p.name,chipLabel:p.name})).sort((p,f)=>p.label.localeCompare(f.label))),(!t||t.includes("Account"))&&s.push(...i.investmentsConfig.accounts.map(p=>({type:"Account",id:p.id,label:p.assetAccount,chipLabel:p.assetAccount})).sort((p,f)=>p.label.localeCompare(f.label))),(!t||t.includes("Currency"))&&s.push(...i.investmentsConfig.currencies.filter(p=>p.isInvestment||r).map(p=>({type:"Currency",id:p.id,label:`${p.name} (${p.currency})`,chipLabel:p.currency})).sort((p,f)=>p.label.localeCompare(f.label)));let l=o.map(p=>s.find(f=>f.id===p)).filter(p=>p!==void 0),u=(p,f)=>{n(f.map(d=>d.id))},c=a.palette.mode==="dark"?"background.default":rI[100];return(0,Vf.jsx)(UC,{multiple:!0,limitTags:4,disableCloseOnSelect:!0,value:l,onChange:u,options:s,getOptionKey:p=>p.id,renderOption:(p,f,{selected:d})=>{let{key:m,...h}=p;return(0,Vf.jsxs)("li",{...h,children:[(0,Vf.jsx)($C,{icon:(0,Vf.jsx)(KPe,{fontSize:"small"}),checkedIcon:(0,Vf.jsx)(ZPe,{fontSize:"small"}),style:{marginRight:8},checked:d}),(0,Vf.jsx)(Hht,{type:f.type,sx:{marginRight:1}}),f.label]},m)},renderTags:(p,f)=>p.map((d,m)=>{let{key:h,...g}=f({index:m});return(0,Vf.jsx)(lm,{label:d.chipLabel,variant:"outlined",sx:{backgroundColor:c,border:`1px solid ${tJ[d.type]}`},...g},d.id)}),style:{width:800},renderInput:p=>(0,Vf.jsx)(Q0,{...p,label:e})})}function Hht({type:e,sx:t}){return(0,Vf.jsx)(lm,{label:jht[e],variant:"outlined",size:"small",sx:{...t,color:tJ[e],borderColor:tJ[e]}})}var jht={Account:"ACC",Group:"GRP",Currency:"CUR"},tJ={Account:Jd[500],Group:CK[500],Currency:PK[500]};var QPe=z(Q());function XPe(){let{t:e}=Nr(),{investmentFilter:t,setInvestmentFilter:r}=gi();return(0,QPe.jsx)(PV,{label:e("Investments Filter"),types:["Group","Account","Currency"],investments:t,setInvestments:r})}var rJ=z(Q());function JPe(){let{config:e}=Pc(),{targetCurrency:t,setTargetCurrency:r}=gi();return(0,rJ.jsx)(eP,{value:t,onChange:(o,n)=>r(n),exclusive:!0,children:e.operatingCurrencies.map(o=>(0,rJ.jsx)(zy,{value:o,children:o},o))})}var eS=z(Q());function e1e(){let e=D3(),t=e[e.length-1]?.staticData,r=t?.showInvestmentsSelection!==!1,o=t?.showDateRangeSelection!==!1,n=t?.showCurrencySelection!==!1;return(0,eS.jsxs)(Ny,{sx:{flexDirection:"row",justifyContent:"flex-end",alignItems:"center",gap:2,marginBottom:2},children:[r&&(0,eS.jsx)(XPe,{}),o&&(0,eS.jsx)(WPe,{}),n&&(0,eS.jsx)(_c,{children:(0,eS.jsx)(JPe,{})})]})}var a1e=z(Q()),t1e="#af3d3d",r1e="#3daf46",o1e="120, 44%, 53%",n1e="0, 90%, 40%",oJ={"green-red":{pnl:{profit:r1e,loss:t1e},trend:{positive(e=1){return`hsla(${o1e}, ${e})`},negative(e=1){return`hsla(${n1e}, ${e})`}}},"red-green":{pnl:{profit:t1e,loss:r1e},trend:{positive(e=1){return`hsla(${n1e}, ${e})`},negative(e=1){return`hsla(${o1e}, ${e})`}}}};function i1e({children:e}){let{config:t}=Pc(),r=XQ("(prefers-color-scheme: dark)"),o=Wht()??(r?"dark":"light"),n=Yht(),i=t.pnlColorScheme&&t.pnlColorScheme in oJ?oJ[t.pnlColorScheme]:oJ[n],a=nm({cssVariables:!0,palette:{mode:o},typography:{fontFamily:""},...i});return(0,a1e.jsx)(lU,{theme:a,children:e})}function Wht(){switch(document.documentElement.style.colorScheme){case"light":return"light";case"dark":return"dark";default:return}}function Yht(){switch(new Intl.Locale(navigator.language).region){case"CN":case"JP":return"red-green";default:return"green-red"}}var wg=z(Q()),Zht=["account","charts","conversion","filter","interval","time"],qht=[...Zht,"investments","currency"];function Rc(e){return Object.fromEntries(Object.entries(e).filter(([t])=>qht.includes(t)))}var Kht=Hr.object({time:Hr.union([Hr.string(),Hr.number()]).optional(),account:Hr.string().optional(),filter:Hr.string().optional(),investments:Hr.string().optional(),currency:Hr.string().optional()}),$n=C3({validateSearch:Kht,component:Xht});function Xht(){return(0,wg.jsx)(VPe,{children:(0,wg.jsx)(i1e,{children:(0,wg.jsxs)(HPe,{children:[(0,wg.jsx)($Pe,{}),(0,wg.jsx)(e1e,{}),(0,wg.jsx)(EL,{}),(0,wg.jsx)(Iye,{})]})})})}function Qht(){return $n.useSearch({select:e=>({time:e.time,account:e.account,filter:e.filter})})}function ul(){let e=Qht();return new URLSearchParams({...e.time?{time:String(e.time)}:{},...e.account?{account:e.account}:{},...e.filter?{filter:e.filter}:{}})}var s1e=Nn({getParentRoute:()=>$n,path:"/",loader:async()=>{throw Pv({to:"/portfolio",search:Rc})}});function nJ(e){let t=ul();t.set("investments",e.investmentFilter.join(",")),t.set("currency",e.targetCurrency),t.set("interval",e.interval);let r=`cash_flows?${t}`;return ws({queryKey:[r],queryFn:()=>ll(r)})}var $f=z(Q());function ps({children:e}){let t=lo();return(0,$f.jsx)(Ny,{sx:{flexDirection:"column",mx:"-1.5em",marginBottom:"-1.5em",padding:"1.5em",gap:2,backgroundColor:t.palette.mode==="dark"?void 0:"#FAFBFB"},children:e})}function Bn({sx:e,children:t}){return(0,$f.jsx)(Ny,{sx:{flexDirection:"row",gap:2,alignItems:"flex-start",...e},children:t})}function Uo({title:e,help:t,topRightElem:r,sx:o,children:n}){return(0,$f.jsxs)(BU,{variant:"outlined",sx:{flex:1,padding:2,overflow:"auto",...o},children:[(0,$f.jsxs)(Ny,{sx:{flexDirection:"row",justifyContent:"space-between"},children:[(0,$f.jsx)("h3",{children:e}),r]}),t&&(0,$f.jsx)("p",{style:{whiteSpace:"pre-line",maxWidth:"80%"},children:t}),n]})}function nP({active:e,setActive:t,children:r}){let n=(r.find(a=>a.props.id===e)??r[0]).props.children,i=(0,$f.jsx)(wp,{value:e,onChange:a=>t(a.target.value),displayEmpty:!0,size:"small",children:r.map(a=>(0,$f.jsx)(Uf,{value:a.props.id,children:a.props.label},a.props.id))});return(0,$f.jsx)(Uo,{...n.props,topRightElem:i})}function _g(e){return null}var iJ=function(e,t){return iJ=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,o){r.__proto__=o}||function(r,o){for(var n in o)Object.prototype.hasOwnProperty.call(o,n)&&(r[n]=o[n])},iJ(e,t)};function Y(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Class extends value "+String(t)+" is not a constructor or null");iJ(e,t);function r(){this.constructor=e}e.prototype=t===null?Object.create(t):(r.prototype=t.prototype,new r)}var Jht=(function(){function e(){this.firefox=!1,this.ie=!1,this.edge=!1,this.newEdge=!1,this.weChat=!1}return e})(),egt=(function(){function e(){this.browser=new Jht,this.node=!1,this.wxa=!1,this.worker=!1,this.svgSupported=!1,this.touchEventsSupported=!1,this.pointerEventsSupported=!1,this.domSupported=!1,this.transformSupported=!1,this.transform3dSupported=!1,this.hasGlobalWindow=typeof window<"u"}return e})(),Fy=new egt;typeof wx=="object"&&typeof wx.getSystemInfoSync=="function"?(Fy.wxa=!0,Fy.touchEventsSupported=!0):typeof document>"u"&&typeof self<"u"?Fy.worker=!0:!Fy.hasGlobalWindow||"Deno"in window||typeof navigator<"u"&&typeof navigator.userAgent=="string"&&navigator.userAgent.indexOf("Node.js")>-1?(Fy.node=!0,Fy.svgSupported=!0):tgt(navigator.userAgent,Fy);function tgt(e,t){var r=t.browser,o=e.match(/Firefox\/([\d.]+)/),n=e.match(/MSIE\s([\d.]+)/)||e.match(/Trident\/.+?rv:(([\d.]+))/),i=e.match(/Edge?\/([\d.]+)/),a=/micromessenger/i.test(e);o&&(r.firefox=!0,r.version=o[1]),n&&(r.ie=!0,r.version=n[1]),i&&(r.edge=!0,r.version=i[1],r.newEdge=+i[1].split(".")[0]>18),a&&(r.weChat=!0),t.svgSupported=typeof SVGRect<"u",t.touchEventsSupported="ontouchstart"in window&&!r.ie&&!r.edge,t.pointerEventsSupported="onpointerdown"in window&&(r.edge||r.ie&&+r.version>=11);var s=t.domSupported=typeof document<"u";if(s){var l=document.documentElement.style;t.transform3dSupported=(r.ie&&"transition"in l||r.edge||"WebKitCSSMatrix"in window&&"m11"in new WebKitCSSMatrix||"MozPerspective"in l)&&!("OTransition"in l),t.transformSupported=t.transform3dSupported||r.ie&&+r.version>=9}}var rr=Fy;var RV=12,aJ="sans-serif",Ru=RV+"px "+aJ,rgt=20,ogt=100,ngt="007LLmW'55;N0500LLLLLLLLLL00NNNLzWW\\\\WQb\\0FWLg\\bWb\\WQ\\WrWWQ000CL5LLFLL0LL**F*gLLLL5F0LF\\FFF5.5N";function igt(e){var t={};if(typeof JSON>"u")return t;for(var r=0;r<e.length;r++){var o=String.fromCharCode(r+32),n=(e.charCodeAt(r)-rgt)/ogt;t[o]=n}return t}var agt=igt(ngt),Fa={createCanvas:function(){return typeof document<"u"&&document.createElement("canvas")},measureText:(function(){var e,t;return function(r,o){if(!e){var n=Fa.createCanvas();e=n&&n.getContext("2d")}if(e)return t!==o&&(t=e.font=o||Ru),e.measureText(r);r=r||"",o=o||Ru;var i=/((?:\d+)?\.?\d*)px/.exec(o),a=i&&+i[1]||RV,s=0;if(o.indexOf("mono")>=0)s=a*r.length;else for(var l=0;l<r.length;l++){var u=agt[r[l]];s+=u==null?a:u*a}return{width:s}}})(),loadImage:function(e,t,r){var o=new Image;return o.onload=t,o.onerror=r,o.src=e,o}};var c1e=Us(["Function","RegExp","Date","Error","CanvasGradient","CanvasPattern","Image","Canvas"],function(e,t){return e["[object "+t+"]"]=!0,e},{}),p1e=Us(["Int8","Uint8","Uint8Clamped","Int16","Uint16","Int32","Uint32","Float32","Float64"],function(e,t){return e["[object "+t+"Array]"]=!0,e},{}),iP=Object.prototype.toString,MV=Array.prototype,sgt=MV.forEach,lgt=MV.filter,sJ=MV.slice,ugt=MV.map,l1e=function(){}.constructor,EV=l1e?l1e.prototype:null,lJ="__proto__",cgt=2311;function IV(){return cgt++}function tS(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];typeof console<"u"&&console.error.apply(console,e)}function $e(e){if(e==null||typeof e!="object")return e;var t=e,r=iP.call(e);if(r==="[object Array]"){if(!xD(e)){t=[];for(var o=0,n=e.length;o<n;o++)t[o]=$e(e[o])}}else if(p1e[r]){if(!xD(e)){var i=e.constructor;if(i.from)t=i.from(e);else{t=new i(e.length);for(var o=0,n=e.length;o<n;o++)t[o]=e[o]}}}else if(!c1e[r]&&!xD(e)&&!Uy(e)){t={};for(var a in e)e.hasOwnProperty(a)&&a!==lJ&&(t[a]=$e(e[a]))}return t}function Rt(e,t,r){if(!Ge(t)||!Ge(e))return r?$e(t):e;for(var o in t)if(t.hasOwnProperty(o)&&o!==lJ){var n=e[o],i=t[o];Ge(i)&&Ge(n)&&!oe(i)&&!oe(n)&&!Uy(i)&&!Uy(n)&&!u1e(i)&&!u1e(n)&&!xD(i)&&!xD(n)?Rt(n,i,r):(r||!(o in e))&&(e[o]=$e(t[o]))}return e}function aP(e,t){for(var r=e[0],o=1,n=e.length;o<n;o++)r=Rt(r,e[o],t);return r}function re(e,t){if(Object.assign)Object.assign(e,t);else for(var r in t)t.hasOwnProperty(r)&&r!==lJ&&(e[r]=t[r]);return e}function Fe(e,t,r){for(var o=Nt(t),n=0,i=o.length;n<i;n++){var a=o[n];(r?t[a]!=null:e[a]==null)&&(e[a]=t[a])}return e}var QMr=Fa.createCanvas;function vt(e,t){if(e){if(e.indexOf)return e.indexOf(t);for(var r=0,o=e.length;r<o;r++)if(e[r]===t)return r}return-1}function f1e(e,t){var r=e.prototype;function o(){}o.prototype=t.prototype,e.prototype=new o;for(var n in r)r.hasOwnProperty(n)&&(e.prototype[n]=r[n]);e.prototype.constructor=e,e.superClass=t}function oo(e,t,r){if(e="prototype"in e?e.prototype:e,t="prototype"in t?t.prototype:t,Object.getOwnPropertyNames)for(var o=Object.getOwnPropertyNames(t),n=0;n<o.length;n++){var i=o[n];i!=="constructor"&&(r?t[i]!=null:e[i]==null)&&(e[i]=t[i])}else Fe(e,t,r)}function ri(e){return!e||typeof e=="string"?!1:typeof e.length=="number"}function L(e,t,r){if(e&&t)if(e.forEach&&e.forEach===sgt)e.forEach(t,r);else if(e.length===+e.length)for(var o=0,n=e.length;o<n;o++)t.call(r,e[o],o,e);else for(var i in e)e.hasOwnProperty(i)&&t.call(r,e[i],i,e)}function ae(e,t,r){if(!e)return[];if(!t)return DV(e);if(e.map&&e.map===ugt)return e.map(t,r);for(var o=[],n=0,i=e.length;n<i;n++)o.push(t.call(r,e[n],n,e));return o}function Us(e,t,r,o){if(e&&t){for(var n=0,i=e.length;n<i;n++)r=t.call(o,r,e[n],n,e);return r}}function er(e,t,r){if(!e)return[];if(!t)return DV(e);if(e.filter&&e.filter===lgt)return e.filter(t,r);for(var o=[],n=0,i=e.length;n<i;n++)t.call(r,e[n],n,e)&&o.push(e[n]);return o}function Bf(e,t,r){if(e&&t){for(var o=0,n=e.length;o<n;o++)if(t.call(r,e[o],o,e))return e[o]}}function Nt(e){if(!e)return[];if(Object.keys)return Object.keys(e);var t=[];for(var r in e)e.hasOwnProperty(r)&&t.push(r);return t}function pgt(e,t){for(var r=[],o=2;o<arguments.length;o++)r[o-2]=arguments[o];return function(){return e.apply(t,r.concat(sJ.call(arguments)))}}var we=EV&&Ae(EV.bind)?EV.call.bind(EV.bind):pgt;function xt(e){for(var t=[],r=1;r<arguments.length;r++)t[r-1]=arguments[r];return function(){return e.apply(this,t.concat(sJ.call(arguments)))}}function oe(e){return Array.isArray?Array.isArray(e):iP.call(e)==="[object Array]"}function Ae(e){return typeof e=="function"}function xe(e){return typeof e=="string"}function bD(e){return iP.call(e)==="[object String]"}function Ft(e){return typeof e=="number"}function Ge(e){var t=typeof e;return t==="function"||!!e&&t==="object"}function u1e(e){return!!c1e[iP.call(e)]}function Di(e){return!!p1e[iP.call(e)]}function Uy(e){return typeof e=="object"&&typeof e.nodeType=="number"&&typeof e.ownerDocument=="object"}function Vy(e){return e.colorStops!=null}function d1e(e){return e.image!=null}function m1e(e){return iP.call(e)==="[object RegExp]"}function oi(e){return e!==e}function Ko(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];for(var r=0,o=e.length;r<o;r++)if(e[r]!=null)return e[r]}function Ue(e,t){return e??t}function Gn(e,t,r){return e??t??r}function DV(e){for(var t=[],r=1;r<arguments.length;r++)t[r-1]=arguments[r];return sJ.apply(e,t)}function $y(e){if(typeof e=="number")return[e,e,e,e];var t=e.length;return t===2?[e[0],e[1],e[0],e[1]]:t===3?[e[0],e[1],e[2],e[1]]:e}function go(e,t){if(!e)throw new Error(t)}function Xi(e){return e==null?null:typeof e.trim=="function"?e.trim():e.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,"")}var h1e="__ec_primitive__";function rS(e){e[h1e]=!0}function xD(e){return e[h1e]}var fgt=(function(){function e(){this.data={}}return e.prototype.delete=function(t){var r=this.has(t);return r&&delete this.data[t],r},e.prototype.has=function(t){return this.data.hasOwnProperty(t)},e.prototype.get=function(t){return this.data[t]},e.prototype.set=function(t,r){return this.data[t]=r,this},e.prototype.keys=function(){return Nt(this.data)},e.prototype.forEach=function(t){var r=this.data;for(var o in r)r.hasOwnProperty(o)&&t(r[o],o)},e})(),g1e=typeof Map=="function";function dgt(){return g1e?new Map:new fgt}var mgt=(function(){function e(t){var r=oe(t);this.data=dgt();var o=this;t instanceof e?t.each(n):t&&L(t,n);function n(i,a){r?o.set(i,a):o.set(a,i)}}return e.prototype.hasKey=function(t){return this.data.has(t)},e.prototype.get=function(t){return this.data.get(t)},e.prototype.set=function(t,r){return this.data.set(t,r),r},e.prototype.each=function(t,r){this.data.forEach(function(o,n){t.call(r,o,n)})},e.prototype.keys=function(){var t=this.data.keys();return g1e?Array.from(t):t},e.prototype.removeKey=function(t){this.data.delete(t)},e})();function Ie(e){return new mgt(e)}function Cg(e,t){for(var r=new e.constructor(e.length+t.length),o=0;o<e.length;o++)r[o]=e[o];for(var n=e.length,o=0;o<t.length;o++)r[o+n]=t[o];return r}function By(e,t){var r;if(Object.create)r=Object.create(e);else{var o=function(){};o.prototype=e,r=new o}return t&&re(r,t),r}function OV(e){var t=e.style;t.webkitUserSelect="none",t.userSelect="none",t.webkitTapHighlightColor="rgba(0,0,0,0)",t["-webkit-touch-callout"]="none"}function tt(e,t){return e.hasOwnProperty(t)}function xo(){}var sP=180/Math.PI,JMr=Number.EPSILON||Math.pow(2,-52);function mm(e,t){return e==null&&(e=0),t==null&&(t=0),[e,t]}function Ua(e,t){return e[0]=t[0],e[1]=t[1],e}function Eu(e){return[e[0],e[1]]}function SD(e,t,r){return e[0]=t,e[1]=r,e}function uJ(e,t,r){return e[0]=t[0]+r[0],e[1]=t[1]+r[1],e}function TD(e,t,r,o){return e[0]=t[0]+r[0]*o,e[1]=t[1]+r[1]*o,e}function Gf(e,t,r){return e[0]=t[0]-r[0],e[1]=t[1]-r[1],e}function kV(e){return Math.sqrt(hgt(e))}function hgt(e){return e[0]*e[0]+e[1]*e[1]}function lP(e,t,r){return e[0]=t[0]*r,e[1]=t[1]*r,e}function _p(e,t){var r=kV(t);return r===0?(e[0]=0,e[1]=0):(e[0]=t[0]/r,e[1]=t[1]/r),e}function AV(e,t){return Math.sqrt((e[0]-t[0])*(e[0]-t[0])+(e[1]-t[1])*(e[1]-t[1]))}var Cp=AV;function ggt(e,t){return(e[0]-t[0])*(e[0]-t[0])+(e[1]-t[1])*(e[1]-t[1])}var Pg=ggt;function uP(e,t,r,o){return e[0]=t[0]+o*(r[0]-t[0]),e[1]=t[1]+o*(r[1]-t[1]),e}function Do(e,t,r){var o=t[0],n=t[1];return e[0]=r[0]*o+r[2]*n+r[4],e[1]=r[1]*o+r[3]*n+r[5],e}function Ec(e,t,r){return e[0]=Math.min(t[0],r[0]),e[1]=Math.min(t[1],r[1]),e}function Mc(e,t,r){return e[0]=Math.max(t[0],r[0]),e[1]=Math.max(t[1],r[1]),e}var cP=(function(){function e(t,r){this.target=t,this.topTarget=r&&r.topTarget}return e})(),vgt=(function(){function e(t){this.handler=t,t.on("mousedown",this._dragStart,this),t.on("mousemove",this._drag,this),t.on("mouseup",this._dragEnd,this)}return e.prototype._dragStart=function(t){for(var r=t.target;r&&!r.draggable;)r=r.parent||r.__hostTarget;r&&(this._draggingTarget=r,r.dragging=!0,this._x=t.offsetX,this._y=t.offsetY,this.handler.dispatchToElement(new cP(r,t),"dragstart",t.event))},e.prototype._drag=function(t){var r=this._draggingTarget;if(r){var o=t.offsetX,n=t.offsetY,i=o-this._x,a=n-this._y;this._x=o,this._y=n,r.drift(i,a,t),this.handler.dispatchToElement(new cP(r,t),"drag",t.event);var s=this.handler.findHover(o,n,r).target,l=this._dropTarget;this._dropTarget=s,r!==s&&(l&&s!==l&&this.handler.dispatchToElement(new cP(l,t),"dragleave",t.event),s&&s!==l&&this.handler.dispatchToElement(new cP(s,t),"dragenter",t.event))}},e.prototype._dragEnd=function(t){var r=this._draggingTarget;r&&(r.dragging=!1),this.handler.dispatchToElement(new cP(r,t),"dragend",t.event),this._dropTarget&&this.handler.dispatchToElement(new cP(this._dropTarget,t),"drop",t.event),this._draggingTarget=null,this._dropTarget=null},e})(),v1e=vgt;var ygt=(function(){function e(t){t&&(this._$eventProcessor=t)}return e.prototype.on=function(t,r,o,n){this._$handlers||(this._$handlers={});var i=this._$handlers;if(typeof r=="function"&&(n=o,o=r,r=null),!o||!t)return this;var a=this._$eventProcessor;r!=null&&a&&a.normalizeQuery&&(r=a.normalizeQuery(r)),i[t]||(i[t]=[]);for(var s=0;s<i[t].length;s++)if(i[t][s].h===o)return this;var l={h:o,query:r,ctx:n||this,callAtLast:o.zrEventfulCallAtLast},u=i[t].length-1,c=i[t][u];return c&&c.callAtLast?i[t].splice(u,0,l):i[t].push(l),this},e.prototype.isSilent=function(t){var r=this._$handlers;return!r||!r[t]||!r[t].length},e.prototype.off=function(t,r){var o=this._$handlers;if(!o)return this;if(!t)return this._$handlers={},this;if(r){if(o[t]){for(var n=[],i=0,a=o[t].length;i<a;i++)o[t][i].h!==r&&n.push(o[t][i]);o[t]=n}o[t]&&o[t].length===0&&delete o[t]}else delete o[t];return this},e.prototype.trigger=function(t){for(var r=[],o=1;o<arguments.length;o++)r[o-1]=arguments[o];if(!this._$handlers)return this;var n=this._$handlers[t],i=this._$eventProcessor;if(n)for(var a=r.length,s=n.length,l=0;l<s;l++){var u=n[l];if(!(i&&i.filter&&u.query!=null&&!i.filter(t,u.query)))switch(a){case 0:u.h.call(u.ctx);break;case 1:u.h.call(u.ctx,r[0]);break;case 2:u.h.call(u.ctx,r[0],r[1]);break;default:u.h.apply(u.ctx,r);break}}return i&&i.afterTrigger&&i.afterTrigger(t),this},e.prototype.triggerWithContext=function(t){for(var r=[],o=1;o<arguments.length;o++)r[o-1]=arguments[o];if(!this._$handlers)return this;var n=this._$handlers[t],i=this._$eventProcessor;if(n)for(var a=r.length,s=r[a-1],l=n.length,u=0;u<l;u++){var c=n[u];if(!(i&&i.filter&&c.query!=null&&!i.filter(t,c.query)))switch(a){case 0:c.h.call(s);break;case 1:c.h.call(s,r[0]);break;case 2:c.h.call(s,r[0],r[1]);break;default:c.h.apply(s,r.slice(1,a-1));break}}return i&&i.afterTrigger&&i.afterTrigger(t),this},e})(),Qi=ygt;var xgt=Math.log(2);function cJ(e,t,r,o,n,i){var a=o+"-"+n,s=e.length;if(i.hasOwnProperty(a))return i[a];if(t===1){var l=Math.round(Math.log((1<<s)-1&~n)/xgt);return e[r][l]}for(var u=o|1<<r,c=r+1;o&1<<c;)c++;for(var p=0,f=0,d=0;f<s;f++){var m=1<<f;m&n||(p+=(d%2?-1:1)*e[r][f]*cJ(e,t-1,c,u,n|m,i),d++)}return i[a]=p,p}function pJ(e,t){var r=[[e[0],e[1],1,0,0,0,-t[0]*e[0],-t[0]*e[1]],[0,0,0,e[0],e[1],1,-t[1]*e[0],-t[1]*e[1]],[e[2],e[3],1,0,0,0,-t[2]*e[2],-t[2]*e[3]],[0,0,0,e[2],e[3],1,-t[3]*e[2],-t[3]*e[3]],[e[4],e[5],1,0,0,0,-t[4]*e[4],-t[4]*e[5]],[0,0,0,e[4],e[5],1,-t[5]*e[4],-t[5]*e[5]],[e[6],e[7],1,0,0,0,-t[6]*e[6],-t[6]*e[7]],[0,0,0,e[6],e[7],1,-t[7]*e[6],-t[7]*e[7]]],o={},n=cJ(r,8,0,0,0,o);if(n!==0){for(var i=[],a=0;a<8;a++)for(var s=0;s<8;s++)i[s]==null&&(i[s]=0),i[s]+=((a+s)%2?-1:1)*cJ(r,7,a===0?1:0,1<<a,1<<s,o)/n*t[a];return function(l,u,c){var p=u*i[6]+c*i[7]+1;l[0]=(u*i[0]+c*i[1]+i[2])/p,l[1]=(u*i[3]+c*i[4]+i[5])/p}}}var LV="___zrEVENTSAVED",fJ=[];function y1e(e,t,r,o,n){return NV(fJ,t,o,n,!0)&&NV(e,r,fJ[0],fJ[1])}function x1e(e,t){e&&r(e),t&&r(t);function r(o){var n=o[LV];n&&(n.clearMarkers&&n.clearMarkers(),delete o[LV])}}function NV(e,t,r,o,n){if(t.getBoundingClientRect&&rr.domSupported&&!dJ(t)){var i=t[LV]||(t[LV]={}),a=bgt(t,i),s=Sgt(a,i,n);if(s)return s(e,r,o),!0}return!1}function bgt(e,t){var r=t.markers;if(r)return r;r=t.markers=[];for(var o=["left","right"],n=["top","bottom"],i=0;i<4;i++){var a=document.createElement("div"),s=a.style,l=i%2,u=(i>>1)%2;s.cssText=["position: absolute","visibility: hidden","padding: 0","margin: 0","border-width: 0","user-select: none","width:0","height:0",o[l]+":0",n[u]+":0",o[1-l]+":auto",n[1-u]+":auto",""].join("!important;"),e.appendChild(a),r.push(a)}return t.clearMarkers=function(){L(r,function(c){c.parentNode&&c.parentNode.removeChild(c)})},r}function Sgt(e,t,r){for(var o=r?"invTrans":"trans",n=t[o],i=t.srcCoords,a=[],s=[],l=!0,u=0;u<4;u++){var c=e[u].getBoundingClientRect(),p=2*u,f=c.left,d=c.top;a.push(f,d),l=l&&i&&f===i[p]&&d===i[p+1],s.push(e[u].offsetLeft,e[u].offsetTop)}return l&&n?n:(t.srcCoords=a,t[o]=r?pJ(s,a):pJ(a,s))}function dJ(e){return e.nodeName.toUpperCase()==="CANVAS"}var Tgt=/([&<>"'])/g,wgt={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;"};function ma(e){return e==null?"":(e+"").replace(Tgt,function(t,r){return wgt[r]})}var _gt=/^(?:mouse|pointer|contextmenu|drag|drop)|click/,mJ=[],Cgt=rr.browser.firefox&&+rr.browser.version.split(".")[0]<39;function zV(e,t,r,o){return r=r||{},o?b1e(e,t,r):Cgt&&t.layerX!=null&&t.layerX!==t.offsetX?(r.zrX=t.layerX,r.zrY=t.layerY):t.offsetX!=null?(r.zrX=t.offsetX,r.zrY=t.offsetY):b1e(e,t,r),r}function b1e(e,t,r){if(rr.domSupported&&e.getBoundingClientRect){var o=t.clientX,n=t.clientY;if(dJ(e)){var i=e.getBoundingClientRect();r.zrX=o-i.left,r.zrY=n-i.top;return}else if(NV(mJ,e,o,n)){r.zrX=mJ[0],r.zrY=mJ[1];return}}r.zrX=r.zrY=0}function FV(e){return e||window.event}function Mu(e,t,r){if(t=FV(t),t.zrX!=null)return t;var o=t.type,n=o&&o.indexOf("touch")>=0;if(n){var a=o!=="touchend"?t.targetTouches[0]:t.changedTouches[0];a&&zV(e,a,t,r)}else{zV(e,t,t,r);var i=Pgt(t);t.zrDelta=i?i/120:-(t.detail||0)/3}var s=t.button;return t.which==null&&s!==void 0&&_gt.test(t.type)&&(t.which=s&1?1:s&2?3:s&4?2:0),t}function Pgt(e){var t=e.wheelDelta;if(t)return t;var r=e.deltaX,o=e.deltaY;if(r==null||o==null)return t;var n=Math.abs(o!==0?o:r),i=o>0?-1:o<0?1:r>0?-1:1;return 3*n*i}function wD(e,t,r,o){e.addEventListener(t,r,o)}function S1e(e,t,r,o){e.removeEventListener(t,r,o)}var Iu=function(e){e.preventDefault(),e.stopPropagation(),e.cancelBubble=!0};function hJ(e){return e.which===2||e.which===3}var w1e=(function(){function e(){this._track=[]}return e.prototype.recognize=function(t,r,o){return this._doTrack(t,r,o),this._recognize(t)},e.prototype.clear=function(){return this._track.length=0,this},e.prototype._doTrack=function(t,r,o){var n=t.touches;if(n){for(var i={points:[],touches:[],target:r,event:t},a=0,s=n.length;a<s;a++){var l=n[a],u=zV(o,l,{});i.points.push([u.zrX,u.zrY]),i.touches.push(l)}this._track.push(i)}},e.prototype._recognize=function(t){for(var r in gJ)if(gJ.hasOwnProperty(r)){var o=gJ[r](this._track,t);if(o)return o}},e})();function T1e(e){var t=e[1][0]-e[0][0],r=e[1][1]-e[0][1];return Math.sqrt(t*t+r*r)}function Rgt(e){return[(e[0][0]+e[1][0])/2,(e[0][1]+e[1][1])/2]}var gJ={pinch:function(e,t){var r=e.length;if(r){var o=(e[r-1]||{}).points,n=(e[r-2]||{}).points||o;if(n&&n.length>1&&o&&o.length>1){var i=T1e(o)/T1e(n);!isFinite(i)&&(i=1),t.pinchScale=i;var a=Rgt(o);return t.pinchX=a[0],t.pinchY=a[1],{type:"pinch",target:e[0].target,event:t}}}}};function Vo(){return[1,0,0,1,0,0]}function Gy(e){return e[0]=1,e[1]=0,e[2]=0,e[3]=1,e[4]=0,e[5]=0,e}function oS(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e[4]=t[4],e[5]=t[5],e}function Vs(e,t,r){var o=t[0]*r[0]+t[2]*r[1],n=t[1]*r[0]+t[3]*r[1],i=t[0]*r[2]+t[2]*r[3],a=t[1]*r[2]+t[3]*r[3],s=t[0]*r[4]+t[2]*r[5]+t[4],l=t[1]*r[4]+t[3]*r[5]+t[5];return e[0]=o,e[1]=n,e[2]=i,e[3]=a,e[4]=s,e[5]=l,e}function $s(e,t,r){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e[4]=t[4]+r[0],e[5]=t[5]+r[1],e}function cl(e,t,r,o){o===void 0&&(o=[0,0]);var n=t[0],i=t[2],a=t[4],s=t[1],l=t[3],u=t[5],c=Math.sin(r),p=Math.cos(r);return e[0]=n*p+s*c,e[1]=-n*c+s*p,e[2]=i*p+l*c,e[3]=-i*c+p*l,e[4]=p*(a-o[0])+c*(u-o[1])+o[0],e[5]=p*(u-o[1])-c*(a-o[0])+o[1],e}function fP(e,t,r){var o=r[0],n=r[1];return e[0]=t[0]*o,e[1]=t[1]*n,e[2]=t[2]*o,e[3]=t[3]*n,e[4]=t[4]*o,e[5]=t[5]*n,e}function Ji(e,t){var r=t[0],o=t[2],n=t[4],i=t[1],a=t[3],s=t[5],l=r*a-i*o;return l?(l=1/l,e[0]=a*l,e[1]=-i*l,e[2]=-o*l,e[3]=r*l,e[4]=(o*s-a*n)*l,e[5]=(i*n-r*s)*l,e):null}function _1e(e){var t=Vo();return oS(t,e),t}var Egt=(function(){function e(t,r){this.x=t||0,this.y=r||0}return e.prototype.copy=function(t){return this.x=t.x,this.y=t.y,this},e.prototype.clone=function(){return new e(this.x,this.y)},e.prototype.set=function(t,r){return this.x=t,this.y=r,this},e.prototype.equal=function(t){return t.x===this.x&&t.y===this.y},e.prototype.add=function(t){return this.x+=t.x,this.y+=t.y,this},e.prototype.scale=function(t){this.x*=t,this.y*=t},e.prototype.scaleAndAdd=function(t,r){this.x+=t.x*r,this.y+=t.y*r},e.prototype.sub=function(t){return this.x-=t.x,this.y-=t.y,this},e.prototype.dot=function(t){return this.x*t.x+this.y*t.y},e.prototype.len=function(){return Math.sqrt(this.x*this.x+this.y*this.y)},e.prototype.lenSquare=function(){return this.x*this.x+this.y*this.y},e.prototype.normalize=function(){var t=this.len();return this.x/=t,this.y/=t,this},e.prototype.distance=function(t){var r=this.x-t.x,o=this.y-t.y;return Math.sqrt(r*r+o*o)},e.prototype.distanceSquare=function(t){var r=this.x-t.x,o=this.y-t.y;return r*r+o*o},e.prototype.negate=function(){return this.x=-this.x,this.y=-this.y,this},e.prototype.transform=function(t){if(t){var r=this.x,o=this.y;return this.x=t[0]*r+t[2]*o+t[4],this.y=t[1]*r+t[3]*o+t[5],this}},e.prototype.toArray=function(t){return t[0]=this.x,t[1]=this.y,t},e.prototype.fromArray=function(t){this.x=t[0],this.y=t[1]},e.set=function(t,r,o){t.x=r,t.y=o},e.copy=function(t,r){t.x=r.x,t.y=r.y},e.len=function(t){return Math.sqrt(t.x*t.x+t.y*t.y)},e.lenSquare=function(t){return t.x*t.x+t.y*t.y},e.dot=function(t,r){return t.x*r.x+t.y*r.y},e.add=function(t,r,o){t.x=r.x+o.x,t.y=r.y+o.y},e.sub=function(t,r,o){t.x=r.x-o.x,t.y=r.y-o.y},e.scale=function(t,r,o){t.x=r.x*o,t.y=r.y*o},e.scaleAndAdd=function(t,r,o,n){t.x=r.x+o.x*n,t.y=r.y+o.y*n},e.lerp=function(t,r,o,n){var i=1-n;t.x=i*r.x+n*o.x,t.y=i*r.y+n*o.y},e})(),wt=Egt;var lS=Math.min,dP=Math.max,vJ=Math.abs,C1e=["x","y"],Mgt=["width","height"],nS=new wt,iS=new wt,aS=new wt,sS=new wt,Ic=bJ(),_D=Ic.minTv,yJ=Ic.maxTv,CD=[0,0],xJ=(function(){function e(t,r,o,n){e.set(this,t,r,o,n)}return e.set=function(t,r,o,n,i){return n<0&&(r=r+n,n=-n),i<0&&(o=o+i,i=-i),t.x=r,t.y=o,t.width=n,t.height=i,t},e.prototype.union=function(t){var r=lS(t.x,this.x),o=lS(t.y,this.y);isFinite(this.x)&&isFinite(this.width)?this.width=dP(t.x+t.width,this.x+this.width)-r:this.width=t.width,isFinite(this.y)&&isFinite(this.height)?this.height=dP(t.y+t.height,this.y+this.height)-o:this.height=t.height,this.x=r,this.y=o},e.prototype.applyTransform=function(t){e.applyTransform(this,this,t)},e.prototype.calculateTransform=function(t){var r=this,o=t.width/r.width,n=t.height/r.height,i=Vo();return $s(i,i,[-r.x,-r.y]),fP(i,i,[o,n]),$s(i,i,[t.x,t.y]),i},e.prototype.intersect=function(t,r,o){return e.intersect(this,t,r,o)},e.intersect=function(t,r,o,n){o&&wt.set(o,0,0);var i=n&&n.outIntersectRect||null,a=n&&n.clamp;if(i&&(i.x=i.y=i.width=i.height=NaN),!t||!r)return!1;t instanceof e||(t=e.set(Igt,t.x,t.y,t.width,t.height)),r instanceof e||(r=e.set(Dgt,r.x,r.y,r.width,r.height));var s=!!o;Ic.reset(n,s);var l=Ic.touchThreshold,u=t.x+l,c=t.x+t.width-l,p=t.y+l,f=t.y+t.height-l,d=r.x+l,m=r.x+r.width-l,h=r.y+l,g=r.y+r.height-l;if(u>c||p>f||d>m||h>g)return!1;var v=!(c<d||m<u||f<h||g<p);return(s||i)&&(CD[0]=1/0,CD[1]=0,P1e(u,c,d,m,0,s,i,a),P1e(p,f,h,g,1,s,i,a),s&&wt.copy(o,v?Ic.useDir?Ic.dirMinTv:_D:yJ)),v},e.contain=function(t,r,o){return r>=t.x&&r<=t.x+t.width&&o>=t.y&&o<=t.y+t.height},e.prototype.contain=function(t,r){return e.contain(this,t,r)},e.prototype.clone=function(){return new e(this.x,this.y,this.width,this.height)},e.prototype.copy=function(t){e.copy(this,t)},e.prototype.plain=function(){return{x:this.x,y:this.y,width:this.width,height:this.height}},e.prototype.isFinite=function(){return isFinite(this.x)&&isFinite(this.y)&&isFinite(this.width)&&isFinite(this.height)},e.prototype.isZero=function(){return this.width===0||this.height===0},e.create=function(t){return new e(t.x,t.y,t.width,t.height)},e.copy=function(t,r){return t.x=r.x,t.y=r.y,t.width=r.width,t.height=r.height,t},e.applyTransform=function(t,r,o){if(!o){t!==r&&e.copy(t,r);return}if(o[1]<1e-5&&o[1]>-1e-5&&o[2]<1e-5&&o[2]>-1e-5){var n=o[0],i=o[3],a=o[4],s=o[5];t.x=r.x*n+a,t.y=r.y*i+s,t.width=r.width*n,t.height=r.height*i,t.width<0&&(t.x+=t.width,t.width=-t.width),t.height<0&&(t.y+=t.height,t.height=-t.height);return}nS.x=aS.x=r.x,nS.y=sS.y=r.y,iS.x=sS.x=r.x+r.width,iS.y=aS.y=r.y+r.height,nS.transform(o),sS.transform(o),iS.transform(o),aS.transform(o),t.x=lS(nS.x,iS.x,aS.x,sS.x),t.y=lS(nS.y,iS.y,aS.y,sS.y);var l=dP(nS.x,iS.x,aS.x,sS.x),u=dP(nS.y,iS.y,aS.y,sS.y);t.width=l-t.x,t.height=u-t.y},e})(),Igt=new xJ(0,0,0,0),Dgt=new xJ(0,0,0,0);function P1e(e,t,r,o,n,i,a,s){var l=vJ(t-r),u=vJ(o-e),c=lS(l,u),p=C1e[n],f=C1e[1-n],d=Mgt[n];t<r||o<e?l<u?(i&&(yJ[p]=-l),s&&(a[p]=t,a[d]=0)):(i&&(yJ[p]=u),s&&(a[p]=e,a[d]=0)):(a&&(a[p]=dP(e,r),a[d]=lS(t,o)-a[p]),i&&(c<CD[0]||Ic.useDir)&&(CD[0]=lS(c,CD[0]),(l<u||!Ic.bidirectional)&&(_D[p]=l,_D[f]=0,Ic.useDir&&Ic.calcDirMTV()),(l>=u||!Ic.bidirectional)&&(_D[p]=-u,_D[f]=0,Ic.useDir&&Ic.calcDirMTV())))}function bJ(){var e=0,t=new wt,r=new wt,o={minTv:new wt,maxTv:new wt,useDir:!1,dirMinTv:new wt,touchThreshold:0,bidirectional:!0,negativeSize:!1,reset:function(i,a){o.touchThreshold=0,i&&i.touchThreshold!=null&&(o.touchThreshold=dP(0,i.touchThreshold)),o.negativeSize=!1,a&&(o.minTv.set(1/0,1/0),o.maxTv.set(0,0),o.useDir=!1,i&&i.direction!=null&&(o.useDir=!0,o.dirMinTv.copy(o.minTv),r.copy(o.minTv),e=i.direction,o.bidirectional=i.bidirectional==null||!!i.bidirectional,o.bidirectional||t.set(Math.cos(e),Math.sin(e))))},calcDirMTV:function(){var i=o.minTv,a=o.dirMinTv,s=i.y*i.y+i.x*i.x,l=Math.sin(e),u=Math.cos(e),c=l*i.y+u*i.x;if(n(c)){n(i.x)&&n(i.y)&&a.set(0,0);return}if(r.x=s*u/c,r.y=s*l/c,n(r.x)&&n(r.y)){a.set(0,0);return}(o.bidirectional||t.dot(r)>0)&&r.len()<a.len()&&a.copy(r)}};function n(i){return vJ(i)<1e-10}return o}var Je=xJ;var E1e="silent";function Ogt(e,t,r){return{type:e,event:r,target:t.target,topTarget:t.topTarget,cancelBubble:!1,offsetX:r.zrX,offsetY:r.zrY,gestureEvent:r.gestureEvent,pinchX:r.pinchX,pinchY:r.pinchY,pinchScale:r.pinchScale,wheelDelta:r.zrDelta,zrByTouch:r.zrByTouch,which:r.which,stop:kgt}}function kgt(){Iu(this.event)}var Agt=(function(e){Y(t,e);function t(){var r=e!==null&&e.apply(this,arguments)||this;return r.handler=null,r}return t.prototype.dispose=function(){},t.prototype.setCursor=function(){},t})(Qi),PD=(function(){function e(t,r){this.x=t,this.y=r}return e})(),Lgt=["click","dblclick","mousewheel","mouseout","mouseup","mousedown","mousemove","contextmenu"],SJ=new Je(0,0,0,0),M1e=(function(e){Y(t,e);function t(r,o,n,i,a){var s=e.call(this)||this;return s._hovered=new PD(0,0),s.storage=r,s.painter=o,s.painterRoot=i,s._pointerSize=a,n=n||new Agt,s.proxy=null,s.setHandlerProxy(n),s._draggingMgr=new v1e(s),s}return t.prototype.setHandlerProxy=function(r){this.proxy&&this.proxy.dispose(),r&&(L(Lgt,function(o){r.on&&r.on(o,this[o],this)},this),r.handler=this),this.proxy=r},t.prototype.mousemove=function(r){var o=r.zrX,n=r.zrY,i=I1e(this,o,n),a=this._hovered,s=a.target;s&&!s.__zr&&(a=this.findHover(a.x,a.y),s=a.target);var l=this._hovered=i?new PD(o,n):this.findHover(o,n),u=l.target,c=this.proxy;c.setCursor&&c.setCursor(u?u.cursor:"default"),s&&u!==s&&this.dispatchToElement(a,"mouseout",r),this.dispatchToElement(l,"mousemove",r),u&&u!==s&&this.dispatchToElement(l,"mouseover",r)},t.prototype.mouseout=function(r){var o=r.zrEventControl;o!=="only_globalout"&&this.dispatchToElement(this._hovered,"mouseout",r),o!=="no_globalout"&&this.trigger("globalout",{type:"globalout",event:r})},t.prototype.resize=function(){this._hovered=new PD(0,0)},t.prototype.dispatch=function(r,o){var n=this[r];n&&n.call(this,o)},t.prototype.dispose=function(){this.proxy.dispose(),this.storage=null,this.proxy=null,this.painter=null},t.prototype.setCursorStyle=function(r){var o=this.proxy;o.setCursor&&o.setCursor(r)},t.prototype.dispatchToElement=function(r,o,n){r=r||{};var i=r.target;if(!(i&&i.silent)){for(var a="on"+o,s=Ogt(o,r,n);i&&(i[a]&&(s.cancelBubble=!!i[a].call(i,s)),i.trigger(o,s),i=i.__hostTarget?i.__hostTarget:i.parent,!s.cancelBubble););s.cancelBubble||(this.trigger(o,s),this.painter&&this.painter.eachOtherLayer&&this.painter.eachOtherLayer(function(l){typeof l[a]=="function"&&l[a].call(l,s),l.trigger&&l.trigger(o,s)}))}},t.prototype.findHover=function(r,o,n){var i=this.storage.getDisplayList(),a=new PD(r,o);if(R1e(i,a,r,o,n),this._pointerSize&&!a.target){for(var s=[],l=this._pointerSize,u=l/2,c=new Je(r-u,o-u,l,l),p=i.length-1;p>=0;p--){var f=i[p];f!==n&&!f.ignore&&!f.ignoreCoarsePointer&&(!f.parent||!f.parent.ignoreCoarsePointer)&&(SJ.copy(f.getBoundingRect()),f.transform&&SJ.applyTransform(f.transform),SJ.intersect(c)&&s.push(f))}if(s.length)for(var d=4,m=Math.PI/12,h=Math.PI*2,g=0;g<u;g+=d)for(var v=0;v<h;v+=m){var y=r+g*Math.cos(v),x=o+g*Math.sin(v);if(R1e(s,a,y,x,n),a.target)return a}}return a},t.prototype.processGesture=function(r,o){this._gestureMgr||(this._gestureMgr=new w1e);var n=this._gestureMgr;o==="start"&&n.clear();var i=n.recognize(r,this.findHover(r.zrX,r.zrY,null).target,this.proxy.dom);if(o==="end"&&n.clear(),i){var a=i.type;r.gestureEvent=a;var s=new PD;s.target=i.target,this.dispatchToElement(s,a,i.event)}},t})(Qi);L(["click","mousedown","mouseup","mousewheel","dblclick","contextmenu"],function(e){M1e.prototype[e]=function(t){var r=t.zrX,o=t.zrY,n=I1e(this,r,o),i,a;if((e!=="mouseup"||!n)&&(i=this.findHover(r,o),a=i.target),e==="mousedown")this._downEl=a,this._downPoint=[t.zrX,t.zrY],this._upEl=a;else if(e==="mouseup")this._upEl=a;else if(e==="click"){if(this._downEl!==this._upEl||!this._downPoint||Cp(this._downPoint,[t.zrX,t.zrY])>4)return;this._downPoint=null}this.dispatchToElement(i,e,t)}});function Ngt(e,t,r){if(e[e.rectHover?"rectContain":"contain"](t,r)){for(var o=e,n=void 0,i=!1;o;){if(o.ignoreClip&&(i=!0),!i){var a=o.getClipPath();if(a&&!a.contain(t,r))return!1}o.silent&&(n=!0);var s=o.__hostTarget;o=s?o.ignoreHostSilent?null:s:o.parent}return n?E1e:!0}return!1}function R1e(e,t,r,o,n){for(var i=e.length-1;i>=0;i--){var a=e[i],s=void 0;if(a!==n&&!a.ignore&&(s=Ngt(a,r,o))&&(!t.topTarget&&(t.topTarget=a),s!==E1e)){t.target=a;break}}}function I1e(e,t,r){var o=e.painter;return t<0||t>o.getWidth()||r<0||r>o.getHeight()}var D1e=M1e;var A1e=32,RD=7;function zgt(e){for(var t=0;e>=A1e;)t|=e&1,e>>=1;return e+t}function O1e(e,t,r,o){var n=t+1;if(n===r)return 1;if(o(e[n++],e[t])<0){for(;n<r&&o(e[n],e[n-1])<0;)n++;Fgt(e,t,n)}else for(;n<r&&o(e[n],e[n-1])>=0;)n++;return n-t}function Fgt(e,t,r){for(r--;t<r;){var o=e[t];e[t++]=e[r],e[r--]=o}}function k1e(e,t,r,o,n){for(o===t&&o++;o<r;o++){for(var i=e[o],a=t,s=o,l;a<s;)l=a+s>>>1,n(i,e[l])<0?s=l:a=l+1;var u=o-a;switch(u){case 3:e[a+3]=e[a+2];case 2:e[a+2]=e[a+1];case 1:e[a+1]=e[a];break;default:for(;u>0;)e[a+u]=e[a+u-1],u--}e[a]=i}}function TJ(e,t,r,o,n,i){var a=0,s=0,l=1;if(i(e,t[r+n])>0){for(s=o-n;l<s&&i(e,t[r+n+l])>0;)a=l,l=(l<<1)+1,l<=0&&(l=s);l>s&&(l=s),a+=n,l+=n}else{for(s=n+1;l<s&&i(e,t[r+n-l])<=0;)a=l,l=(l<<1)+1,l<=0&&(l=s);l>s&&(l=s);var u=a;a=n-l,l=n-u}for(a++;a<l;){var c=a+(l-a>>>1);i(e,t[r+c])>0?a=c+1:l=c}return l}function wJ(e,t,r,o,n,i){var a=0,s=0,l=1;if(i(e,t[r+n])<0){for(s=n+1;l<s&&i(e,t[r+n-l])<0;)a=l,l=(l<<1)+1,l<=0&&(l=s);l>s&&(l=s);var u=a;a=n-l,l=n-u}else{for(s=o-n;l<s&&i(e,t[r+n+l])>=0;)a=l,l=(l<<1)+1,l<=0&&(l=s);l>s&&(l=s),a+=n,l+=n}for(a++;a<l;){var c=a+(l-a>>>1);i(e,t[r+c])<0?l=c:a=c+1}return l}function Ugt(e,t){var r=RD,o,n,i=0,a=[];o=[],n=[];function s(d,m){o[i]=d,n[i]=m,i+=1}function l(){for(;i>1;){var d=i-2;if(d>=1&&n[d-1]<=n[d]+n[d+1]||d>=2&&n[d-2]<=n[d]+n[d-1])n[d-1]<n[d+1]&&d--;else if(n[d]>n[d+1])break;c(d)}}function u(){for(;i>1;){var d=i-2;d>0&&n[d-1]<n[d+1]&&d--,c(d)}}function c(d){var m=o[d],h=n[d],g=o[d+1],v=n[d+1];n[d]=h+v,d===i-3&&(o[d+1]=o[d+2],n[d+1]=n[d+2]),i--;var y=wJ(e[g],e,m,h,0,t);m+=y,h-=y,h!==0&&(v=TJ(e[m+h-1],e,g,v,v-1,t),v!==0&&(h<=v?p(m,h,g,v):f(m,h,g,v)))}function p(d,m,h,g){var v=0;for(v=0;v<m;v++)a[v]=e[d+v];var y=0,x=h,b=d;if(e[b++]=e[x++],--g===0){for(v=0;v<m;v++)e[b+v]=a[y+v];return}if(m===1){for(v=0;v<g;v++)e[b+v]=e[x+v];e[b+g]=a[y];return}for(var S=r,T,w,C;;){T=0,w=0,C=!1;do if(t(e[x],a[y])<0){if(e[b++]=e[x++],w++,T=0,--g===0){C=!0;break}}else if(e[b++]=a[y++],T++,w=0,--m===1){C=!0;break}while((T|w)<S);if(C)break;do{if(T=wJ(e[x],a,y,m,0,t),T!==0){for(v=0;v<T;v++)e[b+v]=a[y+v];if(b+=T,y+=T,m-=T,m<=1){C=!0;break}}if(e[b++]=e[x++],--g===0){C=!0;break}if(w=TJ(a[y],e,x,g,0,t),w!==0){for(v=0;v<w;v++)e[b+v]=e[x+v];if(b+=w,x+=w,g-=w,g===0){C=!0;break}}if(e[b++]=a[y++],--m===1){C=!0;break}S--}while(T>=RD||w>=RD);if(C)break;S<0&&(S=0),S+=2}if(r=S,r<1&&(r=1),m===1){for(v=0;v<g;v++)e[b+v]=e[x+v];e[b+g]=a[y]}else{if(m===0)throw new Error;for(v=0;v<m;v++)e[b+v]=a[y+v]}}function f(d,m,h,g){var v=0;for(v=0;v<g;v++)a[v]=e[h+v];var y=d+m-1,x=g-1,b=h+g-1,S=0,T=0;if(e[b--]=e[y--],--m===0){for(S=b-(g-1),v=0;v<g;v++)e[S+v]=a[v];return}if(g===1){for(b-=m,y-=m,T=b+1,S=y+1,v=m-1;v>=0;v--)e[T+v]=e[S+v];e[b]=a[x];return}for(var w=r;;){var C=0,P=0,R=!1;do if(t(a[x],e[y])<0){if(e[b--]=e[y--],C++,P=0,--m===0){R=!0;break}}else if(e[b--]=a[x--],P++,C=0,--g===1){R=!0;break}while((C|P)<w);if(R)break;do{if(C=m-wJ(a[x],e,d,m,m-1,t),C!==0){for(b-=C,y-=C,m-=C,T=b+1,S=y+1,v=C-1;v>=0;v--)e[T+v]=e[S+v];if(m===0){R=!0;break}}if(e[b--]=a[x--],--g===1){R=!0;break}if(P=g-TJ(e[y],a,0,g,g-1,t),P!==0){for(b-=P,x-=P,g-=P,T=b+1,S=x+1,v=0;v<P;v++)e[T+v]=a[S+v];if(g<=1){R=!0;break}}if(e[b--]=e[y--],--m===0){R=!0;break}w--}while(C>=RD||P>=RD);if(R)break;w<0&&(w=0),w+=2}if(r=w,r<1&&(r=1),g===1){for(b-=m,y-=m,T=b+1,S=y+1,v=m-1;v>=0;v--)e[T+v]=e[S+v];e[b]=a[x]}else{if(g===0)throw new Error;for(S=b-(g-1),v=0;v<g;v++)e[S+v]=a[v]}}return{mergeRuns:l,forceMergeRuns:u,pushRun:s}}function uS(e,t,r,o){r||(r=0),o||(o=e.length);var n=o-r;if(!(n<2)){var i=0;if(n<A1e){i=O1e(e,r,o,t),k1e(e,r,o,r+i,t);return}var a=Ugt(e,t),s=zgt(n);do{if(i=O1e(e,r,o,t),i<s){var l=n;l>s&&(l=s),k1e(e,r,r+l,r+i,t),i=l}a.pushRun(r,i),a.mergeRuns(),n-=i,r+=i}while(n!==0);a.forceMergeRuns()}}var ha=1,cS=2,Hy=4;var L1e=!1;function _J(){L1e||(L1e=!0,console.warn("z / z2 / zlevel of displayable is invalid, which may cause unexpected errors"))}function N1e(e,t){return e.zlevel===t.zlevel?e.z===t.z?e.z2-t.z2:e.z-t.z:e.zlevel-t.zlevel}var Vgt=(function(){function e(){this._roots=[],this._displayList=[],this._displayListLen=0,this.displayableSortFunc=N1e}return e.prototype.traverse=function(t,r){for(var o=0;o<this._roots.length;o++)this._roots[o].traverse(t,r)},e.prototype.getDisplayList=function(t,r){r=r||!1;var o=this._displayList;return(t||!o.length)&&this.updateDisplayList(r),o},e.prototype.updateDisplayList=function(t){this._displayListLen=0;for(var r=this._roots,o=this._displayList,n=0,i=r.length;n<i;n++)this._updateAndAddDisplayable(r[n],null,t);o.length=this._displayListLen,uS(o,N1e)},e.prototype._updateAndAddDisplayable=function(t,r,o){if(!(t.ignore&&!o)){t.beforeUpdate(),t.update(),t.afterUpdate();var n=t.getClipPath(),i=r&&r.length,a=0,s=t.__clipPaths;if(!t.ignoreClip&&(i||n)){if(s||(s=t.__clipPaths=[]),i)for(var l=0;l<r.length;l++)s[a++]=r[l];for(var u=n,c=t;u;)u.parent=c,u.updateTransform(),s[a++]=u,c=u,u=u.getClipPath()}if(s&&(s.length=a),t.childrenRef){for(var p=t.childrenRef(),f=0;f<p.length;f++){var d=p[f];t.__dirty&&(d.__dirty|=ha),this._updateAndAddDisplayable(d,s,o)}t.__dirty=0}else{var m=t;isNaN(m.z)&&(_J(),m.z=0),isNaN(m.z2)&&(_J(),m.z2=0),isNaN(m.zlevel)&&(_J(),m.zlevel=0),this._displayList[this._displayListLen++]=m}var h=t.getDecalElement&&t.getDecalElement();h&&this._updateAndAddDisplayable(h,s,o);var g=t.getTextGuideLine();g&&this._updateAndAddDisplayable(g,s,o);var v=t.getTextContent();v&&this._updateAndAddDisplayable(v,s,o)}},e.prototype.addRoot=function(t){t.__zr&&t.__zr.storage===this||this._roots.push(t)},e.prototype.delRoot=function(t){if(t instanceof Array){for(var r=0,o=t.length;r<o;r++)this.delRoot(t[r]);return}var n=vt(this._roots,t);n>=0&&this._roots.splice(n,1)},e.prototype.delAllRoots=function(){this._roots=[],this._displayList=[],this._displayListLen=0},e.prototype.getRoots=function(){return this._roots},e.prototype.dispose=function(){this._displayList=null,this._roots=null},e})(),z1e=Vgt;var F1e;F1e=rr.hasGlobalWindow&&(window.requestAnimationFrame&&window.requestAnimationFrame.bind(window)||window.msRequestAnimationFrame&&window.msRequestAnimationFrame.bind(window)||window.mozRequestAnimationFrame||window.webkitRequestAnimationFrame)||function(e){return setTimeout(e,16)};var ED=F1e;var UV={linear:function(e){return e},quadraticIn:function(e){return e*e},quadraticOut:function(e){return e*(2-e)},quadraticInOut:function(e){return(e*=2)<1?.5*e*e:-.5*(--e*(e-2)-1)},cubicIn:function(e){return e*e*e},cubicOut:function(e){return--e*e*e+1},cubicInOut:function(e){return(e*=2)<1?.5*e*e*e:.5*((e-=2)*e*e+2)},quarticIn:function(e){return e*e*e*e},quarticOut:function(e){return 1- --e*e*e*e},quarticInOut:function(e){return(e*=2)<1?.5*e*e*e*e:-.5*((e-=2)*e*e*e-2)},quinticIn:function(e){return e*e*e*e*e},quinticOut:function(e){return--e*e*e*e*e+1},quinticInOut:function(e){return(e*=2)<1?.5*e*e*e*e*e:.5*((e-=2)*e*e*e*e+2)},sinusoidalIn:function(e){return 1-Math.cos(e*Math.PI/2)},sinusoidalOut:function(e){return Math.sin(e*Math.PI/2)},sinusoidalInOut:function(e){return .5*(1-Math.cos(Math.PI*e))},exponentialIn:function(e){return e===0?0:Math.pow(1024,e-1)},exponentialOut:function(e){return e===1?1:1-Math.pow(2,-10*e)},exponentialInOut:function(e){return e===0?0:e===1?1:(e*=2)<1?.5*Math.pow(1024,e-1):.5*(-Math.pow(2,-10*(e-1))+2)},circularIn:function(e){return 1-Math.sqrt(1-e*e)},circularOut:function(e){return Math.sqrt(1- --e*e)},circularInOut:function(e){return(e*=2)<1?-.5*(Math.sqrt(1-e*e)-1):.5*(Math.sqrt(1-(e-=2)*e)+1)},elasticIn:function(e){var t,r=.1,o=.4;return e===0?0:e===1?1:(!r||r<1?(r=1,t=o/4):t=o*Math.asin(1/r)/(2*Math.PI),-(r*Math.pow(2,10*(e-=1))*Math.sin((e-t)*(2*Math.PI)/o)))},elasticOut:function(e){var t,r=.1,o=.4;return e===0?0:e===1?1:(!r||r<1?(r=1,t=o/4):t=o*Math.asin(1/r)/(2*Math.PI),r*Math.pow(2,-10*e)*Math.sin((e-t)*(2*Math.PI)/o)+1)},elasticInOut:function(e){var t,r=.1,o=.4;return e===0?0:e===1?1:(!r||r<1?(r=1,t=o/4):t=o*Math.asin(1/r)/(2*Math.PI),(e*=2)<1?-.5*(r*Math.pow(2,10*(e-=1))*Math.sin((e-t)*(2*Math.PI)/o)):r*Math.pow(2,-10*(e-=1))*Math.sin((e-t)*(2*Math.PI)/o)*.5+1)},backIn:function(e){var t=1.70158;return e*e*((t+1)*e-t)},backOut:function(e){var t=1.70158;return--e*e*((t+1)*e+t)+1},backInOut:function(e){var t=2.5949095;return(e*=2)<1?.5*(e*e*((t+1)*e-t)):.5*((e-=2)*e*((t+1)*e+t)+2)},bounceIn:function(e){return 1-UV.bounceOut(1-e)},bounceOut:function(e){return e<.36363636363636365?7.5625*e*e:e<.7272727272727273?7.5625*(e-=.5454545454545454)*e+.75:e<.9090909090909091?7.5625*(e-=.8181818181818182)*e+.9375:7.5625*(e-=.9545454545454546)*e+.984375},bounceInOut:function(e){return e<.5?UV.bounceIn(e*2)*.5:UV.bounceOut(e*2-1)*.5+.5}},VV=UV;var $V=Math.pow,Wy=Math.sqrt,GV=1e-8,V1e=1e-4,U1e=Wy(3),BV=1/3,hm=mm(),Pp=mm(),mP=mm();function jy(e){return e>-GV&&e<GV}function $1e(e){return e>GV||e<-GV}function ni(e,t,r,o,n){var i=1-n;return i*i*(i*e+3*n*t)+n*n*(n*o+3*i*r)}function CJ(e,t,r,o,n){var i=1-n;return 3*(((t-e)*i+2*(r-t)*n)*i+(o-r)*n*n)}function pS(e,t,r,o,n,i){var a=o+3*(t-r)-e,s=3*(r-t*2+e),l=3*(t-e),u=e-n,c=s*s-3*a*l,p=s*l-9*a*u,f=l*l-3*s*u,d=0;if(jy(c)&&jy(p))if(jy(s))i[0]=0;else{var m=-l/s;m>=0&&m<=1&&(i[d++]=m)}else{var h=p*p-4*c*f;if(jy(h)){var g=p/c,m=-s/a+g,v=-g/2;m>=0&&m<=1&&(i[d++]=m),v>=0&&v<=1&&(i[d++]=v)}else if(h>0){var y=Wy(h),x=c*s+1.5*a*(-p+y),b=c*s+1.5*a*(-p-y);x<0?x=-$V(-x,BV):x=$V(x,BV),b<0?b=-$V(-b,BV):b=$V(b,BV);var m=(-s-(x+b))/(3*a);m>=0&&m<=1&&(i[d++]=m)}else{var S=(2*c*s-3*a*p)/(2*Wy(c*c*c)),T=Math.acos(S)/3,w=Wy(c),C=Math.cos(T),m=(-s-2*w*C)/(3*a),v=(-s+w*(C+U1e*Math.sin(T)))/(3*a),P=(-s+w*(C-U1e*Math.sin(T)))/(3*a);m>=0&&m<=1&&(i[d++]=m),v>=0&&v<=1&&(i[d++]=v),P>=0&&P<=1&&(i[d++]=P)}}return d}function HV(e,t,r,o,n){var i=6*r-12*t+6*e,a=9*t+3*o-3*e-9*r,s=3*t-3*e,l=0;if(jy(a)){if($1e(i)){var u=-s/i;u>=0&&u<=1&&(n[l++]=u)}}else{var c=i*i-4*a*s;if(jy(c))n[0]=-i/(2*a);else if(c>0){var p=Wy(c),u=(-i+p)/(2*a),f=(-i-p)/(2*a);u>=0&&u<=1&&(n[l++]=u),f>=0&&f<=1&&(n[l++]=f)}}return l}function Rp(e,t,r,o,n,i){var a=(t-e)*n+e,s=(r-t)*n+t,l=(o-r)*n+r,u=(s-a)*n+a,c=(l-s)*n+s,p=(c-u)*n+u;i[0]=e,i[1]=a,i[2]=u,i[3]=p,i[4]=p,i[5]=c,i[6]=l,i[7]=o}function jV(e,t,r,o,n,i,a,s,l,u,c){var p,f=.005,d=1/0,m,h,g,v;hm[0]=l,hm[1]=u;for(var y=0;y<1;y+=.05)Pp[0]=ni(e,r,n,a,y),Pp[1]=ni(t,o,i,s,y),g=Pg(hm,Pp),g<d&&(p=y,d=g);d=1/0;for(var x=0;x<32&&!(f<V1e);x++)m=p-f,h=p+f,Pp[0]=ni(e,r,n,a,m),Pp[1]=ni(t,o,i,s,m),g=Pg(Pp,hm),m>=0&&g<d?(p=m,d=g):(mP[0]=ni(e,r,n,a,h),mP[1]=ni(t,o,i,s,h),v=Pg(mP,hm),h<=1&&v<d?(p=h,d=v):f*=.5);return c&&(c[0]=ni(e,r,n,a,p),c[1]=ni(t,o,i,s,p)),Wy(d)}function B1e(e,t,r,o,n,i,a,s,l){for(var u=e,c=t,p=0,f=1/l,d=1;d<=l;d++){var m=d*f,h=ni(e,r,n,a,m),g=ni(t,o,i,s,m),v=h-u,y=g-c;p+=Math.sqrt(v*v+y*y),u=h,c=g}return p}function vi(e,t,r,o){var n=1-o;return n*(n*e+2*o*t)+o*o*r}function MD(e,t,r,o){return 2*((1-o)*(t-e)+o*(r-t))}function G1e(e,t,r,o,n){var i=e-2*t+r,a=2*(t-e),s=e-o,l=0;if(jy(i)){if($1e(a)){var u=-s/a;u>=0&&u<=1&&(n[l++]=u)}}else{var c=a*a-4*i*s;if(jy(c)){var u=-a/(2*i);u>=0&&u<=1&&(n[l++]=u)}else if(c>0){var p=Wy(c),u=(-a+p)/(2*i),f=(-a-p)/(2*i);u>=0&&u<=1&&(n[l++]=u),f>=0&&f<=1&&(n[l++]=f)}}return l}function WV(e,t,r){var o=e+r-2*t;return o===0?.5:(e-t)/o}function Yy(e,t,r,o,n){var i=(t-e)*o+e,a=(r-t)*o+t,s=(a-i)*o+i;n[0]=e,n[1]=i,n[2]=s,n[3]=s,n[4]=a,n[5]=r}function YV(e,t,r,o,n,i,a,s,l){var u,c=.005,p=1/0;hm[0]=a,hm[1]=s;for(var f=0;f<1;f+=.05){Pp[0]=vi(e,r,n,f),Pp[1]=vi(t,o,i,f);var d=Pg(hm,Pp);d<p&&(u=f,p=d)}p=1/0;for(var m=0;m<32&&!(c<V1e);m++){var h=u-c,g=u+c;Pp[0]=vi(e,r,n,h),Pp[1]=vi(t,o,i,h);var d=Pg(Pp,hm);if(h>=0&&d<p)u=h,p=d;else{mP[0]=vi(e,r,n,g),mP[1]=vi(t,o,i,g);var v=Pg(mP,hm);g<=1&&v<p?(u=g,p=v):c*=.5}}return l&&(l[0]=vi(e,r,n,u),l[1]=vi(t,o,i,u)),Wy(p)}function H1e(e,t,r,o,n,i,a){for(var s=e,l=t,u=0,c=1/a,p=1;p<=a;p++){var f=p*c,d=vi(e,r,n,f),m=vi(t,o,i,f),h=d-s,g=m-l;u+=Math.sqrt(h*h+g*g),s=d,l=m}return u}var $gt=/cubic-bezier\(([0-9,\.e ]+)\)/;function hP(e){var t=e&&$gt.exec(e);if(t){var r=t[1].split(","),o=+Xi(r[0]),n=+Xi(r[1]),i=+Xi(r[2]),a=+Xi(r[3]);if(isNaN(o+n+i+a))return;var s=[];return function(l){return l<=0?0:l>=1?1:pS(0,o,i,1,l,s)&&ni(0,n,a,1,s[0])}}}var Bgt=(function(){function e(t){this._inited=!1,this._startTime=0,this._pausedTime=0,this._paused=!1,this._life=t.life||1e3,this._delay=t.delay||0,this.loop=t.loop||!1,this.onframe=t.onframe||xo,this.ondestroy=t.ondestroy||xo,this.onrestart=t.onrestart||xo,t.easing&&this.setEasing(t.easing)}return e.prototype.step=function(t,r){if(this._inited||(this._startTime=t+this._delay,this._inited=!0),this._paused){this._pausedTime+=r;return}var o=this._life,n=t-this._startTime-this._pausedTime,i=n/o;i<0&&(i=0),i=Math.min(i,1);var a=this.easingFunc,s=a?a(i):i;if(this.onframe(s),i===1)if(this.loop){var l=n%o;this._startTime=t-l,this._pausedTime=0,this.onrestart()}else return!0;return!1},e.prototype.pause=function(){this._paused=!0},e.prototype.resume=function(){this._paused=!1},e.prototype.setEasing=function(t){this.easing=t,this.easingFunc=Ae(t)?t:VV[t]||hP(t)},e})(),j1e=Bgt;var W1e=(function(){function e(t){this.value=t}return e})();var Ggt=(function(){function e(){this._len=0}return e.prototype.insert=function(t){var r=new W1e(t);return this.insertEntry(r),r},e.prototype.insertEntry=function(t){this.head?(this.tail.next=t,t.prev=this.tail,t.next=null,this.tail=t):this.head=this.tail=t,this._len++},e.prototype.remove=function(t){var r=t.prev,o=t.next;r?r.next=o:this.head=o,o?o.prev=r:this.tail=r,t.next=t.prev=null,this._len--},e.prototype.len=function(){return this._len},e.prototype.clear=function(){this.head=this.tail=null,this._len=0},e})();var Hgt=(function(){function e(t){this._list=new Ggt,this._maxSize=10,this._map={},this._maxSize=t}return e.prototype.put=function(t,r){var o=this._list,n=this._map,i=null;if(n[t]==null){var a=o.len(),s=this._lastRemovedEntry;if(a>=this._maxSize&&a>0){var l=o.head;o.remove(l),delete n[l.key],i=l.value,this._lastRemovedEntry=l}s?s.value=r:s=new W1e(r),s.key=t,o.insertEntry(s),n[t]=s}return i},e.prototype.get=function(t){var r=this._map[t],o=this._list;if(r!=null)return r!==o.tail&&(o.remove(r),o.insertEntry(r)),r.value},e.prototype.clear=function(){this._list.clear(),this._map={}},e.prototype.len=function(){return this._list.len()},e})(),gm=Hgt;var Y1e={transparent:[0,0,0,0],aliceblue:[240,248,255,1],antiquewhite:[250,235,215,1],aqua:[0,255,255,1],aquamarine:[127,255,212,1],azure:[240,255,255,1],beige:[245,245,220,1],bisque:[255,228,196,1],black:[0,0,0,1],blanchedalmond:[255,235,205,1],blue:[0,0,255,1],blueviolet:[138,43,226,1],brown:[165,42,42,1],burlywood:[222,184,135,1],cadetblue:[95,158,160,1],chartreuse:[127,255,0,1],chocolate:[210,105,30,1],coral:[255,127,80,1],cornflowerblue:[100,149,237,1],cornsilk:[255,248,220,1],crimson:[220,20,60,1],cyan:[0,255,255,1],darkblue:[0,0,139,1],darkcyan:[0,139,139,1],darkgoldenrod:[184,134,11,1],darkgray:[169,169,169,1],darkgreen:[0,100,0,1],darkgrey:[169,169,169,1],darkkhaki:[189,183,107,1],darkmagenta:[139,0,139,1],darkolivegreen:[85,107,47,1],darkorange:[255,140,0,1],darkorchid:[153,50,204,1],darkred:[139,0,0,1],darksalmon:[233,150,122,1],darkseagreen:[143,188,143,1],darkslateblue:[72,61,139,1],darkslategray:[47,79,79,1],darkslategrey:[47,79,79,1],darkturquoise:[0,206,209,1],darkviolet:[148,0,211,1],deeppink:[255,20,147,1],deepskyblue:[0,191,255,1],dimgray:[105,105,105,1],dimgrey:[105,105,105,1],dodgerblue:[30,144,255,1],firebrick:[178,34,34,1],floralwhite:[255,250,240,1],forestgreen:[34,139,34,1],fuchsia:[255,0,255,1],gainsboro:[220,220,220,1],ghostwhite:[248,248,255,1],gold:[255,215,0,1],goldenrod:[218,165,32,1],gray:[128,128,128,1],green:[0,128,0,1],greenyellow:[173,255,47,1],grey:[128,128,128,1],honeydew:[240,255,240,1],hotpink:[255,105,180,1],indianred:[205,92,92,1],indigo:[75,0,130,1],ivory:[255,255,240,1],khaki:[240,230,140,1],lavender:[230,230,250,1],lavenderblush:[255,240,245,1],lawngreen:[124,252,0,1],lemonchiffon:[255,250,205,1],lightblue:[173,216,230,1],lightcoral:[240,128,128,1],lightcyan:[224,255,255,1],lightgoldenrodyellow:[250,250,210,1],lightgray:[211,211,211,1],lightgreen:[144,238,144,1],lightgrey:[211,211,211,1],lightpink:[255,182,193,1],lightsalmon:[255,160,122,1],lightseagreen:[32,178,170,1],lightskyblue:[135,206,250,1],lightslategray:[119,136,153,1],lightslategrey:[119,136,153,1],lightsteelblue:[176,196,222,1],lightyellow:[255,255,224,1],lime:[0,255,0,1],limegreen:[50,205,50,1],linen:[250,240,230,1],magenta:[255,0,255,1],maroon:[128,0,0,1],mediumaquamarine:[102,205,170,1],mediumblue:[0,0,205,1],mediumorchid:[186,85,211,1],mediumpurple:[147,112,219,1],mediumseagreen:[60,179,113,1],mediumslateblue:[123,104,238,1],mediumspringgreen:[0,250,154,1],mediumturquoise:[72,209,204,1],mediumvioletred:[199,21,133,1],midnightblue:[25,25,112,1],mintcream:[245,255,250,1],mistyrose:[255,228,225,1],moccasin:[255,228,181,1],navajowhite:[255,222,173,1],navy:[0,0,128,1],oldlace:[253,245,230,1],olive:[128,128,0,1],olivedrab:[107,142,35,1],orange:[255,165,0,1],orangered:[255,69,0,1],orchid:[218,112,214,1],palegoldenrod:[238,232,170,1],palegreen:[152,251,152,1],paleturquoise:[175,238,238,1],palevioletred:[219,112,147,1],papayawhip:[255,239,213,1],peachpuff:[255,218,185,1],peru:[205,133,63,1],pink:[255,192,203,1],plum:[221,160,221,1],powderblue:[176,224,230,1],purple:[128,0,128,1],red:[255,0,0,1],rosybrown:[188,143,143,1],royalblue:[65,105,225,1],saddlebrown:[139,69,19,1],salmon:[250,128,114,1],sandybrown:[244,164,96,1],seagreen:[46,139,87,1],seashell:[255,245,238,1],sienna:[160,82,45,1],silver:[192,192,192,1],skyblue:[135,206,235,1],slateblue:[106,90,205,1],slategray:[112,128,144,1],slategrey:[112,128,144,1],snow:[255,250,250,1],springgreen:[0,255,127,1],steelblue:[70,130,180,1],tan:[210,180,140,1],teal:[0,128,128,1],thistle:[216,191,216,1],tomato:[255,99,71,1],turquoise:[64,224,208,1],violet:[238,130,238,1],wheat:[245,222,179,1],white:[255,255,255,1],whitesmoke:[245,245,245,1],yellow:[255,255,0,1],yellowgreen:[154,205,50,1]};function Hf(e){return e=Math.round(e),e<0?0:e>255?255:e}function jgt(e){return e=Math.round(e),e<0?0:e>360?360:e}function DD(e){return e<0?0:e>1?1:e}function PJ(e){var t=e;return t.length&&t.charAt(t.length-1)==="%"?Hf(parseFloat(t)/100*255):Hf(parseInt(t,10))}function Rg(e){var t=e;return t.length&&t.charAt(t.length-1)==="%"?DD(parseFloat(t)/100):DD(parseFloat(t))}function RJ(e,t,r){return r<0?r+=1:r>1&&(r-=1),r*6<1?e+(t-e)*r*6:r*2<1?t:r*3<2?e+(t-e)*(2/3-r)*6:e}function Zy(e,t,r){return e+(t-e)*r}function Ep(e,t,r,o,n){return e[0]=t,e[1]=r,e[2]=o,e[3]=n,e}function EJ(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e}var q1e=new gm(20),ZV=null;function gP(e,t){ZV&&EJ(ZV,t),ZV=q1e.put(e,ZV||t.slice())}function ga(e,t){if(e){t=t||[];var r=q1e.get(e);if(r)return EJ(t,r);e=e+"";var o=e.replace(/ /g,"").toLowerCase();if(o in Y1e)return EJ(t,Y1e[o]),gP(e,t),t;var n=o.length;if(o.charAt(0)==="#"){if(n===4||n===5){var i=parseInt(o.slice(1,4),16);if(!(i>=0&&i<=4095)){Ep(t,0,0,0,1);return}return Ep(t,(i&3840)>>4|(i&3840)>>8,i&240|(i&240)>>4,i&15|(i&15)<<4,n===5?parseInt(o.slice(4),16)/15:1),gP(e,t),t}else if(n===7||n===9){var i=parseInt(o.slice(1,7),16);if(!(i>=0&&i<=16777215)){Ep(t,0,0,0,1);return}return Ep(t,(i&16711680)>>16,(i&65280)>>8,i&255,n===9?parseInt(o.slice(7),16)/255:1),gP(e,t),t}return}var a=o.indexOf("("),s=o.indexOf(")");if(a!==-1&&s+1===n){var l=o.substr(0,a),u=o.substr(a+1,s-(a+1)).split(","),c=1;switch(l){case"rgba":if(u.length!==4)return u.length===3?Ep(t,+u[0],+u[1],+u[2],1):Ep(t,0,0,0,1);c=Rg(u.pop());case"rgb":if(u.length>=3)return Ep(t,PJ(u[0]),PJ(u[1]),PJ(u[2]),u.length===3?c:Rg(u[3])),gP(e,t),t;Ep(t,0,0,0,1);return;case"hsla":if(u.length!==4){Ep(t,0,0,0,1);return}return u[3]=Rg(u[3]),MJ(u,t),gP(e,t),t;case"hsl":if(u.length!==3){Ep(t,0,0,0,1);return}return MJ(u,t),gP(e,t),t;default:return}}Ep(t,0,0,0,1)}}function MJ(e,t){var r=(parseFloat(e[0])%360+360)%360/360,o=Rg(e[1]),n=Rg(e[2]),i=n<=.5?n*(o+1):n+o-n*o,a=n*2-i;return t=t||[],Ep(t,Hf(RJ(a,i,r+1/3)*255),Hf(RJ(a,i,r)*255),Hf(RJ(a,i,r-1/3)*255),1),e.length===4&&(t[3]=e[3]),t}function Wgt(e){if(e){var t=e[0]/255,r=e[1]/255,o=e[2]/255,n=Math.min(t,r,o),i=Math.max(t,r,o),a=i-n,s=(i+n)/2,l,u;if(a===0)l=0,u=0;else{s<.5?u=a/(i+n):u=a/(2-i-n);var c=((i-t)/6+a/2)/a,p=((i-r)/6+a/2)/a,f=((i-o)/6+a/2)/a;t===i?l=f-p:r===i?l=1/3+c-f:o===i&&(l=2/3+p-c),l<0&&(l+=1),l>1&&(l-=1)}var d=[l*360,u,s];return e[3]!=null&&d.push(e[3]),d}}function qV(e,t){var r=ga(e);if(r){for(var o=0;o<3;o++)t<0?r[o]=r[o]*(1-t)|0:r[o]=(255-r[o])*t+r[o]|0,r[o]>255?r[o]=255:r[o]<0&&(r[o]=0);return Du(r,r.length===4?"rgba":"rgb")}}function KV(e,t,r){if(!(!(t&&t.length)||!(e>=0&&e<=1))){r=r||[];var o=e*(t.length-1),n=Math.floor(o),i=Math.ceil(o),a=t[n],s=t[i],l=o-n;return r[0]=Hf(Zy(a[0],s[0],l)),r[1]=Hf(Zy(a[1],s[1],l)),r[2]=Hf(Zy(a[2],s[2],l)),r[3]=DD(Zy(a[3],s[3],l)),r}}function K1e(e,t,r){if(!(!(t&&t.length)||!(e>=0&&e<=1))){var o=e*(t.length-1),n=Math.floor(o),i=Math.ceil(o),a=ga(t[n]),s=ga(t[i]),l=o-n,u=Du([Hf(Zy(a[0],s[0],l)),Hf(Zy(a[1],s[1],l)),Hf(Zy(a[2],s[2],l)),DD(Zy(a[3],s[3],l))],"rgba");return r?{color:u,leftIndex:n,rightIndex:i,value:o}:u}}function Mp(e,t,r,o){var n=ga(e);if(e)return n=Wgt(n),t!=null&&(n[0]=jgt(Ae(t)?t(n[0]):t)),r!=null&&(n[1]=Rg(Ae(r)?r(n[1]):r)),o!=null&&(n[2]=Rg(Ae(o)?o(n[2]):o)),Du(MJ(n),"rgba")}function fS(e,t){var r=ga(e);if(r&&t!=null)return r[3]=DD(t),Du(r,"rgba")}function Du(e,t){if(!(!e||!e.length)){var r=e[0]+","+e[1]+","+e[2];return(t==="rgba"||t==="hsva"||t==="hsla")&&(r+=","+e[3]),t+"("+r+")"}}function vP(e,t){var r=ga(e);return r?(.299*r[0]+.587*r[1]+.114*r[2])*r[3]/255+(1-r[3])*t:0}var Z1e=new gm(100);function OD(e){if(xe(e)){var t=Z1e.get(e);return t||(t=qV(e,-.1),Z1e.put(e,t)),t}else if(Vy(e)){var r=re({},e);return r.colorStops=ae(e.colorStops,function(o){return{offset:o.offset,color:qV(o.color,-.1)}}),r}return e}var JV=Math.round;function qy(e){var t;if(!e||e==="transparent")e="none";else if(typeof e=="string"&&e.indexOf("rgba")>-1){var r=ga(e);r&&(e="rgb("+r[0]+","+r[1]+","+r[2]+")",t=r[3])}return{color:e,opacity:t??1}}var X1e=1e-4;function vm(e){return e<X1e&&e>-X1e}function QV(e){return JV(e*1e3)/1e3}function e$(e){return JV(e*1e4)/1e4}function Q1e(e){return"matrix("+QV(e[0])+","+QV(e[1])+","+QV(e[2])+","+QV(e[3])+","+e$(e[4])+","+e$(e[5])+")"}var J1e={left:"start",right:"end",center:"middle",middle:"middle"};function eRe(e,t,r){return r==="top"?e+=t/2:r==="bottom"&&(e-=t/2),e}function tRe(e){return e&&(e.shadowBlur||e.shadowOffsetX||e.shadowOffsetY)}function rRe(e){var t=e.style,r=e.getGlobalScale();return[t.shadowColor,(t.shadowBlur||0).toFixed(2),(t.shadowOffsetX||0).toFixed(2),(t.shadowOffsetY||0).toFixed(2),r[0],r[1]].join(",")}function IJ(e){return e&&!!e.image}function Ygt(e){return e&&!!e.svgElement}function kD(e){return IJ(e)||Ygt(e)}function t$(e){return e.type==="linear"}function r$(e){return e.type==="radial"}function o$(e){return e&&(e.type==="linear"||e.type==="radial")}function AD(e){return"url(#"+e+")"}function n$(e){var t=e.getGlobalScale(),r=Math.max(t[0],t[1]);return Math.max(Math.ceil(Math.log(r)/Math.log(10)),1)}function i$(e){var t=e.x||0,r=e.y||0,o=(e.rotation||0)*sP,n=Ue(e.scaleX,1),i=Ue(e.scaleY,1),a=e.skewX||0,s=e.skewY||0,l=[];return(t||r)&&l.push("translate("+t+"px,"+r+"px)"),o&&l.push("rotate("+o+")"),(n!==1||i!==1)&&l.push("scale("+n+","+i+")"),(a||s)&&l.push("skew("+JV(a*sP)+"deg, "+JV(s*sP)+"deg)"),l.join(" ")}var oRe=(function(){return rr.hasGlobalWindow&&Ae(window.btoa)?function(e){return window.btoa(unescape(encodeURIComponent(e)))}:typeof Buffer<"u"?function(e){return Buffer.from(e).toString("base64")}:function(e){return null}})();var OJ=Array.prototype.slice;function Eg(e,t,r){return(t-e)*r+e}function DJ(e,t,r,o){for(var n=t.length,i=0;i<n;i++)e[i]=Eg(t[i],r[i],o);return e}function Zgt(e,t,r,o){for(var n=t.length,i=n&&t[0].length,a=0;a<n;a++){e[a]||(e[a]=[]);for(var s=0;s<i;s++)e[a][s]=Eg(t[a][s],r[a][s],o)}return e}function a$(e,t,r,o){for(var n=t.length,i=0;i<n;i++)e[i]=t[i]+r[i]*o;return e}function nRe(e,t,r,o){for(var n=t.length,i=n&&t[0].length,a=0;a<n;a++){e[a]||(e[a]=[]);for(var s=0;s<i;s++)e[a][s]=t[a][s]+r[a][s]*o}return e}function qgt(e,t){for(var r=e.length,o=t.length,n=r>o?t:e,i=Math.min(r,o),a=n[i-1]||{color:[0,0,0,0],offset:0},s=i;s<Math.max(r,o);s++)n.push({offset:a.offset,color:a.color.slice()})}function Kgt(e,t,r){var o=e,n=t;if(!(!o.push||!n.push)){var i=o.length,a=n.length;if(i!==a){var s=i>a;if(s)o.length=a;else for(var l=i;l<a;l++)o.push(r===1?n[l]:OJ.call(n[l]))}for(var u=o[0]&&o[0].length,l=0;l<o.length;l++)if(r===1)isNaN(o[l])&&(o[l]=n[l]);else for(var c=0;c<u;c++)isNaN(o[l][c])&&(o[l][c]=n[l][c])}}function dS(e){if(ri(e)){var t=e.length;if(ri(e[0])){for(var r=[],o=0;o<t;o++)r.push(OJ.call(e[o]));return r}return OJ.call(e)}return e}function u$(e){return e[0]=Math.floor(e[0])||0,e[1]=Math.floor(e[1])||0,e[2]=Math.floor(e[2])||0,e[3]=e[3]==null?1:e[3],"rgba("+e.join(",")+")"}function Xgt(e){return ri(e&&e[0])?2:1}var s$=0,c$=1,sRe=2,ND=3,kJ=4,AJ=5,iRe=6;function aRe(e){return e===kJ||e===AJ}function l$(e){return e===c$||e===sRe}var LD=[0,0,0,0],Qgt=(function(){function e(t){this.keyframes=[],this.discrete=!1,this._invalid=!1,this._needsSort=!1,this._lastFr=0,this._lastFrP=0,this.propName=t}return e.prototype.isFinished=function(){return this._finished},e.prototype.setFinished=function(){this._finished=!0,this._additiveTrack&&this._additiveTrack.setFinished()},e.prototype.needsAnimate=function(){return this.keyframes.length>=1},e.prototype.getAdditiveTrack=function(){return this._additiveTrack},e.prototype.addKeyframe=function(t,r,o){this._needsSort=!0;var n=this.keyframes,i=n.length,a=!1,s=iRe,l=r;if(ri(r)){var u=Xgt(r);s=u,(u===1&&!Ft(r[0])||u===2&&!Ft(r[0][0]))&&(a=!0)}else if(Ft(r)&&!oi(r))s=s$;else if(xe(r))if(!isNaN(+r))s=s$;else{var c=ga(r);c&&(l=c,s=ND)}else if(Vy(r)){var p=re({},l);p.colorStops=ae(r.colorStops,function(d){return{offset:d.offset,color:ga(d.color)}}),t$(r)?s=kJ:r$(r)&&(s=AJ),l=p}i===0?this.valType=s:(s!==this.valType||s===iRe)&&(a=!0),this.discrete=this.discrete||a;var f={time:t,value:l,rawValue:r,percent:0};return o&&(f.easing=o,f.easingFunc=Ae(o)?o:VV[o]||hP(o)),n.push(f),f},e.prototype.prepare=function(t,r){var o=this.keyframes;this._needsSort&&o.sort(function(h,g){return h.time-g.time});for(var n=this.valType,i=o.length,a=o[i-1],s=this.discrete,l=l$(n),u=aRe(n),c=0;c<i;c++){var p=o[c],f=p.value,d=a.value;p.percent=p.time/t,s||(l&&c!==i-1?Kgt(f,d,n):u&&qgt(f.colorStops,d.colorStops))}if(!s&&n!==AJ&&r&&this.needsAnimate()&&r.needsAnimate()&&n===r.valType&&!r._finished){this._additiveTrack=r;for(var m=o[0].value,c=0;c<i;c++)n===s$?o[c].additiveValue=o[c].value-m:n===ND?o[c].additiveValue=a$([],o[c].value,m,-1):l$(n)&&(o[c].additiveValue=n===c$?a$([],o[c].value,m,-1):nRe([],o[c].value,m,-1))}},e.prototype.step=function(t,r){if(!this._finished){this._additiveTrack&&this._additiveTrack._finished&&(this._additiveTrack=null);var o=this._additiveTrack!=null,n=o?"additiveValue":"value",i=this.valType,a=this.keyframes,s=a.length,l=this.propName,u=i===ND,c,p=this._lastFr,f=Math.min,d,m;if(s===1)d=m=a[0];else{if(r<0)c=0;else if(r<this._lastFrP){var h=f(p+1,s-1);for(c=h;c>=0&&!(a[c].percent<=r);c--);c=f(c,s-2)}else{for(c=p;c<s&&!(a[c].percent>r);c++);c=f(c-1,s-2)}m=a[c+1],d=a[c]}if(d&&m){this._lastFr=c,this._lastFrP=r;var g=m.percent-d.percent,v=g===0?1:f((r-d.percent)/g,1);m.easingFunc&&(v=m.easingFunc(v));var y=o?this._additiveValue:u?LD:t[l];if((l$(i)||u)&&!y&&(y=this._additiveValue=[]),this.discrete)t[l]=v<1?d.rawValue:m.rawValue;else if(l$(i))i===c$?DJ(y,d[n],m[n],v):Zgt(y,d[n],m[n],v);else if(aRe(i)){var x=d[n],b=m[n],S=i===kJ;t[l]={type:S?"linear":"radial",x:Eg(x.x,b.x,v),y:Eg(x.y,b.y,v),colorStops:ae(x.colorStops,function(w,C){var P=b.colorStops[C];return{offset:Eg(w.offset,P.offset,v),color:u$(DJ([],w.color,P.color,v))}}),global:b.global},S?(t[l].x2=Eg(x.x2,b.x2,v),t[l].y2=Eg(x.y2,b.y2,v)):t[l].r=Eg(x.r,b.r,v)}else if(u)DJ(y,d[n],m[n],v),o||(t[l]=u$(y));else{var T=Eg(d[n],m[n],v);o?this._additiveValue=T:t[l]=T}o&&this._addToTarget(t)}}},e.prototype._addToTarget=function(t){var r=this.valType,o=this.propName,n=this._additiveValue;r===s$?t[o]=t[o]+n:r===ND?(ga(t[o],LD),a$(LD,LD,n,1),t[o]=u$(LD)):r===c$?a$(t[o],t[o],n,1):r===sRe&&nRe(t[o],t[o],n,1)},e})(),Jgt=(function(){function e(t,r,o,n){if(this._tracks={},this._trackKeys=[],this._maxTime=0,this._started=0,this._clip=null,this._target=t,this._loop=r,r&&n){tS("Can' use additive animation on looped animation.");return}this._additiveAnimators=n,this._allowDiscrete=o}return e.prototype.getMaxTime=function(){return this._maxTime},e.prototype.getDelay=function(){return this._delay},e.prototype.getLoop=function(){return this._loop},e.prototype.getTarget=function(){return this._target},e.prototype.changeTarget=function(t){this._target=t},e.prototype.when=function(t,r,o){return this.whenWithKeys(t,r,Nt(r),o)},e.prototype.whenWithKeys=function(t,r,o,n){for(var i=this._tracks,a=0;a<o.length;a++){var s=o[a],l=i[s];if(!l){l=i[s]=new Qgt(s);var u=void 0,c=this._getAdditiveTrack(s);if(c){var p=c.keyframes,f=p[p.length-1];u=f&&f.value,c.valType===ND&&u&&(u=u$(u))}else u=this._target[s];if(u==null)continue;t>0&&l.addKeyframe(0,dS(u),n),this._trackKeys.push(s)}l.addKeyframe(t,dS(r[s]),n)}return this._maxTime=Math.max(this._maxTime,t),this},e.prototype.pause=function(){this._clip.pause(),this._paused=!0},e.prototype.resume=function(){this._clip.resume(),this._paused=!1},e.prototype.isPaused=function(){return!!this._paused},e.prototype.duration=function(t){return this._maxTime=t,this._force=!0,this},e.prototype._doneCallback=function(){this._setTracksFinished(),this._clip=null;var t=this._doneCbs;if(t)for(var r=t.length,o=0;o<r;o++)t[o].call(this)},e.prototype._abortedCallback=function(){this._setTracksFinished();var t=this.animation,r=this._abortedCbs;if(t&&t.removeClip(this._clip),this._clip=null,r)for(var o=0;o<r.length;o++)r[o].call(this)},e.prototype._setTracksFinished=function(){for(var t=this._tracks,r=this._trackKeys,o=0;o<r.length;o++)t[r[o]].setFinished()},e.prototype._getAdditiveTrack=function(t){var r,o=this._additiveAnimators;if(o)for(var n=0;n<o.length;n++){var i=o[n].getTrack(t);i&&(r=i)}return r},e.prototype.start=function(t){if(!(this._started>0)){this._started=1;for(var r=this,o=[],n=this._maxTime||0,i=0;i<this._trackKeys.length;i++){var a=this._trackKeys[i],s=this._tracks[a],l=this._getAdditiveTrack(a),u=s.keyframes,c=u.length;if(s.prepare(n,l),s.needsAnimate())if(!this._allowDiscrete&&s.discrete){var p=u[c-1];p&&(r._target[s.propName]=p.rawValue),s.setFinished()}else o.push(s)}if(o.length||this._force){var f=new j1e({life:n,loop:this._loop,delay:this._delay||0,onframe:function(d){r._started=2;var m=r._additiveAnimators;if(m){for(var h=!1,g=0;g<m.length;g++)if(m[g]._clip){h=!0;break}h||(r._additiveAnimators=null)}for(var g=0;g<o.length;g++)o[g].step(r._target,d);var v=r._onframeCbs;if(v)for(var g=0;g<v.length;g++)v[g](r._target,d)},ondestroy:function(){r._doneCallback()}});this._clip=f,this.animation&&this.animation.addClip(f),t&&f.setEasing(t)}else this._doneCallback();return this}},e.prototype.stop=function(t){if(this._clip){var r=this._clip;t&&r.onframe(1),this._abortedCallback()}},e.prototype.delay=function(t){return this._delay=t,this},e.prototype.during=function(t){return t&&(this._onframeCbs||(this._onframeCbs=[]),this._onframeCbs.push(t)),this},e.prototype.done=function(t){return t&&(this._doneCbs||(this._doneCbs=[]),this._doneCbs.push(t)),this},e.prototype.aborted=function(t){return t&&(this._abortedCbs||(this._abortedCbs=[]),this._abortedCbs.push(t)),this},e.prototype.getClip=function(){return this._clip},e.prototype.getTrack=function(t){return this._tracks[t]},e.prototype.getTracks=function(){var t=this;return ae(this._trackKeys,function(r){return t._tracks[r]})},e.prototype.stopTracks=function(t,r){if(!t.length||!this._clip)return!0;for(var o=this._tracks,n=this._trackKeys,i=0;i<t.length;i++){var a=o[t[i]];a&&!a.isFinished()&&(r?a.step(this._target,1):this._started===1&&a.step(this._target,0),a.setFinished())}for(var s=!0,i=0;i<n.length;i++)if(!o[n[i]].isFinished()){s=!1;break}return s&&this._abortedCallback(),s},e.prototype.saveTo=function(t,r,o){if(t){r=r||this._trackKeys;for(var n=0;n<r.length;n++){var i=r[n],a=this._tracks[i];if(!(!a||a.isFinished())){var s=a.keyframes,l=s[o?0:s.length-1];l&&(t[i]=dS(l.rawValue))}}}},e.prototype.__changeFinalValue=function(t,r){r=r||Nt(t);for(var o=0;o<r.length;o++){var n=r[o],i=this._tracks[n];if(i){var a=i.keyframes;if(a.length>1){var s=a.pop();i.addKeyframe(s.time,t[n]),i.prepare(this._maxTime,i.getAdditiveTrack())}}}},e})(),zD=Jgt;function mS(){return new Date().getTime()}var evt=(function(e){Y(t,e);function t(r){var o=e.call(this)||this;return o._running=!1,o._time=0,o._pausedTime=0,o._pauseStart=0,o._paused=!1,r=r||{},o.stage=r.stage||{},o}return t.prototype.addClip=function(r){r.animation&&this.removeClip(r),this._head?(this._tail.next=r,r.prev=this._tail,r.next=null,this._tail=r):this._head=this._tail=r,r.animation=this},t.prototype.addAnimator=function(r){r.animation=this;var o=r.getClip();o&&this.addClip(o)},t.prototype.removeClip=function(r){if(r.animation){var o=r.prev,n=r.next;o?o.next=n:this._head=n,n?n.prev=o:this._tail=o,r.next=r.prev=r.animation=null}},t.prototype.removeAnimator=function(r){var o=r.getClip();o&&this.removeClip(o),r.animation=null},t.prototype.update=function(r){for(var o=mS()-this._pausedTime,n=o-this._time,i=this._head;i;){var a=i.next,s=i.step(o,n);s&&(i.ondestroy(),this.removeClip(i)),i=a}this._time=o,r||(this.trigger("frame",n),this.stage.update&&this.stage.update())},t.prototype._startLoop=function(){var r=this;this._running=!0;function o(){r._running&&(ED(o),!r._paused&&r.update())}ED(o)},t.prototype.start=function(){this._running||(this._time=mS(),this._pausedTime=0,this._startLoop())},t.prototype.stop=function(){this._running=!1},t.prototype.pause=function(){this._paused||(this._pauseStart=mS(),this._paused=!0)},t.prototype.resume=function(){this._paused&&(this._pausedTime+=mS()-this._pauseStart,this._paused=!1)},t.prototype.clear=function(){for(var r=this._head;r;){var o=r.next;r.prev=r.next=r.animation=null,r=o}this._head=this._tail=null},t.prototype.isFinished=function(){return this._head==null},t.prototype.animate=function(r,o){o=o||{},this.start();var n=new zD(r,o.loop);return this.addAnimator(n),n},t})(Qi),lRe=evt;var tvt=300,LJ=rr.domSupported,NJ=(function(){var e=["click","dblclick","mousewheel","wheel","mouseout","mouseup","mousedown","mousemove","contextmenu"],t=["touchstart","touchend","touchmove"],r={pointerdown:1,pointerup:1,pointermove:1,pointerout:1},o=ae(e,function(n){var i=n.replace("mouse","pointer");return r.hasOwnProperty(i)?i:n});return{mouse:e,touch:t,pointer:o}})(),uRe={mouse:["mousemove","mouseup"],pointer:["pointermove","pointerup"]},cRe=!1;function UJ(e){var t=e.pointerType;return t==="pen"||t==="touch"}function rvt(e){e.touching=!0,e.touchTimer!=null&&(clearTimeout(e.touchTimer),e.touchTimer=null),e.touchTimer=setTimeout(function(){e.touching=!1,e.touchTimer=null},700)}function zJ(e){e&&(e.zrByTouch=!0)}function ovt(e,t){return Mu(e.dom,new nvt(e,t),!0)}function fRe(e,t){for(var r=t,o=!1;r&&r.nodeType!==9&&!(o=r.domBelongToZr||r!==t&&r===e.painterRoot);)r=r.parentNode;return o}var nvt=(function(){function e(t,r){this.stopPropagation=xo,this.stopImmediatePropagation=xo,this.preventDefault=xo,this.type=r.type,this.target=this.currentTarget=t.dom,this.pointerType=r.pointerType,this.clientX=r.clientX,this.clientY=r.clientY}return e})(),jf={mousedown:function(e){e=Mu(this.dom,e),this.__mayPointerCapture=[e.zrX,e.zrY],this.trigger("mousedown",e)},mousemove:function(e){e=Mu(this.dom,e);var t=this.__mayPointerCapture;t&&(e.zrX!==t[0]||e.zrY!==t[1])&&this.__togglePointerCapture(!0),this.trigger("mousemove",e)},mouseup:function(e){e=Mu(this.dom,e),this.__togglePointerCapture(!1),this.trigger("mouseup",e)},mouseout:function(e){e=Mu(this.dom,e);var t=e.toElement||e.relatedTarget;fRe(this,t)||(this.__pointerCapturing&&(e.zrEventControl="no_globalout"),this.trigger("mouseout",e))},wheel:function(e){cRe=!0,e=Mu(this.dom,e),this.trigger("mousewheel",e)},mousewheel:function(e){cRe||(e=Mu(this.dom,e),this.trigger("mousewheel",e))},touchstart:function(e){e=Mu(this.dom,e),zJ(e),this.__lastTouchMoment=new Date,this.handler.processGesture(e,"start"),jf.mousemove.call(this,e),jf.mousedown.call(this,e)},touchmove:function(e){e=Mu(this.dom,e),zJ(e),this.handler.processGesture(e,"change"),jf.mousemove.call(this,e)},touchend:function(e){e=Mu(this.dom,e),zJ(e),this.handler.processGesture(e,"end"),jf.mouseup.call(this,e),+new Date-+this.__lastTouchMoment<tvt&&jf.click.call(this,e)},pointerdown:function(e){jf.mousedown.call(this,e)},pointermove:function(e){UJ(e)||jf.mousemove.call(this,e)},pointerup:function(e){jf.mouseup.call(this,e)},pointerout:function(e){UJ(e)||jf.mouseout.call(this,e)}};L(["click","dblclick","contextmenu"],function(e){jf[e]=function(t){t=Mu(this.dom,t),this.trigger(e,t)}});var VJ={pointermove:function(e){UJ(e)||VJ.mousemove.call(this,e)},pointerup:function(e){VJ.mouseup.call(this,e)},mousemove:function(e){this.trigger("mousemove",e)},mouseup:function(e){var t=this.__pointerCapturing;this.__togglePointerCapture(!1),this.trigger("mouseup",e),t&&(e.zrEventControl="only_globalout",this.trigger("mouseout",e))}};function ivt(e,t){var r=t.domHandlers;rr.pointerEventsSupported?L(NJ.pointer,function(o){p$(t,o,function(n){r[o].call(e,n)})}):(rr.touchEventsSupported&&L(NJ.touch,function(o){p$(t,o,function(n){r[o].call(e,n),rvt(t)})}),L(NJ.mouse,function(o){p$(t,o,function(n){n=FV(n),t.touching||r[o].call(e,n)})}))}function avt(e,t){rr.pointerEventsSupported?L(uRe.pointer,r):rr.touchEventsSupported||L(uRe.mouse,r);function r(o){function n(i){i=FV(i),fRe(e,i.target)||(i=ovt(e,i),t.domHandlers[o].call(e,i))}p$(t,o,n,{capture:!0})}}function p$(e,t,r,o){e.mounted[t]=r,e.listenerOpts[t]=o,wD(e.domTarget,t,r,o)}function FJ(e){var t=e.mounted;for(var r in t)t.hasOwnProperty(r)&&S1e(e.domTarget,r,t[r],e.listenerOpts[r]);e.mounted={}}var pRe=(function(){function e(t,r){this.mounted={},this.listenerOpts={},this.touching=!1,this.domTarget=t,this.domHandlers=r}return e})(),svt=(function(e){Y(t,e);function t(r,o){var n=e.call(this)||this;return n.__pointerCapturing=!1,n.dom=r,n.painterRoot=o,n._localHandlerScope=new pRe(r,jf),LJ&&(n._globalHandlerScope=new pRe(document,VJ)),ivt(n,n._localHandlerScope),n}return t.prototype.dispose=function(){FJ(this._localHandlerScope),LJ&&FJ(this._globalHandlerScope)},t.prototype.setCursor=function(r){this.dom.style&&(this.dom.style.cursor=r||"default")},t.prototype.__togglePointerCapture=function(r){if(this.__mayPointerCapture=null,LJ&&+this.__pointerCapturing^+r){this.__pointerCapturing=r;var o=this._globalHandlerScope;r?avt(this,o):FJ(o)}},t})(Qi),dRe=svt;var mRe=1;rr.hasGlobalWindow&&(mRe=Math.max(window.devicePixelRatio||window.screen&&window.screen.deviceXDPI/window.screen.logicalXDPI||1,1));var hS=mRe,FD=.4,UD="#333",VD="#ccc",hRe="#eee";var gRe=Gy,vRe=5e-5;function gS(e){return e>vRe||e<-vRe}var vS=[],yP=[],$J=Vo(),BJ=Math.abs,lvt=(function(){function e(){}return e.prototype.getLocalTransform=function(t){return e.getLocalTransform(this,t)},e.prototype.setPosition=function(t){this.x=t[0],this.y=t[1]},e.prototype.setScale=function(t){this.scaleX=t[0],this.scaleY=t[1]},e.prototype.setSkew=function(t){this.skewX=t[0],this.skewY=t[1]},e.prototype.setOrigin=function(t){this.originX=t[0],this.originY=t[1]},e.prototype.needLocalTransform=function(){return gS(this.rotation)||gS(this.x)||gS(this.y)||gS(this.scaleX-1)||gS(this.scaleY-1)||gS(this.skewX)||gS(this.skewY)},e.prototype.updateTransform=function(){var t=this.parent&&this.parent.transform,r=this.needLocalTransform(),o=this.transform;if(!(r||t)){o&&(gRe(o),this.invTransform=null);return}o=o||Vo(),r?this.getLocalTransform(o):gRe(o),t&&(r?Vs(o,t,o):oS(o,t)),this.transform=o,this._resolveGlobalScaleRatio(o)},e.prototype._resolveGlobalScaleRatio=function(t){var r=this.globalScaleRatio;if(r!=null&&r!==1){this.getGlobalScale(vS);var o=vS[0]<0?-1:1,n=vS[1]<0?-1:1,i=((vS[0]-o)*r+o)/vS[0]||0,a=((vS[1]-n)*r+n)/vS[1]||0;t[0]*=i,t[1]*=i,t[2]*=a,t[3]*=a}this.invTransform=this.invTransform||Vo(),Ji(this.invTransform,t)},e.prototype.getComputedTransform=function(){for(var t=this,r=[];t;)r.push(t),t=t.parent;for(;t=r.pop();)t.updateTransform();return this.transform},e.prototype.setLocalTransform=function(t){if(t){var r=t[0]*t[0]+t[1]*t[1],o=t[2]*t[2]+t[3]*t[3],n=Math.atan2(t[1],t[0]),i=Math.PI/2+n-Math.atan2(t[3],t[2]);o=Math.sqrt(o)*Math.cos(i),r=Math.sqrt(r),this.skewX=i,this.skewY=0,this.rotation=-n,this.x=+t[4],this.y=+t[5],this.scaleX=r,this.scaleY=o,this.originX=0,this.originY=0}},e.prototype.decomposeTransform=function(){if(this.transform){var t=this.parent,r=this.transform;t&&t.transform&&(t.invTransform=t.invTransform||Vo(),Vs(yP,t.invTransform,r),r=yP);var o=this.originX,n=this.originY;(o||n)&&($J[4]=o,$J[5]=n,Vs(yP,r,$J),yP[4]-=o,yP[5]-=n,r=yP),this.setLocalTransform(r)}},e.prototype.getGlobalScale=function(t){var r=this.transform;return t=t||[],r?(t[0]=Math.sqrt(r[0]*r[0]+r[1]*r[1]),t[1]=Math.sqrt(r[2]*r[2]+r[3]*r[3]),r[0]<0&&(t[0]=-t[0]),r[3]<0&&(t[1]=-t[1]),t):(t[0]=1,t[1]=1,t)},e.prototype.transformCoordToLocal=function(t,r){var o=[t,r],n=this.invTransform;return n&&Do(o,o,n),o},e.prototype.transformCoordToGlobal=function(t,r){var o=[t,r],n=this.transform;return n&&Do(o,o,n),o},e.prototype.getLineScale=function(){var t=this.transform;return t&&BJ(t[0]-1)>1e-10&&BJ(t[3]-1)>1e-10?Math.sqrt(BJ(t[0]*t[3]-t[2]*t[1])):1},e.prototype.copyTransform=function(t){xP(this,t)},e.getLocalTransform=function(t,r){r=r||[];var o=t.originX||0,n=t.originY||0,i=t.scaleX,a=t.scaleY,s=t.anchorX,l=t.anchorY,u=t.rotation||0,c=t.x,p=t.y,f=t.skewX?Math.tan(t.skewX):0,d=t.skewY?Math.tan(-t.skewY):0;if(o||n||s||l){var m=o+s,h=n+l;r[4]=-m*i-f*h*a,r[5]=-h*a-d*m*i}else r[4]=r[5]=0;return r[0]=i,r[3]=a,r[1]=d*i,r[2]=f*a,u&&cl(r,r,u),r[4]+=o+c,r[5]+=n+p,r},e.initDefaultProps=(function(){var t=e.prototype;t.scaleX=t.scaleY=t.globalScaleRatio=1,t.x=t.y=t.originX=t.originY=t.skewX=t.skewY=t.rotation=t.anchorX=t.anchorY=0})(),e})(),Dc=["x","y","originX","originY","anchorX","anchorY","rotation","scaleX","scaleY","skewX","skewY"];function xP(e,t){for(var r=0;r<Dc.length;r++){var o=Dc[r];e[o]=t[o]}}var Ou=lvt;function Wf(e){f$||(f$=new gm(100)),e=e||Ru;var t=f$.get(e);return t||(t={font:e,strWidthCache:new gm(500),asciiWidthMap:null,asciiWidthMapTried:!1,stWideCharWidth:Fa.measureText("\u56FD",e).width,asciiCharWidth:Fa.measureText("a",e).width},f$.put(e,t)),t}var f$;function uvt(e){if(!(GJ>=yRe)){e=e||Ru;for(var t=[],r=+new Date,o=0;o<=127;o++)t[o]=Fa.measureText(String.fromCharCode(o),e).width;var n=+new Date-r;return n>16?GJ=yRe:n>2&&GJ++,t}}var GJ=0,yRe=5;function HJ(e,t){return e.asciiWidthMapTried||(e.asciiWidthMap=uvt(e.font),e.asciiWidthMapTried=!0),0<=t&&t<=127?e.asciiWidthMap!=null?e.asciiWidthMap[t]:e.asciiCharWidth:e.stWideCharWidth}function Yf(e,t){var r=e.strWidthCache,o=r.get(t);return o==null&&(o=Fa.measureText(t,e.font).width,r.put(t,o)),o}function xRe(e,t,r,o){var n=Yf(Wf(t),e),i=yS(t),a=Xy(0,n,r),s=Mg(0,i,o),l=new Je(a,s,n,i);return l}function Ky(e,t,r,o){var n=((e||"")+"").split(`
+    ${e.palette.mode==="light"?e.lighten(e.alpha(e.palette.divider,1),.88):e.darken(e.alpha(e.palette.divider,1),.68)}`,textAlign:"left",padding:16,variants:[{props:{variant:"head"},style:{color:(e.vars||e).palette.text.primary,lineHeight:e.typography.pxToRem(24),fontWeight:e.typography.fontWeightMedium}},{props:{variant:"body"},style:{color:(e.vars||e).palette.text.primary}},{props:{variant:"footer"},style:{color:(e.vars||e).palette.text.secondary,lineHeight:e.typography.pxToRem(21),fontSize:e.typography.pxToRem(12)}},{props:{size:"small"},style:{padding:"6px 16px",[`&.${cPe.paddingCheckbox}`]:{width:24,padding:"0 12px 0 16px","& > *":{padding:0}}}},{props:{padding:"checkbox"},style:{width:48,padding:"0 0 0 4px"}},{props:{padding:"none"},style:{padding:0}},{props:{align:"left"},style:{textAlign:"left"}},{props:{align:"center"},style:{textAlign:"center"}},{props:{align:"right"},style:{textAlign:"right",flexDirection:"row-reverse"}},{props:{align:"justify"},style:{textAlign:"justify"}},{props:({ownerState:t})=>t.stickyHeader,style:{position:"sticky",top:0,zIndex:2,backgroundColor:(e.vars||e).palette.background.default}}]}))),qmt=mD.forwardRef(function(t,r){let o=et({props:t,name:"MuiTableCell"}),{align:n="inherit",className:i,component:a,padding:s,scope:l,size:u,sortDirection:c,variant:p,...f}=o,d=mD.useContext(aPe),m=mD.useContext(lPe),h=m&&m.variant==="head",g;a?g=a:g=h?"th":"td";let v=l;g==="td"?v=void 0:!v&&h&&(v="col");let y=p||m&&m.variant,x={...o,align:n,component:g,padding:s||(d&&d.padding?d.padding:"normal"),size:u||(d&&d.size?d.size:"medium"),sortDirection:c,stickyHeader:y==="head"&&d&&d.stickyHeader,variant:y},b=Ymt(x),S=null;return c&&(S=c==="asc"?"ascending":"descending"),(0,pPe.jsx)(Zmt,{as:g,ref:r,className:le(b.root,i),"aria-sort":S,scope:v,ownerState:x,...f})}),hD=qmt;var SPe=z(K(),1);gt();var dPe=z(K(),1);gt();function fPe(e){return We("MuiToolbar",e)}var Twr=Be("MuiToolbar",["root","gutters","regular","dense"]);var mPe=z(Q(),1),Kmt=e=>{let{classes:t,disableGutters:r,variant:o}=e;return ce({root:["root",!r&&"gutters",o]},fPe,t)},Xmt=ne("div",{name:"MuiToolbar",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.root,!r.disableGutters&&t.gutters,t[r.variant]]}})(nt(({theme:e})=>({position:"relative",display:"flex",alignItems:"center",variants:[{props:({ownerState:t})=>!t.disableGutters,style:{paddingLeft:e.spacing(2),paddingRight:e.spacing(2),[e.breakpoints.up("sm")]:{paddingLeft:e.spacing(3),paddingRight:e.spacing(3)}}},{props:{variant:"dense"},style:{minHeight:48}},{props:{variant:"regular"},style:e.mixins.toolbar}]}))),Qmt=dPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiToolbar"}),{className:n,component:i="div",disableGutters:a=!1,variant:s="regular",...l}=o,u={...o,component:i,disableGutters:a,variant:s},c=Kmt(u);return(0,mPe.jsx)(Xmt,{as:i,className:le(c.root,n),ref:r,ownerState:u,...l})}),GQ=Qmt;var yPe=z(K(),1);gt();var hPe=z(Q(),1),mV=Xr((0,hPe.jsx)("path",{d:"M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"}),"KeyboardArrowLeft");var gPe=z(Q(),1),hV=Xr((0,gPe.jsx)("path",{d:"M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"}),"KeyboardArrowRight");function vPe(e){return We("MuiTablePaginationActions",e)}var Vwr=Be("MuiTablePaginationActions",["root"]);var Ul=z(Q(),1),Jmt=e=>{let{classes:t}=e;return ce({root:["root"]},vPe,t)},eht=ne("div",{name:"MuiTablePaginationActions",slot:"Root"})({}),tht=yPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiTablePaginationActions"}),{backIconButtonProps:n,className:i,count:a,disabled:s=!1,getItemAriaLabel:l,nextIconButtonProps:u,onPageChange:c,page:p,rowsPerPage:f,showFirstButton:d,showLastButton:m,slots:h={},slotProps:g={},...v}=o,y=ro(),b=Jmt(o),S=J=>{c(J,0)},T=J=>{c(J,p-1)},w=J=>{c(J,p+1)},C=J=>{c(J,Math.max(0,Math.ceil(a/f)-1))},P=h.firstButton??bc,R=h.lastButton??bc,M=h.nextButton??bc,E=h.previousButton??bc,I=h.firstButtonIcon??HCe,k=h.lastButtonIcon??WCe,N=h.nextButtonIcon??hV,O=h.previousButtonIcon??mV,F=y?R:P,V=y?M:E,B=y?E:M,$=y?P:R,G=y?g.lastButton:g.firstButton,W=y?g.nextButton:g.previousButton,j=y?g.previousButton:g.nextButton,X=y?g.firstButton:g.lastButton;return(0,Ul.jsxs)(eht,{ref:r,className:le(b.root,i),...v,children:[d&&(0,Ul.jsx)(F,{onClick:S,disabled:s||p===0,"aria-label":l("first",p),title:l("first",p),...G,children:y?(0,Ul.jsx)(k,{...g.lastButtonIcon}):(0,Ul.jsx)(I,{...g.firstButtonIcon})}),(0,Ul.jsx)(V,{onClick:T,disabled:s||p===0,color:"inherit","aria-label":l("previous",p),title:l("previous",p),...W??n,children:y?(0,Ul.jsx)(N,{...g.nextButtonIcon}):(0,Ul.jsx)(O,{...g.previousButtonIcon})}),(0,Ul.jsx)(B,{onClick:w,disabled:s||(a!==-1?p>=Math.ceil(a/f)-1:!1),color:"inherit","aria-label":l("next",p),title:l("next",p),...j??u,children:y?(0,Ul.jsx)(O,{...g.previousButtonIcon}):(0,Ul.jsx)(N,{...g.nextButtonIcon})}),m&&(0,Ul.jsx)($,{onClick:C,disabled:s||p>=Math.ceil(a/f)-1,"aria-label":l("last",p),title:l("last",p),...X,children:y?(0,Ul.jsx)(I,{...g.firstButtonIcon}):(0,Ul.jsx)(k,{...g.lastButtonIcon})})]})}),HQ=tht;function xPe(e){return We("MuiTablePagination",e)}var rht=Be("MuiTablePagination",["root","toolbar","spacer","selectLabel","selectRoot","select","selectIcon","input","menuItem","displayedRows","actions"]),fm=rht;var dm=z(Q(),1),TPe=z(K(),1),bPe,oht=ne(hD,{name:"MuiTablePagination",slot:"Root"})(nt(({theme:e})=>({overflow:"auto",color:(e.vars||e).palette.text.primary,fontSize:e.typography.pxToRem(14),"&:last-child":{padding:0}}))),nht=ne(GQ,{name:"MuiTablePagination",slot:"Toolbar",overridesResolver:(e,t)=>({[`& .${fm.actions}`]:t.actions,...t.toolbar})})(nt(({theme:e})=>({minHeight:52,paddingRight:2,[`${e.breakpoints.up("xs")} and (orientation: landscape)`]:{minHeight:52},[e.breakpoints.up("sm")]:{minHeight:52,paddingRight:2},[`& .${fm.actions}`]:{flexShrink:0,marginLeft:20}}))),iht=ne("div",{name:"MuiTablePagination",slot:"Spacer"})({flex:"1 1 100%"}),aht=ne("p",{name:"MuiTablePagination",slot:"SelectLabel"})(nt(({theme:e})=>({...e.typography.body2,flexShrink:0}))),sht=ne(wp,{name:"MuiTablePagination",slot:"Select",overridesResolver:(e,t)=>({[`& .${fm.selectIcon}`]:t.selectIcon,[`& .${fm.select}`]:t.select,...t.input,...t.selectRoot})})({color:"inherit",fontSize:"inherit",flexShrink:0,marginRight:32,marginLeft:8,[`& .${fm.select}`]:{paddingLeft:8,paddingRight:24,textAlign:"right",textAlignLast:"right"}}),lht=ne(Uf,{name:"MuiTablePagination",slot:"MenuItem"})({}),uht=ne("p",{name:"MuiTablePagination",slot:"DisplayedRows"})(nt(({theme:e})=>({...e.typography.body2,flexShrink:0})));function cht({from:e,to:t,count:r}){return`${e}\u2013${t} of ${r!==-1?r:`more than ${t}`}`}function pht(e){return`Go to ${e} page`}var fht=e=>{let{classes:t}=e;return ce({root:["root"],toolbar:["toolbar"],spacer:["spacer"],selectLabel:["selectLabel"],select:["select"],input:["input"],selectIcon:["selectIcon"],menuItem:["menuItem"],displayedRows:["displayedRows"],actions:["actions"]},xPe,t)},dht=SPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiTablePagination"}),{ActionsComponent:n=HQ,backIconButtonProps:i,colSpan:a,component:s=hD,count:l,disabled:u=!1,getItemAriaLabel:c=pht,labelDisplayedRows:p=cht,labelRowsPerPage:f="Rows per page:",nextIconButtonProps:d,onPageChange:m,onRowsPerPageChange:h,page:g,rowsPerPage:v,rowsPerPageOptions:y=[10,25,50,100],SelectProps:x={},showFirstButton:b=!1,showLastButton:S=!1,slotProps:T={},slots:w={},...C}=o,P=o,R=fht(P),M=T?.select??x,E=M.native?"option":lht,I;(s===hD||s==="td")&&(I=a||1e3);let k=am(M.id),N=am(M.labelId),O=()=>l===-1?(g+1)*v:v===-1?l:Math.min(l,(g+1)*v),F={slots:w,slotProps:T},[V,B]=At("root",{ref:r,className:R.root,elementType:oht,externalForwardedProps:{...F,component:s,...C},ownerState:P,additionalProps:{colSpan:I}}),[$,G]=At("toolbar",{className:R.toolbar,elementType:nht,externalForwardedProps:F,ownerState:P}),[W,j]=At("spacer",{className:R.spacer,elementType:iht,externalForwardedProps:F,ownerState:P}),[X,J]=At("selectLabel",{className:R.selectLabel,elementType:aht,externalForwardedProps:F,ownerState:P,additionalProps:{id:N}}),[ee,de]=At("select",{className:R.select,elementType:sht,externalForwardedProps:F,ownerState:P}),[fe,ie]=At("menuItem",{className:R.menuItem,elementType:E,externalForwardedProps:F,ownerState:P}),[ue,pe]=At("displayedRows",{className:R.displayedRows,elementType:uht,externalForwardedProps:F,ownerState:P});return(0,dm.jsx)(V,{...B,children:(0,dm.jsxs)($,{...G,children:[(0,dm.jsx)(W,{...j}),y.length>1&&(0,dm.jsx)(X,{...J,children:f}),y.length>1&&(0,dm.jsx)(ee,{variant:"standard",...!M.variant&&{input:bPe||(bPe=(0,dm.jsx)(Lf,{}))},value:v,onChange:h,id:k,labelId:N,...M,classes:{...M.classes,root:le(R.input,R.selectRoot,(M.classes||{}).root),select:le(R.select,(M.classes||{}).select),icon:le(R.selectIcon,(M.classes||{}).icon)},disabled:u,...de,children:y.map(ye=>(0,TPe.createElement)(fe,{...ie,key:ye.label?ye.label:ye,value:ye.value?ye.value:ye},ye.label?ye.label:ye))}),(0,dm.jsx)(ue,{...pe,children:p({from:l===0?0:g*v+1,to:O(),count:l===-1?-1:l,page:g})}),(0,dm.jsx)(n,{className:R.actions,backIconButtonProps:i,count:l,nextIconButtonProps:d,onPageChange:m,page:g,rowsPerPage:v,showFirstButton:b,showLastButton:S,slotProps:T.actions,slots:w.actions,getItemAriaLabel:c,disabled:u})]})})}),jQ=dht;var cn=z(K(),1);gt();function mht(e){return(1+Math.sin(Math.PI*e-Math.PI/2))/2}function WQ(e,t,r,o={},n=()=>{}){let{ease:i=mht,duration:a=300}=o,s=null,l=t[e],u=!1,c=()=>{u=!0},p=f=>{if(u){n(new Error("Animation cancelled"));return}s===null&&(s=f);let d=Math.min(1,(f-s)/a);if(t[e]=i(d)*(r-l)+l,d>=1){requestAnimationFrame(()=>{n(null)});return}requestAnimationFrame(p)};return l===r?(n(new Error("Element already at target position")),c):(requestAnimationFrame(p),c)}var gD=z(K(),1);var wPe=z(Q(),1),hht={width:99,height:99,position:"absolute",top:-9999,overflow:"scroll"};function YQ(e){let{onChange:t,...r}=e,o=gD.useRef(),n=gD.useRef(null),i=()=>{o.current=n.current.offsetHeight-n.current.clientHeight};return sg(()=>{let a=wC(()=>{let l=o.current;i(),l!==o.current&&t(o.current)}),s=im(n.current);return s.addEventListener("resize",a),()=>{a.clear(),s.removeEventListener("resize",a)}},[t]),gD.useEffect(()=>{i(),t(o.current)},[t]),(0,wPe.jsx)("div",{style:hht,...r,ref:n})}var PPe=z(K(),1);gt();function _Pe(e){return We("MuiTabScrollButton",e)}var ght=Be("MuiTabScrollButton",["root","vertical","horizontal","disabled"]),CPe=ght;var gV=z(Q(),1),vht=e=>{let{classes:t,orientation:r,disabled:o}=e;return ce({root:["root",r,o&&"disabled"]},_Pe,t)},yht=ne(ls,{name:"MuiTabScrollButton",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.root,r.orientation&&t[r.orientation]]}})({width:40,flexShrink:0,opacity:.8,[`&.${CPe.disabled}`]:{opacity:0},variants:[{props:{orientation:"vertical"},style:{width:"100%",height:40,"& svg":{transform:"var(--TabScrollButton-svgRotate)"}}}]}),xht=PPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiTabScrollButton"}),{className:n,slots:i={},slotProps:a={},direction:s,orientation:l,disabled:u,...c}=o,p=ro(),f={isRtl:p,...o},d=vht(f),m=i.StartScrollButtonIcon??mV,h=i.EndScrollButtonIcon??hV,g=Af({elementType:m,externalSlotProps:a.startScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:f}),v=Af({elementType:h,externalSlotProps:a.endScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:f});return(0,gV.jsx)(yht,{component:"div",className:le(d.root,n),ref:r,role:null,ownerState:f,tabIndex:null,...c,style:{...c.style,...l==="vertical"&&{"--TabScrollButton-svgRotate":`rotate(${p?-90:90}deg)`}},children:s==="left"?(0,gV.jsx)(m,{...g}):(0,gV.jsx)(h,{...v})})}),ZQ=xht;function RPe(e){return We("MuiTabs",e)}var bht=Be("MuiTabs",["root","vertical","list","flexContainer","flexContainerVertical","centered","scroller","fixed","scrollableX","scrollableY","hideScrollbar","scrollButtons","scrollButtonsHideMobile","indicator"]),vV=bht;var Sg=z(Q(),1),EPe=(e,t)=>e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:e.firstChild,MPe=(e,t)=>e===t?e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:e.lastChild,yV=(e,t,r)=>{let o=!1,n=r(e,t);for(;n;){if(n===e.firstChild){if(o)return;o=!0}let i=n.disabled||n.getAttribute("aria-disabled")==="true";if(!n.hasAttribute("tabindex")||i)n=r(e,n);else{n.focus();return}}},Sht=e=>{let{vertical:t,fixed:r,hideScrollbar:o,scrollableX:n,scrollableY:i,centered:a,scrollButtonsHideMobile:s,classes:l}=e;return ce({root:["root",t&&"vertical"],scroller:["scroller",r&&"fixed",o&&"hideScrollbar",n&&"scrollableX",i&&"scrollableY"],list:["list","flexContainer",t&&"flexContainerVertical",t&&"vertical",a&&"centered"],indicator:["indicator"],scrollButtons:["scrollButtons",s&&"scrollButtonsHideMobile"],scrollableX:[n&&"scrollableX"],hideScrollbar:[o&&"hideScrollbar"]},RPe,l)},Tht=ne("div",{name:"MuiTabs",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[{[`& .${vV.scrollButtons}`]:t.scrollButtons},{[`& .${vV.scrollButtons}`]:r.scrollButtonsHideMobile&&t.scrollButtonsHideMobile},t.root,r.vertical&&t.vertical]}})(nt(({theme:e})=>({overflow:"hidden",minHeight:48,WebkitOverflowScrolling:"touch",display:"flex",variants:[{props:({ownerState:t})=>t.vertical,style:{flexDirection:"column"}},{props:({ownerState:t})=>t.scrollButtonsHideMobile,style:{[`& .${vV.scrollButtons}`]:{[e.breakpoints.down("sm")]:{display:"none"}}}}]}))),wht=ne("div",{name:"MuiTabs",slot:"Scroller",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.scroller,r.fixed&&t.fixed,r.hideScrollbar&&t.hideScrollbar,r.scrollableX&&t.scrollableX,r.scrollableY&&t.scrollableY]}})({position:"relative",display:"inline-block",flex:"1 1 auto",whiteSpace:"nowrap",variants:[{props:({ownerState:e})=>e.fixed,style:{overflowX:"hidden",width:"100%"}},{props:({ownerState:e})=>e.hideScrollbar,style:{scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}},{props:({ownerState:e})=>e.scrollableX,style:{overflowX:"auto",overflowY:"hidden"}},{props:({ownerState:e})=>e.scrollableY,style:{overflowY:"auto",overflowX:"hidden"}}]}),_ht=ne("div",{name:"MuiTabs",slot:"List",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.list,t.flexContainer,r.vertical&&t.flexContainerVertical,r.centered&&t.centered]}})({display:"flex",variants:[{props:({ownerState:e})=>e.vertical,style:{flexDirection:"column"}},{props:({ownerState:e})=>e.centered,style:{justifyContent:"center"}}]}),Cht=ne("span",{name:"MuiTabs",slot:"Indicator"})(nt(({theme:e})=>({position:"absolute",height:2,bottom:0,width:"100%",transition:e.transitions.create(),variants:[{props:{indicatorColor:"primary"},style:{backgroundColor:(e.vars||e).palette.primary.main}},{props:{indicatorColor:"secondary"},style:{backgroundColor:(e.vars||e).palette.secondary.main}},{props:({ownerState:t})=>t.vertical,style:{height:"100%",width:2,right:0}}]}))),Pht=ne(YQ)({overflowX:"auto",overflowY:"hidden",scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}),IPe={};var Rht=cn.forwardRef(function(t,r){let o=et({props:t,name:"MuiTabs"}),n=lo(),i=ro(),{"aria-label":a,"aria-labelledby":s,action:l,centered:u=!1,children:c,className:p,component:f="div",allowScrollButtonsMobile:d=!1,indicatorColor:m="primary",onChange:h,orientation:g="horizontal",ScrollButtonComponent:v,scrollButtons:y="auto",selectionFollowsFocus:x,slots:b={},slotProps:S={},TabIndicatorProps:T={},TabScrollButtonProps:w={},textColor:C="primary",value:P,variant:R="standard",visibleScrollbar:M=!1,...E}=o,I=R==="scrollable",k=g==="vertical",N=k?"scrollTop":"scrollLeft",O=k?"top":"left",F=k?"bottom":"right",V=k?"clientHeight":"clientWidth",B=k?"height":"width",$={...o,component:f,allowScrollButtonsMobile:d,indicatorColor:m,orientation:g,vertical:k,scrollButtons:y,textColor:C,variant:R,visibleScrollbar:M,fixed:!I,hideScrollbar:I&&!M,scrollableX:I&&!k,scrollableY:I&&k,centered:u&&!I,scrollButtonsHideMobile:!d},G=Sht($),W=Af({elementType:b.StartScrollButtonIcon,externalSlotProps:S.startScrollButtonIcon,ownerState:$}),j=Af({elementType:b.EndScrollButtonIcon,externalSlotProps:S.endScrollButtonIcon,ownerState:$}),[X,J]=cn.useState(!1),[ee,de]=cn.useState(IPe),[fe,ie]=cn.useState(!1),[ue,pe]=cn.useState(!1),[ye,ze]=cn.useState(!1),[Ee,Pe]=cn.useState({overflow:"hidden",scrollbarWidth:0}),Ye=new Map,_e=cn.useRef(null),be=cn.useRef(null),He={slots:b,slotProps:{indicator:T,scrollButtons:w,...S}},qe=()=>{let Ut=_e.current,Tt;if(Ut){let Lr=Ut.getBoundingClientRect();Tt={clientWidth:Ut.clientWidth,scrollLeft:Ut.scrollLeft,scrollTop:Ut.scrollTop,scrollWidth:Ut.scrollWidth,top:Lr.top,bottom:Lr.bottom,left:Lr.left,right:Lr.right}}let Ir;if(Ut&&P!==!1){let Lr=be.current.children;if(Lr.length>0){let Ro=Lr[Ye.get(P)];Ir=Ro?Ro.getBoundingClientRect():null}}return{tabsMeta:Tt,tabMeta:Ir}},bt=gp(()=>{let{tabsMeta:Ut,tabMeta:Tt}=qe(),Ir=0,Lr;k?(Lr="top",Tt&&Ut&&(Ir=Tt.top-Ut.top+Ut.scrollTop)):(Lr=i?"right":"left",Tt&&Ut&&(Ir=(i?-1:1)*(Tt[Lr]-Ut[Lr]+Ut.scrollLeft)));let Ro={[Lr]:Ir,[B]:Tt?Tt[B]:0};if(typeof ee[Lr]!="number"||typeof ee[B]!="number")de(Ro);else{let Eo=Math.abs(ee[Lr]-Ro[Lr]),Vi=Math.abs(ee[B]-Ro[B]);(Eo>=1||Vi>=1)&&de(Ro)}}),rt=(Ut,{animation:Tt=!0}={})=>{Tt?WQ(N,_e.current,Ut,{duration:n.transitions.duration.standard}):_e.current[N]=Ut},mr=Ut=>{let Tt=_e.current[N];k?Tt+=Ut:Tt+=Ut*(i?-1:1),rt(Tt)},Ze=()=>{let Ut=_e.current[V],Tt=0,Ir=Array.from(be.current.children);for(let Lr=0;Lr<Ir.length;Lr+=1){let Ro=Ir[Lr];if(Tt+Ro[V]>Ut){Lr===0&&(Tt=Ut);break}Tt+=Ro[V]}return Tt},zt=()=>{mr(-1*Ze())},Lt=()=>{mr(Ze())},[qt,{onChange:Dt,...ht}]=At("scrollbar",{className:le(G.scrollableX,G.hideScrollbar),elementType:Pht,shouldForwardComponentProp:!0,externalForwardedProps:He,ownerState:$}),Bt=cn.useCallback(Ut=>{Dt?.(Ut),Pe({overflow:null,scrollbarWidth:Ut})},[Dt]),[je,Et]=At("scrollButtons",{className:le(G.scrollButtons,w.className),elementType:ZQ,externalForwardedProps:He,ownerState:$,additionalProps:{orientation:g,slots:{StartScrollButtonIcon:b.startScrollButtonIcon||b.StartScrollButtonIcon,EndScrollButtonIcon:b.endScrollButtonIcon||b.EndScrollButtonIcon},slotProps:{startScrollButtonIcon:W,endScrollButtonIcon:j}}}),ir=()=>{let Ut={};Ut.scrollbarSizeListener=I?(0,Sg.jsx)(qt,{...ht,onChange:Bt}):null;let Ir=I&&(y==="auto"&&(fe||ue)||y===!0);return Ut.scrollButtonStart=Ir?(0,Sg.jsx)(je,{direction:i?"right":"left",onClick:zt,disabled:!fe,...Et}):null,Ut.scrollButtonEnd=Ir?(0,Sg.jsx)(je,{direction:i?"left":"right",onClick:Lt,disabled:!ue,...Et}):null,Ut},ar=gp(Ut=>{let{tabsMeta:Tt,tabMeta:Ir}=qe();if(!(!Ir||!Tt)){if(Ir[O]<Tt[O]){let Lr=Tt[N]+(Ir[O]-Tt[O]);rt(Lr,{animation:Ut})}else if(Ir[F]>Tt[F]){let Lr=Tt[N]+(Ir[F]-Tt[F]);rt(Lr,{animation:Ut})}}}),Ao=gp(()=>{I&&y!==!1&&ze(!ye)});cn.useEffect(()=>{let Ut=wC(()=>{_e.current&&bt()}),Tt,Ir=Eo=>{Eo.forEach(Vi=>{Vi.removedNodes.forEach(ra=>{Tt?.unobserve(ra)}),Vi.addedNodes.forEach(ra=>{Tt?.observe(ra)})}),Ut(),Ao()},Lr=im(_e.current);Lr.addEventListener("resize",Ut);let Ro;return typeof ResizeObserver<"u"&&(Tt=new ResizeObserver(Ut),Array.from(be.current.children).forEach(Eo=>{Tt.observe(Eo)})),typeof MutationObserver<"u"&&(Ro=new MutationObserver(Ir),Ro.observe(be.current,{childList:!0})),()=>{Ut.clear(),Lr.removeEventListener("resize",Ut),Ro?.disconnect(),Tt?.disconnect()}},[bt,Ao]),cn.useEffect(()=>{let Ut=Array.from(be.current.children),Tt=Ut.length;if(typeof IntersectionObserver<"u"&&Tt>0&&I&&y!==!1){let Ir=Ut[0],Lr=Ut[Tt-1],Ro={root:_e.current,threshold:.99},Eo=$i=>{ie(!$i[0].isIntersecting)},Vi=new IntersectionObserver(Eo,Ro);Vi.observe(Ir);let ra=$i=>{pe(!$i[0].isIntersecting)},Sn=new IntersectionObserver(ra,Ro);return Sn.observe(Lr),()=>{Vi.disconnect(),Sn.disconnect()}}},[I,y,ye,c?.length]),cn.useEffect(()=>{J(!0)},[]),cn.useEffect(()=>{bt()}),cn.useEffect(()=>{ar(IPe!==ee)},[ar,ee]),cn.useImperativeHandle(l,()=>({updateIndicator:bt,updateScrollButtons:Ao}),[bt,Ao]);let[Yn,jo]=At("indicator",{className:le(G.indicator,T.className),elementType:Cht,externalForwardedProps:He,ownerState:$,additionalProps:{style:ee}}),Ot=(0,Sg.jsx)(Yn,{...jo}),sr=0,Ur=cn.Children.map(c,Ut=>{if(!cn.isValidElement(Ut))return null;let Tt=Ut.props.value===void 0?sr:Ut.props.value;Ye.set(Tt,sr);let Ir=Tt===P;return sr+=1,cn.cloneElement(Ut,{fullWidth:R==="fullWidth",indicator:Ir&&!X&&Ot,selected:Ir,selectionFollowsFocus:x,onChange:h,textColor:C,value:Tt,...sr===1&&P===!1&&!Ut.props.tabIndex?{tabIndex:0}:{}})}),dn=Ut=>{if(Ut.altKey||Ut.shiftKey||Ut.ctrlKey||Ut.metaKey)return;let Tt=be.current,Ir=gg(ag(Tt));if(Ir?.getAttribute("role")!=="tab")return;let Ro=g==="horizontal"?"ArrowLeft":"ArrowUp",Eo=g==="horizontal"?"ArrowRight":"ArrowDown";switch(g==="horizontal"&&i&&(Ro="ArrowRight",Eo="ArrowLeft"),Ut.key){case Ro:Ut.preventDefault(),yV(Tt,Ir,MPe);break;case Eo:Ut.preventDefault(),yV(Tt,Ir,EPe);break;case"Home":Ut.preventDefault(),yV(Tt,null,EPe);break;case"End":Ut.preventDefault(),yV(Tt,null,MPe);break;default:break}},mn=ir(),[_t,Ui]=At("root",{ref:r,className:le(G.root,p),elementType:Tht,externalForwardedProps:{...He,...E,component:f},ownerState:$}),[Ts,On]=At("scroller",{ref:_e,className:G.scroller,elementType:wht,externalForwardedProps:He,ownerState:$,additionalProps:{style:{overflow:Ee.overflow,[k?`margin${i?"Left":"Right"}`:"marginBottom"]:M?void 0:-Ee.scrollbarWidth}}}),[Qt,tr]=At("list",{ref:be,className:le(G.list,G.flexContainer),elementType:_ht,externalForwardedProps:He,ownerState:$,getSlotProps:Ut=>({...Ut,onKeyDown:Tt=>{dn(Tt),Ut.onKeyDown?.(Tt)}})});return(0,Sg.jsxs)(_t,{...Ui,children:[mn.scrollButtonStart,mn.scrollbarSizeListener,(0,Sg.jsxs)(Ts,{...On,children:[(0,Sg.jsx)(Qt,{"aria-label":a,"aria-labelledby":s,"aria-orientation":g==="vertical"?"vertical":null,role:"tablist",...tr,children:Ur}),X&&Ot]}),mn.scrollButtonEnd]})}),qQ=Rht;var OPe=z(K(),1);gt();function DPe(e){return We("MuiTextField",e)}var vCr=Be("MuiTextField",["root"]);var X0=z(Q(),1),Eht={standard:oD,filled:rD,outlined:pD},Mht=e=>{let{classes:t}=e;return ce({root:["root"]},DPe,t)},Iht=ne(Iy,{name:"MuiTextField",slot:"Root"})({}),Dht=OPe.forwardRef(function(t,r){let o=et({props:t,name:"MuiTextField"}),{autoComplete:n,autoFocus:i=!1,children:a,className:s,color:l="primary",defaultValue:u,disabled:c=!1,error:p=!1,FormHelperTextProps:f,fullWidth:d=!1,helperText:m,id:h,InputLabelProps:g,inputProps:v,InputProps:y,inputRef:x,label:b,maxRows:S,minRows:T,multiline:w=!1,name:C,onBlur:P,onChange:R,onFocus:M,placeholder:E,required:I=!1,rows:k,select:N=!1,SelectProps:O,slots:F={},slotProps:V={},type:B,value:$,variant:G="outlined",...W}=o,j={...o,autoFocus:i,color:l,disabled:c,error:p,fullWidth:d,multiline:w,required:I,select:N,variant:G},X=Mht(j),J=Jt(h),ee=m&&J?`${J}-helper-text`:void 0,de=b&&J?`${J}-label`:void 0,fe=Eht[G],ie={slots:F,slotProps:{input:y,inputLabel:g,htmlInput:v,formHelperText:f,select:O,...V}},ue={},pe=ie.slotProps.inputLabel;G==="outlined"&&(pe&&typeof pe.shrink<"u"&&(ue.notched=pe.shrink),ue.label=b),N&&((!O||!O.native)&&(ue.id=void 0),ue["aria-describedby"]=void 0);let[ye,ze]=At("root",{elementType:Iht,shouldForwardComponentProp:!0,externalForwardedProps:{...ie,...W},ownerState:j,className:le(X.root,s),ref:r,additionalProps:{disabled:c,error:p,fullWidth:d,required:I,color:l,variant:G}}),[Ee,Pe]=At("input",{elementType:fe,externalForwardedProps:ie,additionalProps:ue,ownerState:j}),[Ye,_e]=At("inputLabel",{elementType:nD,externalForwardedProps:ie,ownerState:j}),[be,He]=At("htmlInput",{elementType:"input",externalForwardedProps:ie,ownerState:j}),[qe,bt]=At("formHelperText",{elementType:hQ,externalForwardedProps:ie,ownerState:j}),[rt,mr]=At("select",{elementType:wp,externalForwardedProps:ie,ownerState:j}),Ze=(0,X0.jsx)(Ee,{"aria-describedby":ee,autoComplete:n,autoFocus:i,defaultValue:u,fullWidth:d,multiline:w,name:C,rows:k,maxRows:S,minRows:T,type:B,value:$,id:J,inputRef:x,onBlur:P,onChange:R,onFocus:M,placeholder:E,inputProps:He,slots:{input:F.htmlInput?be:void 0},...Pe});return(0,X0.jsxs)(ye,{...ze,children:[b!=null&&b!==""&&(0,X0.jsx)(Ye,{htmlFor:J,id:de,..._e,children:b}),N?(0,X0.jsx)(rt,{"aria-describedby":ee,id:J,labelId:de,value:$,input:Ze,...mr,children:a}):Ze,m&&(0,X0.jsx)(qe,{id:ee,...bt,children:m})]})}),Q0=Dht;var vD=z(K(),1);gt();function kPe(e){return We("MuiToggleButton",e)}var Oht=Be("MuiToggleButton",["root","disabled","selected","standard","primary","secondary","sizeSmall","sizeMedium","sizeLarge","fullWidth"]),Tg=Oht;var APe=z(K(),1),kht=APe.createContext({}),xV=kht;var LPe=z(K(),1),Aht=LPe.createContext(void 0),bV=Aht;function KQ(e,t){return t===void 0||e===void 0?!1:Array.isArray(t)?t.includes(e):e===t}var NPe=z(Q(),1),Lht=e=>{let{classes:t,fullWidth:r,selected:o,disabled:n,size:i,color:a}=e,s={root:["root",o&&"selected",n&&"disabled",r&&"fullWidth",`size${Te(i)}`,a]};return ce(s,kPe,t)},Nht=ne(ls,{name:"MuiToggleButton",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[t.root,t[`size${Te(r.size)}`]]}})(nt(({theme:e})=>({...e.typography.button,borderRadius:(e.vars||e).shape.borderRadius,padding:11,border:`1px solid ${(e.vars||e).palette.divider}`,color:(e.vars||e).palette.action.active,[`&.${Tg.disabled}`]:{color:(e.vars||e).palette.action.disabled,border:`1px solid ${(e.vars||e).palette.action.disabledBackground}`},"&:hover":{textDecoration:"none",backgroundColor:e.alpha((e.vars||e).palette.text.primary,(e.vars||e).palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},variants:[{props:{color:"standard"},style:{[`&.${Tg.selected}`]:{color:(e.vars||e).palette.text.primary,backgroundColor:e.alpha((e.vars||e).palette.text.primary,(e.vars||e).palette.action.selectedOpacity),"&:hover":{backgroundColor:e.alpha((e.vars||e).palette.text.primary,`${(e.vars||e).palette.action.selectedOpacity} + ${(e.vars||e).palette.action.hoverOpacity}`),"@media (hover: none)":{backgroundColor:e.alpha((e.vars||e).palette.text.primary,(e.vars||e).palette.action.selectedOpacity)}}}}},...Object.entries(e.palette).filter(kr()).map(([t])=>({props:{color:t},style:{[`&.${Tg.selected}`]:{color:(e.vars||e).palette[t].main,backgroundColor:e.alpha((e.vars||e).palette[t].main,(e.vars||e).palette.action.selectedOpacity),"&:hover":{backgroundColor:e.alpha((e.vars||e).palette[t].main,`${(e.vars||e).palette.action.selectedOpacity} + ${(e.vars||e).palette.action.hoverOpacity}`),"@media (hover: none)":{backgroundColor:e.alpha((e.vars||e).palette[t].main,(e.vars||e).palette.action.selectedOpacity)}}}}})),{props:{fullWidth:!0},style:{width:"100%"}},{props:{size:"small"},style:{padding:7,fontSize:e.typography.pxToRem(13)}},{props:{size:"large"},style:{padding:15,fontSize:e.typography.pxToRem(15)}}]}))),zht=vD.forwardRef(function(t,r){let{value:o,...n}=vD.useContext(xV),i=vD.useContext(bV),a=_u({...n,selected:KQ(t.value,o)},t),s=et({props:a,name:"MuiToggleButton"}),{children:l,className:u,color:c="standard",disabled:p=!1,disableFocusRipple:f=!1,fullWidth:d=!1,onChange:m,onClick:h,selected:g,size:v="medium",value:y,...x}=s,b={...s,color:c,disabled:p,disableFocusRipple:f,fullWidth:d,size:v},S=Lht(b),T=C=>{h&&(h(C,y),C.defaultPrevented)||m&&m(C,y)},w=i||"";return(0,NPe.jsx)(Nht,{className:le(n.className,S.root,u,w),disabled:p,focusRipple:!f,ref:r,onClick:T,onChange:m,value:y,ownerState:b,"aria-pressed":g,...x,children:l})}),zy=zht;var J0=z(K(),1);gt();function zPe(e){return We("MuiToggleButtonGroup",e)}var Fht=Be("MuiToggleButtonGroup",["root","selected","horizontal","vertical","disabled","grouped","groupedHorizontal","groupedVertical","fullWidth","firstButton","lastButton","middleButton"]),Pn=Fht;var SV=z(Q(),1),Uht=e=>{let{classes:t,orientation:r,fullWidth:o,disabled:n}=e,i={root:["root",r,o&&"fullWidth"],grouped:["grouped",`grouped${Te(r)}`,n&&"disabled"],firstButton:["firstButton"],lastButton:["lastButton"],middleButton:["middleButton"]};return ce(i,zPe,t)},Vht=ne("div",{name:"MuiToggleButtonGroup",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:r}=e;return[{[`& .${Pn.grouped}`]:t.grouped},{[`& .${Pn.grouped}`]:t[`grouped${Te(r.orientation)}`]},{[`& .${Pn.firstButton}`]:t.firstButton},{[`& .${Pn.lastButton}`]:t.lastButton},{[`& .${Pn.middleButton}`]:t.middleButton},t.root,r.orientation==="vertical"&&t.vertical,r.fullWidth&&t.fullWidth]}})(nt(({theme:e})=>({display:"inline-flex",borderRadius:(e.vars||e).shape.borderRadius,variants:[{props:{orientation:"vertical"},style:{flexDirection:"column",[`& .${Pn.grouped}`]:{[`&.${Pn.selected} + .${Pn.grouped}.${Pn.selected}`]:{borderTop:0,marginTop:0}},[`& .${Pn.firstButton},& .${Pn.middleButton}`]:{borderBottomLeftRadius:0,borderBottomRightRadius:0},[`& .${Pn.lastButton},& .${Pn.middleButton}`]:{marginTop:-1,borderTop:"1px solid transparent",borderTopLeftRadius:0,borderTopRightRadius:0},[`& .${Pn.lastButton}.${Tg.disabled},& .${Pn.middleButton}.${Tg.disabled}`]:{borderTop:"1px solid transparent"}}},{props:{fullWidth:!0},style:{width:"100%"}},{props:{orientation:"horizontal"},style:{[`& .${Pn.grouped}`]:{[`&.${Pn.selected} + .${Pn.grouped}.${Pn.selected}`]:{borderLeft:0,marginLeft:0}},[`& .${Pn.firstButton},& .${Pn.middleButton}`]:{borderTopRightRadius:0,borderBottomRightRadius:0},[`& .${Pn.lastButton},& .${Pn.middleButton}`]:{marginLeft:-1,borderLeft:"1px solid transparent",borderTopLeftRadius:0,borderBottomLeftRadius:0},[`& .${Pn.lastButton}.${Tg.disabled},& .${Pn.middleButton}.${Tg.disabled}`]:{borderLeft:"1px solid transparent"}}}]}))),$ht=J0.forwardRef(function(t,r){let o=et({props:t,name:"MuiToggleButtonGroup"}),{children:n,className:i,color:a="standard",disabled:s=!1,exclusive:l=!1,fullWidth:u=!1,onChange:c,orientation:p="horizontal",size:f="medium",value:d,...m}=o,h={...o,disabled:s,fullWidth:u,orientation:p,size:f},g=Uht(h),v=J0.useCallback((w,C)=>{if(!c)return;let P=d&&d.indexOf(C),R;d&&P>=0?(R=d.slice(),R.splice(P,1)):R=d?d.concat(C):[C],c(w,R)},[c,d]),y=J0.useCallback((w,C)=>{c&&c(w,d===C?null:C)},[c,d]),x=J0.useMemo(()=>({className:g.grouped,onChange:l?y:v,value:d,size:f,fullWidth:u,color:a,disabled:s}),[g.grouped,l,y,v,d,f,u,a,s]),b=$U(n),S=b.length,T=w=>{let C=w===0,P=w===S-1;return C&&P?"":C?g.firstButton:P?g.lastButton:g.middleButton};return(0,SV.jsx)(Vht,{role:"group",className:le(g.root,i),ref:r,ownerState:h,...m,children:(0,SV.jsx)(xV.Provider,{value:x,children:b.map((w,C)=>(0,SV.jsx)(bV.Provider,{value:T(C),children:w},C))})})}),eP=$ht;var Bht=XK({themeId:ka}),XQ=Bht;var tP=z(K());async function ll(e){let t=await fetch(e),r=await t.json();if(!t.ok||!r.success)throw new Error(r.error);return r.data}function rj(e){let t=JSON.parse(e);if(!t.success)throw new Error(t.error);return t.data}async function*Vl(e){let t=await fetch(e);if(!t.ok||!t.body){let n=await t.json();throw new Error(n.error)}let r=t.body.pipeThrough(new TextDecoderStream).getReader(),o="";for(;;){let{done:n,value:i}=await r.read();if(n)break;o+=i;let a=o.split("\n");o=a.pop()??"";for(let l of a)yield rj(l)}o&&(yield rj(o))}function FPe(){let t=`config?${ul()}`;return ws({queryKey:[t],queryFn:()=>ll(t)})}var yD=z(Q()),UPe=(0,tP.createContext)(void 0);function VPe({children:e}){let{i18n:t}=Nr(),{isPending:r,error:o,data:n}=FPe();return(0,tP.useEffect)(()=>{n?.language&&t.changeLanguage(n.language)},[t,n?.language]),r?(0,yD.jsx)(_c,{sx:{display:"flex",justifyContent:"center",my:5},children:(0,yD.jsx)(xp,{})}):o?(0,yD.jsx)(un,{severity:"error",children:o.message}):(0,yD.jsx)(UPe.Provider,{value:{config:n},children:e})}function Pc(){let e=(0,tP.useContext)(UPe);if(e===void 0)throw new Error("No ConfigContext found. Did you forget a ConfigProvider?");return e}var hi=z(Q());function $Pe(){let{t:e}=Nr();return(0,hi.jsxs)(_c,{className:"headerline",sx:{".active":{color:"inherit"}},children:[(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/portfolio",search:Rc,children:e("Portfolio")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/performance",search:Rc,children:e("Performance")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/returns",search:Rc,children:e("Returns")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/metrics",search:Rc,children:e("Metrics")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/dividends",search:Rc,children:e("Dividends")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/cash_flows",search:Rc,children:e("Cash Flows")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/groups",search:Rc,children:e("Groups")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/investments",search:Rc,children:e("Investments")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/missing_prices",search:Rc,children:e("Missing Prices")})}),(0,hi.jsx)("h3",{children:(0,hi.jsx)(Ia,{to:"/help",search:Rc,children:e("Help")})})]})}var oP=z(BPe());var _V=z(K());var JQ=z(K());function za(e,t){let r=e.useSearch({select:i=>i[t]}),o=e.useNavigate(),n=(0,JQ.useCallback)(i=>o({to:".",search:a=>({...a,[t]:i}),replace:!0}),[t,o]);return[r,n]}function TV(e){let t=Mv({strict:!1,select:n=>n[e]}),r=Iv(),o=(0,JQ.useCallback)(n=>r({to:".",search:i=>({...i,[e]:n}),replace:!0}),[e,r]);return[t,o]}function wV([e,t],r="~"){return[e?e.split(r):[],o=>t(o.length>0?o.join(r):void 0)]}var jPe=z(Q()),GPe=(0,_V.createContext)(void 0);function HPe({children:e}){let{config:t}=Pc(),[r,o]=wV(TV("investments")),[n,i]=TV("currency"),a=n??t?.operatingCurrencies[0]??"USD",s=f=>i(f!==t?.operatingCurrencies[0]?f:void 0),[l,u]=TV("time"),c=Ght(typeof l=="number"?String(l):l),p=f=>u(f==="MAX"?void 0:CV[f]);return(0,jPe.jsx)(GPe.Provider,{value:{investmentFilter:r,setInvestmentFilter:o,targetCurrency:a,setTargetCurrency:s,dateRange:c,setDateRange:p},children:e})}function gi(){let e=(0,_V.useContext)(GPe);if(e===void 0)throw new Error("No ToolbarContext found. Did you forget a ToolbarProvider?");return e}function Ght(e){if(!e)return"MAX";for(let[t,r]of Object.entries(CV))if(r===e)return t}var eJ=z(Q()),CV={"3M":(0,oP.default)().subtract(3,"months").format("YYYY-MM-DD")+" - day","6M":(0,oP.default)().subtract(6,"months").format("YYYY-MM-DD")+" - day",YTD:"year - day","1Y":(0,oP.default)().subtract(1,"years").format("YYYY-MM-DD")+" - day","3Y":(0,oP.default)().subtract(3,"years").format("YYYY-MM-DD")+" - day","5Y":(0,oP.default)().subtract(5,"years").format("YYYY-MM-DD")+" - day",MAX:void 0};function WPe(){let{dateRange:e,setDateRange:t}=gi();return(0,eJ.jsx)(eP,{value:e,onChange:(r,o)=>t(o),exclusive:!0,children:Object.keys(CV).map(r=>(0,eJ.jsx)(zy,{value:r,children:r},r))})}var YPe=z(Q(),1),ZPe=Xr((0,YPe.jsx)("path",{d:"M19 3H5c-1.11 0-2 .9-2 2v14c0 1.1.89 2 2 2h14c1.11 0 2-.9 2-2V5c0-1.1-.89-2-2-2m-9 14-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8z"}),"CheckBox");var qPe=z(Q(),1),KPe=Xr((0,qPe.jsx)("path",{d:"M19 5v14H5V5zm0-2H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2"}),"CheckBoxOutlineBlank");var Vf=z(Q());function PV({label:e,types:t,includeAllCurrencies:r,investments:o,setInvestments:n}){let{config:i}=Pc(),a=lo(),s=[];(!t||t.includes("Group"))&&s.push(...i.investmentsConfig.groups.map(p=>({type:"Group",id:p.id,label:p.name,chipLabel:p.name})).sort((p,f)=>p.label.localeCompare(f.label))),(!t||t.includes("Account"))&&s.push(...i.investmentsConfig.accounts.map(p=>({type:"Account",id:p.id,label:p.assetAccount,chipLabel:p.assetAccount})).sort((p,f)=>p.label.localeCompare(f.label))),(!t||t.includes("Currency"))&&s.push(...i.investmentsConfig.currencies.filter(p=>p.isInvestment||r).map(p=>({type:"Currency",id:p.id,label:`${p.name} (${p.currency})`,chipLabel:p.currency})).sort((p,f)=>p.label.localeCompare(f.label)));let l=o.map(p=>s.find(f=>f.id===p)).filter(p=>p!==void 0),u=(p,f)=>{n(f.map(d=>d.id))},c=a.palette.mode==="dark"?"background.default":rI[100];return(0,Vf.jsx)(UC,{multiple:!0,limitTags:4,disableCloseOnSelect:!0,value:l,onChange:u,options:s,getOptionKey:p=>p.id,renderOption:(p,f,{selected:d})=>{let{key:m,...h}=p;return(0,Vf.jsxs)("li",{...h,children:[(0,Vf.jsx)($C,{icon:(0,Vf.jsx)(KPe,{fontSize:"small"}),checkedIcon:(0,Vf.jsx)(ZPe,{fontSize:"small"}),style:{marginRight:8},checked:d}),(0,Vf.jsx)(Hht,{type:f.type,sx:{marginRight:1}}),f.label]},m)},renderTags:(p,f)=>p.map((d,m)=>{let{key:h,...g}=f({index:m});return(0,Vf.jsx)(lm,{label:d.chipLabel,variant:"outlined",sx:{backgroundColor:c,border:`1px solid ${tJ[d.type]}`},...g},d.id)}),style:{width:800},renderInput:p=>(0,Vf.jsx)(Q0,{...p,label:e})})}function Hht({type:e,sx:t}){return(0,Vf.jsx)(lm,{label:jht[e],variant:"outlined",size:"small",sx:{...t,color:tJ[e],borderColor:tJ[e]}})}var jht={Account:"ACC",Group:"GRP",Currency:"CUR"},tJ={Account:Jd[500],Group:CK[500],Currency:PK[500]};var QPe=z(Q());function XPe(){let{t:e}=Nr(),{investmentFilter:t,setInvestmentFilter:r}=gi();return(0,QPe.jsx)(PV,{label:e("Investments Filter"),types:["Group","Account","Currency"],investments:t,setInvestments:r})}var rJ=z(Q());function JPe(){let{config:e}=Pc(),{targetCurrency:t,setTargetCurrency:r}=gi();return(0,rJ.jsx)(eP,{value:t,onChange:(o,n)=>r(n),exclusive:!0,children:e.operatingCurrencies.map(o=>(0,rJ.jsx)(zy,{value:o,children:o},o))})}var eS=z(Q());function e1e(){let e=D3(),t=e[e.length-1]?.staticData,r=t?.showInvestmentsSelection!==!1,o=t?.showDateRangeSelection!==!1,n=t?.showCurrencySelection!==!1;return(0,eS.jsxs)(Ny,{sx:{flexDirection:"row",justifyContent:"flex-end",alignItems:"center",gap:2,marginBottom:2},children:[r&&(0,eS.jsx)(XPe,{}),o&&(0,eS.jsx)(WPe,{}),n&&(0,eS.jsx)(_c,{children:(0,eS.jsx)(JPe,{})})]})}var a1e=z(Q()),t1e="#af3d3d",r1e="#3daf46",o1e="120, 44%, 53%",n1e="0, 90%, 40%",oJ={"green-red":{pnl:{profit:r1e,loss:t1e},trend:{positive(e=1){return`hsla(${o1e}, ${e})`},negative(e=1){return`hsla(${n1e}, ${e})`}}},"red-green":{pnl:{profit:t1e,loss:r1e},trend:{positive(e=1){return`hsla(${n1e}, ${e})`},negative(e=1){return`hsla(${o1e}, ${e})`}}}};function i1e({children:e}){let{config:t}=Pc(),r=XQ("(prefers-color-scheme: dark)"),o=Wht()??(r?"dark":"light"),n=Yht(),i=t.pnlColorScheme&&t.pnlColorScheme in oJ?oJ[t.pnlColorScheme]:oJ[n],a=nm({cssVariables:!0,palette:{mode:o},typography:{fontFamily:""},...i});return(0,a1e.jsx)(lU,{theme:a,children:e})}function Wht(){switch(document.documentElement.style.colorScheme){case"light":return"light";case"dark":return"dark";default:return}}function Yht(){switch(new Intl.Locale(navigator.language).region){case"CN":case"JP":return"red-green";default:return"green-red"}}var wg=z(Q()),Zht=["account","charts","conversion","filter","interval","time"],qht=[...Zht,"investments","currency"];function Rc(e){return Object.fromEntries(Object.entries(e).filter(([t])=>qht.includes(t)))}var Kht=Hr.object({time:Hr.union([Hr.string(),Hr.number()]).optional(),account:Hr.string().optional(),filter:Hr.string().optional(),investments:Hr.string().optional(),currency:Hr.string().optional()}),$n=C3({validateSearch:Kht,component:Xht});function Xht(){return(0,wg.jsx)(VPe,{children:(0,wg.jsx)(i1e,{children:(0,wg.jsxs)(HPe,{children:[(0,wg.jsx)($Pe,{}),(0,wg.jsx)(e1e,{}),(0,wg.jsx)(EL,{}),(0,wg.jsx)(Iye,{})]})})})}function Qht(){return $n.useSearch({select:e=>({time:e.time,account:e.account,filter:e.filter})})}function ul(){let e=Qht();return new URLSearchParams({...e.time?{time:String(e.time)}:{},...e.account?{account:e.account}:{},...e.filter?{filter:e.filter}:{}})}var s1e=Nn({getParentRoute:()=>$n,path:"/",loader:async()=>{throw Pv({to:"/portfolio",search:Rc})}});function nJ(e){let t=ul();t.set("investments",e.investmentFilter.join(",")),t.set("currency",e.targetCurrency),t.set("interval",e.interval);let r=`cash_flows?${t}`;return ws({queryKey:[r],queryFn:()=>ll(r)})}var $f=z(Q());function ps({children:e}){let t=lo();return(0,$f.jsx)(Ny,{sx:{flexDirection:"column",mx:"-1.5em",marginBottom:"-1.5em",padding:"1.5em",gap:2,backgroundColor:t.palette.mode==="dark"?void 0:"#FAFBFB"},children:e})}function Bn({sx:e,children:t}){return(0,$f.jsx)(Ny,{sx:{flexDirection:"row",gap:2,alignItems:"flex-start",...e},children:t})}function Uo({title:e,help:t,topRightElem:r,sx:o,children:n}){return(0,$f.jsxs)(BU,{variant:"outlined",sx:{flex:1,padding:2,overflow:"auto",...o},children:[(0,$f.jsxs)(Ny,{sx:{flexDirection:"row",justifyContent:"space-between"},children:[(0,$f.jsx)("h3",{children:e}),r]}),t&&(0,$f.jsx)("p",{style:{whiteSpace:"pre-line",maxWidth:"80%"},children:t}),n]})}function nP({active:e,setActive:t,children:r}){let n=(r.find(a=>a.props.id===e)??r[0]).props.children,i=(0,$f.jsx)(wp,{value:e,onChange:a=>t(a.target.value),displayEmpty:!0,size:"small",children:r.map(a=>(0,$f.jsx)(Uf,{value:a.props.id,children:a.props.label},a.props.id))});return(0,$f.jsx)(Uo,{...n.props,topRightElem:i})}function _g(e){return null}var iJ=function(e,t){return iJ=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,o){r.__proto__=o}||function(r,o){for(var n in o)Object.prototype.hasOwnProperty.call(o,n)&&(r[n]=o[n])},iJ(e,t)};function Y(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Class extends value "+String(t)+" is not a constructor or null");iJ(e,t);function r(){this.constructor=e}e.prototype=t===null?Object.create(t):(r.prototype=t.prototype,new r)}var Jht=(function(){function e(){this.firefox=!1,this.ie=!1,this.edge=!1,this.newEdge=!1,this.weChat=!1}return e})(),egt=(function(){function e(){this.browser=new Jht,this.node=!1,this.wxa=!1,this.worker=!1,this.svgSupported=!1,this.touchEventsSupported=!1,this.pointerEventsSupported=!1,this.domSupported=!1,this.transformSupported=!1,this.transform3dSupported=!1,this.hasGlobalWindow=typeof window<"u"}return e})(),Fy=new egt;typeof wx=="object"&&typeof wx.getSystemInfoSync=="function"?(Fy.wxa=!0,Fy.touchEventsSupported=!0):typeof document>"u"&&typeof self<"u"?Fy.worker=!0:!Fy.hasGlobalWindow||"Deno"in window||typeof navigator<"u"&&typeof navigator.userAgent=="string"&&navigator.userAgent.indexOf("Node.js")>-1?(Fy.node=!0,Fy.svgSupported=!0):tgt(navigator.userAgent,Fy);function tgt(e,t){var r=t.browser,o=e.match(/Firefox\/([\d.]+)/),n=e.match(/MSIE\s([\d.]+)/)||e.match(/Trident\/.+?rv:(([\d.]+))/),i=e.match(/Edge?\/([\d.]+)/),a=/micromessenger/i.test(e);o&&(r.firefox=!0,r.version=o[1]),n&&(r.ie=!0,r.version=n[1]),i&&(r.edge=!0,r.version=i[1],r.newEdge=+i[1].split(".")[0]>18),a&&(r.weChat=!0),t.svgSupported=typeof SVGRect<"u",t.touchEventsSupported="ontouchstart"in window&&!r.ie&&!r.edge,t.pointerEventsSupported="onpointerdown"in window&&(r.edge||r.ie&&+r.version>=11);var s=t.domSupported=typeof document<"u";if(s){var l=document.documentElement.style;t.transform3dSupported=(r.ie&&"transition"in l||r.edge||"WebKitCSSMatrix"in window&&"m11"in new WebKitCSSMatrix||"MozPerspective"in l)&&!("OTransition"in l),t.transformSupported=t.transform3dSupported||r.ie&&+r.version>=9}}var rr=Fy;var RV=12,aJ="sans-serif",Ru=RV+"px "+aJ,rgt=20,ogt=100,ngt="007LLmW'55;N0500LLLLLLLLLL00NNNLzWW\\\\WQb\\0FWLg\\bWb\\WQ\\WrWWQ000CL5LLFLL0LL**F*gLLLL5F0LF\\FFF5.5N";function igt(e){var t={};if(typeof JSON>"u")return t;for(var r=0;r<e.length;r++){var o=String.fromCharCode(r+32),n=(e.charCodeAt(r)-rgt)/ogt;t[o]=n}return t}var agt=igt(ngt),Fa={createCanvas:function(){return typeof document<"u"&&document.createElement("canvas")},measureText:(function(){var e,t;return function(r,o){if(!e){var n=Fa.createCanvas();e=n&&n.getContext("2d")}if(e)return t!==o&&(t=e.font=o||Ru),e.measureText(r);r=r||"",o=o||Ru;var i=/((?:\d+)?\.?\d*)px/.exec(o),a=i&&+i[1]||RV,s=0;if(o.indexOf("mono")>=0)s=a*r.length;else for(var l=0;l<r.length;l++){var u=agt[r[l]];s+=u==null?a:u*a}return{width:s}}})(),loadImage:function(e,t,r){var o=new Image;return o.onload=t,o.onerror=r,o.src=e,o}};var c1e=Us(["Function","RegExp","Date","Error","CanvasGradient","CanvasPattern","Image","Canvas"],function(e,t){return e["[object "+t+"]"]=!0,e},{}),p1e=Us(["Int8","Uint8","Uint8Clamped","Int16","Uint16","Int32","Uint32","Float32","Float64"],function(e,t){return e["[object "+t+"Array]"]=!0,e},{}),iP=Object.prototype.toString,MV=Array.prototype,sgt=MV.forEach,lgt=MV.filter,sJ=MV.slice,ugt=MV.map,l1e=function(){}.constructor,EV=l1e?l1e.prototype:null,lJ="__proto__",cgt=2311;function IV(){return cgt++}function tS(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];typeof console<"u"&&console.error.apply(console,e)}function $e(e){if(e==null||typeof e!="object")return e;var t=e,r=iP.call(e);if(r==="[object Array]"){if(!xD(e)){t=[];for(var o=0,n=e.length;o<n;o++)t[o]=$e(e[o])}}else if(p1e[r]){if(!xD(e)){var i=e.constructor;if(i.from)t=i.from(e);else{t=new i(e.length);for(var o=0,n=e.length;o<n;o++)t[o]=e[o]}}}else if(!c1e[r]&&!xD(e)&&!Uy(e)){t={};for(var a in e)e.hasOwnProperty(a)&&a!==lJ&&(t[a]=$e(e[a]))}return t}function Rt(e,t,r){if(!Ge(t)||!Ge(e))return r?$e(t):e;for(var o in t)if(t.hasOwnProperty(o)&&o!==lJ){var n=e[o],i=t[o];Ge(i)&&Ge(n)&&!oe(i)&&!oe(n)&&!Uy(i)&&!Uy(n)&&!u1e(i)&&!u1e(n)&&!xD(i)&&!xD(n)?Rt(n,i,r):(r||!(o in e))&&(e[o]=$e(t[o]))}return e}function aP(e,t){for(var r=e[0],o=1,n=e.length;o<n;o++)r=Rt(r,e[o],t);return r}function re(e,t){if(Object.assign)Object.assign(e,t);else for(var r in t)t.hasOwnProperty(r)&&r!==lJ&&(e[r]=t[r]);return e}function Fe(e,t,r){for(var o=Nt(t),n=0,i=o.length;n<i;n++){var a=o[n];(r?t[a]!=null:e[a]==null)&&(e[a]=t[a])}return e}var QMr=Fa.createCanvas;function vt(e,t){if(e){if(e.indexOf)return e.indexOf(t);for(var r=0,o=e.length;r<o;r++)if(e[r]===t)return r}return-1}function f1e(e,t){var r=e.prototype;function o(){}o.prototype=t.prototype,e.prototype=new o;for(var n in r)r.hasOwnProperty(n)&&(e.prototype[n]=r[n]);e.prototype.constructor=e,e.superClass=t}function oo(e,t,r){if(e="prototype"in e?e.prototype:e,t="prototype"in t?t.prototype:t,Object.getOwnPropertyNames)for(var o=Object.getOwnPropertyNames(t),n=0;n<o.length;n++){var i=o[n];i!=="constructor"&&(r?t[i]!=null:e[i]==null)&&(e[i]=t[i])}else Fe(e,t,r)}function ri(e){return!e||typeof e=="string"?!1:typeof e.length=="number"}function L(e,t,r){if(e&&t)if(e.forEach&&e.forEach===sgt)e.forEach(t,r);else if(e.length===+e.length)for(var o=0,n=e.length;o<n;o++)t.call(r,e[o],o,e);else for(var i in e)e.hasOwnProperty(i)&&t.call(r,e[i],i,e)}function ae(e,t,r){if(!e)return[];if(!t)return DV(e);if(e.map&&e.map===ugt)return e.map(t,r);for(var o=[],n=0,i=e.length;n<i;n++)o.push(t.call(r,e[n],n,e));return o}function Us(e,t,r,o){if(e&&t){for(var n=0,i=e.length;n<i;n++)r=t.call(o,r,e[n],n,e);return r}}function er(e,t,r){if(!e)return[];if(!t)return DV(e);if(e.filter&&e.filter===lgt)return e.filter(t,r);for(var o=[],n=0,i=e.length;n<i;n++)t.call(r,e[n],n,e)&&o.push(e[n]);return o}function Bf(e,t,r){if(e&&t){for(var o=0,n=e.length;o<n;o++)if(t.call(r,e[o],o,e))return e[o]}}function Nt(e){if(!e)return[];if(Object.keys)return Object.keys(e);var t=[];for(var r in e)e.hasOwnProperty(r)&&t.push(r);return t}function pgt(e,t){for(var r=[],o=2;o<arguments.length;o++)r[o-2]=arguments[o];return function(){return e.apply(t,r.concat(sJ.call(arguments)))}}var we=EV&&Ae(EV.bind)?EV.call.bind(EV.bind):pgt;function xt(e){for(var t=[],r=1;r<arguments.length;r++)t[r-1]=arguments[r];return function(){return e.apply(this,t.concat(sJ.call(arguments)))}}function oe(e){return Array.isArray?Array.isArray(e):iP.call(e)==="[object Array]"}function Ae(e){return typeof e=="function"}function xe(e){return typeof e=="string"}function bD(e){return iP.call(e)==="[object String]"}function Ft(e){return typeof e=="number"}function Ge(e){var t=typeof e;return t==="function"||!!e&&t==="object"}function u1e(e){return!!c1e[iP.call(e)]}function Di(e){return!!p1e[iP.call(e)]}function Uy(e){return typeof e=="object"&&typeof e.nodeType=="number"&&typeof e.ownerDocument=="object"}function Vy(e){return e.colorStops!=null}function d1e(e){return e.image!=null}function m1e(e){return iP.call(e)==="[object RegExp]"}function oi(e){return e!==e}function Ko(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];for(var r=0,o=e.length;r<o;r++)if(e[r]!=null)return e[r]}function Ue(e,t){return e??t}function Gn(e,t,r){return e??t??r}function DV(e){for(var t=[],r=1;r<arguments.length;r++)t[r-1]=arguments[r];return sJ.apply(e,t)}function $y(e){if(typeof e=="number")return[e,e,e,e];var t=e.length;return t===2?[e[0],e[1],e[0],e[1]]:t===3?[e[0],e[1],e[2],e[1]]:e}function go(e,t){if(!e)throw new Error(t)}function Xi(e){return e==null?null:typeof e.trim=="function"?e.trim():e.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,"")}var h1e="__ec_primitive__";function rS(e){e[h1e]=!0}function xD(e){return e[h1e]}var fgt=(function(){function e(){this.data={}}return e.prototype.delete=function(t){var r=this.has(t);return r&&delete this.data[t],r},e.prototype.has=function(t){return this.data.hasOwnProperty(t)},e.prototype.get=function(t){return this.data[t]},e.prototype.set=function(t,r){return this.data[t]=r,this},e.prototype.keys=function(){return Nt(this.data)},e.prototype.forEach=function(t){var r=this.data;for(var o in r)r.hasOwnProperty(o)&&t(r[o],o)},e})(),g1e=typeof Map=="function";function dgt(){return g1e?new Map:new fgt}var mgt=(function(){function e(t){var r=oe(t);this.data=dgt();var o=this;t instanceof e?t.each(n):t&&L(t,n);function n(i,a){r?o.set(i,a):o.set(a,i)}}return e.prototype.hasKey=function(t){return this.data.has(t)},e.prototype.get=function(t){return this.data.get(t)},e.prototype.set=function(t,r){return this.data.set(t,r),r},e.prototype.each=function(t,r){this.data.forEach(function(o,n){t.call(r,o,n)})},e.prototype.keys=function(){var t=this.data.keys();return g1e?Array.from(t):t},e.prototype.removeKey=function(t){this.data.delete(t)},e})();function Ie(e){return new mgt(e)}function Cg(e,t){for(var r=new e.constructor(e.length+t.length),o=0;o<e.length;o++)r[o]=e[o];for(var n=e.length,o=0;o<t.length;o++)r[o+n]=t[o];return r}function By(e,t){var r;if(Object.create)r=Object.create(e);else{var o=function(){};o.prototype=e,r=new o}return t&&re(r,t),r}function OV(e){var t=e.style;t.webkitUserSelect="none",t.userSelect="none",t.webkitTapHighlightColor="rgba(0,0,0,0)",t["-webkit-touch-callout"]="none"}function tt(e,t){return e.hasOwnProperty(t)}function xo(){}var sP=180/Math.PI,JMr=Number.EPSILON||Math.pow(2,-52);function mm(e,t){return e==null&&(e=0),t==null&&(t=0),[e,t]}function Ua(e,t){return e[0]=t[0],e[1]=t[1],e}function Eu(e){return[e[0],e[1]]}function SD(e,t,r){return e[0]=t,e[1]=r,e}function uJ(e,t,r){return e[0]=t[0]+r[0],e[1]=t[1]+r[1],e}function TD(e,t,r,o){return e[0]=t[0]+r[0]*o,e[1]=t[1]+r[1]*o,e}function Gf(e,t,r){return e[0]=t[0]-r[0],e[1]=t[1]-r[1],e}function kV(e){return Math.sqrt(hgt(e))}function hgt(e){return e[0]*e[0]+e[1]*e[1]}function lP(e,t,r){return e[0]=t[0]*r,e[1]=t[1]*r,e}function _p(e,t){var r=kV(t);return r===0?(e[0]=0,e[1]=0):(e[0]=t[0]/r,e[1]=t[1]/r),e}function AV(e,t){return Math.sqrt((e[0]-t[0])*(e[0]-t[0])+(e[1]-t[1])*(e[1]-t[1]))}var Cp=AV;function ggt(e,t){return(e[0]-t[0])*(e[0]-t[0])+(e[1]-t[1])*(e[1]-t[1])}var Pg=ggt;function uP(e,t,r,o){return e[0]=t[0]+o*(r[0]-t[0]),e[1]=t[1]+o*(r[1]-t[1]),e}function Do(e,t,r){var o=t[0],n=t[1];return e[0]=r[0]*o+r[2]*n+r[4],e[1]=r[1]*o+r[3]*n+r[5],e}function Ec(e,t,r){return e[0]=Math.min(t[0],r[0]),e[1]=Math.min(t[1],r[1]),e}function Mc(e,t,r){return e[0]=Math.max(t[0],r[0]),e[1]=Math.max(t[1],r[1]),e}var cP=(function(){function e(t,r){this.target=t,this.topTarget=r&&r.topTarget}return e})(),vgt=(function(){function e(t){this.handler=t,t.on("mousedown",this._dragStart,this),t.on("mousemove",this._drag,this),t.on("mouseup",this._dragEnd,this)}return e.prototype._dragStart=function(t){for(var r=t.target;r&&!r.draggable;)r=r.parent||r.__hostTarget;r&&(this._draggingTarget=r,r.dragging=!0,this._x=t.offsetX,this._y=t.offsetY,this.handler.dispatchToElement(new cP(r,t),"dragstart",t.event))},e.prototype._drag=function(t){var r=this._draggingTarget;if(r){var o=t.offsetX,n=t.offsetY,i=o-this._x,a=n-this._y;this._x=o,this._y=n,r.drift(i,a,t),this.handler.dispatchToElement(new cP(r,t),"drag",t.event);var s=this.handler.findHover(o,n,r).target,l=this._dropTarget;this._dropTarget=s,r!==s&&(l&&s!==l&&this.handler.dispatchToElement(new cP(l,t),"dragleave",t.event),s&&s!==l&&this.handler.dispatchToElement(new cP(s,t),"dragenter",t.event))}},e.prototype._dragEnd=function(t){var r=this._draggingTarget;r&&(r.dragging=!1),this.handler.dispatchToElement(new cP(r,t),"dragend",t.event),this._dropTarget&&this.handler.dispatchToElement(new cP(this._dropTarget,t),"drop",t.event),this._draggingTarget=null,this._dropTarget=null},e})(),v1e=vgt;var ygt=(function(){function e(t){t&&(this._$eventProcessor=t)}return e.prototype.on=function(t,r,o,n){this._$handlers||(this._$handlers={});var i=this._$handlers;if(typeof r=="function"&&(n=o,o=r,r=null),!o||!t)return this;var a=this._$eventProcessor;r!=null&&a&&a.normalizeQuery&&(r=a.normalizeQuery(r)),i[t]||(i[t]=[]);for(var s=0;s<i[t].length;s++)if(i[t][s].h===o)return this;var l={h:o,query:r,ctx:n||this,callAtLast:o.zrEventfulCallAtLast},u=i[t].length-1,c=i[t][u];return c&&c.callAtLast?i[t].splice(u,0,l):i[t].push(l),this},e.prototype.isSilent=function(t){var r=this._$handlers;return!r||!r[t]||!r[t].length},e.prototype.off=function(t,r){var o=this._$handlers;if(!o)return this;if(!t)return this._$handlers={},this;if(r){if(o[t]){for(var n=[],i=0,a=o[t].length;i<a;i++)o[t][i].h!==r&&n.push(o[t][i]);o[t]=n}o[t]&&o[t].length===0&&delete o[t]}else delete o[t];return this},e.prototype.trigger=function(t){for(var r=[],o=1;o<arguments.length;o++)r[o-1]=arguments[o];if(!this._$handlers)return this;var n=this._$handlers[t],i=this._$eventProcessor;if(n)for(var a=r.length,s=n.length,l=0;l<s;l++){var u=n[l];if(!(i&&i.filter&&u.query!=null&&!i.filter(t,u.query)))switch(a){case 0:u.h.call(u.ctx);break;case 1:u.h.call(u.ctx,r[0]);break;case 2:u.h.call(u.ctx,r[0],r[1]);break;default:u.h.apply(u.ctx,r);break}}return i&&i.afterTrigger&&i.afterTrigger(t),this},e.prototype.triggerWithContext=function(t){for(var r=[],o=1;o<arguments.length;o++)r[o-1]=arguments[o];if(!this._$handlers)return this;var n=this._$handlers[t],i=this._$eventProcessor;if(n)for(var a=r.length,s=r[a-1],l=n.length,u=0;u<l;u++){var c=n[u];if(!(i&&i.filter&&c.query!=null&&!i.filter(t,c.query)))switch(a){case 0:c.h.call(s);break;case 1:c.h.call(s,r[0]);break;case 2:c.h.call(s,r[0],r[1]);break;default:c.h.apply(s,r.slice(1,a-1));break}}return i&&i.afterTrigger&&i.afterTrigger(t),this},e})(),Qi=ygt;var xgt=Math.log(2);function cJ(e,t,r,o,n,i){var a=o+"-"+n,s=e.length;if(i.hasOwnProperty(a))return i[a];if(t===1){var l=Math.round(Math.log((1<<s)-1&~n)/xgt);return e[r][l]}for(var u=o|1<<r,c=r+1;o&1<<c;)c++;for(var p=0,f=0,d=0;f<s;f++){var m=1<<f;m&n||(p+=(d%2?-1:1)*e[r][f]*cJ(e,t-1,c,u,n|m,i),d++)}return i[a]=p,p}function pJ(e,t){var r=[[e[0],e[1],1,0,0,0,-t[0]*e[0],-t[0]*e[1]],[0,0,0,e[0],e[1],1,-t[1]*e[0],-t[1]*e[1]],[e[2],e[3],1,0,0,0,-t[2]*e[2],-t[2]*e[3]],[0,0,0,e[2],e[3],1,-t[3]*e[2],-t[3]*e[3]],[e[4],e[5],1,0,0,0,-t[4]*e[4],-t[4]*e[5]],[0,0,0,e[4],e[5],1,-t[5]*e[4],-t[5]*e[5]],[e[6],e[7],1,0,0,0,-t[6]*e[6],-t[6]*e[7]],[0,0,0,e[6],e[7],1,-t[7]*e[6],-t[7]*e[7]]],o={},n=cJ(r,8,0,0,0,o);if(n!==0){for(var i=[],a=0;a<8;a++)for(var s=0;s<8;s++)i[s]==null&&(i[s]=0),i[s]+=((a+s)%2?-1:1)*cJ(r,7,a===0?1:0,1<<a,1<<s,o)/n*t[a];return function(l,u,c){var p=u*i[6]+c*i[7]+1;l[0]=(u*i[0]+c*i[1]+i[2])/p,l[1]=(u*i[3]+c*i[4]+i[5])/p}}}var LV="___zrEVENTSAVED",fJ=[];function y1e(e,t,r,o,n){return NV(fJ,t,o,n,!0)&&NV(e,r,fJ[0],fJ[1])}function x1e(e,t){e&&r(e),t&&r(t);function r(o){var n=o[LV];n&&(n.clearMarkers&&n.clearMarkers(),delete o[LV])}}function NV(e,t,r,o,n){if(t.getBoundingClientRect&&rr.domSupported&&!dJ(t)){var i=t[LV]||(t[LV]={}),a=bgt(t,i),s=Sgt(a,i,n);if(s)return s(e,r,o),!0}return!1}function bgt(e,t){var r=t.markers;if(r)return r;r=t.markers=[];for(var o=["left","right"],n=["top","bottom"],i=0;i<4;i++){var a=document.createElement("div"),s=a.style,l=i%2,u=(i>>1)%2;s.cssText=["position: absolute","visibility: hidden","padding: 0","margin: 0","border-width: 0","user-select: none","width:0","height:0",o[l]+":0",n[u]+":0",o[1-l]+":auto",n[1-u]+":auto",""].join("!important;"),e.appendChild(a),r.push(a)}return t.clearMarkers=function(){L(r,function(c){c.parentNode&&c.parentNode.removeChild(c)})},r}function Sgt(e,t,r){for(var o=r?"invTrans":"trans",n=t[o],i=t.srcCoords,a=[],s=[],l=!0,u=0;u<4;u++){var c=e[u].getBoundingClientRect(),p=2*u,f=c.left,d=c.top;a.push(f,d),l=l&&i&&f===i[p]&&d===i[p+1],s.push(e[u].offsetLeft,e[u].offsetTop)}return l&&n?n:(t.srcCoords=a,t[o]=r?pJ(s,a):pJ(a,s))}function dJ(e){return e.nodeName.toUpperCase()==="CANVAS"}var Tgt=/([&<>"'])/g,wgt={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;"};function ma(e){return e==null?"":(e+"").replace(Tgt,function(t,r){return wgt[r]})}var _gt=/^(?:mouse|pointer|contextmenu|drag|drop)|click/,mJ=[],Cgt=rr.browser.firefox&&+rr.browser.version.split(".")[0]<39;function zV(e,t,r,o){return r=r||{},o?b1e(e,t,r):Cgt&&t.layerX!=null&&t.layerX!==t.offsetX?(r.zrX=t.layerX,r.zrY=t.layerY):t.offsetX!=null?(r.zrX=t.offsetX,r.zrY=t.offsetY):b1e(e,t,r),r}function b1e(e,t,r){if(rr.domSupported&&e.getBoundingClientRect){var o=t.clientX,n=t.clientY;if(dJ(e)){var i=e.getBoundingClientRect();r.zrX=o-i.left,r.zrY=n-i.top;return}else if(NV(mJ,e,o,n)){r.zrX=mJ[0],r.zrY=mJ[1];return}}r.zrX=r.zrY=0}function FV(e){return e||window.event}function Mu(e,t,r){if(t=FV(t),t.zrX!=null)return t;var o=t.type,n=o&&o.indexOf("touch")>=0;if(n){var a=o!=="touchend"?t.targetTouches[0]:t.changedTouches[0];a&&zV(e,a,t,r)}else{zV(e,t,t,r);var i=Pgt(t);t.zrDelta=i?i/120:-(t.detail||0)/3}var s=t.button;return t.which==null&&s!==void 0&&_gt.test(t.type)&&(t.which=s&1?1:s&2?3:s&4?2:0),t}function Pgt(e){var t=e.wheelDelta;if(t)return t;var r=e.deltaX,o=e.deltaY;if(r==null||o==null)return t;var n=Math.abs(o!==0?o:r),i=o>0?-1:o<0?1:r>0?-1:1;return 3*n*i}function wD(e,t,r,o){e.addEventListener(t,r,o)}function S1e(e,t,r,o){e.removeEventListener(t,r,o)}var Iu=function(e){e.preventDefault(),e.stopPropagation(),e.cancelBubble=!0};function hJ(e){return e.which===2||e.which===3}var w1e=(function(){function e(){this._track=[]}return e.prototype.recognize=function(t,r,o){return this._doTrack(t,r,o),this._recognize(t)},e.prototype.clear=function(){return this._track.length=0,this},e.prototype._doTrack=function(t,r,o){var n=t.touches;if(n){for(var i={points:[],touches:[],target:r,event:t},a=0,s=n.length;a<s;a++){var l=n[a],u=zV(o,l,{});i.points.push([u.zrX,u.zrY]),i.touches.push(l)}this._track.push(i)}},e.prototype._recognize=function(t){for(var r in gJ)if(gJ.hasOwnProperty(r)){var o=gJ[r](this._track,t);if(o)return o}},e})();function T1e(e){var t=e[1][0]-e[0][0],r=e[1][1]-e[0][1];return Math.sqrt(t*t+r*r)}function Rgt(e){return[(e[0][0]+e[1][0])/2,(e[0][1]+e[1][1])/2]}var gJ={pinch:function(e,t){var r=e.length;if(r){var o=(e[r-1]||{}).points,n=(e[r-2]||{}).points||o;if(n&&n.length>1&&o&&o.length>1){var i=T1e(o)/T1e(n);!isFinite(i)&&(i=1),t.pinchScale=i;var a=Rgt(o);return t.pinchX=a[0],t.pinchY=a[1],{type:"pinch",target:e[0].target,event:t}}}}};function Vo(){return[1,0,0,1,0,0]}function Gy(e){return e[0]=1,e[1]=0,e[2]=0,e[3]=1,e[4]=0,e[5]=0,e}function oS(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e[4]=t[4],e[5]=t[5],e}function Vs(e,t,r){var o=t[0]*r[0]+t[2]*r[1],n=t[1]*r[0]+t[3]*r[1],i=t[0]*r[2]+t[2]*r[3],a=t[1]*r[2]+t[3]*r[3],s=t[0]*r[4]+t[2]*r[5]+t[4],l=t[1]*r[4]+t[3]*r[5]+t[5];return e[0]=o,e[1]=n,e[2]=i,e[3]=a,e[4]=s,e[5]=l,e}function $s(e,t,r){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e[4]=t[4]+r[0],e[5]=t[5]+r[1],e}function cl(e,t,r,o){o===void 0&&(o=[0,0]);var n=t[0],i=t[2],a=t[4],s=t[1],l=t[3],u=t[5],c=Math.sin(r),p=Math.cos(r);return e[0]=n*p+s*c,e[1]=-n*c+s*p,e[2]=i*p+l*c,e[3]=-i*c+p*l,e[4]=p*(a-o[0])+c*(u-o[1])+o[0],e[5]=p*(u-o[1])-c*(a-o[0])+o[1],e}function fP(e,t,r){var o=r[0],n=r[1];return e[0]=t[0]*o,e[1]=t[1]*n,e[2]=t[2]*o,e[3]=t[3]*n,e[4]=t[4]*o,e[5]=t[5]*n,e}function Ji(e,t){var r=t[0],o=t[2],n=t[4],i=t[1],a=t[3],s=t[5],l=r*a-i*o;return l?(l=1/l,e[0]=a*l,e[1]=-i*l,e[2]=-o*l,e[3]=r*l,e[4]=(o*s-a*n)*l,e[5]=(i*n-r*s)*l,e):null}function _1e(e){var t=Vo();return oS(t,e),t}var Egt=(function(){function e(t,r){this.x=t||0,this.y=r||0}return e.prototype.copy=function(t){return this.x=t.x,this.y=t.y,this},e.prototype.clone=function(){return new e(this.x,this.y)},e.prototype.set=function(t,r){return this.x=t,this.y=r,this},e.prototype.equal=function(t){return t.x===this.x&&t.y===this.y},e.prototype.add=function(t){return this.x+=t.x,this.y+=t.y,this},e.prototype.scale=function(t){this.x*=t,this.y*=t},e.prototype.scaleAndAdd=function(t,r){this.x+=t.x*r,this.y+=t.y*r},e.prototype.sub=function(t){return this.x-=t.x,this.y-=t.y,this},e.prototype.dot=function(t){return this.x*t.x+this.y*t.y},e.prototype.len=function(){return Math.sqrt(this.x*this.x+this.y*this.y)},e.prototype.lenSquare=function(){return this.x*this.x+this.y*this.y},e.prototype.normalize=function(){var t=this.len();return this.x/=t,this.y/=t,this},e.prototype.distance=function(t){var r=this.x-t.x,o=this.y-t.y;return Math.sqrt(r*r+o*o)},e.prototype.distanceSquare=function(t){var r=this.x-t.x,o=this.y-t.y;return r*r+o*o},e.prototype.negate=function(){return this.x=-this.x,this.y=-this.y,this},e.prototype.transform=function(t){if(t){var r=this.x,o=this.y;return this.x=t[0]*r+t[2]*o+t[4],this.y=t[1]*r+t[3]*o+t[5],this}},e.prototype.toArray=function(t){return t[0]=this.x,t[1]=this.y,t},e.prototype.fromArray=function(t){this.x=t[0],this.y=t[1]},e.set=function(t,r,o){t.x=r,t.y=o},e.copy=function(t,r){t.x=r.x,t.y=r.y},e.len=function(t){return Math.sqrt(t.x*t.x+t.y*t.y)},e.lenSquare=function(t){return t.x*t.x+t.y*t.y},e.dot=function(t,r){return t.x*r.x+t.y*r.y},e.add=function(t,r,o){t.x=r.x+o.x,t.y=r.y+o.y},e.sub=function(t,r,o){t.x=r.x-o.x,t.y=r.y-o.y},e.scale=function(t,r,o){t.x=r.x*o,t.y=r.y*o},e.scaleAndAdd=function(t,r,o,n){t.x=r.x+o.x*n,t.y=r.y+o.y*n},e.lerp=function(t,r,o,n){var i=1-n;t.x=i*r.x+n*o.x,t.y=i*r.y+n*o.y},e})(),wt=Egt;var lS=Math.min,dP=Math.max,vJ=Math.abs,C1e=["x","y"],Mgt=["width","height"],nS=new wt,iS=new wt,aS=new wt,sS=new wt,Ic=bJ(),_D=Ic.minTv,yJ=Ic.maxTv,CD=[0,0],xJ=(function(){function e(t,r,o,n){e.set(this,t,r,o,n)}return e.set=function(t,r,o,n,i){return n<0&&(r=r+n,n=-n),i<0&&(o=o+i,i=-i),t.x=r,t.y=o,t.width=n,t.height=i,t},e.prototype.union=function(t){var r=lS(t.x,this.x),o=lS(t.y,this.y);isFinite(this.x)&&isFinite(this.width)?this.width=dP(t.x+t.width,this.x+this.width)-r:this.width=t.width,isFinite(this.y)&&isFinite(this.height)?this.height=dP(t.y+t.height,this.y+this.height)-o:this.height=t.height,this.x=r,this.y=o},e.prototype.applyTransform=function(t){e.applyTransform(this,this,t)},e.prototype.calculateTransform=function(t){var r=this,o=t.width/r.width,n=t.height/r.height,i=Vo();return $s(i,i,[-r.x,-r.y]),fP(i,i,[o,n]),$s(i,i,[t.x,t.y]),i},e.prototype.intersect=function(t,r,o){return e.intersect(this,t,r,o)},e.intersect=function(t,r,o,n){o&&wt.set(o,0,0);var i=n&&n.outIntersectRect||null,a=n&&n.clamp;if(i&&(i.x=i.y=i.width=i.height=NaN),!t||!r)return!1;t instanceof e||(t=e.set(Igt,t.x,t.y,t.width,t.height)),r instanceof e||(r=e.set(Dgt,r.x,r.y,r.width,r.height));var s=!!o;Ic.reset(n,s);var l=Ic.touchThreshold,u=t.x+l,c=t.x+t.width-l,p=t.y+l,f=t.y+t.height-l,d=r.x+l,m=r.x+r.width-l,h=r.y+l,g=r.y+r.height-l;if(u>c||p>f||d>m||h>g)return!1;var v=!(c<d||m<u||f<h||g<p);return(s||i)&&(CD[0]=1/0,CD[1]=0,P1e(u,c,d,m,0,s,i,a),P1e(p,f,h,g,1,s,i,a),s&&wt.copy(o,v?Ic.useDir?Ic.dirMinTv:_D:yJ)),v},e.contain=function(t,r,o){return r>=t.x&&r<=t.x+t.width&&o>=t.y&&o<=t.y+t.height},e.prototype.contain=function(t,r){return e.contain(this,t,r)},e.prototype.clone=function(){return new e(this.x,this.y,this.width,this.height)},e.prototype.copy=function(t){e.copy(this,t)},e.prototype.plain=function(){return{x:this.x,y:this.y,width:this.width,height:this.height}},e.prototype.isFinite=function(){return isFinite(this.x)&&isFinite(this.y)&&isFinite(this.width)&&isFinite(this.height)},e.prototype.isZero=function(){return this.width===0||this.height===0},e.create=function(t){return new e(t.x,t.y,t.width,t.height)},e.copy=function(t,r){return t.x=r.x,t.y=r.y,t.width=r.width,t.height=r.height,t},e.applyTransform=function(t,r,o){if(!o){t!==r&&e.copy(t,r);return}if(o[1]<1e-5&&o[1]>-1e-5&&o[2]<1e-5&&o[2]>-1e-5){var n=o[0],i=o[3],a=o[4],s=o[5];t.x=r.x*n+a,t.y=r.y*i+s,t.width=r.width*n,t.height=r.height*i,t.width<0&&(t.x+=t.width,t.width=-t.width),t.height<0&&(t.y+=t.height,t.height=-t.height);return}nS.x=aS.x=r.x,nS.y=sS.y=r.y,iS.x=sS.x=r.x+r.width,iS.y=aS.y=r.y+r.height,nS.transform(o),sS.transform(o),iS.transform(o),aS.transform(o),t.x=lS(nS.x,iS.x,aS.x,sS.x),t.y=lS(nS.y,iS.y,aS.y,sS.y);var l=dP(nS.x,iS.x,aS.x,sS.x),u=dP(nS.y,iS.y,aS.y,sS.y);t.width=l-t.x,t.height=u-t.y},e})(),Igt=new xJ(0,0,0,0),Dgt=new xJ(0,0,0,0);function P1e(e,t,r,o,n,i,a,s){var l=vJ(t-r),u=vJ(o-e),c=lS(l,u),p=C1e[n],f=C1e[1-n],d=Mgt[n];t<r||o<e?l<u?(i&&(yJ[p]=-l),s&&(a[p]=t,a[d]=0)):(i&&(yJ[p]=u),s&&(a[p]=e,a[d]=0)):(a&&(a[p]=dP(e,r),a[d]=lS(t,o)-a[p]),i&&(c<CD[0]||Ic.useDir)&&(CD[0]=lS(c,CD[0]),(l<u||!Ic.bidirectional)&&(_D[p]=l,_D[f]=0,Ic.useDir&&Ic.calcDirMTV()),(l>=u||!Ic.bidirectional)&&(_D[p]=-u,_D[f]=0,Ic.useDir&&Ic.calcDirMTV())))}function bJ(){var e=0,t=new wt,r=new wt,o={minTv:new wt,maxTv:new wt,useDir:!1,dirMinTv:new wt,touchThreshold:0,bidirectional:!0,negativeSize:!1,reset:function(i,a){o.touchThreshold=0,i&&i.touchThreshold!=null&&(o.touchThreshold=dP(0,i.touchThreshold)),o.negativeSize=!1,a&&(o.minTv.set(1/0,1/0),o.maxTv.set(0,0),o.useDir=!1,i&&i.direction!=null&&(o.useDir=!0,o.dirMinTv.copy(o.minTv),r.copy(o.minTv),e=i.direction,o.bidirectional=i.bidirectional==null||!!i.bidirectional,o.bidirectional||t.set(Math.cos(e),Math.sin(e))))},calcDirMTV:function(){var i=o.minTv,a=o.dirMinTv,s=i.y*i.y+i.x*i.x,l=Math.sin(e),u=Math.cos(e),c=l*i.y+u*i.x;if(n(c)){n(i.x)&&n(i.y)&&a.set(0,0);return}if(r.x=s*u/c,r.y=s*l/c,n(r.x)&&n(r.y)){a.set(0,0);return}(o.bidirectional||t.dot(r)>0)&&r.len()<a.len()&&a.copy(r)}};function n(i){return vJ(i)<1e-10}return o}var Je=xJ;var E1e="silent";function Ogt(e,t,r){return{type:e,event:r,target:t.target,topTarget:t.topTarget,cancelBubble:!1,offsetX:r.zrX,offsetY:r.zrY,gestureEvent:r.gestureEvent,pinchX:r.pinchX,pinchY:r.pinchY,pinchScale:r.pinchScale,wheelDelta:r.zrDelta,zrByTouch:r.zrByTouch,which:r.which,stop:kgt}}function kgt(){Iu(this.event)}var Agt=(function(e){Y(t,e);function t(){var r=e!==null&&e.apply(this,arguments)||this;return r.handler=null,r}return t.prototype.dispose=function(){},t.prototype.setCursor=function(){},t})(Qi),PD=(function(){function e(t,r){this.x=t,this.y=r}return e})(),Lgt=["click","dblclick","mousewheel","mouseout","mouseup","mousedown","mousemove","contextmenu"],SJ=new Je(0,0,0,0),M1e=(function(e){Y(t,e);function t(r,o,n,i,a){var s=e.call(this)||this;return s._hovered=new PD(0,0),s.storage=r,s.painter=o,s.painterRoot=i,s._pointerSize=a,n=n||new Agt,s.proxy=null,s.setHandlerProxy(n),s._draggingMgr=new v1e(s),s}return t.prototype.setHandlerProxy=function(r){this.proxy&&this.proxy.dispose(),r&&(L(Lgt,function(o){r.on&&r.on(o,this[o],this)},this),r.handler=this),this.proxy=r},t.prototype.mousemove=function(r){var o=r.zrX,n=r.zrY,i=I1e(this,o,n),a=this._hovered,s=a.target;s&&!s.__zr&&(a=this.findHover(a.x,a.y),s=a.target);var l=this._hovered=i?new PD(o,n):this.findHover(o,n),u=l.target,c=this.proxy;c.setCursor&&c.setCursor(u?u.cursor:"default"),s&&u!==s&&this.dispatchToElement(a,"mouseout",r),this.dispatchToElement(l,"mousemove",r),u&&u!==s&&this.dispatchToElement(l,"mouseover",r)},t.prototype.mouseout=function(r){var o=r.zrEventControl;o!=="only_globalout"&&this.dispatchToElement(this._hovered,"mouseout",r),o!=="no_globalout"&&this.trigger("globalout",{type:"globalout",event:r})},t.prototype.resize=function(){this._hovered=new PD(0,0)},t.prototype.dispatch=function(r,o){var n=this[r];n&&n.call(this,o)},t.prototype.dispose=function(){this.proxy.dispose(),this.storage=null,this.proxy=null,this.painter=null},t.prototype.setCursorStyle=function(r){var o=this.proxy;o.setCursor&&o.setCursor(r)},t.prototype.dispatchToElement=function(r,o,n){r=r||{};var i=r.target;if(!(i&&i.silent)){for(var a="on"+o,s=Ogt(o,r,n);i&&(i[a]&&(s.cancelBubble=!!i[a].call(i,s)),i.trigger(o,s),i=i.__hostTarget?i.__hostTarget:i.parent,!s.cancelBubble););s.cancelBubble||(this.trigger(o,s),this.painter&&this.painter.eachOtherLayer&&this.painter.eachOtherLayer(function(l){typeof l[a]=="function"&&l[a].call(l,s),l.trigger&&l.trigger(o,s)}))}},t.prototype.findHover=function(r,o,n){var i=this.storage.getDisplayList(),a=new PD(r,o);if(R1e(i,a,r,o,n),this._pointerSize&&!a.target){for(var s=[],l=this._pointerSize,u=l/2,c=new Je(r-u,o-u,l,l),p=i.length-1;p>=0;p--){var f=i[p];f!==n&&!f.ignore&&!f.ignoreCoarsePointer&&(!f.parent||!f.parent.ignoreCoarsePointer)&&(SJ.copy(f.getBoundingRect()),f.transform&&SJ.applyTransform(f.transform),SJ.intersect(c)&&s.push(f))}if(s.length)for(var d=4,m=Math.PI/12,h=Math.PI*2,g=0;g<u;g+=d)for(var v=0;v<h;v+=m){var y=r+g*Math.cos(v),x=o+g*Math.sin(v);if(R1e(s,a,y,x,n),a.target)return a}}return a},t.prototype.processGesture=function(r,o){this._gestureMgr||(this._gestureMgr=new w1e);var n=this._gestureMgr;o==="start"&&n.clear();var i=n.recognize(r,this.findHover(r.zrX,r.zrY,null).target,this.proxy.dom);if(o==="end"&&n.clear(),i){var a=i.type;r.gestureEvent=a;var s=new PD;s.target=i.target,this.dispatchToElement(s,a,i.event)}},t})(Qi);L(["click","mousedown","mouseup","mousewheel","dblclick","contextmenu"],function(e){M1e.prototype[e]=function(t){var r=t.zrX,o=t.zrY,n=I1e(this,r,o),i,a;if((e!=="mouseup"||!n)&&(i=this.findHover(r,o),a=i.target),e==="mousedown")this._downEl=a,this._downPoint=[t.zrX,t.zrY],this._upEl=a;else if(e==="mouseup")this._upEl=a;else if(e==="click"){if(this._downEl!==this._upEl||!this._downPoint||Cp(this._downPoint,[t.zrX,t.zrY])>4)return;this._downPoint=null}this.dispatchToElement(i,e,t)}});function Ngt(e,t,r){if(e[e.rectHover?"rectContain":"contain"](t,r)){for(var o=e,n=void 0,i=!1;o;){if(o.ignoreClip&&(i=!0),!i){var a=o.getClipPath();if(a&&!a.contain(t,r))return!1}o.silent&&(n=!0);var s=o.__hostTarget;o=s?o.ignoreHostSilent?null:s:o.parent}return n?E1e:!0}return!1}function R1e(e,t,r,o,n){for(var i=e.length-1;i>=0;i--){var a=e[i],s=void 0;if(a!==n&&!a.ignore&&(s=Ngt(a,r,o))&&(!t.topTarget&&(t.topTarget=a),s!==E1e)){t.target=a;break}}}function I1e(e,t,r){var o=e.painter;return t<0||t>o.getWidth()||r<0||r>o.getHeight()}var D1e=M1e;var A1e=32,RD=7;function zgt(e){for(var t=0;e>=A1e;)t|=e&1,e>>=1;return e+t}function O1e(e,t,r,o){var n=t+1;if(n===r)return 1;if(o(e[n++],e[t])<0){for(;n<r&&o(e[n],e[n-1])<0;)n++;Fgt(e,t,n)}else for(;n<r&&o(e[n],e[n-1])>=0;)n++;return n-t}function Fgt(e,t,r){for(r--;t<r;){var o=e[t];e[t++]=e[r],e[r--]=o}}function k1e(e,t,r,o,n){for(o===t&&o++;o<r;o++){for(var i=e[o],a=t,s=o,l;a<s;)l=a+s>>>1,n(i,e[l])<0?s=l:a=l+1;var u=o-a;switch(u){case 3:e[a+3]=e[a+2];case 2:e[a+2]=e[a+1];case 1:e[a+1]=e[a];break;default:for(;u>0;)e[a+u]=e[a+u-1],u--}e[a]=i}}function TJ(e,t,r,o,n,i){var a=0,s=0,l=1;if(i(e,t[r+n])>0){for(s=o-n;l<s&&i(e,t[r+n+l])>0;)a=l,l=(l<<1)+1,l<=0&&(l=s);l>s&&(l=s),a+=n,l+=n}else{for(s=n+1;l<s&&i(e,t[r+n-l])<=0;)a=l,l=(l<<1)+1,l<=0&&(l=s);l>s&&(l=s);var u=a;a=n-l,l=n-u}for(a++;a<l;){var c=a+(l-a>>>1);i(e,t[r+c])>0?a=c+1:l=c}return l}function wJ(e,t,r,o,n,i){var a=0,s=0,l=1;if(i(e,t[r+n])<0){for(s=n+1;l<s&&i(e,t[r+n-l])<0;)a=l,l=(l<<1)+1,l<=0&&(l=s);l>s&&(l=s);var u=a;a=n-l,l=n-u}else{for(s=o-n;l<s&&i(e,t[r+n+l])>=0;)a=l,l=(l<<1)+1,l<=0&&(l=s);l>s&&(l=s),a+=n,l+=n}for(a++;a<l;){var c=a+(l-a>>>1);i(e,t[r+c])<0?l=c:a=c+1}return l}function Ugt(e,t){var r=RD,o,n,i=0,a=[];o=[],n=[];function s(d,m){o[i]=d,n[i]=m,i+=1}function l(){for(;i>1;){var d=i-2;if(d>=1&&n[d-1]<=n[d]+n[d+1]||d>=2&&n[d-2]<=n[d]+n[d-1])n[d-1]<n[d+1]&&d--;else if(n[d]>n[d+1])break;c(d)}}function u(){for(;i>1;){var d=i-2;d>0&&n[d-1]<n[d+1]&&d--,c(d)}}function c(d){var m=o[d],h=n[d],g=o[d+1],v=n[d+1];n[d]=h+v,d===i-3&&(o[d+1]=o[d+2],n[d+1]=n[d+2]),i--;var y=wJ(e[g],e,m,h,0,t);m+=y,h-=y,h!==0&&(v=TJ(e[m+h-1],e,g,v,v-1,t),v!==0&&(h<=v?p(m,h,g,v):f(m,h,g,v)))}function p(d,m,h,g){var v=0;for(v=0;v<m;v++)a[v]=e[d+v];var y=0,x=h,b=d;if(e[b++]=e[x++],--g===0){for(v=0;v<m;v++)e[b+v]=a[y+v];return}if(m===1){for(v=0;v<g;v++)e[b+v]=e[x+v];e[b+g]=a[y];return}for(var S=r,T,w,C;;){T=0,w=0,C=!1;do if(t(e[x],a[y])<0){if(e[b++]=e[x++],w++,T=0,--g===0){C=!0;break}}else if(e[b++]=a[y++],T++,w=0,--m===1){C=!0;break}while((T|w)<S);if(C)break;do{if(T=wJ(e[x],a,y,m,0,t),T!==0){for(v=0;v<T;v++)e[b+v]=a[y+v];if(b+=T,y+=T,m-=T,m<=1){C=!0;break}}if(e[b++]=e[x++],--g===0){C=!0;break}if(w=TJ(a[y],e,x,g,0,t),w!==0){for(v=0;v<w;v++)e[b+v]=e[x+v];if(b+=w,x+=w,g-=w,g===0){C=!0;break}}if(e[b++]=a[y++],--m===1){C=!0;break}S--}while(T>=RD||w>=RD);if(C)break;S<0&&(S=0),S+=2}if(r=S,r<1&&(r=1),m===1){for(v=0;v<g;v++)e[b+v]=e[x+v];e[b+g]=a[y]}else{if(m===0)throw new Error;for(v=0;v<m;v++)e[b+v]=a[y+v]}}function f(d,m,h,g){var v=0;for(v=0;v<g;v++)a[v]=e[h+v];var y=d+m-1,x=g-1,b=h+g-1,S=0,T=0;if(e[b--]=e[y--],--m===0){for(S=b-(g-1),v=0;v<g;v++)e[S+v]=a[v];return}if(g===1){for(b-=m,y-=m,T=b+1,S=y+1,v=m-1;v>=0;v--)e[T+v]=e[S+v];e[b]=a[x];return}for(var w=r;;){var C=0,P=0,R=!1;do if(t(a[x],e[y])<0){if(e[b--]=e[y--],C++,P=0,--m===0){R=!0;break}}else if(e[b--]=a[x--],P++,C=0,--g===1){R=!0;break}while((C|P)<w);if(R)break;do{if(C=m-wJ(a[x],e,d,m,m-1,t),C!==0){for(b-=C,y-=C,m-=C,T=b+1,S=y+1,v=C-1;v>=0;v--)e[T+v]=e[S+v];if(m===0){R=!0;break}}if(e[b--]=a[x--],--g===1){R=!0;break}if(P=g-TJ(e[y],a,0,g,g-1,t),P!==0){for(b-=P,x-=P,g-=P,T=b+1,S=x+1,v=0;v<P;v++)e[T+v]=a[S+v];if(g<=1){R=!0;break}}if(e[b--]=e[y--],--m===0){R=!0;break}w--}while(C>=RD||P>=RD);if(R)break;w<0&&(w=0),w+=2}if(r=w,r<1&&(r=1),g===1){for(b-=m,y-=m,T=b+1,S=y+1,v=m-1;v>=0;v--)e[T+v]=e[S+v];e[b]=a[x]}else{if(g===0)throw new Error;for(S=b-(g-1),v=0;v<g;v++)e[S+v]=a[v]}}return{mergeRuns:l,forceMergeRuns:u,pushRun:s}}function uS(e,t,r,o){r||(r=0),o||(o=e.length);var n=o-r;if(!(n<2)){var i=0;if(n<A1e){i=O1e(e,r,o,t),k1e(e,r,o,r+i,t);return}var a=Ugt(e,t),s=zgt(n);do{if(i=O1e(e,r,o,t),i<s){var l=n;l>s&&(l=s),k1e(e,r,r+l,r+i,t),i=l}a.pushRun(r,i),a.mergeRuns(),n-=i,r+=i}while(n!==0);a.forceMergeRuns()}}var ha=1,cS=2,Hy=4;var L1e=!1;function _J(){L1e||(L1e=!0,console.warn("z / z2 / zlevel of displayable is invalid, which may cause unexpected errors"))}function N1e(e,t){return e.zlevel===t.zlevel?e.z===t.z?e.z2-t.z2:e.z-t.z:e.zlevel-t.zlevel}var Vgt=(function(){function e(){this._roots=[],this._displayList=[],this._displayListLen=0,this.displayableSortFunc=N1e}return e.prototype.traverse=function(t,r){for(var o=0;o<this._roots.length;o++)this._roots[o].traverse(t,r)},e.prototype.getDisplayList=function(t,r){r=r||!1;var o=this._displayList;return(t||!o.length)&&this.updateDisplayList(r),o},e.prototype.updateDisplayList=function(t){this._displayListLen=0;for(var r=this._roots,o=this._displayList,n=0,i=r.length;n<i;n++)this._updateAndAddDisplayable(r[n],null,t);o.length=this._displayListLen,uS(o,N1e)},e.prototype._updateAndAddDisplayable=function(t,r,o){if(!(t.ignore&&!o)){t.beforeUpdate(),t.update(),t.afterUpdate();var n=t.getClipPath(),i=r&&r.length,a=0,s=t.__clipPaths;if(!t.ignoreClip&&(i||n)){if(s||(s=t.__clipPaths=[]),i)for(var l=0;l<r.length;l++)s[a++]=r[l];for(var u=n,c=t;u;)u.parent=c,u.updateTransform(),s[a++]=u,c=u,u=u.getClipPath()}if(s&&(s.length=a),t.childrenRef){for(var p=t.childrenRef(),f=0;f<p.length;f++){var d=p[f];t.__dirty&&(d.__dirty|=ha),this._updateAndAddDisplayable(d,s,o)}t.__dirty=0}else{var m=t;isNaN(m.z)&&(_J(),m.z=0),isNaN(m.z2)&&(_J(),m.z2=0),isNaN(m.zlevel)&&(_J(),m.zlevel=0),this._displayList[this._displayListLen++]=m}var h=t.getDecalElement&&t.getDecalElement();h&&this._updateAndAddDisplayable(h,s,o);var g=t.getTextGuideLine();g&&this._updateAndAddDisplayable(g,s,o);var v=t.getTextContent();v&&this._updateAndAddDisplayable(v,s,o)}},e.prototype.addRoot=function(t){t.__zr&&t.__zr.storage===this||this._roots.push(t)},e.prototype.delRoot=function(t){if(t instanceof Array){for(var r=0,o=t.length;r<o;r++)this.delRoot(t[r]);return}var n=vt(this._roots,t);n>=0&&this._roots.splice(n,1)},e.prototype.delAllRoots=function(){this._roots=[],this._displayList=[],this._displayListLen=0},e.prototype.getRoots=function(){return this._roots},e.prototype.dispose=function(){this._displayList=null,this._roots=null},e})(),z1e=Vgt;var F1e;F1e=rr.hasGlobalWindow&&(window.requestAnimationFrame&&window.requestAnimationFrame.bind(window)||window.msRequestAnimationFrame&&window.msRequestAnimationFrame.bind(window)||window.mozRequestAnimationFrame||window.webkitRequestAnimationFrame)||function(e){return setTimeout(e,16)};var ED=F1e;var UV={linear:function(e){return e},quadraticIn:function(e){return e*e},quadraticOut:function(e){return e*(2-e)},quadraticInOut:function(e){return(e*=2)<1?.5*e*e:-.5*(--e*(e-2)-1)},cubicIn:function(e){return e*e*e},cubicOut:function(e){return--e*e*e+1},cubicInOut:function(e){return(e*=2)<1?.5*e*e*e:.5*((e-=2)*e*e+2)},quarticIn:function(e){return e*e*e*e},quarticOut:function(e){return 1- --e*e*e*e},quarticInOut:function(e){return(e*=2)<1?.5*e*e*e*e:-.5*((e-=2)*e*e*e-2)},quinticIn:function(e){return e*e*e*e*e},quinticOut:function(e){return--e*e*e*e*e+1},quinticInOut:function(e){return(e*=2)<1?.5*e*e*e*e*e:.5*((e-=2)*e*e*e*e+2)},sinusoidalIn:function(e){return 1-Math.cos(e*Math.PI/2)},sinusoidalOut:function(e){return Math.sin(e*Math.PI/2)},sinusoidalInOut:function(e){return .5*(1-Math.cos(Math.PI*e))},exponentialIn:function(e){return e===0?0:Math.pow(1024,e-1)},exponentialOut:function(e){return e===1?1:1-Math.pow(2,-10*e)},exponentialInOut:function(e){return e===0?0:e===1?1:(e*=2)<1?.5*Math.pow(1024,e-1):.5*(-Math.pow(2,-10*(e-1))+2)},circularIn:function(e){return 1-Math.sqrt(1-e*e)},circularOut:function(e){return Math.sqrt(1- --e*e)},circularInOut:function(e){return(e*=2)<1?-.5*(Math.sqrt(1-e*e)-1):.5*(Math.sqrt(1-(e-=2)*e)+1)},elasticIn:function(e){var t,r=.1,o=.4;return e===0?0:e===1?1:(!r||r<1?(r=1,t=o/4):t=o*Math.asin(1/r)/(2*Math.PI),-(r*Math.pow(2,10*(e-=1))*Math.sin((e-t)*(2*Math.PI)/o)))},elasticOut:function(e){var t,r=.1,o=.4;return e===0?0:e===1?1:(!r||r<1?(r=1,t=o/4):t=o*Math.asin(1/r)/(2*Math.PI),r*Math.pow(2,-10*e)*Math.sin((e-t)*(2*Math.PI)/o)+1)},elasticInOut:function(e){var t,r=.1,o=.4;return e===0?0:e===1?1:(!r||r<1?(r=1,t=o/4):t=o*Math.asin(1/r)/(2*Math.PI),(e*=2)<1?-.5*(r*Math.pow(2,10*(e-=1))*Math.sin((e-t)*(2*Math.PI)/o)):r*Math.pow(2,-10*(e-=1))*Math.sin((e-t)*(2*Math.PI)/o)*.5+1)},backIn:function(e){var t=1.70158;return e*e*((t+1)*e-t)},backOut:function(e){var t=1.70158;return--e*e*((t+1)*e+t)+1},backInOut:function(e){var t=2.5949095;return(e*=2)<1?.5*(e*e*((t+1)*e-t)):.5*((e-=2)*e*((t+1)*e+t)+2)},bounceIn:function(e){return 1-UV.bounceOut(1-e)},bounceOut:function(e){return e<.36363636363636365?7.5625*e*e:e<.7272727272727273?7.5625*(e-=.5454545454545454)*e+.75:e<.9090909090909091?7.5625*(e-=.8181818181818182)*e+.9375:7.5625*(e-=.9545454545454546)*e+.984375},bounceInOut:function(e){return e<.5?UV.bounceIn(e*2)*.5:UV.bounceOut(e*2-1)*.5+.5}},VV=UV;var $V=Math.pow,Wy=Math.sqrt,GV=1e-8,V1e=1e-4,U1e=Wy(3),BV=1/3,hm=mm(),Pp=mm(),mP=mm();function jy(e){return e>-GV&&e<GV}function $1e(e){return e>GV||e<-GV}function ni(e,t,r,o,n){var i=1-n;return i*i*(i*e+3*n*t)+n*n*(n*o+3*i*r)}function CJ(e,t,r,o,n){var i=1-n;return 3*(((t-e)*i+2*(r-t)*n)*i+(o-r)*n*n)}function pS(e,t,r,o,n,i){var a=o+3*(t-r)-e,s=3*(r-t*2+e),l=3*(t-e),u=e-n,c=s*s-3*a*l,p=s*l-9*a*u,f=l*l-3*s*u,d=0;if(jy(c)&&jy(p))if(jy(s))i[0]=0;else{var m=-l/s;m>=0&&m<=1&&(i[d++]=m)}else{var h=p*p-4*c*f;if(jy(h)){var g=p/c,m=-s/a+g,v=-g/2;m>=0&&m<=1&&(i[d++]=m),v>=0&&v<=1&&(i[d++]=v)}else if(h>0){var y=Wy(h),x=c*s+1.5*a*(-p+y),b=c*s+1.5*a*(-p-y);x<0?x=-$V(-x,BV):x=$V(x,BV),b<0?b=-$V(-b,BV):b=$V(b,BV);var m=(-s-(x+b))/(3*a);m>=0&&m<=1&&(i[d++]=m)}else{var S=(2*c*s-3*a*p)/(2*Wy(c*c*c)),T=Math.acos(S)/3,w=Wy(c),C=Math.cos(T),m=(-s-2*w*C)/(3*a),v=(-s+w*(C+U1e*Math.sin(T)))/(3*a),P=(-s+w*(C-U1e*Math.sin(T)))/(3*a);m>=0&&m<=1&&(i[d++]=m),v>=0&&v<=1&&(i[d++]=v),P>=0&&P<=1&&(i[d++]=P)}}return d}function HV(e,t,r,o,n){var i=6*r-12*t+6*e,a=9*t+3*o-3*e-9*r,s=3*t-3*e,l=0;if(jy(a)){if($1e(i)){var u=-s/i;u>=0&&u<=1&&(n[l++]=u)}}else{var c=i*i-4*a*s;if(jy(c))n[0]=-i/(2*a);else if(c>0){var p=Wy(c),u=(-i+p)/(2*a),f=(-i-p)/(2*a);u>=0&&u<=1&&(n[l++]=u),f>=0&&f<=1&&(n[l++]=f)}}return l}function Rp(e,t,r,o,n,i){var a=(t-e)*n+e,s=(r-t)*n+t,l=(o-r)*n+r,u=(s-a)*n+a,c=(l-s)*n+s,p=(c-u)*n+u;i[0]=e,i[1]=a,i[2]=u,i[3]=p,i[4]=p,i[5]=c,i[6]=l,i[7]=o}function jV(e,t,r,o,n,i,a,s,l,u,c){var p,f=.005,d=1/0,m,h,g,v;hm[0]=l,hm[1]=u;for(var y=0;y<1;y+=.05)Pp[0]=ni(e,r,n,a,y),Pp[1]=ni(t,o,i,s,y),g=Pg(hm,Pp),g<d&&(p=y,d=g);d=1/0;for(var x=0;x<32&&!(f<V1e);x++)m=p-f,h=p+f,Pp[0]=ni(e,r,n,a,m),Pp[1]=ni(t,o,i,s,m),g=Pg(Pp,hm),m>=0&&g<d?(p=m,d=g):(mP[0]=ni(e,r,n,a,h),mP[1]=ni(t,o,i,s,h),v=Pg(mP,hm),h<=1&&v<d?(p=h,d=v):f*=.5);return c&&(c[0]=ni(e,r,n,a,p),c[1]=ni(t,o,i,s,p)),Wy(d)}function B1e(e,t,r,o,n,i,a,s,l){for(var u=e,c=t,p=0,f=1/l,d=1;d<=l;d++){var m=d*f,h=ni(e,r,n,a,m),g=ni(t,o,i,s,m),v=h-u,y=g-c;p+=Math.sqrt(v*v+y*y),u=h,c=g}return p}function vi(e,t,r,o){var n=1-o;return n*(n*e+2*o*t)+o*o*r}function MD(e,t,r,o){return 2*((1-o)*(t-e)+o*(r-t))}function G1e(e,t,r,o,n){var i=e-2*t+r,a=2*(t-e),s=e-o,l=0;if(jy(i)){if($1e(a)){var u=-s/a;u>=0&&u<=1&&(n[l++]=u)}}else{var c=a*a-4*i*s;if(jy(c)){var u=-a/(2*i);u>=0&&u<=1&&(n[l++]=u)}else if(c>0){var p=Wy(c),u=(-a+p)/(2*i),f=(-a-p)/(2*i);u>=0&&u<=1&&(n[l++]=u),f>=0&&f<=1&&(n[l++]=f)}}return l}function WV(e,t,r){var o=e+r-2*t;return o===0?.5:(e-t)/o}function Yy(e,t,r,o,n){var i=(t-e)*o+e,a=(r-t)*o+t,s=(a-i)*o+i;n[0]=e,n[1]=i,n[2]=s,n[3]=s,n[4]=a,n[5]=r}function YV(e,t,r,o,n,i,a,s,l){var u,c=.005,p=1/0;hm[0]=a,hm[1]=s;for(var f=0;f<1;f+=.05){Pp[0]=vi(e,r,n,f),Pp[1]=vi(t,o,i,f);var d=Pg(hm,Pp);d<p&&(u=f,p=d)}p=1/0;for(var m=0;m<32&&!(c<V1e);m++){var h=u-c,g=u+c;Pp[0]=vi(e,r,n,h),Pp[1]=vi(t,o,i,h);var d=Pg(Pp,hm);if(h>=0&&d<p)u=h,p=d;else{mP[0]=vi(e,r,n,g),mP[1]=vi(t,o,i,g);var v=Pg(mP,hm);g<=1&&v<p?(u=g,p=v):c*=.5}}return l&&(l[0]=vi(e,r,n,u),l[1]=vi(t,o,i,u)),Wy(p)}function H1e(e,t,r,o,n,i,a){for(var s=e,l=t,u=0,c=1/a,p=1;p<=a;p++){var f=p*c,d=vi(e,r,n,f),m=vi(t,o,i,f),h=d-s,g=m-l;u+=Math.sqrt(h*h+g*g),s=d,l=m}return u}var $gt=/cubic-bezier\(([0-9,\.e ]+)\)/;function hP(e){var t=e&&$gt.exec(e);if(t){var r=t[1].split(","),o=+Xi(r[0]),n=+Xi(r[1]),i=+Xi(r[2]),a=+Xi(r[3]);if(isNaN(o+n+i+a))return;var s=[];return function(l){return l<=0?0:l>=1?1:pS(0,o,i,1,l,s)&&ni(0,n,a,1,s[0])}}}var Bgt=(function(){function e(t){this._inited=!1,this._startTime=0,this._pausedTime=0,this._paused=!1,this._life=t.life||1e3,this._delay=t.delay||0,this.loop=t.loop||!1,this.onframe=t.onframe||xo,this.ondestroy=t.ondestroy||xo,this.onrestart=t.onrestart||xo,t.easing&&this.setEasing(t.easing)}return e.prototype.step=function(t,r){if(this._inited||(this._startTime=t+this._delay,this._inited=!0),this._paused){this._pausedTime+=r;return}var o=this._life,n=t-this._startTime-this._pausedTime,i=n/o;i<0&&(i=0),i=Math.min(i,1);var a=this.easingFunc,s=a?a(i):i;if(this.onframe(s),i===1)if(this.loop){var l=n%o;this._startTime=t-l,this._pausedTime=0,this.onrestart()}else return!0;return!1},e.prototype.pause=function(){this._paused=!0},e.prototype.resume=function(){this._paused=!1},e.prototype.setEasing=function(t){this.easing=t,this.easingFunc=Ae(t)?t:VV[t]||hP(t)},e})(),j1e=Bgt;var W1e=(function(){function e(t){this.value=t}return e})();var Ggt=(function(){function e(){this._len=0}return e.prototype.insert=function(t){var r=new W1e(t);return this.insertEntry(r),r},e.prototype.insertEntry=function(t){this.head?(this.tail.next=t,t.prev=this.tail,t.next=null,this.tail=t):this.head=this.tail=t,this._len++},e.prototype.remove=function(t){var r=t.prev,o=t.next;r?r.next=o:this.head=o,o?o.prev=r:this.tail=r,t.next=t.prev=null,this._len--},e.prototype.len=function(){return this._len},e.prototype.clear=function(){this.head=this.tail=null,this._len=0},e})();var Hgt=(function(){function e(t){this._list=new Ggt,this._maxSize=10,this._map={},this._maxSize=t}return e.prototype.put=function(t,r){var o=this._list,n=this._map,i=null;if(n[t]==null){var a=o.len(),s=this._lastRemovedEntry;if(a>=this._maxSize&&a>0){var l=o.head;o.remove(l),delete n[l.key],i=l.value,this._lastRemovedEntry=l}s?s.value=r:s=new W1e(r),s.key=t,o.insertEntry(s),n[t]=s}return i},e.prototype.get=function(t){var r=this._map[t],o=this._list;if(r!=null)return r!==o.tail&&(o.remove(r),o.insertEntry(r)),r.value},e.prototype.clear=function(){this._list.clear(),this._map={}},e.prototype.len=function(){return this._list.len()},e})(),gm=Hgt;var Y1e={transparent:[0,0,0,0],aliceblue:[240,248,255,1],antiquewhite:[250,235,215,1],aqua:[0,255,255,1],aquamarine:[127,255,212,1],azure:[240,255,255,1],beige:[245,245,220,1],bisque:[255,228,196,1],black:[0,0,0,1],blanchedalmond:[255,235,205,1],blue:[0,0,255,1],blueviolet:[138,43,226,1],brown:[165,42,42,1],burlywood:[222,184,135,1],cadetblue:[95,158,160,1],chartreuse:[127,255,0,1],chocolate:[210,105,30,1],coral:[255,127,80,1],cornflowerblue:[100,149,237,1],cornsilk:[255,248,220,1],crimson:[220,20,60,1],cyan:[0,255,255,1],darkblue:[0,0,139,1],darkcyan:[0,139,139,1],darkgoldenrod:[184,134,11,1],darkgray:[169,169,169,1],darkgreen:[0,100,0,1],darkgrey:[169,169,169,1],darkkhaki:[189,183,107,1],darkmagenta:[139,0,139,1],darkolivegreen:[85,107,47,1],darkorange:[255,140,0,1],darkorchid:[153,50,204,1],darkred:[139,0,0,1],darksalmon:[233,150,122,1],darkseagreen:[143,188,143,1],darkslateblue:[72,61,139,1],darkslategray:[47,79,79,1],darkslategrey:[47,79,79,1],darkturquoise:[0,206,209,1],darkviolet:[148,0,211,1],deeppink:[255,20,147,1],deepskyblue:[0,191,255,1],dimgray:[105,105,105,1],dimgrey:[105,105,105,1],dodgerblue:[30,144,255,1],firebrick:[178,34,34,1],floralwhite:[255,250,240,1],forestgreen:[34,139,34,1],fuchsia:[255,0,255,1],gainsboro:[220,220,220,1],ghostwhite:[248,248,255,1],gold:[255,215,0,1],goldenrod:[218,165,32,1],gray:[128,128,128,1],green:[0,128,0,1],greenyellow:[173,255,47,1],grey:[128,128,128,1],honeydew:[240,255,240,1],hotpink:[255,105,180,1],indianred:[205,92,92,1],indigo:[75,0,130,1],ivory:[255,255,240,1],khaki:[240,230,140,1],lavender:[230,230,250,1],lavenderblush:[255,240,245,1],lawngreen:[124,252,0,1],lemonchiffon:[255,250,205,1],lightblue:[173,216,230,1],lightcoral:[240,128,128,1],lightcyan:[224,255,255,1],lightgoldenrodyellow:[250,250,210,1],lightgray:[211,211,211,1],lightgreen:[144,238,144,1],lightgrey:[211,211,211,1],lightpink:[255,182,193,1],lightsalmon:[255,160,122,1],lightseagreen:[32,178,170,1],lightskyblue:[135,206,250,1],lightslategray:[119,136,153,1],lightslategrey:[119,136,153,1],lightsteelblue:[176,196,222,1],lightyellow:[255,255,224,1],lime:[0,255,0,1],limegreen:[50,205,50,1],linen:[250,240,230,1],magenta:[255,0,255,1],maroon:[128,0,0,1],mediumaquamarine:[102,205,170,1],mediumblue:[0,0,205,1],mediumorchid:[186,85,211,1],mediumpurple:[147,112,219,1],mediumseagreen:[60,179,113,1],mediumslateblue:[123,104,238,1],mediumspringgreen:[0,250,154,1],mediumturquoise:[72,209,204,1],mediumvioletred:[199,21,133,1],midnightblue:[25,25,112,1],mintcream:[245,255,250,1],mistyrose:[255,228,225,1],moccasin:[255,228,181,1],navajowhite:[255,222,173,1],navy:[0,0,128,1],oldlace:[253,245,230,1],olive:[128,128,0,1],olivedrab:[107,142,35,1],orange:[255,165,0,1],orangered:[255,69,0,1],orchid:[218,112,214,1],palegoldenrod:[238,232,170,1],palegreen:[152,251,152,1],paleturquoise:[175,238,238,1],palevioletred:[219,112,147,1],papayawhip:[255,239,213,1],peachpuff:[255,218,185,1],peru:[205,133,63,1],pink:[255,192,203,1],plum:[221,160,221,1],powderblue:[176,224,230,1],purple:[128,0,128,1],red:[255,0,0,1],rosybrown:[188,143,143,1],royalblue:[65,105,225,1],saddlebrown:[139,69,19,1],salmon:[250,128,114,1],sandybrown:[244,164,96,1],seagreen:[46,139,87,1],seashell:[255,245,238,1],sienna:[160,82,45,1],silver:[192,192,192,1],skyblue:[135,206,235,1],slateblue:[106,90,205,1],slategray:[112,128,144,1],slategrey:[112,128,144,1],snow:[255,250,250,1],springgreen:[0,255,127,1],steelblue:[70,130,180,1],tan:[210,180,140,1],teal:[0,128,128,1],thistle:[216,191,216,1],tomato:[255,99,71,1],turquoise:[64,224,208,1],violet:[238,130,238,1],wheat:[245,222,179,1],white:[255,255,255,1],whitesmoke:[245,245,245,1],yellow:[255,255,0,1],yellowgreen:[154,205,50,1]};function Hf(e){return e=Math.round(e),e<0?0:e>255?255:e}function jgt(e){return e=Math.round(e),e<0?0:e>360?360:e}function DD(e){return e<0?0:e>1?1:e}function PJ(e){var t=e;return t.length&&t.charAt(t.length-1)==="%"?Hf(parseFloat(t)/100*255):Hf(parseInt(t,10))}function Rg(e){var t=e;return t.length&&t.charAt(t.length-1)==="%"?DD(parseFloat(t)/100):DD(parseFloat(t))}function RJ(e,t,r){return r<0?r+=1:r>1&&(r-=1),r*6<1?e+(t-e)*r*6:r*2<1?t:r*3<2?e+(t-e)*(2/3-r)*6:e}function Zy(e,t,r){return e+(t-e)*r}function Ep(e,t,r,o,n){return e[0]=t,e[1]=r,e[2]=o,e[3]=n,e}function EJ(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e}var q1e=new gm(20),ZV=null;function gP(e,t){ZV&&EJ(ZV,t),ZV=q1e.put(e,ZV||t.slice())}function ga(e,t){if(e){t=t||[];var r=q1e.get(e);if(r)return EJ(t,r);e=e+"";var o=e.replace(/ /g,"").toLowerCase();if(o in Y1e)return EJ(t,Y1e[o]),gP(e,t),t;var n=o.length;if(o.charAt(0)==="#"){if(n===4||n===5){var i=parseInt(o.slice(1,4),16);if(!(i>=0&&i<=4095)){Ep(t,0,0,0,1);return}return Ep(t,(i&3840)>>4|(i&3840)>>8,i&240|(i&240)>>4,i&15|(i&15)<<4,n===5?parseInt(o.slice(4),16)/15:1),gP(e,t),t}else if(n===7||n===9){var i=parseInt(o.slice(1,7),16);if(!(i>=0&&i<=16777215)){Ep(t,0,0,0,1);return}return Ep(t,(i&16711680)>>16,(i&65280)>>8,i&255,n===9?parseInt(o.slice(7),16)/255:1),gP(e,t),t}return}var a=o.indexOf("("),s=o.indexOf(")");if(a!==-1&&s+1===n){var l=o.substr(0,a),u=o.substr(a+1,s-(a+1)).split(","),c=1;switch(l){case"rgba":if(u.length!==4)return u.length===3?Ep(t,+u[0],+u[1],+u[2],1):Ep(t,0,0,0,1);c=Rg(u.pop());case"rgb":if(u.length>=3)return Ep(t,PJ(u[0]),PJ(u[1]),PJ(u[2]),u.length===3?c:Rg(u[3])),gP(e,t),t;Ep(t,0,0,0,1);return;case"hsla":if(u.length!==4){Ep(t,0,0,0,1);return}return u[3]=Rg(u[3]),MJ(u,t),gP(e,t),t;case"hsl":if(u.length!==3){Ep(t,0,0,0,1);return}return MJ(u,t),gP(e,t),t;default:return}}Ep(t,0,0,0,1)}}function MJ(e,t){var r=(parseFloat(e[0])%360+360)%360/360,o=Rg(e[1]),n=Rg(e[2]),i=n<=.5?n*(o+1):n+o-n*o,a=n*2-i;return t=t||[],Ep(t,Hf(RJ(a,i,r+1/3)*255),Hf(RJ(a,i,r)*255),Hf(RJ(a,i,r-1/3)*255),1),e.length===4&&(t[3]=e[3]),t}function Wgt(e){if(e){var t=e[0]/255,r=e[1]/255,o=e[2]/255,n=Math.min(t,r,o),i=Math.max(t,r,o),a=i-n,s=(i+n)/2,l,u;if(a===0)l=0,u=0;else{s<.5?u=a/(i+n):u=a/(2-i-n);var c=((i-t)/6+a/2)/a,p=((i-r)/6+a/2)/a,f=((i-o)/6+a/2)/a;t===i?l=f-p:r===i?l=1/3+c-f:o===i&&(l=2/3+p-c),l<0&&(l+=1),l>1&&(l-=1)}var d=[l*360,u,s];return e[3]!=null&&d.push(e[3]),d}}function qV(e,t){var r=ga(e);if(r){for(var o=0;o<3;o++)t<0?r[o]=r[o]*(1-t)|0:r[o]=(255-r[o])*t+r[o]|0,r[o]>255?r[o]=255:r[o]<0&&(r[o]=0);return Du(r,r.length===4?"rgba":"rgb")}}function KV(e,t,r){if(!(!(t&&t.length)||!(e>=0&&e<=1))){r=r||[];var o=e*(t.length-1),n=Math.floor(o),i=Math.ceil(o),a=t[n],s=t[i],l=o-n;return r[0]=Hf(Zy(a[0],s[0],l)),r[1]=Hf(Zy(a[1],s[1],l)),r[2]=Hf(Zy(a[2],s[2],l)),r[3]=DD(Zy(a[3],s[3],l)),r}}function K1e(e,t,r){if(!(!(t&&t.length)||!(e>=0&&e<=1))){var o=e*(t.length-1),n=Math.floor(o),i=Math.ceil(o),a=ga(t[n]),s=ga(t[i]),l=o-n,u=Du([Hf(Zy(a[0],s[0],l)),Hf(Zy(a[1],s[1],l)),Hf(Zy(a[2],s[2],l)),DD(Zy(a[3],s[3],l))],"rgba");return r?{color:u,leftIndex:n,rightIndex:i,value:o}:u}}function Mp(e,t,r,o){var n=ga(e);if(e)return n=Wgt(n),t!=null&&(n[0]=jgt(Ae(t)?t(n[0]):t)),r!=null&&(n[1]=Rg(Ae(r)?r(n[1]):r)),o!=null&&(n[2]=Rg(Ae(o)?o(n[2]):o)),Du(MJ(n),"rgba")}function fS(e,t){var r=ga(e);if(r&&t!=null)return r[3]=DD(t),Du(r,"rgba")}function Du(e,t){if(!(!e||!e.length)){var r=e[0]+","+e[1]+","+e[2];return(t==="rgba"||t==="hsva"||t==="hsla")&&(r+=","+e[3]),t+"("+r+")"}}function vP(e,t){var r=ga(e);return r?(.299*r[0]+.587*r[1]+.114*r[2])*r[3]/255+(1-r[3])*t:0}var Z1e=new gm(100);function OD(e){if(xe(e)){var t=Z1e.get(e);return t||(t=qV(e,-.1),Z1e.put(e,t)),t}else if(Vy(e)){var r=re({},e);return r.colorStops=ae(e.colorStops,function(o){return{offset:o.offset,color:qV(o.color,-.1)}}),r}return e}var JV=Math.round;function qy(e){var t;if(!e||e==="transparent")e="none";else if(typeof e=="string"&&e.indexOf("rgba")>-1){var r=ga(e);r&&(e="rgb("+r[0]+","+r[1]+","+r[2]+")",t=r[3])}return{color:e,opacity:t??1}}var X1e=1e-4;function vm(e){return e<X1e&&e>-X1e}function QV(e){return JV(e*1e3)/1e3}function e$(e){return JV(e*1e4)/1e4}function Q1e(e){return"matrix("+QV(e[0])+","+QV(e[1])+","+QV(e[2])+","+QV(e[3])+","+e$(e[4])+","+e$(e[5])+")"}var J1e={left:"start",right:"end",center:"middle",middle:"middle"};function eRe(e,t,r){return r==="top"?e+=t/2:r==="bottom"&&(e-=t/2),e}function tRe(e){return e&&(e.shadowBlur||e.shadowOffsetX||e.shadowOffsetY)}function rRe(e){var t=e.style,r=e.getGlobalScale();return[t.shadowColor,(t.shadowBlur||0).toFixed(2),(t.shadowOffsetX||0).toFixed(2),(t.shadowOffsetY||0).toFixed(2),r[0],r[1]].join(",")}function IJ(e){return e&&!!e.image}function Ygt(e){return e&&!!e.svgElement}function kD(e){return IJ(e)||Ygt(e)}function t$(e){return e.type==="linear"}function r$(e){return e.type==="radial"}function o$(e){return e&&(e.type==="linear"||e.type==="radial")}function AD(e){return"url(#"+e+")"}function n$(e){var t=e.getGlobalScale(),r=Math.max(t[0],t[1]);return Math.max(Math.ceil(Math.log(r)/Math.log(10)),1)}function i$(e){var t=e.x||0,r=e.y||0,o=(e.rotation||0)*sP,n=Ue(e.scaleX,1),i=Ue(e.scaleY,1),a=e.skewX||0,s=e.skewY||0,l=[];return(t||r)&&l.push("translate("+t+"px,"+r+"px)"),o&&l.push("rotate("+o+")"),(n!==1||i!==1)&&l.push("scale("+n+","+i+")"),(a||s)&&l.push("skew("+JV(a*sP)+"deg, "+JV(s*sP)+"deg)"),l.join(" ")}var oRe=(function(){return rr.hasGlobalWindow&&Ae(window.btoa)?function(e){return window.btoa(unescape(encodeURIComponent(e)))}:typeof Buffer<"u"?function(e){return Buffer.from(e).toString("base64")}:function(e){return null}})();var OJ=Array.prototype.slice;function Eg(e,t,r){return(t-e)*r+e}function DJ(e,t,r,o){for(var n=t.length,i=0;i<n;i++)e[i]=Eg(t[i],r[i],o);return e}function Zgt(e,t,r,o){for(var n=t.length,i=n&&t[0].length,a=0;a<n;a++){e[a]||(e[a]=[]);for(var s=0;s<i;s++)e[a][s]=Eg(t[a][s],r[a][s],o)}return e}function a$(e,t,r,o){for(var n=t.length,i=0;i<n;i++)e[i]=t[i]+r[i]*o;return e}function nRe(e,t,r,o){for(var n=t.length,i=n&&t[0].length,a=0;a<n;a++){e[a]||(e[a]=[]);for(var s=0;s<i;s++)e[a][s]=t[a][s]+r[a][s]*o}return e}function qgt(e,t){for(var r=e.length,o=t.length,n=r>o?t:e,i=Math.min(r,o),a=n[i-1]||{color:[0,0,0,0],offset:0},s=i;s<Math.max(r,o);s++)n.push({offset:a.offset,color:a.color.slice()})}function Kgt(e,t,r){var o=e,n=t;if(!(!o.push||!n.push)){var i=o.length,a=n.length;if(i!==a){var s=i>a;if(s)o.length=a;else for(var l=i;l<a;l++)o.push(r===1?n[l]:OJ.call(n[l]))}for(var u=o[0]&&o[0].length,l=0;l<o.length;l++)if(r===1)isNaN(o[l])&&(o[l]=n[l]);else for(var c=0;c<u;c++)isNaN(o[l][c])&&(o[l][c]=n[l][c])}}function dS(e){if(ri(e)){var t=e.length;if(ri(e[0])){for(var r=[],o=0;o<t;o++)r.push(OJ.call(e[o]));return r}return OJ.call(e)}return e}function u$(e){return e[0]=Math.floor(e[0])||0,e[1]=Math.floor(e[1])||0,e[2]=Math.floor(e[2])||0,e[3]=e[3]==null?1:e[3],"rgba("+e.join(",")+")"}function Xgt(e){return ri(e&&e[0])?2:1}var s$=0,c$=1,sRe=2,ND=3,kJ=4,AJ=5,iRe=6;function aRe(e){return e===kJ||e===AJ}function l$(e){return e===c$||e===sRe}var LD=[0,0,0,0],Qgt=(function(){function e(t){this.keyframes=[],this.discrete=!1,this._invalid=!1,this._needsSort=!1,this._lastFr=0,this._lastFrP=0,this.propName=t}return e.prototype.isFinished=function(){return this._finished},e.prototype.setFinished=function(){this._finished=!0,this._additiveTrack&&this._additiveTrack.setFinished()},e.prototype.needsAnimate=function(){return this.keyframes.length>=1},e.prototype.getAdditiveTrack=function(){return this._additiveTrack},e.prototype.addKeyframe=function(t,r,o){this._needsSort=!0;var n=this.keyframes,i=n.length,a=!1,s=iRe,l=r;if(ri(r)){var u=Xgt(r);s=u,(u===1&&!Ft(r[0])||u===2&&!Ft(r[0][0]))&&(a=!0)}else if(Ft(r)&&!oi(r))s=s$;else if(xe(r))if(!isNaN(+r))s=s$;else{var c=ga(r);c&&(l=c,s=ND)}else if(Vy(r)){var p=re({},l);p.colorStops=ae(r.colorStops,function(d){return{offset:d.offset,color:ga(d.color)}}),t$(r)?s=kJ:r$(r)&&(s=AJ),l=p}i===0?this.valType=s:(s!==this.valType||s===iRe)&&(a=!0),this.discrete=this.discrete||a;var f={time:t,value:l,rawValue:r,percent:0};return o&&(f.easing=o,f.easingFunc=Ae(o)?o:VV[o]||hP(o)),n.push(f),f},e.prototype.prepare=function(t,r){var o=this.keyframes;this._needsSort&&o.sort(function(h,g){return h.time-g.time});for(var n=this.valType,i=o.length,a=o[i-1],s=this.discrete,l=l$(n),u=aRe(n),c=0;c<i;c++){var p=o[c],f=p.value,d=a.value;p.percent=p.time/t,s||(l&&c!==i-1?Kgt(f,d,n):u&&qgt(f.colorStops,d.colorStops))}if(!s&&n!==AJ&&r&&this.needsAnimate()&&r.needsAnimate()&&n===r.valType&&!r._finished){this._additiveTrack=r;for(var m=o[0].value,c=0;c<i;c++)n===s$?o[c].additiveValue=o[c].value-m:n===ND?o[c].additiveValue=a$([],o[c].value,m,-1):l$(n)&&(o[c].additiveValue=n===c$?a$([],o[c].value,m,-1):nRe([],o[c].value,m,-1))}},e.prototype.step=function(t,r){if(!this._finished){this._additiveTrack&&this._additiveTrack._finished&&(this._additiveTrack=null);var o=this._additiveTrack!=null,n=o?"additiveValue":"value",i=this.valType,a=this.keyframes,s=a.length,l=this.propName,u=i===ND,c,p=this._lastFr,f=Math.min,d,m;if(s===1)d=m=a[0];else{if(r<0)c=0;else if(r<this._lastFrP){var h=f(p+1,s-1);for(c=h;c>=0&&!(a[c].percent<=r);c--);c=f(c,s-2)}else{for(c=p;c<s&&!(a[c].percent>r);c++);c=f(c-1,s-2)}m=a[c+1],d=a[c]}if(d&&m){this._lastFr=c,this._lastFrP=r;var g=m.percent-d.percent,v=g===0?1:f((r-d.percent)/g,1);m.easingFunc&&(v=m.easingFunc(v));var y=o?this._additiveValue:u?LD:t[l];if((l$(i)||u)&&!y&&(y=this._additiveValue=[]),this.discrete)t[l]=v<1?d.rawValue:m.rawValue;else if(l$(i))i===c$?DJ(y,d[n],m[n],v):Zgt(y,d[n],m[n],v);else if(aRe(i)){var x=d[n],b=m[n],S=i===kJ;t[l]={type:S?"linear":"radial",x:Eg(x.x,b.x,v),y:Eg(x.y,b.y,v),colorStops:ae(x.colorStops,function(w,C){var P=b.colorStops[C];return{offset:Eg(w.offset,P.offset,v),color:u$(DJ([],w.color,P.color,v))}}),global:b.global},S?(t[l].x2=Eg(x.x2,b.x2,v),t[l].y2=Eg(x.y2,b.y2,v)):t[l].r=Eg(x.r,b.r,v)}else if(u)DJ(y,d[n],m[n],v),o||(t[l]=u$(y));else{var T=Eg(d[n],m[n],v);o?this._additiveValue=T:t[l]=T}o&&this._addToTarget(t)}}},e.prototype._addToTarget=function(t){var r=this.valType,o=this.propName,n=this._additiveValue;r===s$?t[o]=t[o]+n:r===ND?(ga(t[o],LD),a$(LD,LD,n,1),t[o]=u$(LD)):r===c$?a$(t[o],t[o],n,1):r===sRe&&nRe(t[o],t[o],n,1)},e})(),Jgt=(function(){function e(t,r,o,n){if(this._tracks={},this._trackKeys=[],this._maxTime=0,this._started=0,this._clip=null,this._target=t,this._loop=r,r&&n){tS("Can' use additive animation on looped animation.");return}this._additiveAnimators=n,this._allowDiscrete=o}return e.prototype.getMaxTime=function(){return this._maxTime},e.prototype.getDelay=function(){return this._delay},e.prototype.getLoop=function(){return this._loop},e.prototype.getTarget=function(){return this._target},e.prototype.changeTarget=function(t){this._target=t},e.prototype.when=function(t,r,o){return this.whenWithKeys(t,r,Nt(r),o)},e.prototype.whenWithKeys=function(t,r,o,n){for(var i=this._tracks,a=0;a<o.length;a++){var s=o[a],l=i[s];if(!l){l=i[s]=new Qgt(s);var u=void 0,c=this._getAdditiveTrack(s);if(c){var p=c.keyframes,f=p[p.length-1];u=f&&f.value,c.valType===ND&&u&&(u=u$(u))}else u=this._target[s];if(u==null)continue;t>0&&l.addKeyframe(0,dS(u),n),this._trackKeys.push(s)}l.addKeyframe(t,dS(r[s]),n)}return this._maxTime=Math.max(this._maxTime,t),this},e.prototype.pause=function(){this._clip.pause(),this._paused=!0},e.prototype.resume=function(){this._clip.resume(),this._paused=!1},e.prototype.isPaused=function(){return!!this._paused},e.prototype.duration=function(t){return this._maxTime=t,this._force=!0,this},e.prototype._doneCallback=function(){this._setTracksFinished(),this._clip=null;var t=this._doneCbs;if(t)for(var r=t.length,o=0;o<r;o++)t[o].call(this)},e.prototype._abortedCallback=function(){this._setTracksFinished();var t=this.animation,r=this._abortedCbs;if(t&&t.removeClip(this._clip),this._clip=null,r)for(var o=0;o<r.length;o++)r[o].call(this)},e.prototype._setTracksFinished=function(){for(var t=this._tracks,r=this._trackKeys,o=0;o<r.length;o++)t[r[o]].setFinished()},e.prototype._getAdditiveTrack=function(t){var r,o=this._additiveAnimators;if(o)for(var n=0;n<o.length;n++){var i=o[n].getTrack(t);i&&(r=i)}return r},e.prototype.start=function(t){if(!(this._started>0)){this._started=1;for(var r=this,o=[],n=this._maxTime||0,i=0;i<this._trackKeys.length;i++){var a=this._trackKeys[i],s=this._tracks[a],l=this._getAdditiveTrack(a),u=s.keyframes,c=u.length;if(s.prepare(n,l),s.needsAnimate())if(!this._allowDiscrete&&s.discrete){var p=u[c-1];p&&(r._target[s.propName]=p.rawValue),s.setFinished()}else o.push(s)}if(o.length||this._force){var f=new j1e({life:n,loop:this._loop,delay:this._delay||0,onframe:function(d){r._started=2;var m=r._additiveAnimators;if(m){for(var h=!1,g=0;g<m.length;g++)if(m[g]._clip){h=!0;break}h||(r._additiveAnimators=null)}for(var g=0;g<o.length;g++)o[g].step(r._target,d);var v=r._onframeCbs;if(v)for(var g=0;g<v.length;g++)v[g](r._target,d)},ondestroy:function(){r._doneCallback()}});this._clip=f,this.animation&&this.animation.addClip(f),t&&f.setEasing(t)}else this._doneCallback();return this}},e.prototype.stop=function(t){if(this._clip){var r=this._clip;t&&r.onframe(1),this._abortedCallback()}},e.prototype.delay=function(t){return this._delay=t,this},e.prototype.during=function(t){return t&&(this._onframeCbs||(this._onframeCbs=[]),this._onframeCbs.push(t)),this},e.prototype.done=function(t){return t&&(this._doneCbs||(this._doneCbs=[]),this._doneCbs.push(t)),this},e.prototype.aborted=function(t){return t&&(this._abortedCbs||(this._abortedCbs=[]),this._abortedCbs.push(t)),this},e.prototype.getClip=function(){return this._clip},e.prototype.getTrack=function(t){return this._tracks[t]},e.prototype.getTracks=function(){var t=this;return ae(this._trackKeys,function(r){return t._tracks[r]})},e.prototype.stopTracks=function(t,r){if(!t.length||!this._clip)return!0;for(var o=this._tracks,n=this._trackKeys,i=0;i<t.length;i++){var a=o[t[i]];a&&!a.isFinished()&&(r?a.step(this._target,1):this._started===1&&a.step(this._target,0),a.setFinished())}for(var s=!0,i=0;i<n.length;i++)if(!o[n[i]].isFinished()){s=!1;break}return s&&this._abortedCallback(),s},e.prototype.saveTo=function(t,r,o){if(t){r=r||this._trackKeys;for(var n=0;n<r.length;n++){var i=r[n],a=this._tracks[i];if(!(!a||a.isFinished())){var s=a.keyframes,l=s[o?0:s.length-1];l&&(t[i]=dS(l.rawValue))}}}},e.prototype.__changeFinalValue=function(t,r){r=r||Nt(t);for(var o=0;o<r.length;o++){var n=r[o],i=this._tracks[n];if(i){var a=i.keyframes;if(a.length>1){var s=a.pop();i.addKeyframe(s.time,t[n]),i.prepare(this._maxTime,i.getAdditiveTrack())}}}},e})(),zD=Jgt;function mS(){return new Date().getTime()}var evt=(function(e){Y(t,e);function t(r){var o=e.call(this)||this;return o._running=!1,o._time=0,o._pausedTime=0,o._pauseStart=0,o._paused=!1,r=r||{},o.stage=r.stage||{},o}return t.prototype.addClip=function(r){r.animation&&this.removeClip(r),this._head?(this._tail.next=r,r.prev=this._tail,r.next=null,this._tail=r):this._head=this._tail=r,r.animation=this},t.prototype.addAnimator=function(r){r.animation=this;var o=r.getClip();o&&this.addClip(o)},t.prototype.removeClip=function(r){if(r.animation){var o=r.prev,n=r.next;o?o.next=n:this._head=n,n?n.prev=o:this._tail=o,r.next=r.prev=r.animation=null}},t.prototype.removeAnimator=function(r){var o=r.getClip();o&&this.removeClip(o),r.animation=null},t.prototype.update=function(r){for(var o=mS()-this._pausedTime,n=o-this._time,i=this._head;i;){var a=i.next,s=i.step(o,n);s&&(i.ondestroy(),this.removeClip(i)),i=a}this._time=o,r||(this.trigger("frame",n),this.stage.update&&this.stage.update())},t.prototype._startLoop=function(){var r=this;this._running=!0;function o(){r._running&&(ED(o),!r._paused&&r.update())}ED(o)},t.prototype.start=function(){this._running||(this._time=mS(),this._pausedTime=0,this._startLoop())},t.prototype.stop=function(){this._running=!1},t.prototype.pause=function(){this._paused||(this._pauseStart=mS(),this._paused=!0)},t.prototype.resume=function(){this._paused&&(this._pausedTime+=mS()-this._pauseStart,this._paused=!1)},t.prototype.clear=function(){for(var r=this._head;r;){var o=r.next;r.prev=r.next=r.animation=null,r=o}this._head=this._tail=null},t.prototype.isFinished=function(){return this._head==null},t.prototype.animate=function(r,o){o=o||{},this.start();var n=new zD(r,o.loop);return this.addAnimator(n),n},t})(Qi),lRe=evt;var tvt=300,LJ=rr.domSupported,NJ=(function(){var e=["click","dblclick","mousewheel","wheel","mouseout","mouseup","mousedown","mousemove","contextmenu"],t=["touchstart","touchend","touchmove"],r={pointerdown:1,pointerup:1,pointermove:1,pointerout:1},o=ae(e,function(n){var i=n.replace("mouse","pointer");return r.hasOwnProperty(i)?i:n});return{mouse:e,touch:t,pointer:o}})(),uRe={mouse:["mousemove","mouseup"],pointer:["pointermove","pointerup"]},cRe=!1;function UJ(e){var t=e.pointerType;return t==="pen"||t==="touch"}function rvt(e){e.touching=!0,e.touchTimer!=null&&(clearTimeout(e.touchTimer),e.touchTimer=null),e.touchTimer=setTimeout(function(){e.touching=!1,e.touchTimer=null},700)}function zJ(e){e&&(e.zrByTouch=!0)}function ovt(e,t){return Mu(e.dom,new nvt(e,t),!0)}function fRe(e,t){for(var r=t,o=!1;r&&r.nodeType!==9&&!(o=r.domBelongToZr||r!==t&&r===e.painterRoot);)r=r.parentNode;return o}var nvt=(function(){function e(t,r){this.stopPropagation=xo,this.stopImmediatePropagation=xo,this.preventDefault=xo,this.type=r.type,this.target=this.currentTarget=t.dom,this.pointerType=r.pointerType,this.clientX=r.clientX,this.clientY=r.clientY}return e})(),jf={mousedown:function(e){e=Mu(this.dom,e),this.__mayPointerCapture=[e.zrX,e.zrY],this.trigger("mousedown",e)},mousemove:function(e){e=Mu(this.dom,e);var t=this.__mayPointerCapture;t&&(e.zrX!==t[0]||e.zrY!==t[1])&&this.__togglePointerCapture(!0),this.trigger("mousemove",e)},mouseup:function(e){e=Mu(this.dom,e),this.__togglePointerCapture(!1),this.trigger("mouseup",e)},mouseout:function(e){e=Mu(this.dom,e);var t=e.toElement||e.relatedTarget;fRe(this,t)||(this.__pointerCapturing&&(e.zrEventControl="no_globalout"),this.trigger("mouseout",e))},wheel:function(e){cRe=!0,e=Mu(this.dom,e),this.trigger("mousewheel",e)},mousewheel:function(e){cRe||(e=Mu(this.dom,e),this.trigger("mousewheel",e))},touchstart:function(e){e=Mu(this.dom,e),zJ(e),this.__lastTouchMoment=new Date,this.handler.processGesture(e,"start"),jf.mousemove.call(this,e),jf.mousedown.call(this,e)},touchmove:function(e){e=Mu(this.dom,e),zJ(e),this.handler.processGesture(e,"change"),jf.mousemove.call(this,e)},touchend:function(e){e=Mu(this.dom,e),zJ(e),this.handler.processGesture(e,"end"),jf.mouseup.call(this,e),+new Date-+this.__lastTouchMoment<tvt&&jf.click.call(this,e)},pointerdown:function(e){jf.mousedown.call(this,e)},pointermove:function(e){UJ(e)||jf.mousemove.call(this,e)},pointerup:function(e){jf.mouseup.call(this,e)},pointerout:function(e){UJ(e)||jf.mouseout.call(this,e)}};L(["click","dblclick","contextmenu"],function(e){jf[e]=function(t){t=Mu(this.dom,t),this.trigger(e,t)}});var VJ={pointermove:function(e){UJ(e)||VJ.mousemove.call(this,e)},pointerup:function(e){VJ.mouseup.call(this,e)},mousemove:function(e){this.trigger("mousemove",e)},mouseup:function(e){var t=this.__pointerCapturing;this.__togglePointerCapture(!1),this.trigger("mouseup",e),t&&(e.zrEventControl="only_globalout",this.trigger("mouseout",e))}};function ivt(e,t){var r=t.domHandlers;rr.pointerEventsSupported?L(NJ.pointer,function(o){p$(t,o,function(n){r[o].call(e,n)})}):(rr.touchEventsSupported&&L(NJ.touch,function(o){p$(t,o,function(n){r[o].call(e,n),rvt(t)})}),L(NJ.mouse,function(o){p$(t,o,function(n){n=FV(n),t.touching||r[o].call(e,n)})}))}function avt(e,t){rr.pointerEventsSupported?L(uRe.pointer,r):rr.touchEventsSupported||L(uRe.mouse,r);function r(o){function n(i){i=FV(i),fRe(e,i.target)||(i=ovt(e,i),t.domHandlers[o].call(e,i))}p$(t,o,n,{capture:!0})}}function p$(e,t,r,o){e.mounted[t]=r,e.listenerOpts[t]=o,wD(e.domTarget,t,r,o)}function FJ(e){var t=e.mounted;for(var r in t)t.hasOwnProperty(r)&&S1e(e.domTarget,r,t[r],e.listenerOpts[r]);e.mounted={}}var pRe=(function(){function e(t,r){this.mounted={},this.listenerOpts={},this.touching=!1,this.domTarget=t,this.domHandlers=r}return e})(),svt=(function(e){Y(t,e);function t(r,o){var n=e.call(this)||this;return n.__pointerCapturing=!1,n.dom=r,n.painterRoot=o,n._localHandlerScope=new pRe(r,jf),LJ&&(n._globalHandlerScope=new pRe(document,VJ)),ivt(n,n._localHandlerScope),n}return t.prototype.dispose=function(){FJ(this._localHandlerScope),LJ&&FJ(this._globalHandlerScope)},t.prototype.setCursor=function(r){this.dom.style&&(this.dom.style.cursor=r||"default")},t.prototype.__togglePointerCapture=function(r){if(this.__mayPointerCapture=null,LJ&&+this.__pointerCapturing^+r){this.__pointerCapturing=r;var o=this._globalHandlerScope;r?avt(this,o):FJ(o)}},t})(Qi),dRe=svt;var mRe=1;rr.hasGlobalWindow&&(mRe=Math.max(window.devicePixelRatio||window.screen&&window.screen.deviceXDPI/window.screen.logicalXDPI||1,1));var hS=mRe,FD=.4,UD="#333",VD="#ccc",hRe="#eee";var gRe=Gy,vRe=5e-5;function gS(e){return e>vRe||e<-vRe}var vS=[],yP=[],$J=Vo(),BJ=Math.abs,lvt=(function(){function e(){}return e.prototype.getLocalTransform=function(t){return e.getLocalTransform(this,t)},e.prototype.setPosition=function(t){this.x=t[0],this.y=t[1]},e.prototype.setScale=function(t){this.scaleX=t[0],this.scaleY=t[1]},e.prototype.setSkew=function(t){this.skewX=t[0],this.skewY=t[1]},e.prototype.setOrigin=function(t){this.originX=t[0],this.originY=t[1]},e.prototype.needLocalTransform=function(){return gS(this.rotation)||gS(this.x)||gS(this.y)||gS(this.scaleX-1)||gS(this.scaleY-1)||gS(this.skewX)||gS(this.skewY)},e.prototype.updateTransform=function(){var t=this.parent&&this.parent.transform,r=this.needLocalTransform(),o=this.transform;if(!(r||t)){o&&(gRe(o),this.invTransform=null);return}o=o||Vo(),r?this.getLocalTransform(o):gRe(o),t&&(r?Vs(o,t,o):oS(o,t)),this.transform=o,this._resolveGlobalScaleRatio(o)},e.prototype._resolveGlobalScaleRatio=function(t){var r=this.globalScaleRatio;if(r!=null&&r!==1){this.getGlobalScale(vS);var o=vS[0]<0?-1:1,n=vS[1]<0?-1:1,i=((vS[0]-o)*r+o)/vS[0]||0,a=((vS[1]-n)*r+n)/vS[1]||0;t[0]*=i,t[1]*=i,t[2]*=a,t[3]*=a}this.invTransform=this.invTransform||Vo(),Ji(this.invTransform,t)},e.prototype.getComputedTransform=function(){for(var t=this,r=[];t;)r.push(t),t=t.parent;for(;t=r.pop();)t.updateTransform();return this.transform},e.prototype.setLocalTransform=function(t){if(t){var r=t[0]*t[0]+t[1]*t[1],o=t[2]*t[2]+t[3]*t[3],n=Math.atan2(t[1],t[0]),i=Math.PI/2+n-Math.atan2(t[3],t[2]);o=Math.sqrt(o)*Math.cos(i),r=Math.sqrt(r),this.skewX=i,this.skewY=0,this.rotation=-n,this.x=+t[4],this.y=+t[5],this.scaleX=r,this.scaleY=o,this.originX=0,this.originY=0}},e.prototype.decomposeTransform=function(){if(this.transform){var t=this.parent,r=this.transform;t&&t.transform&&(t.invTransform=t.invTransform||Vo(),Vs(yP,t.invTransform,r),r=yP);var o=this.originX,n=this.originY;(o||n)&&($J[4]=o,$J[5]=n,Vs(yP,r,$J),yP[4]-=o,yP[5]-=n,r=yP),this.setLocalTransform(r)}},e.prototype.getGlobalScale=function(t){var r=this.transform;return t=t||[],r?(t[0]=Math.sqrt(r[0]*r[0]+r[1]*r[1]),t[1]=Math.sqrt(r[2]*r[2]+r[3]*r[3]),r[0]<0&&(t[0]=-t[0]),r[3]<0&&(t[1]=-t[1]),t):(t[0]=1,t[1]=1,t)},e.prototype.transformCoordToLocal=function(t,r){var o=[t,r],n=this.invTransform;return n&&Do(o,o,n),o},e.prototype.transformCoordToGlobal=function(t,r){var o=[t,r],n=this.transform;return n&&Do(o,o,n),o},e.prototype.getLineScale=function(){var t=this.transform;return t&&BJ(t[0]-1)>1e-10&&BJ(t[3]-1)>1e-10?Math.sqrt(BJ(t[0]*t[3]-t[2]*t[1])):1},e.prototype.copyTransform=function(t){xP(this,t)},e.getLocalTransform=function(t,r){r=r||[];var o=t.originX||0,n=t.originY||0,i=t.scaleX,a=t.scaleY,s=t.anchorX,l=t.anchorY,u=t.rotation||0,c=t.x,p=t.y,f=t.skewX?Math.tan(t.skewX):0,d=t.skewY?Math.tan(-t.skewY):0;if(o||n||s||l){var m=o+s,h=n+l;r[4]=-m*i-f*h*a,r[5]=-h*a-d*m*i}else r[4]=r[5]=0;return r[0]=i,r[3]=a,r[1]=d*i,r[2]=f*a,u&&cl(r,r,u),r[4]+=o+c,r[5]+=n+p,r},e.initDefaultProps=(function(){var t=e.prototype;t.scaleX=t.scaleY=t.globalScaleRatio=1,t.x=t.y=t.originX=t.originY=t.skewX=t.skewY=t.rotation=t.anchorX=t.anchorY=0})(),e})(),Dc=["x","y","originX","originY","anchorX","anchorY","rotation","scaleX","scaleY","skewX","skewY"];function xP(e,t){for(var r=0;r<Dc.length;r++){var o=Dc[r];e[o]=t[o]}}var Ou=lvt;function Wf(e){f$||(f$=new gm(100)),e=e||Ru;var t=f$.get(e);return t||(t={font:e,strWidthCache:new gm(500),asciiWidthMap:null,asciiWidthMapTried:!1,stWideCharWidth:Fa.measureText("\u56FD",e).width,asciiCharWidth:Fa.measureText("a",e).width},f$.put(e,t)),t}var f$;function uvt(e){if(!(GJ>=yRe)){e=e||Ru;for(var t=[],r=+new Date,o=0;o<=127;o++)t[o]=Fa.measureText(String.fromCharCode(o),e).width;var n=+new Date-r;return n>16?GJ=yRe:n>2&&GJ++,t}}var GJ=0,yRe=5;function HJ(e,t){return e.asciiWidthMapTried||(e.asciiWidthMap=uvt(e.font),e.asciiWidthMapTried=!0),0<=t&&t<=127?e.asciiWidthMap!=null?e.asciiWidthMap[t]:e.asciiCharWidth:e.stWideCharWidth}function Yf(e,t){var r=e.strWidthCache,o=r.get(t);return o==null&&(o=Fa.measureText(t,e.font).width,r.put(t,o)),o}function xRe(e,t,r,o){var n=Yf(Wf(t),e),i=yS(t),a=Xy(0,n,r),s=Mg(0,i,o),l=new Je(a,s,n,i);return l}function Ky(e,t,r,o){var n=((e||"")+"").split(`
 `),i=n.length;if(i===1)return xRe(n[0],t,r,o);for(var a=new Je(0,0,0,0),s=0;s<n.length;s++){var l=xRe(n[s],t,r,o);s===0?a.copy(l):a.union(l)}return a}function Xy(e,t,r,o){return r==="right"?o?e+=t:e-=t:r==="center"&&(o?e+=t/2:e-=t/2),e}function Mg(e,t,r,o){return r==="middle"?o?e+=t/2:e-=t/2:r==="bottom"&&(o?e+=t:e-=t),e}function yS(e){return Wf(e).stWideCharWidth}function Bs(e,t){return typeof e=="string"?e.lastIndexOf("%")>=0?parseFloat(e)/100*t:parseFloat(e):e}function xS(e,t,r){var o=t.position||"inside",n=t.distance!=null?t.distance:5,i=r.height,a=r.width,s=i/2,l=r.x,u=r.y,c="left",p="top";if(o instanceof Array)l+=Bs(o[0],r.width),u+=Bs(o[1],r.height),c=null,p=null;else switch(o){case"left":l-=n,u+=s,c="right",p="middle";break;case"right":l+=n+a,u+=s,p="middle";break;case"top":l+=a/2,u-=n,c="center",p="bottom";break;case"bottom":l+=a/2,u+=i+n,c="center";break;case"inside":l+=a/2,u+=s,c="center",p="middle";break;case"insideLeft":l+=n,u+=s,p="middle";break;case"insideRight":l+=a-n,u+=s,c="right",p="middle";break;case"insideTop":l+=a/2,u+=n,c="center";break;case"insideBottom":l+=a/2,u+=i-n,c="center",p="bottom";break;case"insideTopLeft":l+=n,u+=n;break;case"insideTopRight":l+=a-n,u+=n,c="right";break;case"insideBottomLeft":l+=n,u+=i-n,p="bottom";break;case"insideBottomRight":l+=a-n,u+=i-n,c="right",p="bottom";break}return e=e||{},e.x=l,e.y=u,e.align=c,e.verticalAlign=p,e}var jJ="__zr_normal__",WJ=Dc.concat(["ignore"]),cvt=Us(Dc,function(e,t){return e[t]=!0,e},{ignore:!1}),bP={},pvt=new Je(0,0,0,0),m$=[],qJ=(function(){function e(t){this.id=IV(),this.animators=[],this.currentStates=[],this.states={},this._init(t)}return e.prototype._init=function(t){this.attr(t)},e.prototype.drift=function(t,r,o){switch(this.draggable){case"horizontal":r=0;break;case"vertical":t=0;break}var n=this.transform;n||(n=this.transform=[1,0,0,1,0,0]),n[4]+=t,n[5]+=r,this.decomposeTransform(),this.markRedraw()},e.prototype.beforeUpdate=function(){},e.prototype.afterUpdate=function(){},e.prototype.update=function(){this.updateTransform(),this.__dirty&&this.updateInnerText()},e.prototype.updateInnerText=function(t){var r=this._textContent;if(r&&(!r.ignore||t)){this.textConfig||(this.textConfig={});var o=this.textConfig,n=o.local,i=r.innerTransformable,a=void 0,s=void 0,l=!1;i.parent=n?this:null;var u=!1;i.copyTransform(r);var c=o.position!=null,p=o.autoOverflowArea,f=void 0;if((p||c)&&(f=pvt,o.layoutRect?f.copy(o.layoutRect):f.copy(this.getBoundingRect()),n||f.applyTransform(this.transform)),c){this.calculateTextPosition?this.calculateTextPosition(bP,o,f):xS(bP,o,f),i.x=bP.x,i.y=bP.y,a=bP.align,s=bP.verticalAlign;var d=o.origin;if(d&&o.rotation!=null){var m=void 0,h=void 0;d==="center"?(m=f.width*.5,h=f.height*.5):(m=Bs(d[0],f.width),h=Bs(d[1],f.height)),u=!0,i.originX=-i.x+m+(n?0:f.x),i.originY=-i.y+h+(n?0:f.y)}}o.rotation!=null&&(i.rotation=o.rotation);var g=o.offset;g&&(i.x+=g[0],i.y+=g[1],u||(i.originX=-g[0],i.originY=-g[1]));var v=this._innerTextDefaultStyle||(this._innerTextDefaultStyle={});if(p){var y=v.overflowRect=v.overflowRect||new Je(0,0,0,0);i.getLocalTransform(m$),Ji(m$,m$),Je.copy(y,f),y.applyTransform(m$)}else v.overflowRect=null;var x=o.inside==null?typeof o.position=="string"&&o.position.indexOf("inside")>=0:o.inside,b=void 0,S=void 0,T=void 0;x&&this.canBeInsideText()?(b=o.insideFill,S=o.insideStroke,(b==null||b==="auto")&&(b=this.getInsideTextFill()),(S==null||S==="auto")&&(S=this.getInsideTextStroke(b),T=!0)):(b=o.outsideFill,S=o.outsideStroke,(b==null||b==="auto")&&(b=this.getOutsideFill()),(S==null||S==="auto")&&(S=this.getOutsideStroke(b),T=!0)),b=b||"#000",(b!==v.fill||S!==v.stroke||T!==v.autoStroke||a!==v.align||s!==v.verticalAlign)&&(l=!0,v.fill=b,v.stroke=S,v.autoStroke=T,v.align=a,v.verticalAlign=s,r.setDefaultTextStyle(v)),r.__dirty|=ha,l&&r.dirtyStyle(!0)}},e.prototype.canBeInsideText=function(){return!0},e.prototype.getInsideTextFill=function(){return"#fff"},e.prototype.getInsideTextStroke=function(t){return"#000"},e.prototype.getOutsideFill=function(){return this.__zr&&this.__zr.isDarkMode()?VD:UD},e.prototype.getOutsideStroke=function(t){var r=this.__zr&&this.__zr.getBackgroundColor(),o=typeof r=="string"&&ga(r);o||(o=[255,255,255,1]);for(var n=o[3],i=this.__zr.isDarkMode(),a=0;a<3;a++)o[a]=o[a]*n+(i?0:255)*(1-n);return o[3]=1,Du(o,"rgba")},e.prototype.traverse=function(t,r){},e.prototype.attrKV=function(t,r){t==="textConfig"?this.setTextConfig(r):t==="textContent"?this.setTextContent(r):t==="clipPath"?this.setClipPath(r):t==="extra"?(this.extra=this.extra||{},re(this.extra,r)):this[t]=r},e.prototype.hide=function(){this.ignore=!0,this.markRedraw()},e.prototype.show=function(){this.ignore=!1,this.markRedraw()},e.prototype.attr=function(t,r){if(typeof t=="string")this.attrKV(t,r);else if(Ge(t))for(var o=t,n=Nt(o),i=0;i<n.length;i++){var a=n[i];this.attrKV(a,t[a])}return this.markRedraw(),this},e.prototype.saveCurrentToNormalState=function(t){this._innerSaveToNormal(t);for(var r=this._normalState,o=0;o<this.animators.length;o++){var n=this.animators[o],i=n.__fromStateTransition;if(!(n.getLoop()||i&&i!==jJ)){var a=n.targetName,s=a?r[a]:r;n.saveTo(s)}}},e.prototype._innerSaveToNormal=function(t){var r=this._normalState;r||(r=this._normalState={}),t.textConfig&&!r.textConfig&&(r.textConfig=this.textConfig),this._savePrimaryToNormal(t,r,WJ)},e.prototype._savePrimaryToNormal=function(t,r,o){for(var n=0;n<o.length;n++){var i=o[n];t[i]!=null&&!(i in r)&&(r[i]=this[i])}},e.prototype.hasState=function(){return this.currentStates.length>0},e.prototype.getState=function(t){return this.states[t]},e.prototype.ensureState=function(t){var r=this.states;return r[t]||(r[t]={}),r[t]},e.prototype.clearStates=function(t){this.useState(jJ,!1,t)},e.prototype.useState=function(t,r,o,n){var i=t===jJ,a=this.hasState();if(!(!a&&i)){var s=this.currentStates,l=this.stateTransition;if(!(vt(s,t)>=0&&(r||s.length===1))){var u;if(this.stateProxy&&!i&&(u=this.stateProxy(t)),u||(u=this.states&&this.states[t]),!u&&!i){tS("State "+t+" not exists.");return}i||this.saveCurrentToNormalState(u);var c=!!(u&&u.hoverLayer||n);c&&this._toggleHoverLayerFlag(!0),this._applyStateObj(t,u,this._normalState,r,!o&&!this.__inHover&&l&&l.duration>0,l);var p=this._textContent,f=this._textGuide;return p&&p.useState(t,r,o,c),f&&f.useState(t,r,o,c),i?(this.currentStates=[],this._normalState={}):r?this.currentStates.push(t):this.currentStates=[t],this._updateAnimationTargets(),this.markRedraw(),!c&&this.__inHover&&(this._toggleHoverLayerFlag(!1),this.__dirty&=~ha),u}}},e.prototype.useStates=function(t,r,o){if(!t.length)this.clearStates();else{var n=[],i=this.currentStates,a=t.length,s=a===i.length;if(s){for(var l=0;l<a;l++)if(t[l]!==i[l]){s=!1;break}}if(s)return;for(var l=0;l<a;l++){var u=t[l],c=void 0;this.stateProxy&&(c=this.stateProxy(u,t)),c||(c=this.states[u]),c&&n.push(c)}var p=n[a-1],f=!!(p&&p.hoverLayer||o);f&&this._toggleHoverLayerFlag(!0);var d=this._mergeStates(n),m=this.stateTransition;this.saveCurrentToNormalState(d),this._applyStateObj(t.join(","),d,this._normalState,!1,!r&&!this.__inHover&&m&&m.duration>0,m);var h=this._textContent,g=this._textGuide;h&&h.useStates(t,r,f),g&&g.useStates(t,r,f),this._updateAnimationTargets(),this.currentStates=t.slice(),this.markRedraw(),!f&&this.__inHover&&(this._toggleHoverLayerFlag(!1),this.__dirty&=~ha)}},e.prototype.isSilent=function(){for(var t=this;t;){if(t.silent)return!0;var r=t.__hostTarget;t=r?t.ignoreHostSilent?null:r:t.parent}return!1},e.prototype._updateAnimationTargets=function(){for(var t=0;t<this.animators.length;t++){var r=this.animators[t];r.targetName&&r.changeTarget(this[r.targetName])}},e.prototype.removeState=function(t){var r=vt(this.currentStates,t);if(r>=0){var o=this.currentStates.slice();o.splice(r,1),this.useStates(o)}},e.prototype.replaceState=function(t,r,o){var n=this.currentStates.slice(),i=vt(n,t),a=vt(n,r)>=0;i>=0?a?n.splice(i,1):n[i]=r:o&&!a&&n.push(r),this.useStates(n)},e.prototype.toggleState=function(t,r){r?this.useState(t,!0):this.removeState(t)},e.prototype._mergeStates=function(t){for(var r={},o,n=0;n<t.length;n++){var i=t[n];re(r,i),i.textConfig&&(o=o||{},re(o,i.textConfig))}return o&&(r.textConfig=o),r},e.prototype._applyStateObj=function(t,r,o,n,i,a){var s=!(r&&n);r&&r.textConfig?(this.textConfig=re({},n?this.textConfig:o.textConfig),re(this.textConfig,r.textConfig)):s&&o.textConfig&&(this.textConfig=o.textConfig);for(var l={},u=!1,c=0;c<WJ.length;c++){var p=WJ[c],f=i&&cvt[p];r&&r[p]!=null?f?(u=!0,l[p]=r[p]):this[p]=r[p]:s&&o[p]!=null&&(f?(u=!0,l[p]=o[p]):this[p]=o[p])}if(!i)for(var c=0;c<this.animators.length;c++){var d=this.animators[c],m=d.targetName;d.getLoop()||d.__changeFinalValue(m?(r||o)[m]:r||o)}u&&this._transitionState(t,l,a)},e.prototype._attachComponent=function(t){if(!(t.__zr&&!t.__hostTarget)&&t!==this){var r=this.__zr;r&&t.addSelfToZr(r),t.__zr=r,t.__hostTarget=this}},e.prototype._detachComponent=function(t){t.__zr&&t.removeSelfFromZr(t.__zr),t.__zr=null,t.__hostTarget=null},e.prototype.getClipPath=function(){return this._clipPath},e.prototype.setClipPath=function(t){this._clipPath&&this._clipPath!==t&&this.removeClipPath(),this._attachComponent(t),this._clipPath=t,this.markRedraw()},e.prototype.removeClipPath=function(){var t=this._clipPath;t&&(this._detachComponent(t),this._clipPath=null,this.markRedraw())},e.prototype.getTextContent=function(){return this._textContent},e.prototype.setTextContent=function(t){var r=this._textContent;r!==t&&(r&&r!==t&&this.removeTextContent(),t.innerTransformable=new Ou,this._attachComponent(t),this._textContent=t,this.markRedraw())},e.prototype.setTextConfig=function(t){this.textConfig||(this.textConfig={}),re(this.textConfig,t),this.markRedraw()},e.prototype.removeTextConfig=function(){this.textConfig=null,this.markRedraw()},e.prototype.removeTextContent=function(){var t=this._textContent;t&&(t.innerTransformable=null,this._detachComponent(t),this._textContent=null,this._innerTextDefaultStyle=null,this.markRedraw())},e.prototype.getTextGuideLine=function(){return this._textGuide},e.prototype.setTextGuideLine=function(t){this._textGuide&&this._textGuide!==t&&this.removeTextGuideLine(),this._attachComponent(t),this._textGuide=t,this.markRedraw()},e.prototype.removeTextGuideLine=function(){var t=this._textGuide;t&&(this._detachComponent(t),this._textGuide=null,this.markRedraw())},e.prototype.markRedraw=function(){this.__dirty|=ha;var t=this.__zr;t&&(this.__inHover?t.refreshHover():t.refresh()),this.__hostTarget&&this.__hostTarget.markRedraw()},e.prototype.dirty=function(){this.markRedraw()},e.prototype._toggleHoverLayerFlag=function(t){this.__inHover=t;var r=this._textContent,o=this._textGuide;r&&(r.__inHover=t),o&&(o.__inHover=t)},e.prototype.addSelfToZr=function(t){if(this.__zr!==t){this.__zr=t;var r=this.animators;if(r)for(var o=0;o<r.length;o++)t.animation.addAnimator(r[o]);this._clipPath&&this._clipPath.addSelfToZr(t),this._textContent&&this._textContent.addSelfToZr(t),this._textGuide&&this._textGuide.addSelfToZr(t)}},e.prototype.removeSelfFromZr=function(t){if(this.__zr){this.__zr=null;var r=this.animators;if(r)for(var o=0;o<r.length;o++)t.animation.removeAnimator(r[o]);this._clipPath&&this._clipPath.removeSelfFromZr(t),this._textContent&&this._textContent.removeSelfFromZr(t),this._textGuide&&this._textGuide.removeSelfFromZr(t)}},e.prototype.animate=function(t,r,o){var n=t?this[t]:this,i=new zD(n,r,o);return t&&(i.targetName=t),this.addAnimator(i,t),i},e.prototype.addAnimator=function(t,r){var o=this.__zr,n=this;t.during(function(){n.updateDuringAnimation(r)}).done(function(){var i=n.animators,a=vt(i,t);a>=0&&i.splice(a,1)}),this.animators.push(t),o&&o.animation.addAnimator(t),o&&o.wakeUp()},e.prototype.updateDuringAnimation=function(t){this.markRedraw()},e.prototype.stopAnimation=function(t,r){for(var o=this.animators,n=o.length,i=[],a=0;a<n;a++){var s=o[a];!t||t===s.scope?s.stop(r):i.push(s)}return this.animators=i,this},e.prototype.animateTo=function(t,r,o){YJ(this,t,r,o)},e.prototype.animateFrom=function(t,r,o){YJ(this,t,r,o,!0)},e.prototype._transitionState=function(t,r,o,n){for(var i=YJ(this,r,o,n),a=0;a<i.length;a++)i[a].__fromStateTransition=t},e.prototype.getBoundingRect=function(){return null},e.prototype.getPaintRect=function(){return null},e.initDefaultProps=(function(){var t=e.prototype;t.type="element",t.name="",t.ignore=t.silent=t.ignoreHostSilent=t.isGroup=t.draggable=t.dragging=t.ignoreClip=t.__inHover=!1,t.__dirty=ha;var r={};function o(i,a,s){r[i+a+s]||(console.warn("DEPRECATED: '"+i+"' has been deprecated. use '"+a+"', '"+s+"' instead"),r[i+a+s]=!0)}function n(i,a,s,l){Object.defineProperty(t,i,{get:function(){if(!this[a]){var c=this[a]=[];u(this,c)}return this[a]},set:function(c){this[s]=c[0],this[l]=c[1],this[a]=c,u(this,c)}});function u(c,p){Object.defineProperty(p,0,{get:function(){return c[s]},set:function(f){c[s]=f}}),Object.defineProperty(p,1,{get:function(){return c[l]},set:function(f){c[l]=f}})}}Object.defineProperty&&(n("position","_legacyPos","x","y"),n("scale","_legacyScale","scaleX","scaleY"),n("origin","_legacyOrigin","originX","originY"))})(),e})();oo(qJ,Qi);oo(qJ,Ou);function YJ(e,t,r,o,n){r=r||{};var i=[];bRe(e,"",e,t,r,o,i,n);var a=i.length,s=!1,l=r.done,u=r.aborted,c=function(){s=!0,a--,a<=0&&(s?l&&l():u&&u())},p=function(){a--,a<=0&&(s?l&&l():u&&u())};a||l&&l(),i.length>0&&r.during&&i[0].during(function(m,h){r.during(h)});for(var f=0;f<i.length;f++){var d=i[f];c&&d.done(c),p&&d.aborted(p),r.force&&d.duration(r.duration),d.start(r.easing)}return i}function ZJ(e,t,r){for(var o=0;o<r;o++)e[o]=t[o]}function fvt(e){return ri(e[0])}function dvt(e,t,r){if(ri(t[r]))if(ri(e[r])||(e[r]=[]),Di(t[r])){var o=t[r].length;e[r].length!==o&&(e[r]=new t[r].constructor(o),ZJ(e[r],t[r],o))}else{var n=t[r],i=e[r],a=n.length;if(fvt(n))for(var s=n[0].length,l=0;l<a;l++)i[l]?ZJ(i[l],n[l],s):i[l]=Array.prototype.slice.call(n[l]);else ZJ(i,n,a);i.length=n.length}else e[r]=t[r]}function mvt(e,t){return e===t||ri(e)&&ri(t)&&hvt(e,t)}function hvt(e,t){var r=e.length;if(r!==t.length)return!1;for(var o=0;o<r;o++)if(e[o]!==t[o])return!1;return!0}function bRe(e,t,r,o,n,i,a,s){for(var l=Nt(o),u=n.duration,c=n.delay,p=n.additive,f=n.setToFinal,d=!Ge(i),m=e.animators,h=[],g=0;g<l.length;g++){var v=l[g],y=o[v];if(y!=null&&r[v]!=null&&(d||i[v]))if(Ge(y)&&!ri(y)&&!Vy(y)){if(t){s||(r[v]=y,e.updateDuringAnimation(t));continue}bRe(e,v,r[v],y,n,i&&i[v],a,s)}else h.push(v);else s||(r[v]=y,e.updateDuringAnimation(t),h.push(v))}var x=h.length;if(!p&&x)for(var b=0;b<m.length;b++){var S=m[b];if(S.targetName===t){var T=S.stopTracks(h);if(T){var w=vt(m,S);m.splice(w,1)}}}if(n.force||(h=er(h,function(M){return!mvt(o[M],r[M])}),x=h.length),x>0||n.force&&!a.length){var C=void 0,P=void 0,R=void 0;if(s){P={},f&&(C={});for(var b=0;b<x;b++){var v=h[b];P[v]=r[v],f?C[v]=o[v]:r[v]=o[v]}}else if(f){R={};for(var b=0;b<x;b++){var v=h[b];R[v]=dS(r[v]),dvt(r,o,v)}}var S=new zD(r,!1,!1,p?er(m,function(E){return E.targetName===t}):null);S.targetName=t,n.scope&&(S.scope=n.scope),f&&C&&S.whenWithKeys(0,C,h),R&&S.whenWithKeys(0,R,h),S.whenWithKeys(u??500,s?P:o,h).delay(c||0),e.addAnimator(S,t),a.push(S)}}var h$=qJ;var SRe=(function(e){Y(t,e);function t(r){var o=e.call(this)||this;return o.isGroup=!0,o._children=[],o.attr(r),o}return t.prototype.childrenRef=function(){return this._children},t.prototype.children=function(){return this._children.slice()},t.prototype.childAt=function(r){return this._children[r]},t.prototype.childOfName=function(r){for(var o=this._children,n=0;n<o.length;n++)if(o[n].name===r)return o[n]},t.prototype.childCount=function(){return this._children.length},t.prototype.add=function(r){return r&&r!==this&&r.parent!==this&&(this._children.push(r),this._doAdd(r)),this},t.prototype.addBefore=function(r,o){if(r&&r!==this&&r.parent!==this&&o&&o.parent===this){var n=this._children,i=n.indexOf(o);i>=0&&(n.splice(i,0,r),this._doAdd(r))}return this},t.prototype.replace=function(r,o){var n=vt(this._children,r);return n>=0&&this.replaceAt(o,n),this},t.prototype.replaceAt=function(r,o){var n=this._children,i=n[o];if(r&&r!==this&&r.parent!==this&&r!==i){n[o]=r,i.parent=null;var a=this.__zr;a&&i.removeSelfFromZr(a),this._doAdd(r)}return this},t.prototype._doAdd=function(r){r.parent&&r.parent.remove(r),r.parent=this;var o=this.__zr;o&&o!==r.__zr&&r.addSelfToZr(o),o&&o.refresh()},t.prototype.remove=function(r){var o=this.__zr,n=this._children,i=vt(n,r);return i<0?this:(n.splice(i,1),r.parent=null,o&&r.removeSelfFromZr(o),o&&o.refresh(),this)},t.prototype.removeAll=function(){for(var r=this._children,o=this.__zr,n=0;n<r.length;n++){var i=r[n];o&&i.removeSelfFromZr(o),i.parent=null}return r.length=0,this},t.prototype.eachChild=function(r,o){for(var n=this._children,i=0;i<n.length;i++){var a=n[i];r.call(o,a,i)}return this},t.prototype.traverse=function(r,o){for(var n=0;n<this._children.length;n++){var i=this._children[n],a=r.call(o,i);i.isGroup&&!a&&i.traverse(r,o)}return this},t.prototype.addSelfToZr=function(r){e.prototype.addSelfToZr.call(this,r);for(var o=0;o<this._children.length;o++){var n=this._children[o];n.addSelfToZr(r)}},t.prototype.removeSelfFromZr=function(r){e.prototype.removeSelfFromZr.call(this,r);for(var o=0;o<this._children.length;o++){var n=this._children[o];n.removeSelfFromZr(r)}},t.prototype.getBoundingRect=function(r){for(var o=new Je(0,0,0,0),n=r||this._children,i=[],a=null,s=0;s<n.length;s++){var l=n[s];if(!(l.ignore||l.invisible)){var u=l.getBoundingRect(),c=l.getLocalTransform(i);c?(Je.applyTransform(o,u,c),a=a||o.clone(),a.union(o)):(a=a||u.clone(),a.union(u))}}return a||o},t})(h$);SRe.prototype.type="group";var Le=SRe;var g$={},TRe={};function gvt(e){delete TRe[e]}function vvt(e){if(!e)return!1;if(typeof e=="string")return vP(e,1)<FD;if(e.colorStops){for(var t=e.colorStops,r=0,o=t.length,n=0;n<o;n++)r+=vP(t[n].color,1);return r/=o,r<FD}return!1}var yvt=(function(){function e(t,r,o){var n=this;this._sleepAfterStill=10,this._stillFrameAccum=0,this._needsRefresh=!0,this._needsRefreshHover=!0,this._darkMode=!1,o=o||{},this.dom=r,this.id=t;var i=new z1e,a=o.renderer||"canvas";g$[a]||(a=Nt(g$)[0]),o.useDirtyRect=o.useDirtyRect==null?!1:o.useDirtyRect;var s=new g$[a](r,i,o,t),l=o.ssr||s.ssrOnly;this.storage=i,this.painter=s;var u=!rr.node&&!rr.worker&&!l?new dRe(s.getViewportRoot(),s.root):null,c=o.useCoarsePointer,p=c==null||c==="auto"?rr.touchEventsSupported:!!c,f=44,d;p&&(d=Ue(o.pointerSize,f)),this.handler=new D1e(i,s,u,s.root,d),this.animation=new lRe({stage:{update:l?null:function(){return n._flush(!0)}}}),l||this.animation.start()}return e.prototype.add=function(t){this._disposed||!t||(this.storage.addRoot(t),t.addSelfToZr(this),this.refresh())},e.prototype.remove=function(t){this._disposed||!t||(this.storage.delRoot(t),t.removeSelfFromZr(this),this.refresh())},e.prototype.configLayer=function(t,r){this._disposed||(this.painter.configLayer&&this.painter.configLayer(t,r),this.refresh())},e.prototype.setBackgroundColor=function(t){this._disposed||(this.painter.setBackgroundColor&&this.painter.setBackgroundColor(t),this.refresh(),this._backgroundColor=t,this._darkMode=vvt(t))},e.prototype.getBackgroundColor=function(){return this._backgroundColor},e.prototype.setDarkMode=function(t){this._darkMode=t},e.prototype.isDarkMode=function(){return this._darkMode},e.prototype.refreshImmediately=function(t){this._disposed||(t||this.animation.update(!0),this._needsRefresh=!1,this.painter.refresh(),this._needsRefresh=!1)},e.prototype.refresh=function(){this._disposed||(this._needsRefresh=!0,this.animation.start())},e.prototype.flush=function(){this._disposed||this._flush(!1)},e.prototype._flush=function(t){var r,o=mS();this._needsRefresh&&(r=!0,this.refreshImmediately(t)),this._needsRefreshHover&&(r=!0,this.refreshHoverImmediately());var n=mS();r?(this._stillFrameAccum=0,this.trigger("rendered",{elapsedTime:n-o})):this._sleepAfterStill>0&&(this._stillFrameAccum++,this._stillFrameAccum>this._sleepAfterStill&&this.animation.stop())},e.prototype.setSleepAfterStill=function(t){this._sleepAfterStill=t},e.prototype.wakeUp=function(){this._disposed||(this.animation.start(),this._stillFrameAccum=0)},e.prototype.refreshHover=function(){this._needsRefreshHover=!0},e.prototype.refreshHoverImmediately=function(){this._disposed||(this._needsRefreshHover=!1,this.painter.refreshHover&&this.painter.getType()==="canvas"&&this.painter.refreshHover())},e.prototype.resize=function(t){this._disposed||(t=t||{},this.painter.resize(t.width,t.height),this.handler.resize())},e.prototype.clearAnimation=function(){this._disposed||this.animation.clear()},e.prototype.getWidth=function(){if(!this._disposed)return this.painter.getWidth()},e.prototype.getHeight=function(){if(!this._disposed)return this.painter.getHeight()},e.prototype.setCursorStyle=function(t){this._disposed||this.handler.setCursorStyle(t)},e.prototype.findHover=function(t,r){if(!this._disposed)return this.handler.findHover(t,r)},e.prototype.on=function(t,r,o){return this._disposed||this.handler.on(t,r,o),this},e.prototype.off=function(t,r){this._disposed||this.handler.off(t,r)},e.prototype.trigger=function(t,r){this._disposed||this.handler.trigger(t,r)},e.prototype.clear=function(){if(!this._disposed){for(var t=this.storage.getRoots(),r=0;r<t.length;r++)t[r]instanceof Le&&t[r].removeSelfFromZr(this);this.storage.delAllRoots(),this.painter.clear()}},e.prototype.dispose=function(){this._disposed||(this.animation.stop(),this.clear(),this.storage.dispose(),this.painter.dispose(),this.handler.dispose(),this.animation=this.storage=this.painter=this.handler=null,this._disposed=!0,gvt(this.id))},e})();function XJ(e,t){var r=new yvt(IV(),e,t);return TRe[r.id]=r,r}function wRe(e,t){g$[e]=t}var KJ;function _Re(e){if(typeof KJ=="function")return KJ(e)}function CRe(e){KJ=e}var PRe=1e-4,RRe=20;function bvt(e){return e.replace(/^\s+|\s+$/g,"")}var pl=Math.min,xn=Math.max,Zf=Math.abs;function yr(e,t,r,o){var n=t[0],i=t[1],a=r[0],s=r[1],l=i-n,u=s-a;if(l===0)return u===0?a:(a+s)/2;if(o)if(l>0){if(e<=n)return a;if(e>=i)return s}else{if(e>=n)return a;if(e<=i)return s}else{if(e===n)return a;if(e===i)return s}return(e-n)/l*u+a}var Oe=Svt;function Svt(e,t,r){switch(e){case"center":case"middle":e="50%";break;case"left":case"top":e="0%";break;case"right":case"bottom":e="100%";break}return SP(e,t,r)}function SP(e,t,r){return xe(e)?bvt(e).match(/%$/)?parseFloat(e)/100*t+(r||0):parseFloat(e):e==null?NaN:+e}function wo(e,t,r){return t==null&&(t=10),t=Math.min(Math.max(0,t),RRe),e=(+e).toFixed(t),r?e:+e}function va(e){return e.sort(function(t,r){return t-r}),e}function $l(e){if(e=+e,isNaN(e))return 0;if(e>1e-14){for(var t=1,r=0;r<15;r++,t*=10)if(Math.round(e*t)/t===e)return r}return Tvt(e)}function Tvt(e){var t=e.toString().toLowerCase(),r=t.indexOf("e"),o=r>0?+t.slice(r+1):0,n=r>0?r:t.length,i=t.indexOf("."),a=i<0?0:n-1-i;return Math.max(0,a-o)}function v$(e,t){var r=Math.log,o=Math.LN10,n=Math.floor(r(e[1]-e[0])/o),i=Math.round(r(Zf(t[1]-t[0]))/o),a=Math.min(Math.max(-n+i,0),20);return isFinite(a)?a:20}function ERe(e,t){var r=Us(e,function(d,m){return d+(isNaN(m)?0:m)},0);if(r===0)return[];for(var o=Math.pow(10,t),n=ae(e,function(d){return(isNaN(d)?0:d)/r*o*100}),i=o*100,a=ae(n,function(d){return Math.floor(d)}),s=Us(a,function(d,m){return d+m},0),l=ae(n,function(d,m){return d-a[m]});s<i;){for(var u=Number.NEGATIVE_INFINITY,c=null,p=0,f=l.length;p<f;++p)l[p]>u&&(u=l[p],c=p);++a[c],l[c]=0,++s}return ae(a,function(d){return d/o})}function MRe(e,t){var r=Math.max($l(e),$l(t)),o=e+t;return r>RRe?o:wo(o,r)}var QJ=9007199254740991;function JJ(e){var t=Math.PI*2;return(e%t+t)%t}function bS(e){return e>-PRe&&e<PRe}var wvt=/^(?:(\d{4})(?:[-\/](\d{1,2})(?:[-\/](\d{1,2})(?:[T ](\d{1,2})(?::(\d{1,2})(?::(\d{1,2})(?:[.,](\d+))?)?)?(Z|[\+\-]\d\d:?\d\d)?)?)?)?)?$/;function Ip(e){if(e instanceof Date)return e;if(xe(e)){var t=wvt.exec(e);if(!t)return new Date(NaN);if(t[8]){var r=+t[4]||0;return t[8].toUpperCase()!=="Z"&&(r-=+t[8].slice(0,3)),new Date(Date.UTC(+t[1],+(t[2]||1)-1,+t[3]||1,r,+(t[5]||0),+t[6]||0,t[7]?+t[7].substring(0,3):0))}else return new Date(+t[1],+(t[2]||1)-1,+t[3]||1,+t[4]||0,+(t[5]||0),+t[6]||0,t[7]?+t[7].substring(0,3):0)}else if(e==null)return new Date(NaN);return new Date(Math.round(e))}function IRe(e){return Math.pow(10,y$(e))}function y$(e){if(e===0)return 0;var t=Math.floor(Math.log(e)/Math.LN10);return e/Math.pow(10,t)>=10&&t++,t}function x$(e,t){var r=y$(e),o=Math.pow(10,r),n=e/o,i;return t?n<1.5?i=1:n<2.5?i=2:n<4?i=3:n<7?i=5:i=10:n<1?i=1:n<2?i=2:n<3?i=3:n<5?i=5:i=10,e=i*o,r>=-20?+e.toFixed(r<0?-r:0):e}function b$(e,t){var r=(e.length-1)*t+1,o=Math.floor(r),n=+e[o-1],i=r-o;return i?n+i*(e[o]-n):n}function eee(e){e.sort(function(l,u){return s(l,u,0)?-1:1});for(var t=-1/0,r=1,o=0;o<e.length;){for(var n=e[o].interval,i=e[o].close,a=0;a<2;a++)n[a]<=t&&(n[a]=t,i[a]=a?1:1-r),t=n[a],r=i[a];n[0]===n[1]&&i[0]*i[1]!==1?e.splice(o,1):o++}return e;function s(l,u,c){return l.interval[c]<u.interval[c]||l.interval[c]===u.interval[c]&&(l.close[c]-u.close[c]===(c?-1:1)||!c&&s(l,u,1))}}function Dp(e){var t=parseFloat(e);return t==e&&(t!==0||!xe(e)||e.indexOf("x")<=0)?t:NaN}function $D(e){return!isNaN(Dp(e))}function S$(){return Math.round(Math.random()*9)}function DRe(e,t){return t===0?e:DRe(t,e%t)}function tee(e,t){return e==null?t:t==null?e:e*t/DRe(e,t)}var _vt="[ECharts] ",ORe={},Cvt=typeof console<"u"&&console.warn&&console.log;function kRe(e,t,r){if(Cvt){if(r){if(ORe[t])return;ORe[t]=!0}console[e](_vt+t)}}function ARe(e,t){kRe("warn",e,t)}function ree(e,t){kRe("error",e,t)}function _r(e){throw new Error(e)}function LRe(e,t,r){return(t-e)*r+e}var NRe="series\0",zRe="\0_ec_\0";function Cr(e){return e instanceof Array?e:e==null?[]:[e]}function Oc(e,t,r){if(e){e[t]=e[t]||{},e.emphasis=e.emphasis||{},e.emphasis[t]=e.emphasis[t]||{};for(var o=0,n=r.length;o<n;o++){var i=r[o];!e.emphasis[t].hasOwnProperty(i)&&e[t].hasOwnProperty(i)&&(e.emphasis[t][i]=e[t][i])}}}var oee=["fontStyle","fontWeight","fontSize","fontFamily","rich","tag","color","textBorderColor","textBorderWidth","width","height","lineHeight","align","verticalAlign","baseline","shadowColor","shadowBlur","shadowOffsetX","shadowOffsetY","textShadowColor","textShadowBlur","textShadowOffsetX","textShadowOffsetY","backgroundColor","borderColor","borderWidth","borderRadius","padding"];function qf(e){return Ge(e)&&!oe(e)&&!(e instanceof Date)?e.value:e}function FRe(e){return Ge(e)&&!(e instanceof Array)}function T$(e,t,r){var o=r==="normalMerge",n=r==="replaceMerge",i=r==="replaceAll";e=e||[],t=(t||[]).slice();var a=Ie();L(t,function(l,u){if(!Ge(l)){t[u]=null;return}});var s=Pvt(e,a,r);return(o||n)&&Rvt(s,e,a,t),o&&Evt(s,t),o||n?Mvt(s,t,n):i&&Ivt(s,t),Dvt(s),s}function Pvt(e,t,r){var o=[];if(r==="replaceAll")return o;for(var n=0;n<e.length;n++){var i=e[n];i&&i.id!=null&&t.set(i.id,n),o.push({existing:r==="replaceMerge"||TP(i)?null:i,newOption:null,keyInfo:null,brandNew:null})}return o}function Rvt(e,t,r,o){L(o,function(n,i){if(!(!n||n.id==null)){var a=BD(n.id),s=r.get(a);if(s!=null){var l=e[s];go(!l.newOption,'Duplicated option on id "'+a+'".'),l.newOption=n,l.existing=t[s],o[i]=null}}})}function Evt(e,t){L(t,function(r,o){if(!(!r||r.name==null))for(var n=0;n<e.length;n++){var i=e[n].existing;if(!e[n].newOption&&i&&(i.id==null||r.id==null)&&!TP(r)&&!TP(i)&&URe("name",i,r)){e[n].newOption=r,t[o]=null;return}}})}function Mvt(e,t,r){L(t,function(o){if(o){for(var n,i=0;(n=e[i])&&(n.newOption||TP(n.existing)||n.existing&&o.id!=null&&!URe("id",o,n.existing));)i++;n?(n.newOption=o,n.brandNew=r):e.push({newOption:o,brandNew:r,existing:null,keyInfo:null}),i++}})}function Ivt(e,t){L(t,function(r){e.push({newOption:r,brandNew:!0,existing:null,keyInfo:null})})}function Dvt(e){var t=Ie();L(e,function(r){var o=r.existing;o&&t.set(o.id,r)}),L(e,function(r){var o=r.newOption;go(!o||o.id==null||!t.get(o.id)||t.get(o.id)===r,"id duplicates: "+(o&&o.id)),o&&o.id!=null&&t.set(o.id,r),!r.keyInfo&&(r.keyInfo={})}),L(e,function(r,o){var n=r.existing,i=r.newOption,a=r.keyInfo;if(Ge(i)){if(a.name=i.name!=null?BD(i.name):n?n.name:NRe+o,n)a.id=BD(n.id);else if(i.id!=null)a.id=BD(i.id);else{var s=0;do a.id="\0"+a.name+"\0"+s++;while(t.get(a.id))}t.set(a.id,r)}})}function URe(e,t,r){var o=Xo(t[e],null),n=Xo(r[e],null);return o!=null&&n!=null&&o===n}function BD(e){return Xo(e,"")}function Xo(e,t){return e==null?t:xe(e)?e:Ft(e)||bD(e)?e+"":t}function wP(e){var t=e.name;return!!(t&&t.indexOf(NRe))}function TP(e){return e&&e.id!=null&&BD(e.id).indexOf(zRe)===0}function VRe(e){return zRe+e}function $Re(e,t,r){L(e,function(o){var n=o.newOption;Ge(n)&&(o.keyInfo.mainType=t,o.keyInfo.subType=Ovt(t,n,o.existing,r))})}function Ovt(e,t,r,o){var n=t.type?t.type:r?r.subType:o.determineSubType(e,t);return n}function BRe(e,t){var r={},o={};return n(e||[],r),n(t||[],o,r),[i(r),i(o)];function n(a,s,l){for(var u=0,c=a.length;u<c;u++){var p=Xo(a[u].seriesId,null);if(p==null)return;for(var f=Cr(a[u].dataIndex),d=l&&l[p],m=0,h=f.length;m<h;m++){var g=f[m];d&&d[g]?d[g]=null:(s[p]||(s[p]={}))[g]=1}}}function i(a,s){var l=[];for(var u in a)if(a.hasOwnProperty(u)&&a[u]!=null)if(s)l.push(+u);else{var c=i(a[u],!0);c.length&&l.push({seriesId:u,dataIndex:c})}return l}}function Op(e,t){if(t.dataIndexInside!=null)return t.dataIndexInside;if(t.dataIndex!=null)return oe(t.dataIndex)?ae(t.dataIndex,function(r){return e.indexOfRawIndex(r)}):e.indexOfRawIndex(t.dataIndex);if(t.name!=null)return oe(t.name)?ae(t.name,function(r){return e.indexOfName(r)}):e.indexOfName(t.name)}function ut(){var e="__ec_inner_"+kvt++;return function(t){return t[e]||(t[e]={})}}var kvt=S$();function ym(e,t,r){var o=GD(t,r),n=o.mainTypeSpecified,i=o.queryOptionMap,a=o.others,s=a,l=r?r.defaultMainType:null;return!n&&l&&i.set(l,{}),i.each(function(u,c){var p=xm(e,c,u,{useDefault:l===c,enableAll:r&&r.enableAll!=null?r.enableAll:!0,enableNone:r&&r.enableNone!=null?r.enableNone:!0});s[c+"Models"]=p.models,s[c+"Model"]=p.models[0]}),s}function GD(e,t){var r;if(xe(e)){var o={};o[e+"Index"]=0,r=o}else r=e;var n=Ie(),i={},a=!1;return L(r,function(s,l){if(l==="dataIndex"||l==="dataIndexInside"){i[l]=s;return}var u=l.match(/^(\w+)(Index|Id|Name)$/)||[],c=u[1],p=(u[2]||"").toLowerCase();if(!(!c||!p||t&&t.includeMainTypes&&vt(t.includeMainTypes,c)<0)){a=a||!!c;var f=n.get(c)||n.set(c,{});f[p]=s}}),{mainTypeSpecified:a,queryOptionMap:n,others:i}}var Fr={useDefault:!0,enableAll:!1,enableNone:!1},GRe={useDefault:!1,enableAll:!0,enableNone:!0};function xm(e,t,r,o){o=o||Fr;var n=r.index,i=r.id,a=r.name,s={models:null,specified:n!=null||i!=null||a!=null};if(!s.specified){var l=void 0;return s.models=o.useDefault&&(l=e.getComponent(t))?[l]:[],s}if(n==="none"||n===!1){if(o.enableNone)return s.models=[],s;n=-1}return n==="all"&&(o.enableAll?n=i=a=null:n=-1),s.models=e.queryComponents({mainType:t,index:n,id:i,name:a}),s}function nee(e,t,r){e.setAttribute?e.setAttribute(t,r):e[t]=r}function HRe(e,t){return e.getAttribute?e.getAttribute(t):e[t]}function jRe(e){return e==="auto"?rr.domSupported?"html":"richText":e||"html"}function HD(e,t){var r=Ie(),o=[];return L(e,function(n){var i=t(n);(r.get(i)||(o.push(i),r.set(i,[]))).push(n)}),{keys:o,buckets:r}}function w$(e,t,r,o,n){var i=t==null||t==="auto";if(o==null)return o;if(Ft(o)){var a=LRe(r||0,o,n);return wo(a,i?Math.max($l(r||0),$l(o)):t)}else{if(xe(o))return n<1?r:o;for(var s=[],l=r,u=o,c=Math.max(l?l.length:0,u.length),p=0;p<c;++p){var f=e.getDimensionInfo(p);if(f&&f.type==="ordinal")s[p]=(n<1&&l?l:u)[p];else{var d=l&&l[p]?l[p]:0,m=u[p],a=LRe(d,m,n);s[p]=wo(a,i?Math.max($l(d),$l(m)):t)}}return s}}var Kf=(function(){function e(){}return e.prototype.reset=function(t,r,o,n){return this._list=t,this._step=n=n||1,this._idx=r,this._end=o??(n>0?t.length:0),this.item=null,this.key=NaN,this},e.prototype.next=function(){return(this._step>0?this._idx<this._end:this._idx>=this._end)?(this.item=this._list[this._idx],this.key=this._idx=this._idx+this._step,!0):!1},e})();function _$(e){e.option=e.parentModel=e.ecModel=null}var Avt=".",SS="___EC__COMPONENT__CONTAINER___",WRe="___EC__EXTENDED_CLASS___";function Au(e){var t={main:"",sub:""};if(e){var r=e.split(Avt);t.main=r[0]||"",t.sub=r[1]||""}return t}function Lvt(e){go(/^[a-zA-Z0-9_]+([.][a-zA-Z0-9_]+)?$/.test(e),'componentType "'+e+'" illegal')}function YRe(e){return!!(e&&e[WRe])}function _P(e,t){e.$constructor=e,e.extend=function(r){var o=this,n;return Nvt(o)?n=(function(i){Y(a,i);function a(){return i.apply(this,arguments)||this}return a})(o):(n=function(){(r.$constructor||o).apply(this,arguments)},f1e(n,this)),re(n.prototype,r),n[WRe]=!0,n.extend=this.extend,n.superCall=Fvt,n.superApply=Uvt,n.superClass=o,n}}function Nvt(e){return Ae(e)&&/^class\s/.test(Function.prototype.toString.call(e))}function C$(e,t){e.extend=t.extend}var zvt=Math.round(Math.random()*10);function ZRe(e){var t=["__\0is_clz",zvt++].join("_");e.prototype[t]=!0,e.isInstance=function(r){return!!(r&&r[t])}}function Fvt(e,t){for(var r=[],o=2;o<arguments.length;o++)r[o-2]=arguments[o];return this.superClass.prototype[t].apply(e,r)}function Uvt(e,t,r){return this.superClass.prototype[t].apply(e,r)}function Qy(e){var t={};e.registerClass=function(o){var n=o.type||o.prototype.type;if(n){Lvt(n),o.prototype.type=n;var i=Au(n);if(!i.sub)t[i.main]=o;else if(i.sub!==SS){var a=r(i);a[i.sub]=o}}return o},e.getClass=function(o,n,i){var a=t[o];if(a&&a[SS]&&(a=n?a[n]:null),i&&!a)throw new Error(n?"Component "+o+"."+(n||"")+" is used but not imported.":o+".type should be specified.");return a},e.getClassesByMainType=function(o){var n=Au(o),i=[],a=t[n.main];return a&&a[SS]?L(a,function(s,l){l!==SS&&i.push(s)}):i.push(a),i},e.hasClass=function(o){var n=Au(o);return!!t[n.main]},e.getAllClassMainTypes=function(){var o=[];return L(t,function(n,i){o.push(i)}),o},e.hasSubTypes=function(o){var n=Au(o),i=t[n.main];return i&&i[SS]};function r(o){var n=t[o.main];return(!n||!n[SS])&&(n=t[o.main]={},n[SS]=!0),n}}function Lu(e,t){for(var r=0;r<e.length;r++)e[r][1]||(e[r][1]=e[r][0]);return t=t||!1,function(o,n,i){for(var a={},s=0;s<e.length;s++){var l=e[s][1];if(!(n&&vt(n,l)>=0||i&&vt(i,l)<0)){var u=o.getShallow(l,t);u!=null&&(a[e[s][0]]=u)}}return a}}var Vvt=[["fill","color"],["shadowBlur"],["shadowOffsetX"],["shadowOffsetY"],["opacity"],["shadowColor"]],$vt=Lu(Vvt),qRe=(function(){function e(){}return e.prototype.getAreaStyle=function(t,r){return $vt(this,t,r)},e})();var aee=new gm(50);function XRe(e){if(typeof e=="string"){var t=aee.get(e);return t&&t.image}else return e}function jD(e,t,r,o,n){if(e)if(typeof e=="string"){if(t&&t.__zrImageSrc===e||!r)return t;var i=aee.get(e),a={hostEl:r,cb:o,cbPayload:n};return i?(t=i.image,!CP(t)&&i.pending.push(a)):(t=Fa.loadImage(e,KRe,KRe),t.__zrImageSrc=e,aee.put(e,t.__cachedImgObj={image:t,pending:[a]})),t}else return e;else return t}function KRe(){var e=this.__cachedImgObj;this.onload=this.onerror=this.__cachedImgObj=null;for(var t=0;t<e.pending.length;t++){var r=e.pending[t],o=r.cb;o&&o(this,r.cbPayload),r.hostEl.dirty()}e.pending.length=0}function CP(e){return e&&e.width&&e.height}var see=/\{([a-zA-Z0-9_]+)\|([^}]*)\}/g;function Gvt(e,t,r,o,n,i){if(!r){e.text="",e.isTruncated=!1;return}var a=(t+"").split(`
 `);i=tEe(r,o,n,i);for(var s=!1,l={},u=0,c=a.length;u<c;u++)rEe(l,a[u],i),a[u]=l.textLine,s=s||l.isTruncated;e.text=a.join(`
 `),e.isTruncated=s}function tEe(e,t,r,o){o=o||{};var n=re({},o);r=Ue(r,"..."),n.maxIterations=Ue(o.maxIterations,2);var i=n.minChar=Ue(o.minChar,0),a=n.fontMeasureInfo=Wf(t),s=a.asciiCharWidth;n.placeholder=Ue(o.placeholder,"");for(var l=e=Math.max(0,e-1),u=0;u<i&&l>=s;u++)l-=s;var c=Yf(a,r);return c>l&&(r="",c=0),l=e-c,n.ellipsis=r,n.ellipsisWidth=c,n.contentWidth=l,n.containerWidth=e,n}function rEe(e,t,r){var o=r.containerWidth,n=r.contentWidth,i=r.fontMeasureInfo;if(!o){e.textLine="",e.isTruncated=!1;return}var a=Yf(i,t);if(a<=o){e.textLine=t,e.isTruncated=!1;return}for(var s=0;;s++){if(a<=n||s>=r.maxIterations){t+=r.ellipsis;break}var l=s===0?Hvt(t,n,i):a>0?Math.floor(t.length*n/a):0;t=t.substr(0,l),a=Yf(i,t)}t===""&&(t=r.placeholder),e.textLine=t,e.isTruncated=!0}function Hvt(e,t,r){for(var o=0,n=0,i=e.length;n<i&&o<t;n++)o+=HJ(r,e.charCodeAt(n));return n}function oEe(e,t,r,o){var n=cee(e),i=t.overflow,a=t.padding,s=a?a[1]+a[3]:0,l=a?a[0]+a[2]:0,u=t.font,c=i==="truncate",p=yS(u),f=Ue(t.lineHeight,p),d=t.lineOverflow==="truncate",m=!1,h=t.width;h==null&&r!=null&&(h=r-s);var g=t.height;g==null&&o!=null&&(g=o-l);var v;h!=null&&(i==="break"||i==="breakAll")?v=n?iEe(n,t.font,h,i==="breakAll",0).lines:[]:v=n?n.split(`
@@ -399,7 +399,7 @@ return result$$;`.replaceAll("$$",String(bHe)));return bHe+=1,(l,u)=>a(i,l,u)},f
 `));if(!t.dataSource&&af(e)){e.current.updateNonPivotRows(B);return}let $=Zle(e,B,t.getRowId),G=Yle({updates:$,getRowId:t.getRowId,previousCache:e.current.caches.rows});p({cache:G,throttle:!0})},[t.signature,t.dataSource,t.getRowId,p,e]),m=fn.useCallback((B,$)=>{let G=Zle(e,B,t.getRowId),W=Yle({updates:G,getRowId:t.getRowId,previousCache:e.current.caches.rows,groupKeys:$??[]});p({cache:W,throttle:!1})},[t.getRowId,p,e]),h=fn.useCallback(B=>{o.debug(`Setting loading to ${B}`),e.current.setState($=>A({},$,{rows:A({},$.rows,{loading:B})})),e.current.caches.rows.loadingPropBeforePartialUpdates=B},[e,o]),g=fn.useCallback(()=>{let B=tv(e),$=Li(e);return new Map(B.map(G=>[G,$[G]??{}]))},[e]),v=fn.useCallback(()=>Gc(e),[e]),y=fn.useCallback(()=>tv(e),[e]),x=fn.useCallback(B=>{let{rowIdToIndexMap:$}=rh(e);return $.get(B)},[e]),b=fn.useCallback((B,$)=>{let G=ba(e,B);if(!G)throw new Error(`MUI X: No row with id #${B} found.`);if(G.type!=="group")throw new Error("MUI X: Only group nodes can be expanded or collapsed.");let W=A({},G,{childrenExpanded:$});e.current.setState(j=>A({},j,{rows:A({},j.rows,{tree:A({},j.rows.tree,{[B]:W})})})),e.current.publishEvent("rowExpansionChange",W)},[e]),S=fn.useCallback(()=>{let B=A({},yo(e)),$=G=>{let W=B[G];W?.type==="group"&&(B[G]=A({},W,{childrenExpanded:!0}),W.children.forEach($))};$(ko),e.current.setState(G=>A({},G,{rows:A({},G.rows,{tree:B})})),e.current.publishEvent("rowExpansionChange",B[ko])},[e]),T=fn.useCallback(()=>{let B=A({},yo(e)),$=G=>{let W=B[G];W?.type==="group"&&(B[G]=A({},W,{childrenExpanded:!1}),W.children.forEach($))};$(ko),e.current.setState(G=>A({},G,{rows:A({},G.rows,{tree:B})})),e.current.publishEvent("rowExpansionChange",B[ko])},[e]),w=fn.useCallback(B=>ba(e,B)??null,[e]),C=fn.useCallback(({skipAutoGeneratedRows:B=!0,groupId:$,applySorting:G,applyFiltering:W,directChildrenOnly:j=!1})=>{let X=yo(e),J;if(G){let ee=X[$];if(!ee)return[];let de=eb(e);J=[];let fe=de.findIndex(ie=>ie===$)+1;for(let ie=fe;ie<de.length&&(j?X[de[ie]].depth===ee.depth+1:X[de[ie]].depth>ee.depth);ie+=1){let ue=de[ie];(!B||!jm(X[ue]))&&J.push(ue)}}else J=Yk(X,$,B,j);if(W){let ee=qm(e);J=Jx(ee)?J:J.filter(de=>ee[de]!==!1)}return J},[e]),P=fn.useCallback((B,$)=>{if(t.signature===qs.DataGrid&&$.length>1)throw new Error(["MUI X: You cannot replace rows using `apiRef.current.unstable_replaceRows` on the DataGrid.","You need to upgrade to DataGridPro or DataGridPremium component to unlock this feature."].join(`
 `));if($.length===0)return;if(wd(e)>1)throw new Error("`apiRef.current.unstable_replaceRows` is not compatible with tree data and row grouping");let W=A({},yo(e)),j=A({},Li(e)),X=W[ko],J=[...X.children],ee=new Set;for(let fe=0;fe<$.length;fe+=1){let ie=$[fe],ue=jk(ie,t.getRowId,"A row was provided without id when calling replaceRows()."),[pe]=J.splice(B+fe,1,ue);ee.has(pe)||(delete j[pe],delete W[pe]);let ye={id:ue,depth:0,parent:ko,type:"leaf",groupingKey:null};j[ue]=ie,W[ue]=ye,ee.add(ue)}W[ko]=A({},X,{children:J});let de=J.filter(fe=>W[fe]?.type==="leaf");e.current.caches.rows.dataRowIdToModelLookup=j,e.current.setState(fe=>A({},fe,{rows:A({},fe.rows,{loading:t.loading,totalRowCount:Math.max(t.rowCount||0,J.length),dataRowIdToModelLookup:j,dataRowIds:de,tree:W})})),e.current.publishEvent("rowsSet")},[e,t.signature,t.getRowId,t.loading,t.rowCount]),R={getRow:u,setLoading:h,getRowId:c,getRowModels:g,getRowsCount:v,getAllRowIds:y,setRows:f,updateRows:d,getRowNode:w,getRowIndexRelativeToVisibleRows:x,unstable_replaceRows:P},M={setRowIndex:s,setRowPosition:l,setRowChildrenExpansion:b,getRowGroupChildren:C,expandAllRows:S,collapseAllRows:T},E={updateNestedRows:m},I=fn.useCallback(()=>{o.info("Row grouping pre-processing have changed, regenerating the row tree");let B;e.current.caches.rows.rowsBeforePartialUpdates===t.rows?B=A({},e.current.caches.rows,{updates:{type:"full",rows:tv(e)}}):B=Wk({rows:t.rows,getRowId:t.getRowId,loading:t.loading,rowCount:t.rowCount}),p({cache:B,throttle:!1})},[o,e,t.rows,t.getRowId,t.loading,t.rowCount,p]),k=Fo(()=>t.dataSource),N=fn.useCallback(B=>{if(t.dataSource&&t.dataSource!==k.current){k.current=t.dataSource;return}B==="rowTreeCreation"&&I()},[I,k,t.dataSource]),O=fn.useCallback(()=>{e.current.getActiveStrategy(cf.RowTree)!==Hle(e)&&I()},[e,I]);ot(e,"activeStrategyProcessorChange",N),ot(e,"strategyAvailabilityChange",O);let F=fn.useCallback(()=>{e.current.setState(B=>{let $=e.current.unstable_applyPipeProcessors("hydrateRows",{tree:yo(e),treeDepths:c4(e),dataRowIds:tv(e),dataRowIdToModelLookup:Li(e)});return A({},B,{rows:A({},B.rows,$,{totalTopLevelRowCount:jle({tree:$.tree,rowCountProp:t.rowCount})})})}),e.current.publishEvent("rowsSet")},[e,t.rowCount]);yR(e,"hydrateRows",F),It(e,R,"public"),It(e,M,t.signature===qs.DataGrid?"private":"public"),It(e,E,"private");let V=fn.useRef(!0);fn.useEffect(()=>{if(V.current){V.current=!1;return}let B=!1;t.rowCount!==i.current&&(B=!0,i.current=t.rowCount);let $=t.dataSource?nHe(e):t.rows,G=e.current.caches.rows.rowsBeforePartialUpdates===$,W=e.current.caches.rows.loadingPropBeforePartialUpdates===t.loading,j=e.current.caches.rows.rowCountPropBeforePartialUpdates===t.rowCount;G&&(W||(e.current.setState(X=>A({},X,{rows:A({},X.rows,{loading:t.loading})})),e.current.caches.rows.loadingPropBeforePartialUpdates=t.loading),j||(e.current.setState(X=>A({},X,{rows:A({},X.rows,{totalRowCount:Math.max(t.rowCount||0,X.rows.totalRowCount),totalTopLevelRowCount:Math.max(t.rowCount||0,X.rows.totalTopLevelRowCount)})})),e.current.caches.rows.rowCountPropBeforePartialUpdates=t.rowCount),!B)||(o.debug(`Updating all rows, new length ${$?.length}`),p({cache:Wk({rows:$,getRowId:t.getRowId,loading:t.loading,rowCount:t.rowCount}),throttle:!1}))},[t.rows,t.rowCount,t.getRowId,t.loading,t.dataSource,o,p,e])};var FUt=e=>{let t={[ko]:A({},iHe(),{children:e})};for(let r=0;r<e.length;r+=1){let o=e[r];t[o]={id:o,depth:0,parent:ko,type:"leaf",groupingKey:null}}return{groupingName:uh,tree:t,treeDepths:{0:e.length},dataRowIds:e}},UUt=({previousTree:e,actions:t})=>{let r=A({},e),o={};for(let a=0;a<t.remove.length;a+=1){let s=t.remove[a];o[s]=!0,delete r[s]}for(let a=0;a<t.insert.length;a+=1){let s=t.insert[a];r[s]={id:s,depth:0,parent:ko,type:"leaf",groupingKey:null}}let n=r[ko],i=[...n.children,...t.insert];return Object.values(o).length&&(i=i.filter(a=>!o[a])),r[ko]=A({},n,{children:i}),{groupingName:uh,tree:r,treeDepths:{0:i.length},dataRowIds:i}},VUt=e=>e.updates.type==="full"?FUt(e.updates.rows):UUt({previousTree:e.previousTree,actions:e.updates.actions}),CWe=e=>{fv(e,uh,"rowTreeCreation",VUt)};var Cb=z(K(),1);var V5=class extends Error{};function PWe(e,t,r){let o=Cb.useCallback(d=>({field:d,colDef:e.current.getColumn(d)}),[e]),n=Cb.useCallback(d=>{let m=e.current.getRow(d);if(!m)throw new V5(`No row with id #${d} found`);return{id:d,columns:e.current.getAllColumns(),row:m}},[e]),i=Cb.useCallback((d,m,h,{cellMode:g,colDef:v,hasFocus:y,rowNode:x,tabIndex:b,value:S,formattedValue:T})=>{let w=S!==void 0?S:e.current.getRowValue(h,v),C=T!==void 0?T:e.current.getRowFormattedValue(h,v),P={id:d,field:m,row:h,rowNode:x,colDef:v,cellMode:g,hasFocus:y,tabIndex:b,value:w,formattedValue:C,isEditable:!1,api:e.current};return P.isEditable=v&&e.current.isCellEditable(P),P},[e]),a=Cb.useCallback((d,m)=>{let h=e.current.getRow(d),g=ba(e,d);if(!h||!g)throw new V5(`No row with id #${d} found`);let v=Ta(e),y=oR(e),x=e.current.getCellMode(d,m);return e.current.getCellParamsForRow(d,m,h,{colDef:t.listView&&t.listViewColumn?.field===m?_4(e):e.current.getColumn(m),rowNode:g,hasFocus:v!==null&&v.field===m&&v.id===d,tabIndex:y&&y.field===m&&y.id===d?0:-1,cellMode:x})},[e,t.listView,t.listViewColumn?.field]),s=Cb.useCallback(d=>e.current.rootElementRef.current?y5e(e.current.rootElementRef.current,d):null,[e]),l=Cb.useCallback(d=>e.current.rootElementRef.current?b5e(e.current.rootElementRef.current,d):null,[e]),u=Cb.useCallback((d,m)=>e.current.rootElementRef.current?S5e(e.current.rootElementRef.current,{id:d,field:m}):null,[e]),c=r.hooks.useGridParamsOverridableMethods(e),p={getCellValue:c.getCellValue,getCellParams:a,getCellElement:u,getRowValue:c.getRowValue,getRowFormattedValue:c.getRowFormattedValue,getRowParams:n,getRowElement:l,getColumnHeaderParams:o,getColumnHeaderElement:s},f={getCellParamsForRow:i};It(e,p,"public"),It(e,f,"private")}var on=z(K(),1);var SA={type:"include",ids:new Set},RWe=(e,t)=>A({},e,{rowSelection:t.rowSelection?t.rowSelectionModel??SA:SA}),EWe=(e,t)=>{let r=no(e,"useGridSelection"),o=Se(e,wd)>1,n=t.signature!==qs.DataGrid&&(t.rowSelectionPropagation?.parents||t.rowSelectionPropagation?.descendants)&&o,i=on.useMemo(()=>t.rowSelectionModel,[t.rowSelectionModel]),a=on.useRef(null);e.current.registerControlState({stateId:"rowSelection",propModel:i,propOnChange:t.onRowSelectionModelChange,stateSelector:jc,changeEvent:"rowSelectionChange"});let{checkboxSelection:s,disableRowSelectionOnClick:l,isRowSelectable:u}=t,c=tR(t),p=on.useCallback(V=>{let B=V,$=a.current??V,G=e.current.isRowSelected(V);if(G){let W=Md(e),j=W.findIndex(J=>J===$),X=W.findIndex(J=>J===B);if(j===X)return;j>X?B=W[X+1]:B=W[X-1]}a.current=V,e.current.selectRowRange({startId:$,endId:B},!G)},[e]),f=Mt(()=>t.pagination&&t.checkboxSelectionVisibleOnly&&t.paginationMode==="client"?K4(e):Md(e)),d=on.useCallback((V,B)=>{if(t.signature===qs.DataGrid&&!c&&(V.type!=="include"||V.ids.size>1))throw new Error(["MUI X: `rowSelectionModel` can only contain 1 item in DataGrid.","You need to upgrade to DataGridPro or DataGridPremium component to unlock multiple selection."].join(`
 `));if(jc(e)!==V){if(r.debug("Setting selection model"),a.current!==null){let G=V.ids.has(a.current);(V.type==="include"&&!G||V.type==="exclude"&&G)&&(a.current=null)}e.current.setState(G=>A({},G,{rowSelection:t.rowSelection?V:SA}),B)}},[e,r,t.rowSelection,t.signature,c]),m=on.useCallback(V=>rb(e).has(V),[e]),h=on.useCallback(V=>{if(t.rowSelection===!1)return!1;if(t.keepNonExistentRowsSelected&&!e.current.getRow(V))return!0;if(u&&!u(e.current.getRowParams(V)))return!1;let B=ba(e,V);return!(B?.type==="footer"||B?.type==="pinnedRow")},[e,t.rowSelection,t.keepNonExistentRowsSelected,u]),g=on.useCallback(()=>B4(e),[e]),v=on.useCallback((V,B=!0,$=!1)=>{if(!e.current.isRowSelectable(V))return;let G=yo(e);if(a.current=B?V:null,$){r.debug(`Setting selection for row ${V}`);let W={type:"include",ids:new Set},j=X=>{W.ids.add(X)};B&&(j(V),n&&rR(e,G,V,t.rowSelectionPropagation?.descendants??!1,t.rowSelectionPropagation?.parents??!1,j)),e.current.setRowSelectionModel(W,"singleRowSelection")}else{r.debug(`Toggling selection for row ${V}`);let W=jc(e),j={type:W.type,ids:new Set(W.ids)},X=Pd(j);X.unselect(V);let J=fe=>{X.select(fe)},ee=fe=>{X.unselect(fe)};B?(J(V),n&&rR(e,G,V,t.rowSelectionPropagation?.descendants??!1,t.rowSelectionPropagation?.parents??!1,J)):n&&vue(e,G,V,t.rowSelectionPropagation?.descendants??!1,t.rowSelectionPropagation?.parents??!1,ee),(j.type==="include"&&j.ids.size<2||c)&&e.current.setRowSelectionModel(j,"singleRowSelection")}},[e,r,n,t.rowSelectionPropagation?.descendants,t.rowSelectionPropagation?.parents,c]),y=on.useCallback((V,B=!0,$=!1)=>{if(r.debug("Setting selection for several rows"),t.rowSelection===!1)return;let G=yo(e),W=new Set;for(let ee=0;ee<V.length;ee+=1){let de=V[ee];e.current.isRowSelectable(de)&&W.add(de)}let j=jc(e),X;if($){if(X={type:"include",ids:W},B){let ee=Pd(X);if(n){let de=fe=>{ee.select(fe)};for(let fe of W)rR(e,G,fe,t.rowSelectionPropagation?.descendants??!1,t.rowSelectionPropagation?.parents??!1,de)}}else X.ids=new Set;if(j.type===X.type&&X.ids.size===j.ids.size&&Array.from(X.ids).every(ee=>j.ids.has(ee)))return}else{X={type:j.type,ids:new Set(j.ids)};let ee=Pd(X),de=ie=>{ee.select(ie)},fe=ie=>{ee.unselect(ie)};for(let ie of W)B?(ee.select(ie),n&&rR(e,G,ie,t.rowSelectionPropagation?.descendants??!1,t.rowSelectionPropagation?.parents??!1,de)):(fe(ie),n&&vue(e,G,ie,t.rowSelectionPropagation?.descendants??!1,t.rowSelectionPropagation?.parents??!1,fe))}(X.type==="include"&&X.ids.size<2||c)&&e.current.setRowSelectionModel(X,"multipleRowsSelection")},[r,n,c,e,t.rowSelectionPropagation?.descendants,t.rowSelectionPropagation?.parents,t.rowSelection]),x=on.useCallback(V=>{if(!o||!n||V.type==="exclude"||V.ids.size===0&&V.type==="include")return V;let B={type:V.type,ids:new Set(V.ids)},$=yo(e),G=Pd(B),W=j=>{G.select(j)};for(let j of V.ids)rR(e,$,j,t.rowSelectionPropagation?.descendants??!1,t.rowSelectionPropagation?.parents??!1,W,G);return B},[e,t.rowSelectionPropagation?.descendants,t.rowSelectionPropagation?.parents,o,n]),b=on.useCallback(({startId:V,endId:B},$=!0,G=!1)=>{if(!e.current.getRow(V)||!e.current.getRow(B))return;r.debug(`Expanding selection from row ${V} to row ${B}`);let W=Md(e),j=W.indexOf(V),X=W.indexOf(B),[J,ee]=j>X?[X,j]:[j,X],de=W.slice(J,ee+1);e.current.selectRows(de,$,G)},[e,r]),S={selectRow:v,setRowSelectionModel:d,getSelectedRows:g,isRowSelected:m,isRowSelectable:h},T={selectRows:y,selectRowRange:b,getPropagatedRowSelectionModel:x};It(e,S,"public"),It(e,T,t.signature===qs.DataGrid?"private":"public");let w=on.useRef(!0),C=on.useCallback(()=>{if(w.current)return;let V=jc(e),B=Li(e),$=yo(e),G=qm(e),W=de=>t.filterMode==="server"?!B[de]:!$[de]||G[de]===!1,j={type:V.type,ids:new Set(V.ids)},X=Pd(j),J=!1;for(let de of V.ids){if(W(de)){if(t.keepNonExistentRowsSelected)continue;X.unselect(de),J=!0;continue}if(!t.rowSelectionPropagation?.parents)continue;let fe=$[de];if(fe?.type==="group"){if(fe.isAutoGenerated){X.unselect(de),J=!0;continue}fe.children.every(ue=>G[ue]===!1)||(X.unselect(de),J=!0)}}let ee=o&&t.rowSelectionPropagation?.parents&&(j.ids.size>0||j.type==="exclude");if(J||ee)if(ee)if(j.type==="exclude"){let de=f(),fe=[];for(let ie=0;ie<de.length;ie+=1){let ue=de[ie];(t.keepNonExistentRowsSelected||!W(ue))&&X.has(ue)&&fe.push(ue)}e.current.selectRows(fe,!0,!0)}else e.current.selectRows(Array.from(j.ids),!0,!0);else e.current.setRowSelectionModel(j,"multipleRowsSelection")},[e,o,t.rowSelectionPropagation?.parents,t.keepNonExistentRowsSelected,t.filterMode,f]),P=on.useCallback((V,B)=>{let $=B.metaKey||B.ctrlKey,G=!s&&!$&&!IHe(B),W=!c||G,j=e.current.isRowSelected(V),ee=ob(e)>1&&W||!j;e.current.selectRow(V,ee,W)},[e,c,s]),R=on.useCallback((V,B)=>{if(l)return;let $=B.target.closest(`.${Z.cell}`)?.getAttribute("data-field");$===of.field||$===J1||$&&e.current.getColumn($)?.type===Kx||ba(e,V.id).type==="pinnedRow"||(B.shiftKey&&c?p(V.id):P(V.id,B))},[l,c,e,p,P]),M=on.useCallback((V,B)=>{c&&B.shiftKey&&window.getSelection()?.removeAllRanges()},[c]),E=on.useCallback((V,B)=>{c&&B.nativeEvent.shiftKey?p(V.id):e.current.selectRow(V.id,V.value,!c)},[e,p,c]),I=on.useCallback(V=>{let B=Mn(e),$=rA(e),G=B.items.length>0||$?.some(W=>W.length);!t.isRowSelectable&&!t.checkboxSelectionVisibleOnly&&(!o||t.rowSelectionPropagation?.descendants)&&!G&&!t.disableRowSelectionExcludeModel?e.current.setRowSelectionModel({type:V?"exclude":"include",ids:new Set},"multipleRowsSelection"):e.current.selectRows(f(),V)},[e,f,t.checkboxSelectionVisibleOnly,t.isRowSelectable,t.rowSelectionPropagation?.descendants,t.disableRowSelectionExcludeModel,o]),k=on.useCallback(V=>{I(V.value)},[I]),N=on.useCallback((V,B)=>{if(e.current.getCellMode(V.id,V.field)!==Br.Edit&&!sh(B)){if(av(B.key)&&B.shiftKey){let $=Ta(e);if($&&$.id!==V.id){B.preventDefault();let G=e.current.isRowSelected($.id);if(!c){e.current.selectRow($.id,!G,!0);return}let W=e.current.getRowIndexRelativeToVisibleRows($.id),j=e.current.getRowIndexRelativeToVisibleRows(V.id),X,J;W>j?G?(X=j,J=W-1):(X=j,J=W):G?(X=W+1,J=j):(X=W,J=j);let ee=rh(e),de=[];for(let fe=X;fe<=J;fe+=1)de.push(ee.rows[fe].id);e.current.selectRows(de,!G);return}}if(B.key===" "&&B.shiftKey){B.preventDefault(),P(V.id,B);return}String.fromCharCode(B.keyCode)==="A"&&(B.ctrlKey||B.metaKey)&&(B.preventDefault(),c&&I(!0))}},[e,c,P,I]),O=Mt(()=>{if(!t.rowSelection){e.current.setRowSelectionModel(SA);return}if(i===void 0)return;if(!n||!o||i.type==="include"&&i.ids.size===0){e.current.setRowSelectionModel(i);return}let V=e.current.getPropagatedRowSelectionModel(i);if(V.type!==i.type||V.ids.size!==i.ids.size||!Array.from(i.ids).every(B=>V.ids.has(B))){e.current.setRowSelectionModel(V);return}e.current.setRowSelectionModel(i)});ot(e,"filteredRowsSet",vs(t.rowSelection,C)),ot(e,"rowClick",vs(t.rowSelection,R)),ot(e,"rowSelectionCheckboxChange",vs(t.rowSelection,E)),ot(e,"headerSelectionCheckboxChange",k),ot(e,"cellMouseDown",vs(t.rowSelection,M)),ot(e,"cellKeyDown",vs(t.rowSelection,N)),on.useEffect(()=>{O()},[e,i,t.rowSelection,O]);let F=i!=null;on.useEffect(()=>{if(F||!t.rowSelection||typeof h!="function")return;let V=jc(e);if(V.type!=="include")return;let B=new Set;for(let $ of V.ids)h($)&&B.add($);B.size<V.ids.size&&e.current.setRowSelectionModel({type:V.type,ids:B})},[e,h,F,t.rowSelection]),on.useEffect(()=>{if(!t.rowSelection||F)return;let V=jc(e);!c&&(V.type==="include"&&V.ids.size>1||V.type==="exclude")&&e.current.setRowSelectionModel(SA)},[e,c,s,F,t.rowSelection]),on.useEffect(()=>{vs(t.rowSelection,C)},[t.rowSelection,C]),on.useEffect(()=>{w.current&&(w.current=!1)},[])};var $5=z(K(),1);var $Ut=e=>{let{classes:t}=e;return $5.useMemo(()=>ce({cellCheckbox:["cellCheckbox"],columnHeaderCheckbox:["columnHeaderCheckbox"]},yt,t),[t])},MWe=(e,t)=>{let r={classes:t.classes},o=$Ut(r),n=$5.useCallback(i=>{let a=A({},of,{cellClassName:o.cellCheckbox,headerClassName:o.columnHeaderCheckbox,headerName:e.current.getLocaleText("checkboxSelectionHeaderName")}),s=t.checkboxSelection,l=i.lookup[rf]!=null;return s&&!l?(i.lookup[rf]=a,i.orderedFields=[rf,...i.orderedFields]):!s&&l?(delete i.lookup[rf],i.orderedFields=i.orderedFields.filter(u=>u!==rf)):s&&l&&(i.lookup[rf]=A({},a,i.lookup[rf]),t.columns.some(u=>u.field===rf)||(i.orderedFields=[rf,...i.orderedFields.filter(u=>u!==rf)])),i},[e,o,t.columns,t.checkboxSelection]);eo(e,"hydrateColumns",n)};var bs=z(K(),1);var IWe=(e,t)=>{let r=t.sortModel??t.initialState?.sorting?.sortModel??[];return A({},e,{sorting:{sortModel:Kle(r,t.disableMultipleColumnsSorting),sortedRows:[]}})},DWe=(e,t)=>{let r=no(e,"useGridSorting");e.current.registerControlState({stateId:"sortModel",propModel:t.sortModel,propOnChange:t.onSortModelChange,stateSelector:Sl,changeEvent:"sortModelChange"});let o=bs.useCallback((S,T)=>{let w=Sl(e),C=w.findIndex(R=>R.field===S),P=[...w];return C>-1?T?.sort==null?P.splice(C,1):P.splice(C,1,T):P=[...w,T],P},[e]),n=bs.useCallback((S,T)=>{let C=Sl(e).find(P=>P.field===S.field);if(C){let P=T===void 0?Qle(S.sortingOrder??t.sortingOrder,C.sort):T;return P===void 0?void 0:A({},C,{sort:P})}return{field:S.field,sort:T===void 0?Qle(S.sortingOrder??t.sortingOrder):T}},[e,t.sortingOrder]),i=bs.useCallback((S,T)=>T==null||T.sortable===!1||t.disableColumnSorting?S:(T.sortingOrder||t.sortingOrder).some(C=>!!C)?[...S,"columnMenuSortItem"]:S,[t.sortingOrder,t.disableColumnSorting]),a=bs.useCallback(()=>{e.current.setState(S=>{if(t.sortingMode==="server")return r.debug("Skipping sorting rows as sortingMode = server"),A({},S,{sorting:A({},S.sorting,{sortedRows:Yk(yo(e),ko,!1)})});let T=Sl(e),w=pHe(T,e),C=e.current.applyStrategyProcessor("sorting",{sortRowList:w});return A({},S,{sorting:A({},S.sorting,{sortedRows:C})})}),e.current.publishEvent("sortedRowsSet")},[e,r,t.sortingMode]),s=bs.useCallback(S=>{Sl(e)!==S&&(r.debug("Setting sort model"),e.current.setState(Xle(S,t.disableMultipleColumnsSorting)),e.current.applySorting())},[e,r,t.disableMultipleColumnsSorting]),l=bs.useCallback((S,T,w)=>{let C=e.current.getColumn(S),P=n(C,T),R;!w||t.disableMultipleColumnsSorting?R=P?.sort==null?[]:[P]:R=o(C.field,P),e.current.setSortModel(R)},[e,o,n,t.disableMultipleColumnsSorting]),u=bs.useCallback(()=>Sl(e),[e]),c=bs.useCallback(()=>tA(e).map(T=>T.model),[e]),p=bs.useCallback(()=>eb(e),[e]),f=bs.useCallback(S=>e.current.getSortedRowIds()[S],[e]);It(e,{getSortModel:u,getSortedRows:c,getSortedRowIds:p,getRowIdFromRowIndex:f,setSortModel:s,sortColumn:l,applySorting:a},"public");let m=bs.useCallback((S,T)=>{let w=Sl(e);return!T.exportOnlyDirtyModels||t.sortModel!=null||t.initialState?.sorting?.sortModel!=null||w.length>0?A({},S,{sorting:{sortModel:w}}):S},[e,t.sortModel,t.initialState?.sorting?.sortModel]),h=bs.useCallback((S,T)=>{let w=T.stateToRestore.sorting?.sortModel;return w==null?S:(e.current.setState(Xle(w,t.disableMultipleColumnsSorting)),A({},S,{callbacks:[...S.callbacks,e.current.applySorting]}))},[e,t.disableMultipleColumnsSorting]),g=bs.useCallback(S=>{let T=yo(e),w=T[ko],C=S.sortRowList?S.sortRowList(w.children.map(P=>T[P])):[...w.children];return w.footerId!=null&&C.push(w.footerId),C},[e]);eo(e,"exportState",m),eo(e,"restoreState",h),fv(e,uh,"sorting",g);let v=bs.useCallback(({field:S,colDef:T},w)=>{if(!T.sortable||t.disableColumnSorting)return;let C=t.multipleColumnsSortingMode==="always"||w.shiftKey||w.metaKey||w.ctrlKey;l(S,void 0,C)},[l,t.disableColumnSorting,t.multipleColumnsSortingMode]),y=bs.useCallback(({field:S,colDef:T},w)=>{!T.sortable||t.disableColumnSorting||w.key==="Enter"&&!w.ctrlKey&&!w.metaKey&&l(S,void 0,t.multipleColumnsSortingMode==="always"||w.shiftKey)},[l,t.disableColumnSorting,t.multipleColumnsSortingMode]),x=bs.useCallback(()=>{let S=Sl(e),T=ys(e);if(S.length>0){let w=S.filter(C=>T[C.field]);w.length<S.length&&e.current.setSortModel(w)}},[e]),b=bs.useCallback(S=>{S==="sorting"&&e.current.applySorting()},[e]);eo(e,"columnMenu",i),ot(e,"columnHeaderClick",v),ot(e,"columnHeaderKeyDown",y),ot(e,"rowsSet",e.current.applySorting),ot(e,"columnsChange",x),ot(e,"activeStrategyProcessorChange",b),Qu(()=>{t.signature==="DataGrid"&&e.current.applySorting()}),or(()=>{t.sortModel!==void 0&&e.current.setSortModel(t.sortModel)},[e,t.sortModel])};var B5=z(K(),1);function OWe(e){let{containerSize:t,scrollPosition:r,elementSize:o,elementOffset:n}=e,i=n+o;if(o>t)return n;if(i-t>r)return i-t;if(n<r)return n}var kWe=(e,t)=>{let r=ro(),o=no(e,"useGridScroll"),n=e.current.columnHeadersContainerRef,i=e.current.virtualScrollerRef,a=B5.useCallback(c=>{let p=Jr(e),f=Gc(e),d=Gr(e);if(!(c.rowIndex==null)&&f===0||d.length===0)return!1;o.debug(`Scrolling to cell at row ${c.rowIndex}, col: ${c.colIndex} `);let h={};if(c.colIndex!==void 0&&d[c.colIndex]){let g=nu(e),v;if(typeof c.rowIndex<"u"){let x=Ed(e)[c.rowIndex]?.id,b=e.current.unstable_getCellColSpanInfo(x,c.colIndex);b&&!b.spannedByColSpan&&(v=b.cellProps.width)}typeof v>"u"&&(v=d[c.colIndex].computedWidth),h.left=OWe({containerSize:p.viewportOuterSize.width,scrollPosition:Math.abs(i.current?.scrollLeft??0),elementSize:v,elementOffset:g[c.colIndex]})}if(c.rowIndex!==void 0){let g=u4(e),v=uje(e),y=cje(e),x=t.pagination?c.rowIndex-v*y:c.rowIndex,b=g.positions[x+1]?g.positions[x+1]-g.positions[x]:g.currentPageTotalHeight-g.positions[x];h.top=OWe({containerSize:p.viewportInnerSize.height,scrollPosition:i.current?.scrollTop??0,elementSize:b,elementOffset:g.positions[x]})}return h=e.current.unstable_applyPipeProcessors("scrollToIndexes",h,c),typeof h.left<"u"||typeof h.top<"u"?(e.current.scroll(h),!0):!1},[o,e,i,t.pagination]),s=B5.useCallback(c=>{if(i.current&&c.left!==void 0&&n.current){let p=r?-1:1;n.current.scrollLeft=c.left,i.current.scrollLeft=p*c.left,o.debug(`Scrolling left: ${c.left}`)}i.current&&c.top!==void 0&&(i.current.scrollTop=c.top,o.debug(`Scrolling top: ${c.top}`)),o.debug("Scrolling, updating container, and viewport")},[i,r,n,o]),l=B5.useCallback(()=>i?.current?{top:i.current.scrollTop,left:i.current.scrollLeft}:{top:0,left:0},[i]);It(e,{scroll:s,scrollToIndexes:a,getScrollPosition:l},"public")};function AWe(e,t){$r(e,"columnHeaderClick",t.onColumnHeaderClick),$r(e,"columnHeaderContextMenu",t.onColumnHeaderContextMenu),$r(e,"columnHeaderDoubleClick",t.onColumnHeaderDoubleClick),$r(e,"columnHeaderOver",t.onColumnHeaderOver),$r(e,"columnHeaderOut",t.onColumnHeaderOut),$r(e,"columnHeaderEnter",t.onColumnHeaderEnter),$r(e,"columnHeaderLeave",t.onColumnHeaderLeave),$r(e,"cellClick",t.onCellClick),$r(e,"cellDoubleClick",t.onCellDoubleClick),$r(e,"cellKeyDown",t.onCellKeyDown),$r(e,"preferencePanelClose",t.onPreferencePanelClose),$r(e,"preferencePanelOpen",t.onPreferencePanelOpen),$r(e,"menuOpen",t.onMenuOpen),$r(e,"menuClose",t.onMenuClose),$r(e,"rowDoubleClick",t.onRowDoubleClick),$r(e,"rowClick",t.onRowClick),$r(e,"stateChange",t.onStateChange)}var hce=z(K(),1);var TA={width:0,height:0},BUt={isReady:!1,root:TA,viewportOuterSize:TA,viewportInnerSize:TA,contentSize:TA,minimumSize:TA,hasScrollX:!1,hasScrollY:!1,scrollbarSize:0,headerHeight:0,groupHeaderHeight:0,headerFilterHeight:0,rowWidth:0,rowHeight:0,columnsTotalWidth:0,leftPinnedWidth:0,rightPinnedWidth:0,headersTotalHeight:0,topContainerHeight:0,bottomContainerHeight:0,autoHeight:!1,minimalContentHeight:void 0},NWe=(e,t,r)=>{let o=BUt,n=Wm(r),i=A({},o,HUt(t,r,n,iv(r)));return r.current.store.state.dimensions=i,A({},e,{dimensions:i})},GUt=Qe(Gr,nu,(e,t)=>{let r=e.length;return r===0?0:Dd(t[r-1]+e[r-1].computedWidth,1)});function zWe(e,t){let o={getRootDimensions:hce.useCallback(()=>Jr(e),[e])},n={updateDimensions:()=>e.current.virtualizer.api.updateDimensions(),getViewportPageSize:()=>e.current.virtualizer.api.getViewportPageSize()};It(e,o,"public"),It(e,n,"private"),$r(e,"rootMount",a=>{LWe(a,Jr(e))}),$r(e,"debouncedResize",t.onResize),Sd(e.current.store,a=>a.dimensions,(a,s)=>{s.isReady&&(e.current.rootElementRef.current&&LWe(e.current.rootElementRef.current,s),jUt(s.viewportInnerSize,a.viewportInnerSize)||e.current.publishEvent("viewportInnerSizeChange",s.viewportInnerSize),e.current.publishEvent("debouncedResize",s.root))})}function LWe(e,t){let r=(o,n)=>e.style.setProperty(o,n);r("--DataGrid-hasScrollX",`${Number(t.hasScrollX)}`),r("--DataGrid-hasScrollY",`${Number(t.hasScrollY)}`),r("--DataGrid-scrollbarSize",`${t.scrollbarSize}px`),r("--DataGrid-rowWidth",`${t.rowWidth}px`),r("--DataGrid-columnsTotalWidth",`${t.columnsTotalWidth}px`),r("--DataGrid-leftPinnedWidth",`${t.leftPinnedWidth}px`),r("--DataGrid-rightPinnedWidth",`${t.rightPinnedWidth}px`),r("--DataGrid-headerHeight",`${t.headerHeight}px`),r("--DataGrid-headersTotalHeight",`${t.headersTotalHeight}px`),r("--DataGrid-topContainerHeight",`${t.topContainerHeight}px`),r("--DataGrid-bottomContainerHeight",`${t.bottomContainerHeight}px`),r("--height",`${t.rowHeight}px`)}function HUt(e,t,r,o){let n=h4(e.rowHeight,$T.rowHeight,g4);return{rowHeight:Math.floor(n*r),headerHeight:Math.floor(e.columnHeaderHeight*r),groupHeaderHeight:Math.floor((e.columnGroupHeaderHeight??e.columnHeaderHeight)*r),headerFilterHeight:Math.floor((e.headerFilterHeight??e.columnHeaderHeight)*r),columnsTotalWidth:GUt(t),headersTotalHeight:UT(t,e),leftPinnedWidth:o.left.reduce((i,a)=>i+a.computedWidth,0),rightPinnedWidth:o.right.reduce((i,a)=>i+a.computedWidth,0)}}function jUt(e,t){return e.width===t.width&&e.height===t.height}var gce=z(K(),1);var FWe=e=>{let t=gce.useCallback((n={})=>e.current.unstable_applyPipeProcessors("exportState",{},n),[e]),r=gce.useCallback(n=>{e.current.unstable_applyPipeProcessors("restoreState",{callbacks:[]},{stateToRestore:n}).callbacks.forEach(a=>{a()})},[e]);It(e,{exportState:t,restoreState:r},"public")};var UWe=e=>{let t=()=>e.current.virtualizer.api.resetColSpan(),r=(...a)=>e.current.virtualizer.api.getCellColSpanInfo(...a),o=(...a)=>{e.current.virtualizer.api.calculateColSpan(...a)},n={unstable_getCellColSpanInfo:r},i={resetColSpan:t,calculateColSpan:o};It(e,n,"public"),It(e,i,"private"),ot(e,"columnOrderChange",t)};var XT=z(K(),1);var WUt=["groupId","children"],G5=e=>{let t={};for(let r=0;r<e.length;r+=1){let o=e[r];if(nue(o))continue;let{groupId:n,children:i}=o,a=ve(o,WUt);if(!n)throw new Error("MUI X: An element of the columnGroupingModel does not have either `field` or `groupId`.");let s=A({},a,{groupId:n}),l=G5(i);if(l[n]!==void 0||t[n]!==void 0)throw new Error(`MUI X: The groupId ${n} is used multiple times in the columnGroupingModel.`);Object.assign(t,l),t[n]=s}return t},VWe=(e,t,r)=>{if(nue(e)){if(r[e.field]!==void 0)throw new Error(["MUI X: columnGroupingModel contains duplicated field",`column field ${e.field} occurs two times in the grouping model:`,`- ${r[e.field].join(" > ")}`,`- ${t.join(" > ")}`].join(`
-`));r[e.field]=t;return}let{groupId:o,children:n}=e;n.forEach(i=>{VWe(i,[...t,o],r)})},H5=e=>{if(!e)return{};let t={};return e.forEach(r=>{VWe(r,[],t)}),t},j5=(e,t,r)=>{let o=l=>t[l]??[],n=[],i=Math.max(0,...e.map(l=>o(l).length)),a=(l,u,c)=>{let p=o(l),f=o(u);for(let d=0;d<=c;d+=1)if(p[d]!==f[d])return!1;return!0},s=(l,u)=>{let c=r?.left,p=r?.right,f=!!c?.includes(l),d=!!c?.includes(u),m=!!p?.includes(l),h=!!p?.includes(u);return f!==d||m!==h};for(let l=0;l<i;l+=1){let u=[];for(let c=0;c<e.length;c+=1){let p=e[c],f=o(p)[l]??null;if(u.length===0){u.push({columnFields:[p],groupId:f});continue}let d=u[u.length-1],m=d.columnFields[d.columnFields.length-1];d.groupId!==f||!a(m,p,l)||s(m,p)?u.push({columnFields:[p],groupId:f}):d.columnFields.push(p)}n.push(u)}return n};var $We=(e,t,r)=>{if(r.current.caches.columnGrouping={lastColumnGroupingModel:t.columnGroupingModel},!t.columnGroupingModel)return A({},e,{columnGrouping:void 0});let o=bl(r),n=nv(r),i=G5(t.columnGroupingModel??[]),a=H5(t.columnGroupingModel??[]),s=j5(o,a,r.current.state.pinnedColumns??{}),l=n.length===0?0:Math.max(...n.map(u=>a[u]?.length??0));return A({},e,{columnGrouping:{lookup:i,unwrappedGroupingModel:a,headerStructure:s,maxDepth:l}})},BWe=(e,t)=>{let r=XT.useCallback(s=>e5(e)[s]??[],[e]),o=XT.useCallback(()=>t5(e),[e]);It(e,{getColumnGroupPath:r,getAllGroupDetails:o},"public");let i=XT.useCallback(()=>{let s=H5(t.columnGroupingModel??[]);e.current.setState(l=>{let u=l.columns?.orderedFields??[],c=l.pinnedColumns??{},p=j5(u,s,c);return A({},l,{columnGrouping:A({},l.columnGrouping,{headerStructure:p})})})},[e,t.columnGroupingModel]),a=XT.useCallback(s=>{if(!s&&!e.current.caches.columnGrouping.lastColumnGroupingModel)return;e.current.caches.columnGrouping.lastColumnGroupingModel=s;let l=e.current.getPinnedColumns?.()??{},u=bl(e),c=nv(e),p=G5(s??[]),f=H5(s??[]),d=j5(u,f,l),m=c.length===0?0:Math.max(...c.map(h=>f[h]?.length??0));e.current.setState(h=>A({},h,{columnGrouping:{lookup:p,unwrappedGroupingModel:f,headerStructure:d,maxDepth:m}}))},[e]);ot(e,"columnIndexChange",i),ot(e,"columnsChange",()=>{a(t.columnGroupingModel)}),ot(e,"columnVisibilityModelChange",()=>{a(t.columnGroupingModel)}),XT.useEffect(()=>{t.columnGroupingModel!==e.current.caches.columnGrouping.lastColumnGroupingModel&&a(t.columnGroupingModel)},[e,a,t.columnGroupingModel])};var ec=z(K(),1);function GWe(){let e,t,r=new Promise((o,n)=>{e=o,t=n});return r.resolve=e,r.reject=t,r}function HWe(e,t){if(t!==void 0&&e.changedTouches){for(let r=0;r<e.changedTouches.length;r+=1){let o=e.changedTouches[r];if(o.identifier===t)return{x:o.clientX,y:o.clientY}}return!1}return{x:e.clientX,y:e.clientY}}function jWe(e,t,r,o){let n=e;return o==="Right"?n+=t-r.left:n+=r.right-t,Math.round(n)}function YUt(e,t,r){return r==="Left"?e-t.left:t.right-e}function ZUt(e){return e==="Right"?"Left":"Right"}function qUt(e,t){let r=e.classList.contains(Z["columnSeparator--sideRight"])?"Right":"Left";return t?ZUt(r):r}function WWe(e,t){return t===tf.LEFT?e?"--DataGrid-rightPinnedWidth":"--DataGrid-leftPinnedWidth":e?"--DataGrid-leftPinnedWidth":"--DataGrid-rightPinnedWidth"}function YWe(e,t,r){return r===tf.LEFT?t?e.rightPinnedWidth:e.leftPinnedWidth:t?e.leftPinnedWidth:e.rightPinnedWidth}function ZWe(e){e.preventDefault(),e.stopImmediatePropagation()}function KUt(e){let t=ec.useRef(void 0),r=()=>I4e(e),o=Se(e,r);return ec.useEffect(()=>{t.current&&o===!1&&(t.current.resolve(),t.current=void 0)}),()=>{if(!t.current){if(r()===!1)return Promise.resolve();t.current=GWe()}return t.current}}function XUt(e,t){if(e.length<4)return e;let r=e.slice();r.sort((s,l)=>s-l);let o=r[Math.floor(r.length*.25)],n=r[Math.floor(r.length*.75)-1],i=n-o,a=i<5?5:i*t;return r.filter(s=>s>o-a&&s<n+a)}function QUt(e,t,r){let o={},n=e.current.rootElementRef.current;n.classList.add(Z.autosizing);let i=t.includeHeaderFilters&&Q4(e);return r.forEach(a=>{let l=L5e(e.current,a.field).map(h=>h.getBoundingClientRect().width??0),u=t.includeOutliers?l:XUt(l,t.outliersFactor);if(t.includeHeaders){let h=k5e(e.current,a.field);if(h){let g=h.querySelector(`.${Z.columnHeaderTitleContainer}`),v=Array.from(g.children),y=h.querySelector(`.${Z.menuIcon}`),x=window.getComputedStyle(g,null),b=parseInt(x.gap,10)||0,S=window.getComputedStyle(h,null),T=parseInt(S.paddingLeft,10)+parseInt(S.paddingRight,10),w=0,C=0;for(let R=0;R<v.length;R+=1){let M=v[R];M.clientWidth>0&&(w+=1,C+=M.scrollWidth)}C+=1;let P=C+b*(w-1)+T+(y?.clientWidth??0);u.push(P)}}if(i){let h=A5e(e.current,a.field);if(h){let g=window.getComputedStyle(h,null),v=parseInt(g.paddingLeft,10)+parseInt(g.paddingRight,10),x=h.scrollWidth+v;u.push(x)}}let c=a.minWidth!==-1/0&&a.minWidth!==void 0,p=a.maxWidth!==1/0&&a.maxWidth!==void 0,f=c?a.minWidth:0,d=p?a.maxWidth:1/0,m=u.length===0?0:Math.max(...u);o[a.field]=Ym(m,f,d)}),n.classList.remove(Z.autosizing),o}var qWe=e=>A({},e,{columnResize:{resizingColumnField:""}});function JUt(){return{colDef:void 0,initialColWidth:0,initialTotalWidth:0,previousMouseClickEvent:void 0,columnHeaderElement:void 0,headerFilterElement:void 0,groupHeaderElements:[],cellElements:[],leftPinnedCellsAfter:[],rightPinnedCellsBefore:[],fillerLeft:void 0,fillerRight:void 0,leftPinnedHeadersAfter:[],rightPinnedHeadersBefore:[]}}var KWe=(e,t)=>{let r=ro(),o=no(e,"useGridColumnResize"),n=Fo(JUt).current,i=ec.useRef(null),a=ec.useRef(null),s=Vn(),l=ec.useRef(void 0),u=R=>{o.debug(`Updating width to ${R} for col ${n.colDef.field}`);let M=n.columnHeaderElement.offsetWidth,E=R-M,I=R-n.initialColWidth;if(I>0){let F=n.initialTotalWidth+I;e.current.rootElementRef?.current?.style.setProperty("--DataGrid-rowWidth",`${F}px`)}n.colDef.computedWidth=R,n.colDef.width=R,n.colDef.flex=0,n.columnHeaderElement.style.width=`${R}px`;let k=n.headerFilterElement;k&&(k.style.width=`${R}px`),n.groupHeaderElements.forEach(F=>{let V=F,B;V.getAttribute("aria-colspan")==="1"?B=`${R}px`:B=`${V.offsetWidth+E}px`,V.style.width=B}),n.cellElements.forEach(F=>{let V=F,B;V.getAttribute("aria-colspan")==="1"?B=`${R}px`:B=`${V.offsetWidth+E}px`,V.style.setProperty("--width",B)});let N=Jr(e),O=e.current.unstable_applyPipeProcessors("isColumnPinned",!1,n.colDef.field);O===tf.LEFT&&(IR(n.fillerLeft,"width",E),n.leftPinnedCellsAfter.forEach(F=>{IR(F,"left",E)}),n.leftPinnedHeadersAfter.forEach(F=>{IR(F,"left",E)}),e.current.rootElementRef?.current?.style.setProperty(WWe(r,O),`${YWe(N,r,O)+I}px`)),O===tf.RIGHT&&(IR(n.fillerRight,"width",E),n.rightPinnedCellsBefore.forEach(F=>{IR(F,"right",E)}),n.rightPinnedHeadersBefore.forEach(F=>{IR(F,"right",E)}),e.current.rootElementRef?.current?.style.setProperty(WWe(r,O),`${YWe(N,r,O)+I}px`))},c=R=>{if(y(),n.previousMouseClickEvent){let M=n.previousMouseClickEvent,E=M.timeStamp,I=M.clientX,k=M.clientY;if(R.timeStamp-E<300&&R.clientX===I&&R.clientY===k){n.previousMouseClickEvent=void 0,e.current.publishEvent("columnResizeStop",null,R);return}}if(n.colDef){e.current.setColumnWidth(n.colDef.field,n.colDef.width),o.debug(`Updating col ${n.colDef.field} with new width: ${n.colDef.width}`);let M=ou(e);n.groupHeaderElements.forEach(E=>{let I=_5e(E),k=E,O=`${I.reduce((F,V)=>M.columnVisibilityModel[V]!==!1?F+M.lookup[V].computedWidth:F,0)}px`;k.style.width=O})}s.start(0,()=>{e.current.publishEvent("columnResizeStop",null,R)})},p=()=>{n.columnHeaderElement&&(n.cellElements=P5e(n.columnHeaderElement,e.current))},f=(R,M,E)=>{let I=e.current.rootElementRef.current;n.initialColWidth=R.computedWidth,n.initialTotalWidth=e.current.getRootDimensions().rowWidth,n.colDef=R,n.columnHeaderElement=w5e(e.current.columnHeadersContainerRef.current,R.field);let k=I.querySelector(`.${Z.headerFilterRow} [data-field="${sf(R.field)}"]`);k&&(n.headerFilterElement=k),n.groupHeaderElements=C5e(e.current.columnHeadersContainerRef?.current,R.field),p(),n.fillerLeft=Zue(e.current,r?"filler--pinnedRight":"filler--pinnedLeft"),n.fillerRight=Zue(e.current,r?"filler--pinnedLeft":"filler--pinnedRight");let N=e.current.unstable_applyPipeProcessors("isColumnPinned",!1,n.colDef.field);n.leftPinnedCellsAfter=N!==tf.LEFT?[]:E5e(e.current,n.columnHeaderElement,r),n.rightPinnedCellsBefore=N!==tf.RIGHT?[]:M5e(e.current,n.columnHeaderElement,r),n.leftPinnedHeadersAfter=N!==tf.LEFT?[]:D5e(e.current,n.columnHeaderElement,r),n.rightPinnedHeadersBefore=N!==tf.RIGHT?[]:O5e(e.current,n.columnHeaderElement,r),a.current=qUt(M,r),i.current=YUt(E,n.columnHeaderElement.getBoundingClientRect(),a.current)},d=Mt(c),m=Mt(R=>{if(R.buttons===0){d(R);return}let M=jWe(i.current,R.clientX,n.columnHeaderElement.getBoundingClientRect(),a.current);M=Ym(M,n.colDef.minWidth,n.colDef.maxWidth),u(M);let E={element:n.columnHeaderElement,colDef:n.colDef,width:M};e.current.publishEvent("columnResize",E,R)}),h=Mt(R=>{HWe(R,l.current)&&c(R)}),g=Mt(R=>{let M=HWe(R,l.current);if(!M)return;if(R.type==="mousemove"&&R.buttons===0){h(R);return}let E=jWe(i.current,M.x,n.columnHeaderElement.getBoundingClientRect(),a.current);E=Ym(E,n.colDef.minWidth,n.colDef.maxWidth),u(E);let I={element:n.columnHeaderElement,colDef:n.colDef,width:E};e.current.publishEvent("columnResize",I,R)}),v=Mt(R=>{let M=SR(R.target,Z["columnSeparator--resizable"]);if(!M)return;let E=R.changedTouches[0];E!=null&&(l.current=E.identifier);let I=SR(R.target,Z.columnHeader),k=T5e(I),N=e.current.getColumn(k);o.debug(`Start Resize on col ${N.field}`),e.current.publishEvent("columnResizeStart",{field:k},R),f(N,M,E.clientX);let O=uo(R.currentTarget);O.addEventListener("touchmove",g),O.addEventListener("touchend",h)}),y=ec.useCallback(()=>{let R=uo(e.current.rootElementRef.current);R.body.style.removeProperty("cursor"),R.removeEventListener("mousemove",m),R.removeEventListener("mouseup",d),R.removeEventListener("touchmove",g),R.removeEventListener("touchend",h),setTimeout(()=>{R.removeEventListener("click",ZWe,!0)},100),n.columnHeaderElement&&(n.columnHeaderElement.style.pointerEvents="unset")},[e,n,m,d,g,h]),x=ec.useCallback(({field:R})=>{e.current.setState(M=>A({},M,{columnResize:A({},M.columnResize,{resizingColumnField:R})}))},[e]),b=ec.useCallback(()=>{e.current.setState(R=>A({},R,{columnResize:A({},R.columnResize,{resizingColumnField:""})}))},[e]),S=Mt(({colDef:R},M)=>{if(M.button!==0||!M.currentTarget.classList.contains(Z["columnSeparator--resizable"]))return;M.preventDefault(),o.debug(`Start Resize on col ${R.field}`),e.current.publishEvent("columnResizeStart",{field:R.field},M),f(R,M.currentTarget,M.clientX);let E=uo(e.current.rootElementRef.current);E.body.style.cursor="col-resize",n.previousMouseClickEvent=M.nativeEvent,E.addEventListener("mousemove",m),E.addEventListener("mouseup",d),E.addEventListener("click",ZWe,!0)}),T=Mt((R,M)=>{if(t.disableAutosize||M.button!==0)return;let E=e.current.state.columns.lookup[R.field];E.resizable!==!1&&e.current.autosizeColumns(A({},t.autosizeOptions,{disableColumnVirtualization:!1,columns:[E.field]}))}),w=KUt(e),C=ec.useRef(!1),P=ec.useCallback(async R=>{if(!e.current.rootElementRef?.current||C.current)return;C.current=!0;let E=ou(e),I=A({},Jje,R,{columns:R?.columns??E.orderedFields});I.columns=I.columns.filter(N=>E.columnVisibilityModel[N]!==!1);let k=I.columns.map(N=>e.current.state.columns.lookup[N]);try{!t.disableVirtualization&&I.disableColumnVirtualization&&(e.current.unstable_setColumnVirtualization(!1),await w());let N=QUt(e,I,k),O=k.map(F=>A({},F,{width:N[F.field],computedWidth:N[F.field],flex:0}));if(I.expand){let V=E.orderedFields.map(W=>E.lookup[W]).filter(W=>E.columnVisibilityModel[W.field]!==!1).reduce((W,j)=>W+(N[j.field]??j.computedWidth??j.width),0),G=e.current.getRootDimensions().viewportInnerSize.width-V;if(G>0){let W=G/(O.length||1);O.forEach(j=>{j.width+=W,j.computedWidth+=W})}}e.current.updateColumns(O),O.forEach((F,V)=>{if(F.width!==k[V].width){let B=F.width;e.current.publishEvent("columnWidthChange",{element:e.current.getColumnHeaderElement(F.field),colDef:F,width:B})}})}finally{t.disableVirtualization||e.current.unstable_setColumnVirtualization(!0),C.current=!1}},[e,w,t.disableVirtualization]);ec.useEffect(()=>y,[y]),Ef(()=>{t.autosizeOnMount&&Promise.resolve().then(()=>{e.current.autosizeColumns(t.autosizeOptions)})}),n5(e,()=>e.current.columnHeadersContainerRef?.current,"touchstart",v,{passive:!0}),It(e,{autosizeColumns:P},"public"),ot(e,"columnResizeStop",b),ot(e,"columnResizeStart",x),ot(e,"columnSeparatorMouseDown",S),ot(e,"columnSeparatorDoubleClick",T),ot(e,"rowsSet",()=>{Qje(e)!==""&&requestAnimationFrame(()=>{p()})}),$r(e,"columnResize",t.onColumnResize),$r(e,"columnWidthChange",t.onColumnWidthChange)};function IR(e,t,r){e&&(e.style[t]=`${Math.round(parseFloat(e.style[t]))+r}px`)}var wA=z(K(),1);function XWe(e,t){return e.firstRowIndex>=t.firstRowIndex&&e.lastRowIndex<=t.lastRowIndex?null:e.firstRowIndex>=t.firstRowIndex&&e.lastRowIndex>t.lastRowIndex?{firstRowIndex:t.lastRowIndex,lastRowIndex:e.lastRowIndex}:e.firstRowIndex<t.firstRowIndex&&e.lastRowIndex<=t.lastRowIndex?{firstRowIndex:e.firstRowIndex,lastRowIndex:t.firstRowIndex-1}:e}function vce(e){return e.firstRowIndex!==0||e.lastRowIndex!==0}var W5=(e,t,r)=>{if(!e)return null;let o=e[t.field];return t.rowSpanValueGetter?t.rowSpanValueGetter(o,e,t,r):f4(e,t,r)};var eVt={spannedCells:{},hiddenCells:{},hiddenCellOriginMap:{}},tVt={firstRowIndex:0,lastRowIndex:0},QT={caches:eVt,processedRange:tVt},rVt=(e,t,r,o,n,i)=>{let a=e.current.virtualizer,s=i?QT:th.selectors.state(a.store.state),l=A({},s.caches.spannedCells),u=A({},s.caches.hiddenCells),c=A({},s.caches.hiddenCellOriginMap),p={firstRowIndex:Math.min(s.processedRange.firstRowIndex,n.firstRowIndex),lastRowIndex:Math.max(s.processedRange.lastRowIndex,n.lastRowIndex)};return t.forEach((f,d)=>{for(let m=n.firstRowIndex;m<n.lastRowIndex;m+=1){let h=r[m];if(u[h.id]?.[d])continue;let g=W5(h.model,f,e);if(g==null)continue;let v=h.id,y=m,x=0,b=[];if(m===n.firstRowIndex){let T=m-1,w=r[T];for(;T>=o.firstRowIndex&&w&&W5(w.model,f,e)===g;){let C=r[T+1];u[C.id]?u[C.id][d]=!0:u[C.id]={[d]:!0},b.push(m),x+=1,v=w.id,y=T,T-=1,w=r[T]}}b.forEach(T=>{c[T]?c[T][d]=y:c[T]={[d]:y}});let S=m+1;for(;S<=o.lastRowIndex&&r[S]&&W5(r[S].model,f,e)===g;){let T=r[S];u[T.id]?u[T.id][d]=!0:u[T.id]={[d]:!0},c[S]?c[S][d]=y:c[S]={[d]:y},S+=1,x+=1}x>0&&(l[v]?l[v][d]=x+1:l[v]={[d]:x+1})}}),{caches:{spannedCells:l,hiddenCells:u,hiddenCellOriginMap:c},processedRange:p}},QWe=e=>A({},e,{rowSpanning:QT}),JWe=(e,t)=>{let r=wA.useCallback((a,s=!1)=>{let l=e.current.virtualizer.store,{range:u,rows:c}=rh(e);if(s&&l.set("rowSpanning",QT),u===null||!vce(a))return;let p=s?QT:th.selectors.state(l.state),f=XWe({firstRowIndex:a.firstRowIndex,lastRowIndex:Math.min(a.lastRowIndex,u.lastRowIndex-u.firstRowIndex+1)},p.processedRange);if(f===null)return;let d=Gr(e),m=rVt(e,d,c,u,f,s),h=Object.keys(m.caches.spannedCells).length,g=Object.keys(m.caches.hiddenCells).length,v=Object.keys(p.caches.spannedCells).length,y=Object.keys(p.caches.hiddenCells).length;!(s||h!==v||g!==y)||h===0&&v===0||l.set("rowSpanning",m)},[e]),{schedule:o,cancel:n}=Uje(r),i=wA.useCallback(()=>{let a=lA(e);vce(a)&&o(a,!0)},[e,o]);ot(e,"renderedRowsIntervalChange",vs(t.rowSpanning,a=>{let s=n();r(a,s)})),ot(e,"sortedRowsSet",vs(t.rowSpanning,i)),ot(e,"paginationModelChange",vs(t.rowSpanning,i)),ot(e,"filteredRowsSet",vs(t.rowSpanning,i)),ot(e,"columnsChange",vs(t.rowSpanning,i)),ot(e,"rowExpansionChange",vs(t.rowSpanning,i)),wA.useEffect(()=>{let a=e.current.virtualizer?.store;a&&(t.rowSpanning?a.state.rowSpanning===QT&&r(lA(e)):a.state.rowSpanning!==QT&&a.set("rowSpanning",QT))},[e,t.rowSpanning,r])};var Y5=z(K(),1);var e8e=(e,t,r)=>A({},e,{listViewColumn:t.listViewColumn?A({},t.listViewColumn,{computedWidth:yce(r)}):void 0});function t8e(e,t){let r=()=>{e.current.setState(i=>i.listViewColumn?A({},i,{listViewColumn:A({},i.listViewColumn,{computedWidth:yce(e)})}):i)},o=Y5.useRef(null);ot(e,"viewportInnerSizeChange",i=>{o.current!==i.width&&(o.current=i.width,r())}),ot(e,"columnVisibilityModelChange",r),or(()=>{let i=t.listViewColumn;i&&e.current.setState(a=>A({},a,{listViewColumn:A({},i,{computedWidth:yce(e)})}))},[e,t.listViewColumn]),Y5.useEffect(()=>{t.listView&&!t.listViewColumn&&void 0},[t.listView,t.listViewColumn])}function yce(e){return Jr(e).viewportInnerSize.width}var i8e=z(K(),1);var Ss=z(K(),1);var r8e=Qe(Mn,Sl,bi,(e,t,r)=>({groupKeys:[],paginationModel:r,sortModel:t,filterModel:e,start:r.page*r.pageSize,end:r.page*r.pageSize+r.pageSize-1}));var Pb=(function(e){return e.Default="set-flat-rows",e.LazyLoading="replace-row-range",e.GroupedData="set-grouped-rows",e})({}),DR=class{constructor(t){this.chunkSize=t}getCacheKeys=t=>{if(this.chunkSize<1||typeof t.start!="number")return[t];let r=[];for(let o=t.start;o<=t.end;o+=this.chunkSize){let n=Math.min(o+this.chunkSize-1,t.end);r.push(A({},t,{start:o,end:n}))}return r};splitResponse=(t,r)=>{let o=this.getCacheKeys(t);if(o.length===1)return new Map([[t,r]]);let n=new Map;return o.forEach(i=>{let a=i.end===t.end,s=A({},r,{pageInfo:A({},r.pageInfo,{hasNextPage:r.pageInfo?.hasNextPage!==void 0&&!a?!0:r.pageInfo?.hasNextPage,nextCursor:r.pageInfo?.nextCursor!==void 0&&!a?r.rows[i.end+1].id:r.pageInfo?.nextCursor}),rows:typeof i.start!="number"||typeof t.start!="number"?r.rows:r.rows.slice(i.start-t.start,i.end-t.start+1)});n.set(i,s)}),n};static mergeResponses=t=>t.length===1?t[0]:t.reduce((r,o)=>A({},o,{rows:[...r.rows,...o.rows]}),{rows:[],rowCount:0,pageInfo:{}})};var oVt=["skipCache","keepChildrenExpanded"],nVt={clear:()=>{},get:()=>{},set:()=>{}};function o8e(e,t={}){return e===null?nVt:e??new d5(t)}var n8e=(e,t,r={})=>{let o=Ss.useCallback(()=>{e.current.setStrategyAvailability(cf.DataSource,Pb.Default,t.dataSource?()=>!0:()=>!1)},[e,t.dataSource]),[n,i]=Ss.useState(e.current.getActiveStrategy(cf.DataSource)),a=Ss.useMemo(()=>n===Pb.Default||n===Pb.GroupedData,[n]),s=Se(e,bi),l=Ss.useRef(0),u=t.onDataSourceError,c=Fo(()=>{if(!t.pagination)return new DR(s.pageSize);let T=t.pageSizeOptions.map(C=>typeof C=="number"?C:C.value).sort((C,P)=>C-P),w=Math.min(s.pageSize,T[0]);return new DR(w)}).current,[p,f]=Ss.useState(()=>o8e(t.dataSourceCache,r.cacheOptions)),d=Ss.useCallback(async(T,w)=>{let C=t.dataSource?.getRows;if(!C)return;if(T&&T!==ko&&t.signature!=="DataGrid"){r.fetchRowChildren?.([T]);return}r.clearDataSourceState?.();let P=w||{},{skipCache:R,keepChildrenExpanded:M}=P,E=ve(P,oVt),I=A({},r8e(e),e.current.unstable_applyPipeProcessors("getRowsParams",{}),E),N=c.getCacheKeys(I).map(F=>p.get(F));if(!R&&N.every(F=>F!==void 0)){e.current.applyStrategyProcessor("dataSourceRowsUpdate",{response:DR.mergeResponses(N),fetchParams:I,options:{skipCache:R,keepChildrenExpanded:M}});return}(a||e.current.getRowsCount()===0)&&e.current.setLoading(!0);let O=l.current+1;l.current=O;try{let F=await C(I);c.splitResponse(I,F).forEach((B,$)=>p.set($,B)),l.current===O&&e.current.applyStrategyProcessor("dataSourceRowsUpdate",{response:F,fetchParams:I,options:{skipCache:R,keepChildrenExpanded:M}})}catch(F){l.current===O&&(e.current.applyStrategyProcessor("dataSourceRowsUpdate",{error:F,fetchParams:I,options:{skipCache:R,keepChildrenExpanded:M}}),typeof u=="function"?u(new m5({message:F?.message,params:I,cause:F})):void 0)}finally{a&&l.current===O&&e.current.setLoading(!1)}},[c,p,e,a,t.dataSource?.getRows,u,r,t.signature]),m=Ss.useCallback(()=>{i(e.current.getActiveStrategy(cf.DataSource))},[e]),h=Ss.useCallback(T=>{if("error"in T){e.current.setRows([]);return}let{response:w}=T;w.rowCount!==void 0&&e.current.setRowCount(w.rowCount),e.current.setRows(w.rows),e.current.unstable_applyPipeProcessors("processDataSourceRows",{params:T.fetchParams,response:w},!0)},[e]),g=t.dataSource?.updateRow,v=r.handleEditRow,y=Ss.useCallback(async T=>{if(g)try{let w=await g(T);return typeof v=="function"?(v(T,w),w):(w&&!qa(w,T.previousRow)&&e.current.dataSource.cache.clear(),e.current.updateNestedRows([w],[]),w)}catch(w){throw typeof u=="function"?u(new h5({message:w?.message,params:T,cause:w})):void 0,w}},[e,g,u,v]),x={dataSource:{fetchRows:d,cache:p,editRow:y}},b=Ss.useMemo(()=>As(d,0),[d]),S=Ss.useRef(!0);return Ss.useEffect(()=>{if(S.current){S.current=!1;return}if(t.dataSourceCache===void 0)return;let T=o8e(t.dataSourceCache,r.cacheOptions);f(w=>w!==T?T:w)},[t.dataSourceCache,r.cacheOptions]),Ss.useEffect(()=>{if(!(n!==Pb.Default&&n!==Pb.LazyLoading&&n!==Pb.GroupedData))return t.dataSource&&(e.current.dataSource.cache.clear(),e.current.dataSource.fetchRows()),()=>{l.current+=1}},[e,t.dataSource,n]),{api:{public:x},debouncedFetchRows:b,strategyProcessor:{strategyName:Pb.Default,group:"dataSourceRowsUpdate",processor:h},setStrategyAvailability:o,cacheChunkManager:c,cache:p,events:{strategyAvailabilityChange:m,sortModelChange:vs(a,()=>b()),filterModelChange:vs(a,()=>b()),paginationModelChange:vs(a,()=>b())}}};var a8e=(e,t)=>{let{api:r,strategyProcessor:o,events:n,setStrategyAvailability:i}=n8e(e,t);It(e,r.public,"public"),fv(e,o.strategyName,o.group,o.processor),Object.entries(n).forEach(([a,s])=>{ot(e,a,s)}),i8e.useEffect(()=>{i()},[i])};var l8e=(e,t,r)=>{V3e(e,t),MWe(e,t),CWe(e),_a(F3e,e,t),_a(RWe,e,t),_a(Z3e,e,t),_a(wWe,e,t),_a(hWe,e,t),_a(SWe,e,t),_a(uWe,e,t),_a(IWe,e,t),_a(vWe,e,t),_a(sWe,e,t),_a(QWe,e,t),_a(K3e,e,t),_a(qWe,e,t),_a(j3e,e,t),_a($We,e,t),_a(E4e,e,t),_a(NWe,e,t),_a(z4e,e,t),_a(e8e,e,t),fWe(e,t),EWe(e,t),q3e(e,t),_We(e,t,r),JWe(e,t),PWe(e,t,r),UWe(e),BWe(e,t),TWe(e,t,r),cWe(e,t),yWe(e,t),lWe(e,t,r),DWe(e,t),X3e(e,t),KWe(e,t),gWe(e,t),kWe(e,t),W3e(e),eWe(e,t),nWe(e,t),H3e(e,t),zWe(e,t),AWe(e,t),FWe(e),M4e(e,t),t8e(e,t),a8e(e,t),Qu(()=>{e.current.runAppliersForPendingProcessors()}),s8e.useEffect(()=>{e.current.runAppliersForPendingProcessors()})};var OR=z(K(),1);var _9o=z(K(),1);var qc=z(K(),1);gt();var ph=z(K(),1);var u8e=z(Q(),1),iVt=e=>{let{classes:t,headerAlign:r,isDragging:o,isLastColumn:n,showLeftBorder:i,showRightBorder:a,groupId:s,pinnedPosition:l}=e,u={root:["columnHeader",r==="left"&&"columnHeader--alignLeft",r==="center"&&"columnHeader--alignCenter",r==="right"&&"columnHeader--alignRight",o&&"columnHeader--moving",a&&"columnHeader--withRightBorder",i&&"columnHeader--withLeftBorder","withBorderColor",s===null?"columnHeader--emptyGroup":"columnHeader--filledGroup",l===dr.LEFT&&"columnHeader--pinnedLeft",l===dr.RIGHT&&"columnHeader--pinnedRight",n&&"columnHeader--last"],draggableContainer:["columnHeaderDraggableContainer"],titleContainer:["columnHeaderTitleContainer","withBorderColor"],titleContainerContent:["columnHeaderTitleContainerContent"]};return ce(u,yt,t)};function c8e(e){let{groupId:t,width:r,depth:o,maxDepth:n,fields:i,height:a,colIndex:s,hasFocus:l,tabIndex:u,isLastColumn:c,pinnedPosition:p,pinnedOffset:f}=e,d=he(),m=ro(),h=ph.useRef(null),g=st(),v=Se(g,t5),y=t?v[t]:{},{headerName:x=t??"",description:b="",headerAlign:S=void 0}=y,T,w=t&&v[t]?.renderHeaderGroup,C=ph.useMemo(()=>({groupId:t,headerName:x,description:b,depth:o,maxDepth:n,fields:i,colIndex:s,isLastColumn:c}),[t,x,b,o,n,i,s,c]);t&&w&&(T=w(C));let P=A({},e,{classes:d.classes,headerAlign:S,depth:o,isDragging:!1}),R=x??t,M=Jt(),E=t===null?`empty-group-cell-${M}`:t,I=iVt(P);ph.useLayoutEffect(()=>{if(l){let B=h.current.querySelector('[tabindex="0"]')||h.current;if(!B)return;if(cb())B.focus({preventScroll:!0});else{let $=g.current.getScrollPosition();B.focus(),g.current.scroll($)}}},[g,l]);let k=ph.useCallback(V=>B=>{sh(B)||g.current.publishEvent(V,C,B)},[g,C]),N=ph.useMemo(()=>({onKeyDown:k("columnGroupHeaderKeyDown"),onFocus:k("columnGroupHeaderFocus"),onBlur:k("columnGroupHeaderBlur")}),[k]),O=typeof y.headerClassName=="function"?y.headerClassName(C):y.headerClassName,F=ph.useMemo(()=>pb(A({},e.style),m,p,f),[p,f,e.style,m]);return(0,u8e.jsx)(_5,A({ref:h,classes:I,columnMenuOpen:!1,colIndex:s,height:a,isResizing:!1,sortDirection:null,hasFocus:!1,tabIndex:u,isDraggable:!1,headerComponent:T,headerClassName:O,description:b,elementId:E,width:r,columnMenuIconButton:null,columnTitleIconButtons:null,resizable:!1,label:R,"aria-colspan":i.length,"data-fields":`|-${i.join("-|-")}-|`,style:F},N))}gt();var f8e=z(Q(),1),p8e={root:Z.scrollbarFiller,pinnedRight:Z["scrollbarFiller--pinnedRight"]};function d8e({pinnedRight:e}){return(0,f8e.jsx)("div",{role:"presentation",className:le(p8e.root,e&&p8e.pinnedRight)})}var fh=z(Q(),1),m8e=ne("div",{name:"MuiDataGrid",slot:"ColumnHeaderRow"})({display:"flex"}),h8e=e=>{let{visibleColumns:t,sortColumnLookup:r,filterColumnLookup:o,columnHeaderTabIndexState:n,columnGroupHeaderTabIndexState:i,columnHeaderFocus:a,columnGroupHeaderFocus:s,headerGroupingMaxDepth:l,columnMenuState:u,columnVisibility:c,columnGroupsHeaderStructure:p,hasOtherElementInTabSequence:f}=e,[d,m]=qc.useState(""),[h,g]=qc.useState(""),v=Go(),y=he(),x=Se(v,e5),b=Se(v,nu),S=Se(v,D4e),T=Se(v,iv),w=Se(v,ys),C=kue(b,S,T.left.length),P=Se(v,MT),R=Se(v,s4),M=Se(v,eHe),E=Se(v,tHe),I=Se(v,l4),k=qc.useCallback(ee=>g(ee.field),[]),N=qc.useCallback(()=>g(""),[]),O=qc.useCallback(ee=>m(ee.field),[]),F=qc.useCallback(()=>m(""),[]),V=qc.useMemo(()=>T.left.length?{firstColumnIndex:0,lastColumnIndex:T.left.length}:null,[T.left.length]),B=qc.useMemo(()=>T.right.length?{firstColumnIndex:t.length-T.right.length,lastColumnIndex:t.length}:null,[T.right.length,t.length]);ot(v,"columnResizeStart",k),ot(v,"columnResizeStop",N),ot(v,"columnHeaderDragStart",O),ot(v,"columnHeaderDragEndNative",F);let $=ee=>{let{renderContext:de=S}=ee||{},fe=de.firstColumnIndex,ie=Math.min(de.lastColumnIndex,t.length);return{renderedColumns:t.slice(fe,ie),firstColumnToRender:fe,lastColumnToRender:ie}},G=(ee,de,fe,ie=!1)=>{let ue=ee?.position===dr.RIGHT,pe=ee?.position===void 0,ye=T.right.length>0&&ue||T.right.length===0&&pe,ze=C-fe;return(0,fh.jsxs)(qc.Fragment,{children:[pe&&(0,fh.jsx)("div",{role:"presentation",style:{width:ze}}),de,pe&&(0,fh.jsx)("div",{role:"presentation",className:le(Z.filler,ie&&Z["filler--borderBottom"])}),ye&&(0,fh.jsx)(d8e,{pinnedRight:ue})]})},W=(ee,de={})=>{let{renderedColumns:fe,firstColumnToRender:ie}=$(ee),ue=[];for(let pe=0;pe<fe.length;pe+=1){let ye=fe[pe],ze=ie+pe,Ee=ze===0,Pe=n!==null&&n.field===ye.field||Ee&&!f?0:-1,Ye=a!==null&&a.field===ye.field,_e=u.open&&u.field===ye.field,be=ee?.position,He=xb(be,ye.computedWidth,ze,b,P,I),qe=be===dr.RIGHT?fe[pe-1]:fe[pe+1],bt=qe?a!==null&&a.field===qe.field:!1,rt=pe,mr=fe.length,Ze=YT(be,rt,y.showColumnVerticalBorder,y.pinnedColumnsSectionSeparator),zt=WT(be,rt,mr,y.showColumnVerticalBorder,R,y.pinnedColumnsSectionSeparator);ue.push((0,fh.jsx)(V5e,A({},r[ye.field],{columnMenuOpen:_e,filterItemsCounter:o[ye.field]&&o[ye.field].length,headerHeight:M,isDragging:ye.field===d,colDef:ye,colIndex:ze,isResizing:h===ye.field,isLast:ze===b.length-1,hasFocus:Ye,tabIndex:Pe,pinnedPosition:be,pinnedOffset:He,isSiblingFocused:bt,showLeftBorder:Ze,showRightBorder:zt},de),ye.field))}return G(ee,ue,0)},j=()=>(0,fh.jsxs)(m8e,{role:"row","aria-rowindex":l+1,ownerState:y,className:Z["row--borderBottom"],style:{height:M},children:[V&&W({position:dr.LEFT,renderContext:V},{disableReorder:!0}),W({renderContext:S}),B&&W({position:dr.RIGHT,renderContext:B},{disableReorder:!0,separatorSide:w5.Left})]}),X=({depth:ee,params:de})=>{let fe=$(de);if(fe.renderedColumns.length===0)return null;let{firstColumnToRender:ie,lastColumnToRender:ue}=fe,pe=p[ee],ye=t[ie].field,ze=x[ye]?.[ee]??null,Ee=pe.findIndex(({groupId:Ze,columnFields:zt})=>Ze===ze&&zt.includes(ye)),Pe=t[ue-1].field,Ye=x[Pe]?.[ee]??null,_e=pe.findIndex(({groupId:Ze,columnFields:zt})=>Ze===Ye&&zt.includes(Pe)),be=pe.slice(Ee,_e+1).map(Ze=>A({},Ze,{columnFields:Ze.columnFields.filter(zt=>c[zt]!==!1)})).filter(Ze=>Ze.columnFields.length>0),He=be[0].columnFields.indexOf(ye),bt=be[0].columnFields.slice(0,He).reduce((Ze,zt)=>{let Lt=w[zt];return Ze+(Lt.computedWidth??0)},0),rt=ie,mr=be.map(({groupId:Ze,columnFields:zt},Lt)=>{let qt=s!==null&&s.depth===ee&&zt.includes(s.field),Dt=i!==null&&i.depth===ee&&zt.includes(i.field)?0:-1,ht={groupId:Ze,width:zt.reduce((ir,ar)=>ir+w[ar].computedWidth,0),fields:zt,colIndex:rt,hasFocus:qt,tabIndex:Dt},Bt=de.position,je=xb(Bt,ht.width,rt,b,P,I);rt+=zt.length;let Et=Lt;return Bt===dr.LEFT&&(Et=rt-1),(0,fh.jsx)(c8e,{groupId:Ze,width:ht.width,fields:ht.fields,colIndex:ht.colIndex,depth:ee,isLastColumn:Lt===be.length-1,maxDepth:l,height:E,hasFocus:qt,tabIndex:Dt,pinnedPosition:Bt,pinnedOffset:je,showLeftBorder:YT(Bt,Et,y.showColumnVerticalBorder,y.pinnedColumnsSectionSeparator),showRightBorder:WT(Bt,Et,be.length,y.showColumnVerticalBorder,R,y.pinnedColumnsSectionSeparator)},Lt)});return G(de,mr,bt)};return{renderContext:S,leftRenderContext:V,rightRenderContext:B,pinnedColumns:T,visibleColumns:t,columnPositions:b,getFillers:G,getColumnHeadersRow:j,getColumnsToRender:$,getColumnGroupHeadersRows:()=>{if(l===0)return null;let ee=[];for(let de=0;de<l;de+=1)ee.push((0,fh.jsxs)(m8e,{role:"row","aria-rowindex":de+1,ownerState:y,style:{height:E},children:[V&&X({depth:de,params:{position:dr.LEFT,renderContext:V,maxLastColumn:V.lastColumnIndex}}),X({depth:de,params:{renderContext:S}}),B&&X({depth:de,params:{position:dr.RIGHT,renderContext:B,maxLastColumn:B.lastColumnIndex}})]},de));return ee},getPinnedCellOffset:xb,isDragging:!!d,getInnerProps:()=>({role:"rowgroup"})}};var m9o=z(K(),1);gt();var g8e=z(Q(),1),aVt=["className"],sVt=e=>{let{classes:t}=e;return ce({root:["columnHeaders"]},yt,t)},lVt=Kt("div",{name:"MuiDataGrid",slot:"ColumnHeaders"})({display:"flex",flexDirection:"column",borderTopLeftRadius:"var(--unstable_DataGrid-radius)",borderTopRightRadius:"var(--unstable_DataGrid-radius)"}),v8e=Ke(function(t,r){let{className:o}=t,n=ve(t,aVt),i=he(),a=sVt(i);return(0,g8e.jsx)(lVt,A({className:le(a.root,o),ownerState:i},n,{role:"presentation",ref:r}))});var y8e=z(Q(),1),uVt=["className","visibleColumns","sortColumnLookup","filterColumnLookup","columnHeaderTabIndexState","columnGroupHeaderTabIndexState","columnHeaderFocus","columnGroupHeaderFocus","headerGroupingMaxDepth","columnMenuState","columnVisibility","columnGroupsHeaderStructure","hasOtherElementInTabSequence"],cVt=Ke(function(t,r){let{visibleColumns:o,sortColumnLookup:n,filterColumnLookup:i,columnHeaderTabIndexState:a,columnGroupHeaderTabIndexState:s,columnHeaderFocus:l,columnGroupHeaderFocus:u,headerGroupingMaxDepth:c,columnMenuState:p,columnVisibility:f,columnGroupsHeaderStructure:d,hasOtherElementInTabSequence:m}=t,h=ve(t,uVt),{getInnerProps:g,getColumnHeadersRow:v,getColumnGroupHeadersRows:y}=h8e({visibleColumns:o,sortColumnLookup:n,filterColumnLookup:i,columnHeaderTabIndexState:a,columnGroupHeaderTabIndexState:s,columnHeaderFocus:l,columnGroupHeaderFocus:u,headerGroupingMaxDepth:c,columnMenuState:p,columnVisibility:f,columnGroupsHeaderStructure:d,hasOtherElementInTabSequence:m});return(0,y8e.jsxs)(v8e,A({},h,g(),{ref:r,children:[y(),v()]}))}),x8e=Wa(cVt);function b8e(e){return null}function S8e(e){return null}var T8e=z(Q(),1),w8e=Ke(function(t,r){let n=st().current.getLocaleText("noResultsOverlayLabel");return(0,T8e.jsx)(db,A({},t,{ref:r,children:n}))});var F9o=z(K(),1);gt();var _8e=z(Q(),1),pVt=()=>ce({root:["bottomContainer"]},yt,{}),fVt=Kt("div",{slot:"internal",shouldForwardProp:void 0})({position:"sticky",zIndex:40,bottom:"calc(var(--DataGrid-hasScrollX) * var(--DataGrid-scrollbarSize))"});function C8e(e){let t=pVt();return(0,_8e.jsx)(fVt,A({},e,{className:le(t.root,Z["container--bottom"]),role:"presentation"}))}var P8e=A({},WGe,{cell:j4e,skeletonCell:q4e,columnHeaderFilterIconButton:W5e,columnHeaderSortIcon:H5e,columnMenu:s6e,columnHeaders:x8e,detailPanels:b8e,bottomContainer:C8e,footer:e3e,footerRowCount:u3e,toolbar:X6e,pinnedRows:S8e,loadingOverlay:o3e,noResultsOverlay:w8e,noRowsOverlay:i3e,noColumnsOverlay:a3e,pagination:lce,filterPanel:oce,columnsPanel:u6e,columnsManagement:T6e,panel:c6e,row:v3e});var dVt={disableMultipleColumnsFiltering:!0,disableMultipleColumnsSorting:!0,throttleRowsMs:void 0,hideFooterRowCount:!1,pagination:!0,checkboxSelectionVisibleOnly:!1,disableColumnReorder:!0,keepColumnPositionIfDraggedOutside:!1,signature:"DataGrid",listView:!1},mVt=e=>A({},dVt,e.dataSource?{filterMode:"server",sortingMode:"server",paginationMode:"server"}:{}),hVt=P8e,R8e=e=>{let t=lo(),r=OR.useMemo(()=>Jh({props:e,theme:t,name:"MuiDataGrid"}),[t,e]),o=OR.useMemo(()=>A({},lHe,r.localeText),[r.localeText]),n=OR.useMemo(()=>G4e({defaultSlots:hVt,slots:r.slots}),[r.slots]),i=OR.useMemo(()=>Object.keys($T).reduce((a,s)=>(a[s]=r[s]??$T[s],a),{}),[r]);return OR.useMemo(()=>A({},r,i,{localeText:o,slots:n},mVt(r)),[r,o,n,i])};var dh=z(K(),1);var _A=class{maxListeners=20;warnOnce=!1;events={};on(t,r,o={}){let n=this.events[t];n||(n={highPriority:new Map,regular:new Map},this.events[t]=n),o.isFirst?n.highPriority.set(r,!0):n.regular.set(r,!0)}removeListener(t,r){this.events[t]&&(this.events[t].regular.delete(r),this.events[t].highPriority.delete(r))}removeAllListeners(){this.events={}}emit(t,...r){let o=this.events[t];if(!o)return;let n=Array.from(o.highPriority.keys()),i=Array.from(o.regular.keys());for(let a=n.length-1;a>=0;a-=1){let s=n[a];o.highPriority.has(s)&&s.apply(this,r)}for(let a=0;a<i.length;a+=1){let s=i[a];o.regular.has(s)&&s.apply(this,r)}}once(t,r){let o=this;this.on(t,function n(...i){o.removeListener(t,n),r.apply(o,i)})}};var M8e=Symbol("mui.api_private"),gVt=e=>e.isPropagationStopped!==void 0;var E8e=0;function vVt(e){let t=e.current?.[M8e];if(t)return t;let r={},o={state:r,store:q1.create(r),instanceId:{id:E8e}};return E8e+=1,o.getPublicApi=()=>e.current,o.register=(n,i)=>{Object.keys(i).forEach(a=>{let s=i[a],l=o[a];if(l?.spying===!0?l.target=s:o[a]=s,n==="public"){let u=e.current,c=u[a];c?.spying===!0?c.target=s:u[a]=s}})},o.register("private",{caches:{},eventManager:new _A}),o}function yVt(e){return{get state(){return e.current.state},get store(){return e.current.store},get instanceId(){return e.current.instanceId},[M8e]:e.current}}function I8e(e,t){let r=dh.useRef(null),o=dh.useRef(null);o.current||(o.current=vVt(r)),r.current||(r.current=yVt(o));let n=dh.useCallback((...a)=>{let[s,l,u={}]=a;if(u.defaultMuiPrevented=!1,gVt(u)&&u.isPropagationStopped())return;let c=t.signature===qs.DataGridPro||t.signature===qs.DataGridPremium?{api:o.current.getPublicApi()}:{};o.current.eventManager.emit(s,l,u,c)},[o,t.signature]),i=dh.useCallback((a,s,l)=>{o.current.eventManager.on(a,s,l);let u=o.current;return()=>{u.eventManager.removeListener(a,s)}},[o]);return It(o,{subscribeEvent:i,publishEvent:n},"public"),e&&!e.current?.state&&(e.current=r.current),dh.useImperativeHandle(e,()=>r.current,[r]),dh.useEffect(()=>{let a=o.current;return()=>{a.publishEvent("unmount")}},[o]),o}var xce=z(Q(),1),D8e={hooks:{useCSSVariables:$Ge,useGridAriaAttributes:y3e,useGridRowAriaAttributes:b3e,useGridRowsOverridableMethods:S3e,useGridParamsOverridableMethods:T3e,useIsCellEditable:_3e,useCellAggregationResult:()=>null,useFilterValueGetter:e=>e.current.getRowValue}},k8e=function(t,r){let o=R8e(t),n=I8e(o.apiRef,o);return l8e(n,o,D8e),(0,xce.jsx)(P3e,{privateApiRef:n,configuration:D8e,props:o,children:(0,xce.jsx)(a5e,A({className:o.className,style:o.style,sx:o.sx},o.slotProps?.root,{ref:r}))})},A8e=O8e.memo(Ke(k8e));k8e.propTypes={apiRef:me.default.shape({current:me.default.object}),"aria-label":me.default.string,"aria-labelledby":me.default.string,autoHeight:me.default.bool,autoPageSize:me.default.bool,autosizeOnMount:me.default.bool,autosizeOptions:me.default.shape({columns:me.default.arrayOf(me.default.string),disableColumnVirtualization:me.default.bool,expand:me.default.bool,includeHeaders:me.default.bool,includeOutliers:me.default.bool,outliersFactor:me.default.number}),cellModesModel:me.default.object,checkboxSelection:me.default.bool,classes:me.default.object,className:me.default.string,clipboardCopyCellDelimiter:me.default.string,columnBufferPx:me.default.number,columnFilterDebounceMs:me.default.number,columnGroupHeaderHeight:me.default.number,columnGroupingModel:me.default.arrayOf(me.default.object),columnHeaderHeight:me.default.number,columns:me.default.arrayOf(me.default.object).isRequired,columnVisibilityModel:me.default.object,dataSource:me.default.shape({getRows:me.default.func.isRequired,updateRow:me.default.func}),dataSourceCache:me.default.shape({clear:me.default.func.isRequired,get:me.default.func.isRequired,set:me.default.func.isRequired}),density:me.default.oneOf(["comfortable","compact","standard"]),disableAutosize:me.default.bool,disableColumnFilter:me.default.bool,disableColumnMenu:me.default.bool,disableColumnResize:me.default.bool,disableColumnSelector:me.default.bool,disableColumnSorting:me.default.bool,disableDensitySelector:me.default.bool,disableEval:me.default.bool,disableMultipleRowSelection:me.default.bool,disableRowSelectionExcludeModel:me.default.bool,disableRowSelectionOnClick:me.default.bool,disableVirtualization:me.default.bool,editMode:me.default.oneOf(["cell","row"]),estimatedRowCount:me.default.number,experimentalFeatures:me.default.shape({warnIfFocusStateIsNotSynced:me.default.bool}),filterDebounceMs:me.default.number,filterMode:me.default.oneOf(["client","server"]),filterModel:me.default.shape({items:me.default.arrayOf(me.default.shape({field:me.default.string.isRequired,id:me.default.oneOfType([me.default.number,me.default.string]),operator:me.default.string.isRequired,value:me.default.any})).isRequired,logicOperator:me.default.oneOf(["and","or"]),quickFilterExcludeHiddenColumns:me.default.bool,quickFilterLogicOperator:me.default.oneOf(["and","or"]),quickFilterValues:me.default.array}),getCellClassName:me.default.func,getDetailPanelContent:me.default.func,getEstimatedRowHeight:me.default.func,getRowClassName:me.default.func,getRowHeight:me.default.func,getRowId:me.default.func,getRowSpacing:me.default.func,hideFooter:me.default.bool,hideFooterPagination:me.default.bool,hideFooterSelectedRowCount:me.default.bool,ignoreDiacritics:me.default.bool,ignoreValueFormatterDuringExport:me.default.oneOfType([me.default.shape({clipboardExport:me.default.bool,csvExport:me.default.bool}),me.default.bool]),initialState:me.default.object,isCellEditable:me.default.func,isRowSelectable:me.default.func,keepNonExistentRowsSelected:me.default.bool,label:me.default.string,loading:me.default.bool,localeText:me.default.object,logger:me.default.shape({debug:me.default.func.isRequired,error:me.default.func.isRequired,info:me.default.func.isRequired,warn:me.default.func.isRequired}),logLevel:me.default.oneOf(["debug","error","info","warn",!1]),nonce:me.default.string,onCellClick:me.default.func,onCellDoubleClick:me.default.func,onCellEditStart:me.default.func,onCellEditStop:me.default.func,onCellKeyDown:me.default.func,onCellModesModelChange:me.default.func,onClipboardCopy:me.default.func,onColumnHeaderClick:me.default.func,onColumnHeaderContextMenu:me.default.func,onColumnHeaderDoubleClick:me.default.func,onColumnHeaderEnter:me.default.func,onColumnHeaderLeave:me.default.func,onColumnHeaderOut:me.default.func,onColumnHeaderOver:me.default.func,onColumnOrderChange:me.default.func,onColumnResize:me.default.func,onColumnVisibilityModelChange:me.default.func,onColumnWidthChange:me.default.func,onDataSourceError:me.default.func,onDensityChange:me.default.func,onFilterModelChange:me.default.func,onMenuClose:me.default.func,onMenuOpen:me.default.func,onPaginationMetaChange:me.default.func,onPaginationModelChange:me.default.func,onPreferencePanelClose:me.default.func,onPreferencePanelOpen:me.default.func,onProcessRowUpdateError:me.default.func,onResize:me.default.func,onRowClick:me.default.func,onRowCountChange:me.default.func,onRowDoubleClick:me.default.func,onRowEditStart:me.default.func,onRowEditStop:me.default.func,onRowModesModelChange:me.default.func,onRowSelectionModelChange:me.default.func,onSortModelChange:me.default.func,onStateChange:me.default.func,pageSizeOptions:me.default.arrayOf(me.default.oneOfType([me.default.number,me.default.shape({label:me.default.string.isRequired,value:me.default.number.isRequired})]).isRequired),pagination:me.default.oneOf([!0]),paginationMeta:me.default.shape({hasNextPage:me.default.bool}),paginationMode:me.default.oneOf(["client","server"]),paginationModel:me.default.shape({page:me.default.number.isRequired,pageSize:me.default.number.isRequired}),processRowUpdate:me.default.func,resizeThrottleMs:me.default.number,rowBufferPx:me.default.number,rowCount:me.default.number,rowHeight:me.default.number,rowModesModel:me.default.object,rows:me.default.arrayOf(me.default.object),rowSelection:me.default.bool,rowSelectionModel:me.default.shape({ids:me.default.instanceOf(Set).isRequired,type:me.default.oneOf(["exclude","include"]).isRequired}),rowSpacingType:me.default.oneOf(["border","margin"]),rowSpanning:me.default.bool,scrollbarSize:me.default.number,showCellVerticalBorder:me.default.bool,showColumnVerticalBorder:me.default.bool,showToolbar:me.default.bool,slotProps:me.default.object,slots:me.default.object,sortingMode:me.default.oneOf(["client","server"]),sortingOrder:me.default.arrayOf(me.default.oneOf(["asc","desc"])),sortModel:me.default.arrayOf(me.default.shape({field:me.default.string.isRequired,sort:me.default.oneOf(["asc","desc"])})),style:me.default.object,sx:me.default.oneOfType([me.default.arrayOf(me.default.oneOfType([me.default.func,me.default.object,me.default.bool])),me.default.func,me.default.object]),virtualizeColumnsWithAutoRowHeight:me.default.bool};function L8e(e){let t=ul();t.set("currency",e.targetCurrency),t.set("group_by",e.groupBy);let r=`investments?${t}`;return ws({queryKey:[r],queryFn:()=>ll(r)})}var bce=z(Q());function Z5(){let{t:e}=Nr();return{returns:{label:e("Returns"),unit:"percent",supportSeries:!0},irr:{label:e("Internal Rate of Return"),unit:"percent",supportSeries:!1},mdm:{label:e("Modified Dietz Method"),unit:"percent",supportSeries:!1},twr:{label:e("Time-Weighted Rate of Return"),unit:"percent",supportSeries:!0},pnl:{label:e("Total Profit and Loss"),unit:"currency",supportSeries:!0},volatility:{label:e("Volatility"),unit:"percent",supportSeries:!1},mdd:{label:e("Maximum Drawdown"),unit:"percent",supportSeries:!0}}}function CA(e){return Z5()[e]}function kR({options:e,value:t,setValue:r}){let o=Z5();return(0,bce.jsx)(wp,{value:t,onChange:n=>r(n.target.value),displayEmpty:!0,size:"small",children:e.map(n=>(0,bce.jsx)(Uf,{value:n,children:o[n].label},n))})}var Pa=z(Q()),xVt=Hr.object({liquidated:Hr.boolean().default(!1).catch(!1)}),Sce=Nn({getParentRoute:()=>$n,path:"investments",validateSearch:xVt,search:{middlewares:[Qa({liquidated:!1})]},staticData:{showInvestmentsSelection:!1},component:bVt});function bVt(){let{t:e}=Nr(),[t,r]=za(Sce,"liquidated");return(0,Pa.jsx)(ps,{children:(0,Pa.jsx)(Bn,{children:(0,Pa.jsx)(Uo,{title:e("Investments"),help:e("Lists the investments defined in the beangrow configuration file."),children:(0,Pa.jsx)(Tce,{groupBy:"currency",includeLiquidated:t,setIncludeLiquidated:r})})})})}function Tce({groupBy:e,includeLiquidated:t,setIncludeLiquidated:r}){let{t:o}=Nr(),n=lo(),{targetCurrency:i}=gi(),a=Zj(),s=Bx({fixed:!0}),{isPending:l,error:u,data:c}=L8e({targetCurrency:i,groupBy:e}),p=Z5();if(l)return(0,Pa.jsx)(ja,{});if(u)return(0,Pa.jsx)(un,{severity:"error",children:u.message});if(Object.keys(c.investments).length===0)return(0,Pa.jsx)(un,{severity:"info",children:o(e==="group"?"No groups defined in the beangrow configuration.":"No investments defined in the beangrow configuration.")});let f=c.investments;t||(f=f.filter(h=>h.marketValue>0));let d=h=>Math.abs(h)>=.01,m=[{field:"name",headerName:o("Name"),flex:1,renderCell:({row:h})=>(0,Pa.jsx)(Ia,{to:"/portfolio",search:{investments:h.id,currency:h.currency},children:h.name})},{field:"units",headerName:o("Units"),headerAlign:"center",align:"right",minWidth:130,renderCell:({row:h})=>(0,Pa.jsx)("div",{children:h.units.map((g,v)=>(0,Pa.jsxs)("span",{children:[a(g.number)," ",g.currency,(0,Pa.jsx)("br",{})]},v))})},{field:"costValue",headerName:o("Cost Value"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>d(g.costValue)?`${a(g.costValue)} ${g.currency}`:""},{field:"marketValue",headerName:o("Market Value"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>d(g.marketValue)?`${a(g.marketValue)} ${g.currency}`:""},{field:"realizedPnl",headerName:o("Realized P/L"),description:o("Realized Profit and Loss: P&L from sold assets"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>d(g.realizedPnl)?`${a(g.realizedPnl)} ${g.currency}`:"",cellClassName:({row:h})=>h.realizedPnl>=0?"positive":"negative"},{field:"unrealizedPnl",headerName:o("Unrealized P/L"),description:o("Unrealized Profit and Loss: P&L from open positions (excluding fees)"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>d(g.unrealizedPnl)?`${a(g.unrealizedPnl)} ${g.currency}`:"",cellClassName:({row:h})=>h.unrealizedPnl>=0?"positive":"negative"},{field:"totalPnl",headerName:o("Total P/L"),description:o("Total Profit and Loss"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>`${a(g.totalPnl)} ${g.currency}`,cellClassName:({row:h})=>h.totalPnl>=0?"positive":"negative"},{field:"irr",headerName:o("IRR"),description:p.irr.label,headerAlign:"center",align:"right",minWidth:80,valueFormatter:(h,g)=>s(g.irr),cellClassName:({row:h})=>h.irr>=0?"positive":"negative"},{field:"mdm",headerName:o("MDM"),description:p.mdm.label,headerAlign:"center",align:"right",minWidth:80,valueFormatter:(h,g)=>s(g.mdm),cellClassName:({row:h})=>h.mdm>=0?"positive":"negative"},{field:"twr",headerName:o("TWR"),description:p.twr.label,headerAlign:"center",align:"right",minWidth:80,valueFormatter:(h,g)=>s(g.twr),cellClassName:({row:h})=>h.twr>=0?"positive":"negative"},{field:"mdd",headerName:o("MDD"),description:o("Maximum Drawdown"),headerAlign:"center",align:"right",minWidth:80,valueFormatter:(h,g)=>s(g.mdd)}];return(0,Pa.jsxs)(Pa.Fragment,{children:[(0,Pa.jsx)(A8e,{columns:m,rows:f,density:"compact",getRowHeight:()=>"auto",getRowClassName:h=>h.indexRelativeToCurrentPage%2===0?"even":"odd",rowSelection:!1,initialState:{sorting:{sortModel:[{field:"name",sort:"asc"}]}},sx:{"& p":{margin:0},".MuiDataGrid-cell":{px:1,py:.5},".MuiDataGrid-cell:not([data-field='name'])":{fontFamily:"var(--font-family-monospaced)"},".even":{backgroundColor:n.palette.action.hover},".MuiDataGrid-row:hover":{backgroundColor:Nl(n.palette.action.hover,.1)},".positive":{color:n.pnl.profit},".negative":{color:n.pnl.loss}}}),(0,Pa.jsx)(WC,{children:(0,Pa.jsx)(yg,{control:(0,Pa.jsx)(pm,{checked:t,onChange:(h,g)=>r(g)}),label:o("Include liquidated investments")})})]})}var PA=z(Q()),SVt=Hr.object({liquidated:Hr.boolean().default(!1).catch(!1)}),wce=Nn({getParentRoute:()=>$n,path:"groups",validateSearch:SVt,search:{middlewares:[Qa({liquidated:!1})]},staticData:{showInvestmentsSelection:!1,showCurrencySelection:!1},component:TVt});function TVt(){let{t:e}=Nr(),[t,r]=za(wce,"liquidated");return(0,PA.jsx)(ps,{children:(0,PA.jsx)(Bn,{children:(0,PA.jsx)(Uo,{title:e("Groups"),help:e("Lists the groups defined in the beangrow configuration file."),children:(0,PA.jsx)(Tce,{groupBy:"group",includeLiquidated:t,setIncludeLiquidated:r})})})})}var io=z(Q()),N8e=Nn({getParentRoute:()=>$n,path:"help",staticData:{showInvestmentsSelection:!1,showDateRangeSelection:!1,showCurrencySelection:!1},component:wVt});function wVt(){let{t:e}=Nr(),t=[{id:"calculating-portfolio-returns",title:e("Calculating Portfolio Returns"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"fava-portfolio-returns supports multiple ways to calculate the portfolio performance."})}),children:[{id:"returns",title:e("Returns"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Returns compares market value to cost value. In the Performance chart, the percentage difference between market value and cost value is calculated at each price or volume change. The values are aligned at 0% to make them comparable with the performance of other groups and commodities."})})},{id:"total-profit-and-loss",title:e("Total Profit and Loss"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Total Profit and Loss computes the difference between the market value and the invested capital (sum of incoming and outgoing cash flows, including dividends and fees)."})})},{id:"irr",title:e("Internal Rate of Return (IRR)"),body:(0,io.jsxs)(Zd,{children:[(0,io.jsx)("p",{children:"Internal Rate of Return (IRR) accounts for the timing and magnitude of cash flows."}),(0,io.jsxs)("p",{children:["For example, you invest 100 USD on the first day of January, and an additional 20 USD on the first day of February. At the end of February, the investment is worth 200 USD. In other words, you invested 100 USD for two months (59 days), and 20 USD for one month (28 days). IRR calculates ",(0,io.jsx)("code",{children:"x"})," of the following formula: ",(0,io.jsx)("code",{children:"100*(1+x)^(59/365) + 20*(1+x)^(28/365) = 200"}),"."]}),(0,io.jsx)("p",{children:"This metric is recommended when you are in control of the cash flows."})]})},{id:"mdm",title:e("Modified Dietz Method (MDM)"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Modified Dietz Method (MDM) accounts for the timing and magnitude of cash flows. It approximates the Internal Rate of Return."})})},{id:"twr",title:e("Time-Weighted Rate of Return (TWR)"),body:(0,io.jsxs)(Zd,{children:[(0,io.jsx)("p",{children:"Time-Weighted Return (TWR) eliminates the effects of cash flows."}),(0,io.jsxs)("p",{children:["For example, you invest 100 USD in January. In June, your investment is worth 150 USD. The returns on this investment are 50% (",(0,io.jsx)("code",{children:"150/100-1"}),"). Because of these returns, you decide to invest an additional 100 USD. Now, the returns dropped to 25% (",(0,io.jsx)("code",{children:"250/200-1"}),"), even though the price of the commodity did not change. The TWR eliminates this effect, which allows us to compare different portfolios without the effects of cash flows. TWR includes dividends and fees."]}),(0,io.jsx)("p",{children:"This metric is recommended for comparing two funds or portfolios."})]})}]},{id:"risk-metrics",title:e("Risk Metrics"),children:[{id:"volatility",title:e("Volatility"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Volatility measures how strongly returns vary over time. It is based on period returns from the Time-Weighted Rate of Return (TWR), so the effects of cash flows are eliminated. The value shown is annualized: higher volatility means larger return swings (more risk), lower volatility means more stable returns."})})},{id:"mdd",title:e("Maximum Drawdown (MDD)"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Maximum Drawdown computes the maximum decline from a historical peak. It is based on the TWR (i.e. effects of cash flows are eliminated) by tracking the running peak of the TWR and comparing the current value to the peak."})})}]}],r=(n,i)=>(0,io.jsx)("ul",{style:{paddingLeft:`${n}em`},children:i.map(a=>(0,io.jsxs)("li",{style:{listStyle:"none"},children:[(0,io.jsx)(Ia,{to:".",hash:a.id,children:n==0?(0,io.jsx)("strong",{children:a.title}):a.title}),a.children&&r(n+1,a.children)]},a.id))}),o=(n,i)=>i.map(a=>(0,io.jsxs)("section",{"aria-labelledby":a.id,children:[n==0?(0,io.jsx)("h2",{id:a.id,children:a.title}):(0,io.jsx)("h3",{id:a.id,children:a.title}),a.body,a.children&&o(n+1,a.children)]},a.id));return(0,io.jsxs)("div",{className:"help-text",children:[(0,io.jsxs)("nav",{"aria-label":e("Table of contents"),children:[(0,io.jsx)("h2",{children:e("Table of contents")}),r(0,t)]}),o(0,t)]})}function q5(e){let t=ul();t.set("investments",e.investmentFilter.join(",")),t.set("currency",e.targetCurrency),t.set("metric",e.metric),t.set("interval",e.interval);let r=`metric_values?${t}`;return ws({queryKey:[r],queryFn:()=>ll(r)})}var Wn=z(Q()),z8e=["volatility","mdd"],_Vt=Hr.object({metric:Hr.enum(z8e).default("volatility").catch("volatility")}),_ce=Nn({getParentRoute:()=>$n,path:"metrics",validateSearch:_Vt,search:{middlewares:[Qa({metric:"volatility"})]},component:CVt});function CVt(){let{t:e}=Nr(),[t,r]=za(_ce,"metric"),o=CA(t),n=o.supportSeries?o.label:e("{{metricName}} (rolling 1y)",{metricName:o.label});return(0,Wn.jsxs)(ps,{children:[(0,Wn.jsx)(Bn,{sx:{justifyContent:"flex-end"},children:(0,Wn.jsx)(kR,{options:z8e,value:t,setValue:r})}),(0,Wn.jsx)(Bn,{children:(0,Wn.jsx)(Uo,{title:n,children:(0,Wn.jsx)(PVt,{metric:t})})}),(0,Wn.jsx)(Bn,{children:(0,Wn.jsx)(Uo,{title:e("Monthly Heatmap"),children:(0,Wn.jsx)(Cce,{metric:t})})}),(0,Wn.jsxs)(Bn,{children:[(0,Wn.jsx)(Uo,{title:e("Years"),children:(0,Wn.jsx)(RA,{metric:t,interval:"yearly"})}),(0,Wn.jsx)(Uo,{title:e("Periods"),children:(0,Wn.jsx)(RA,{metric:t,interval:"periods"})})]})]})}function PVt({metric:e}){let{investmentFilter:t,targetCurrency:r}=gi(),o=CA(e),n=Qp(r,{integer:!0}),i=Bx(),a=o.unit==="currency"?n:i,{isPending:s,error:l,data:u}=q5({investmentFilter:t,targetCurrency:r,metric:e,interval:o.supportSeries?"series":"rolling_1y"});if(s)return(0,Wn.jsx)(ja,{});if(l)return(0,Wn.jsx)(un,{severity:"error",children:l.message});let c={tooltip:{trigger:"axis",valueFormatter:eu(a)},grid:{left:120,right:100},xAxis:{type:"time"},yAxis:{type:"value",axisLabel:{formatter:a}},series:{type:"line",name:o.label,showSymbol:!1,data:u.series}};return(0,Wn.jsx)(qu,{height:"400px",option:c})}function Cce({metric:e}){let{t}=Nr(),r=lo(),{investmentFilter:o,targetCurrency:n}=gi(),i=CA(e),a=Qp(n,{integer:!0}),s=Bx(),l=i.unit==="currency"?a:s,{isPending:u,error:c,data:p}=q5({investmentFilter:o,targetCurrency:n,metric:e,interval:"heatmap"});if(u)return(0,Wn.jsx)(ja,{});if(c)return(0,Wn.jsx)(un,{severity:"error",children:c.message});let f=Math.max(...p.series.map(([y,x])=>y.includes("-")?Math.abs(x):0)),d=Math.round(f*100)/100,m=new Intl.DateTimeFormat(void 0,{month:"short"}).format,h={tooltip:{position:"top",valueFormatter:eu(l)},grid:{bottom:100},xAxis:{type:"category"},yAxis:{type:"category"},visualMap:{min:-d,max:d,calculable:!0,orient:"horizontal",left:"center",bottom:0,itemHeight:400,inRange:{color:[r.pnl.loss,"#fff",r.pnl.profit]},formatter:eu(l)},series:[{type:"heatmap",data:p.series.map(([y,x])=>{if(!y.includes("-"))return[t("Entire Year"),y,x];let[b,S]=y.split("-"),T=m(new Date(parseInt(b),parseInt(S)-1,1)),w=Math.round((x+Number.EPSILON)*1e4)/1e4+0;return[T,b,w]}),label:{show:!0,formatter:({data:y})=>l(y[2])},emphasis:{itemStyle:{shadowBlur:10,shadowColor:"rgba(0, 0, 0, 0.5)"}}}]},v=170+p.series.filter(([y])=>!y.includes("-")).length*40;return(0,Wn.jsx)(qu,{height:`${v}px`,option:h})}function RA({metric:e,interval:t}){let{t:r}=Nr(),o=lo(),{investmentFilter:n,targetCurrency:i}=gi(),a=CA(e),s=Qp(i,{integer:!0}),l=Bx(),u=a.unit==="currency"?s:l,{isPending:c,error:p,data:f}=q5({investmentFilter:n,targetCurrency:i,metric:e,interval:t});if(c)return(0,Wn.jsx)(ja,{});if(p)return(0,Wn.jsx)(un,{severity:"error",children:p.message});let d={tooltip:{trigger:"axis",valueFormatter:eu(u)},xAxis:{type:"category"},yAxis:{type:"value",axisLabel:{formatter:u}},series:[{type:"bar",name:r("Returns"),data:f.series,itemStyle:{color:m=>m.data[1]>=0?o.pnl.profit:o.pnl.loss}}]};return(0,Wn.jsx)(qu,{height:"400px",option:d})}function F8e(){let t=`missing_prices?${ul()}`;return ws({queryKey:[t],queryFn:()=>ll(t)})}var li=z(Q()),U8e=Nn({getParentRoute:()=>$n,path:"missing_prices",staticData:{showInvestmentsSelection:!1,showDateRangeSelection:!1,showCurrencySelection:!1},component:RVt});function RVt(){let{t:e}=Nr(),{isPending:t,error:r,data:o}=F8e();if(t)return(0,li.jsx)(ja,{});if(r)return(0,li.jsx)(un,{severity:"error",children:r.message});if(o.missingPrices.length===0)return(0,li.jsx)(un,{severity:"info",children:e("All required prices are available in the ledger.")});let n=i=>{let a=i.currentTarget,s=new Range;s.setStart(a,0),s.setEnd(a,1),window.getSelection()?.removeAllRanges(),window.getSelection()?.addRange(s)};return(0,li.jsxs)(ps,{children:[(0,li.jsx)(Bn,{children:(0,li.jsx)(Uo,{title:e("Fetch Required Prices"),help:e("Run the following commands and append the output to your ledger:"),children:(0,li.jsx)("pre",{onDoubleClick:n,children:o.commands.join(`
+`));r[e.field]=t;return}let{groupId:o,children:n}=e;n.forEach(i=>{VWe(i,[...t,o],r)})},H5=e=>{if(!e)return{};let t={};return e.forEach(r=>{VWe(r,[],t)}),t},j5=(e,t,r)=>{let o=l=>t[l]??[],n=[],i=Math.max(0,...e.map(l=>o(l).length)),a=(l,u,c)=>{let p=o(l),f=o(u);for(let d=0;d<=c;d+=1)if(p[d]!==f[d])return!1;return!0},s=(l,u)=>{let c=r?.left,p=r?.right,f=!!c?.includes(l),d=!!c?.includes(u),m=!!p?.includes(l),h=!!p?.includes(u);return f!==d||m!==h};for(let l=0;l<i;l+=1){let u=[];for(let c=0;c<e.length;c+=1){let p=e[c],f=o(p)[l]??null;if(u.length===0){u.push({columnFields:[p],groupId:f});continue}let d=u[u.length-1],m=d.columnFields[d.columnFields.length-1];d.groupId!==f||!a(m,p,l)||s(m,p)?u.push({columnFields:[p],groupId:f}):d.columnFields.push(p)}n.push(u)}return n};var $We=(e,t,r)=>{if(r.current.caches.columnGrouping={lastColumnGroupingModel:t.columnGroupingModel},!t.columnGroupingModel)return A({},e,{columnGrouping:void 0});let o=bl(r),n=nv(r),i=G5(t.columnGroupingModel??[]),a=H5(t.columnGroupingModel??[]),s=j5(o,a,r.current.state.pinnedColumns??{}),l=n.length===0?0:Math.max(...n.map(u=>a[u]?.length??0));return A({},e,{columnGrouping:{lookup:i,unwrappedGroupingModel:a,headerStructure:s,maxDepth:l}})},BWe=(e,t)=>{let r=XT.useCallback(s=>e5(e)[s]??[],[e]),o=XT.useCallback(()=>t5(e),[e]);It(e,{getColumnGroupPath:r,getAllGroupDetails:o},"public");let i=XT.useCallback(()=>{let s=H5(t.columnGroupingModel??[]);e.current.setState(l=>{let u=l.columns?.orderedFields??[],c=l.pinnedColumns??{},p=j5(u,s,c);return A({},l,{columnGrouping:A({},l.columnGrouping,{headerStructure:p})})})},[e,t.columnGroupingModel]),a=XT.useCallback(s=>{if(!s&&!e.current.caches.columnGrouping.lastColumnGroupingModel)return;e.current.caches.columnGrouping.lastColumnGroupingModel=s;let l=e.current.getPinnedColumns?.()??{},u=bl(e),c=nv(e),p=G5(s??[]),f=H5(s??[]),d=j5(u,f,l),m=c.length===0?0:Math.max(...c.map(h=>f[h]?.length??0));e.current.setState(h=>A({},h,{columnGrouping:{lookup:p,unwrappedGroupingModel:f,headerStructure:d,maxDepth:m}}))},[e]);ot(e,"columnIndexChange",i),ot(e,"columnsChange",()=>{a(t.columnGroupingModel)}),ot(e,"columnVisibilityModelChange",()=>{a(t.columnGroupingModel)}),XT.useEffect(()=>{t.columnGroupingModel!==e.current.caches.columnGrouping.lastColumnGroupingModel&&a(t.columnGroupingModel)},[e,a,t.columnGroupingModel])};var ec=z(K(),1);function GWe(){let e,t,r=new Promise((o,n)=>{e=o,t=n});return r.resolve=e,r.reject=t,r}function HWe(e,t){if(t!==void 0&&e.changedTouches){for(let r=0;r<e.changedTouches.length;r+=1){let o=e.changedTouches[r];if(o.identifier===t)return{x:o.clientX,y:o.clientY}}return!1}return{x:e.clientX,y:e.clientY}}function jWe(e,t,r,o){let n=e;return o==="Right"?n+=t-r.left:n+=r.right-t,Math.round(n)}function YUt(e,t,r){return r==="Left"?e-t.left:t.right-e}function ZUt(e){return e==="Right"?"Left":"Right"}function qUt(e,t){let r=e.classList.contains(Z["columnSeparator--sideRight"])?"Right":"Left";return t?ZUt(r):r}function WWe(e,t){return t===tf.LEFT?e?"--DataGrid-rightPinnedWidth":"--DataGrid-leftPinnedWidth":e?"--DataGrid-leftPinnedWidth":"--DataGrid-rightPinnedWidth"}function YWe(e,t,r){return r===tf.LEFT?t?e.rightPinnedWidth:e.leftPinnedWidth:t?e.leftPinnedWidth:e.rightPinnedWidth}function ZWe(e){e.preventDefault(),e.stopImmediatePropagation()}function KUt(e){let t=ec.useRef(void 0),r=()=>I4e(e),o=Se(e,r);return ec.useEffect(()=>{t.current&&o===!1&&(t.current.resolve(),t.current=void 0)}),()=>{if(!t.current){if(r()===!1)return Promise.resolve();t.current=GWe()}return t.current}}function XUt(e,t){if(e.length<4)return e;let r=e.slice();r.sort((s,l)=>s-l);let o=r[Math.floor(r.length*.25)],n=r[Math.floor(r.length*.75)-1],i=n-o,a=i<5?5:i*t;return r.filter(s=>s>o-a&&s<n+a)}function QUt(e,t,r){let o={},n=e.current.rootElementRef.current;n.classList.add(Z.autosizing);let i=t.includeHeaderFilters&&Q4(e);return r.forEach(a=>{let l=L5e(e.current,a.field).map(h=>h.getBoundingClientRect().width??0),u=t.includeOutliers?l:XUt(l,t.outliersFactor);if(t.includeHeaders){let h=k5e(e.current,a.field);if(h){let g=h.querySelector(`.${Z.columnHeaderTitleContainer}`),v=Array.from(g.children),y=h.querySelector(`.${Z.menuIcon}`),x=window.getComputedStyle(g,null),b=parseInt(x.gap,10)||0,S=window.getComputedStyle(h,null),T=parseInt(S.paddingLeft,10)+parseInt(S.paddingRight,10),w=0,C=0;for(let R=0;R<v.length;R+=1){let M=v[R];M.clientWidth>0&&(w+=1,C+=M.scrollWidth)}C+=1;let P=C+b*(w-1)+T+(y?.clientWidth??0);u.push(P)}}if(i){let h=A5e(e.current,a.field);if(h){let g=window.getComputedStyle(h,null),v=parseInt(g.paddingLeft,10)+parseInt(g.paddingRight,10),x=h.scrollWidth+v;u.push(x)}}let c=a.minWidth!==-1/0&&a.minWidth!==void 0,p=a.maxWidth!==1/0&&a.maxWidth!==void 0,f=c?a.minWidth:0,d=p?a.maxWidth:1/0,m=u.length===0?0:Math.max(...u);o[a.field]=Ym(m,f,d)}),n.classList.remove(Z.autosizing),o}var qWe=e=>A({},e,{columnResize:{resizingColumnField:""}});function JUt(){return{colDef:void 0,initialColWidth:0,initialTotalWidth:0,previousMouseClickEvent:void 0,columnHeaderElement:void 0,headerFilterElement:void 0,groupHeaderElements:[],cellElements:[],leftPinnedCellsAfter:[],rightPinnedCellsBefore:[],fillerLeft:void 0,fillerRight:void 0,leftPinnedHeadersAfter:[],rightPinnedHeadersBefore:[]}}var KWe=(e,t)=>{let r=ro(),o=no(e,"useGridColumnResize"),n=Fo(JUt).current,i=ec.useRef(null),a=ec.useRef(null),s=Vn(),l=ec.useRef(void 0),u=R=>{o.debug(`Updating width to ${R} for col ${n.colDef.field}`);let M=n.columnHeaderElement.offsetWidth,E=R-M,I=R-n.initialColWidth;if(I>0){let F=n.initialTotalWidth+I;e.current.rootElementRef?.current?.style.setProperty("--DataGrid-rowWidth",`${F}px`)}n.colDef.computedWidth=R,n.colDef.width=R,n.colDef.flex=0,n.columnHeaderElement.style.width=`${R}px`;let k=n.headerFilterElement;k&&(k.style.width=`${R}px`),n.groupHeaderElements.forEach(F=>{let V=F,B;V.getAttribute("aria-colspan")==="1"?B=`${R}px`:B=`${V.offsetWidth+E}px`,V.style.width=B}),n.cellElements.forEach(F=>{let V=F,B;V.getAttribute("aria-colspan")==="1"?B=`${R}px`:B=`${V.offsetWidth+E}px`,V.style.setProperty("--width",B)});let N=Jr(e),O=e.current.unstable_applyPipeProcessors("isColumnPinned",!1,n.colDef.field);O===tf.LEFT&&(IR(n.fillerLeft,"width",E),n.leftPinnedCellsAfter.forEach(F=>{IR(F,"left",E)}),n.leftPinnedHeadersAfter.forEach(F=>{IR(F,"left",E)}),e.current.rootElementRef?.current?.style.setProperty(WWe(r,O),`${YWe(N,r,O)+I}px`)),O===tf.RIGHT&&(IR(n.fillerRight,"width",E),n.rightPinnedCellsBefore.forEach(F=>{IR(F,"right",E)}),n.rightPinnedHeadersBefore.forEach(F=>{IR(F,"right",E)}),e.current.rootElementRef?.current?.style.setProperty(WWe(r,O),`${YWe(N,r,O)+I}px`))},c=R=>{if(y(),n.previousMouseClickEvent){let M=n.previousMouseClickEvent,E=M.timeStamp,I=M.clientX,k=M.clientY;if(R.timeStamp-E<300&&R.clientX===I&&R.clientY===k){n.previousMouseClickEvent=void 0,e.current.publishEvent("columnResizeStop",null,R);return}}if(n.colDef){e.current.setColumnWidth(n.colDef.field,n.colDef.width),o.debug(`Updating col ${n.colDef.field} with new width: ${n.colDef.width}`);let M=ou(e);n.groupHeaderElements.forEach(E=>{let I=_5e(E),k=E,O=`${I.reduce((F,V)=>M.columnVisibilityModel[V]!==!1?F+M.lookup[V].computedWidth:F,0)}px`;k.style.width=O})}s.start(0,()=>{e.current.publishEvent("columnResizeStop",null,R)})},p=()=>{n.columnHeaderElement&&(n.cellElements=P5e(n.columnHeaderElement,e.current))},f=(R,M,E)=>{let I=e.current.rootElementRef.current;n.initialColWidth=R.computedWidth,n.initialTotalWidth=e.current.getRootDimensions().rowWidth,n.colDef=R,n.columnHeaderElement=w5e(e.current.columnHeadersContainerRef.current,R.field);let k=I.querySelector(`.${Z.headerFilterRow} [data-field="${sf(R.field)}"]`);k&&(n.headerFilterElement=k),n.groupHeaderElements=C5e(e.current.columnHeadersContainerRef?.current,R.field),p(),n.fillerLeft=Zue(e.current,r?"filler--pinnedRight":"filler--pinnedLeft"),n.fillerRight=Zue(e.current,r?"filler--pinnedLeft":"filler--pinnedRight");let N=e.current.unstable_applyPipeProcessors("isColumnPinned",!1,n.colDef.field);n.leftPinnedCellsAfter=N!==tf.LEFT?[]:E5e(e.current,n.columnHeaderElement,r),n.rightPinnedCellsBefore=N!==tf.RIGHT?[]:M5e(e.current,n.columnHeaderElement,r),n.leftPinnedHeadersAfter=N!==tf.LEFT?[]:D5e(e.current,n.columnHeaderElement,r),n.rightPinnedHeadersBefore=N!==tf.RIGHT?[]:O5e(e.current,n.columnHeaderElement,r),a.current=qUt(M,r),i.current=YUt(E,n.columnHeaderElement.getBoundingClientRect(),a.current)},d=Mt(c),m=Mt(R=>{if(R.buttons===0){d(R);return}let M=jWe(i.current,R.clientX,n.columnHeaderElement.getBoundingClientRect(),a.current);M=Ym(M,n.colDef.minWidth,n.colDef.maxWidth),u(M);let E={element:n.columnHeaderElement,colDef:n.colDef,width:M};e.current.publishEvent("columnResize",E,R)}),h=Mt(R=>{HWe(R,l.current)&&c(R)}),g=Mt(R=>{let M=HWe(R,l.current);if(!M)return;if(R.type==="mousemove"&&R.buttons===0){h(R);return}let E=jWe(i.current,M.x,n.columnHeaderElement.getBoundingClientRect(),a.current);E=Ym(E,n.colDef.minWidth,n.colDef.maxWidth),u(E);let I={element:n.columnHeaderElement,colDef:n.colDef,width:E};e.current.publishEvent("columnResize",I,R)}),v=Mt(R=>{let M=SR(R.target,Z["columnSeparator--resizable"]);if(!M)return;let E=R.changedTouches[0];E!=null&&(l.current=E.identifier);let I=SR(R.target,Z.columnHeader),k=T5e(I),N=e.current.getColumn(k);o.debug(`Start Resize on col ${N.field}`),e.current.publishEvent("columnResizeStart",{field:k},R),f(N,M,E.clientX);let O=uo(R.currentTarget);O.addEventListener("touchmove",g),O.addEventListener("touchend",h)}),y=ec.useCallback(()=>{let R=uo(e.current.rootElementRef.current);R.body.style.removeProperty("cursor"),R.removeEventListener("mousemove",m),R.removeEventListener("mouseup",d),R.removeEventListener("touchmove",g),R.removeEventListener("touchend",h),setTimeout(()=>{R.removeEventListener("click",ZWe,!0)},100),n.columnHeaderElement&&(n.columnHeaderElement.style.pointerEvents="unset")},[e,n,m,d,g,h]),x=ec.useCallback(({field:R})=>{e.current.setState(M=>A({},M,{columnResize:A({},M.columnResize,{resizingColumnField:R})}))},[e]),b=ec.useCallback(()=>{e.current.setState(R=>A({},R,{columnResize:A({},R.columnResize,{resizingColumnField:""})}))},[e]),S=Mt(({colDef:R},M)=>{if(M.button!==0||!M.currentTarget.classList.contains(Z["columnSeparator--resizable"]))return;M.preventDefault(),o.debug(`Start Resize on col ${R.field}`),e.current.publishEvent("columnResizeStart",{field:R.field},M),f(R,M.currentTarget,M.clientX);let E=uo(e.current.rootElementRef.current);E.body.style.cursor="col-resize",n.previousMouseClickEvent=M.nativeEvent,E.addEventListener("mousemove",m),E.addEventListener("mouseup",d),E.addEventListener("click",ZWe,!0)}),T=Mt((R,M)=>{if(t.disableAutosize||M.button!==0)return;let E=e.current.state.columns.lookup[R.field];E.resizable!==!1&&e.current.autosizeColumns(A({},t.autosizeOptions,{disableColumnVirtualization:!1,columns:[E.field]}))}),w=KUt(e),C=ec.useRef(!1),P=ec.useCallback(async R=>{if(!e.current.rootElementRef?.current||C.current)return;C.current=!0;let E=ou(e),I=A({},Jje,R,{columns:R?.columns??E.orderedFields});I.columns=I.columns.filter(N=>E.columnVisibilityModel[N]!==!1);let k=I.columns.map(N=>e.current.state.columns.lookup[N]);try{!t.disableVirtualization&&I.disableColumnVirtualization&&(e.current.unstable_setColumnVirtualization(!1),await w());let N=QUt(e,I,k),O=k.map(F=>A({},F,{width:N[F.field],computedWidth:N[F.field],flex:0}));if(I.expand){let V=E.orderedFields.map(W=>E.lookup[W]).filter(W=>E.columnVisibilityModel[W.field]!==!1).reduce((W,j)=>W+(N[j.field]??j.computedWidth??j.width),0),G=e.current.getRootDimensions().viewportInnerSize.width-V;if(G>0){let W=G/(O.length||1);O.forEach(j=>{j.width+=W,j.computedWidth+=W})}}e.current.updateColumns(O),O.forEach((F,V)=>{if(F.width!==k[V].width){let B=F.width;e.current.publishEvent("columnWidthChange",{element:e.current.getColumnHeaderElement(F.field),colDef:F,width:B})}})}finally{t.disableVirtualization||e.current.unstable_setColumnVirtualization(!0),C.current=!1}},[e,w,t.disableVirtualization]);ec.useEffect(()=>y,[y]),Ef(()=>{t.autosizeOnMount&&Promise.resolve().then(()=>{e.current.autosizeColumns(t.autosizeOptions)})}),n5(e,()=>e.current.columnHeadersContainerRef?.current,"touchstart",v,{passive:!0}),It(e,{autosizeColumns:P},"public"),ot(e,"columnResizeStop",b),ot(e,"columnResizeStart",x),ot(e,"columnSeparatorMouseDown",S),ot(e,"columnSeparatorDoubleClick",T),ot(e,"rowsSet",()=>{Qje(e)!==""&&requestAnimationFrame(()=>{p()})}),$r(e,"columnResize",t.onColumnResize),$r(e,"columnWidthChange",t.onColumnWidthChange)};function IR(e,t,r){e&&(e.style[t]=`${Math.round(parseFloat(e.style[t]))+r}px`)}var wA=z(K(),1);function XWe(e,t){return e.firstRowIndex>=t.firstRowIndex&&e.lastRowIndex<=t.lastRowIndex?null:e.firstRowIndex>=t.firstRowIndex&&e.lastRowIndex>t.lastRowIndex?{firstRowIndex:t.lastRowIndex,lastRowIndex:e.lastRowIndex}:e.firstRowIndex<t.firstRowIndex&&e.lastRowIndex<=t.lastRowIndex?{firstRowIndex:e.firstRowIndex,lastRowIndex:t.firstRowIndex-1}:e}function vce(e){return e.firstRowIndex!==0||e.lastRowIndex!==0}var W5=(e,t,r)=>{if(!e)return null;let o=e[t.field];return t.rowSpanValueGetter?t.rowSpanValueGetter(o,e,t,r):f4(e,t,r)};var eVt={spannedCells:{},hiddenCells:{},hiddenCellOriginMap:{}},tVt={firstRowIndex:0,lastRowIndex:0},QT={caches:eVt,processedRange:tVt},rVt=(e,t,r,o,n,i)=>{let a=e.current.virtualizer,s=i?QT:th.selectors.state(a.store.state),l=A({},s.caches.spannedCells),u=A({},s.caches.hiddenCells),c=A({},s.caches.hiddenCellOriginMap),p={firstRowIndex:Math.min(s.processedRange.firstRowIndex,n.firstRowIndex),lastRowIndex:Math.max(s.processedRange.lastRowIndex,n.lastRowIndex)};return t.forEach((f,d)=>{for(let m=n.firstRowIndex;m<n.lastRowIndex;m+=1){let h=r[m];if(u[h.id]?.[d])continue;let g=W5(h.model,f,e);if(g==null)continue;let v=h.id,y=m,x=0,b=[];if(m===n.firstRowIndex){let T=m-1,w=r[T];for(;T>=o.firstRowIndex&&w&&W5(w.model,f,e)===g;){let C=r[T+1];u[C.id]?u[C.id][d]=!0:u[C.id]={[d]:!0},b.push(m),x+=1,v=w.id,y=T,T-=1,w=r[T]}}b.forEach(T=>{c[T]?c[T][d]=y:c[T]={[d]:y}});let S=m+1;for(;S<=o.lastRowIndex&&r[S]&&W5(r[S].model,f,e)===g;){let T=r[S];u[T.id]?u[T.id][d]=!0:u[T.id]={[d]:!0},c[S]?c[S][d]=y:c[S]={[d]:y},S+=1,x+=1}x>0&&(l[v]?l[v][d]=x+1:l[v]={[d]:x+1})}}),{caches:{spannedCells:l,hiddenCells:u,hiddenCellOriginMap:c},processedRange:p}},QWe=e=>A({},e,{rowSpanning:QT}),JWe=(e,t)=>{let r=wA.useCallback((a,s=!1)=>{let l=e.current.virtualizer.store,{range:u,rows:c}=rh(e);if(s&&l.set("rowSpanning",QT),u===null||!vce(a))return;let p=s?QT:th.selectors.state(l.state),f=XWe({firstRowIndex:a.firstRowIndex,lastRowIndex:Math.min(a.lastRowIndex,u.lastRowIndex-u.firstRowIndex+1)},p.processedRange);if(f===null)return;let d=Gr(e),m=rVt(e,d,c,u,f,s),h=Object.keys(m.caches.spannedCells).length,g=Object.keys(m.caches.hiddenCells).length,v=Object.keys(p.caches.spannedCells).length,y=Object.keys(p.caches.hiddenCells).length;!(s||h!==v||g!==y)||h===0&&v===0||l.set("rowSpanning",m)},[e]),{schedule:o,cancel:n}=Uje(r),i=wA.useCallback(()=>{let a=lA(e);vce(a)&&o(a,!0)},[e,o]);ot(e,"renderedRowsIntervalChange",vs(t.rowSpanning,a=>{let s=n();r(a,s)})),ot(e,"sortedRowsSet",vs(t.rowSpanning,i)),ot(e,"paginationModelChange",vs(t.rowSpanning,i)),ot(e,"filteredRowsSet",vs(t.rowSpanning,i)),ot(e,"columnsChange",vs(t.rowSpanning,i)),ot(e,"rowExpansionChange",vs(t.rowSpanning,i)),wA.useEffect(()=>{let a=e.current.virtualizer?.store;a&&(t.rowSpanning?a.state.rowSpanning===QT&&r(lA(e)):a.state.rowSpanning!==QT&&a.set("rowSpanning",QT))},[e,t.rowSpanning,r])};var Y5=z(K(),1);var e8e=(e,t,r)=>A({},e,{listViewColumn:t.listViewColumn?A({},t.listViewColumn,{computedWidth:yce(r)}):void 0});function t8e(e,t){let r=()=>{e.current.setState(i=>i.listViewColumn?A({},i,{listViewColumn:A({},i.listViewColumn,{computedWidth:yce(e)})}):i)},o=Y5.useRef(null);ot(e,"viewportInnerSizeChange",i=>{o.current!==i.width&&(o.current=i.width,r())}),ot(e,"columnVisibilityModelChange",r),or(()=>{let i=t.listViewColumn;i&&e.current.setState(a=>A({},a,{listViewColumn:A({},i,{computedWidth:yce(e)})}))},[e,t.listViewColumn]),Y5.useEffect(()=>{t.listView&&!t.listViewColumn&&void 0},[t.listView,t.listViewColumn])}function yce(e){return Jr(e).viewportInnerSize.width}var i8e=z(K(),1);var Ss=z(K(),1);var r8e=Qe(Mn,Sl,bi,(e,t,r)=>({groupKeys:[],paginationModel:r,sortModel:t,filterModel:e,start:r.page*r.pageSize,end:r.page*r.pageSize+r.pageSize-1}));var Pb=(function(e){return e.Default="set-flat-rows",e.LazyLoading="replace-row-range",e.GroupedData="set-grouped-rows",e})({}),DR=class{constructor(t){this.chunkSize=t}getCacheKeys=t=>{if(this.chunkSize<1||typeof t.start!="number")return[t];let r=[];for(let o=t.start;o<=t.end;o+=this.chunkSize){let n=Math.min(o+this.chunkSize-1,t.end);r.push(A({},t,{start:o,end:n}))}return r};splitResponse=(t,r)=>{let o=this.getCacheKeys(t);if(o.length===1)return new Map([[t,r]]);let n=new Map;return o.forEach(i=>{let a=i.end===t.end,s=A({},r,{pageInfo:A({},r.pageInfo,{hasNextPage:r.pageInfo?.hasNextPage!==void 0&&!a?!0:r.pageInfo?.hasNextPage,nextCursor:r.pageInfo?.nextCursor!==void 0&&!a?r.rows[i.end+1].id:r.pageInfo?.nextCursor}),rows:typeof i.start!="number"||typeof t.start!="number"?r.rows:r.rows.slice(i.start-t.start,i.end-t.start+1)});n.set(i,s)}),n};static mergeResponses=t=>t.length===1?t[0]:t.reduce((r,o)=>A({},o,{rows:[...r.rows,...o.rows]}),{rows:[],rowCount:0,pageInfo:{}})};var oVt=["skipCache","keepChildrenExpanded"],nVt={clear:()=>{},get:()=>{},set:()=>{}};function o8e(e,t={}){return e===null?nVt:e??new d5(t)}var n8e=(e,t,r={})=>{let o=Ss.useCallback(()=>{e.current.setStrategyAvailability(cf.DataSource,Pb.Default,t.dataSource?()=>!0:()=>!1)},[e,t.dataSource]),[n,i]=Ss.useState(e.current.getActiveStrategy(cf.DataSource)),a=Ss.useMemo(()=>n===Pb.Default||n===Pb.GroupedData,[n]),s=Se(e,bi),l=Ss.useRef(0),u=t.onDataSourceError,c=Fo(()=>{if(!t.pagination)return new DR(s.pageSize);let T=t.pageSizeOptions.map(C=>typeof C=="number"?C:C.value).sort((C,P)=>C-P),w=Math.min(s.pageSize,T[0]);return new DR(w)}).current,[p,f]=Ss.useState(()=>o8e(t.dataSourceCache,r.cacheOptions)),d=Ss.useCallback(async(T,w)=>{let C=t.dataSource?.getRows;if(!C)return;if(T&&T!==ko&&t.signature!=="DataGrid"){r.fetchRowChildren?.([T]);return}r.clearDataSourceState?.();let P=w||{},{skipCache:R,keepChildrenExpanded:M}=P,E=ve(P,oVt),I=A({},r8e(e),e.current.unstable_applyPipeProcessors("getRowsParams",{}),E),N=c.getCacheKeys(I).map(F=>p.get(F));if(!R&&N.every(F=>F!==void 0)){e.current.applyStrategyProcessor("dataSourceRowsUpdate",{response:DR.mergeResponses(N),fetchParams:I,options:{skipCache:R,keepChildrenExpanded:M}});return}(a||e.current.getRowsCount()===0)&&e.current.setLoading(!0);let O=l.current+1;l.current=O;try{let F=await C(I);c.splitResponse(I,F).forEach((B,$)=>p.set($,B)),l.current===O&&e.current.applyStrategyProcessor("dataSourceRowsUpdate",{response:F,fetchParams:I,options:{skipCache:R,keepChildrenExpanded:M}})}catch(F){l.current===O&&(e.current.applyStrategyProcessor("dataSourceRowsUpdate",{error:F,fetchParams:I,options:{skipCache:R,keepChildrenExpanded:M}}),typeof u=="function"?u(new m5({message:F?.message,params:I,cause:F})):void 0)}finally{a&&l.current===O&&e.current.setLoading(!1)}},[c,p,e,a,t.dataSource?.getRows,u,r,t.signature]),m=Ss.useCallback(()=>{i(e.current.getActiveStrategy(cf.DataSource))},[e]),h=Ss.useCallback(T=>{if("error"in T){e.current.setRows([]);return}let{response:w}=T;w.rowCount!==void 0&&e.current.setRowCount(w.rowCount),e.current.setRows(w.rows),e.current.unstable_applyPipeProcessors("processDataSourceRows",{params:T.fetchParams,response:w},!0)},[e]),g=t.dataSource?.updateRow,v=r.handleEditRow,y=Ss.useCallback(async T=>{if(g)try{let w=await g(T);return typeof v=="function"?(v(T,w),w):(w&&!qa(w,T.previousRow)&&e.current.dataSource.cache.clear(),e.current.updateNestedRows([w],[]),w)}catch(w){throw typeof u=="function"?u(new h5({message:w?.message,params:T,cause:w})):void 0,w}},[e,g,u,v]),x={dataSource:{fetchRows:d,cache:p,editRow:y}},b=Ss.useMemo(()=>As(d,0),[d]),S=Ss.useRef(!0);return Ss.useEffect(()=>{if(S.current){S.current=!1;return}if(t.dataSourceCache===void 0)return;let T=o8e(t.dataSourceCache,r.cacheOptions);f(w=>w!==T?T:w)},[t.dataSourceCache,r.cacheOptions]),Ss.useEffect(()=>{if(!(n!==Pb.Default&&n!==Pb.LazyLoading&&n!==Pb.GroupedData))return t.dataSource&&(e.current.dataSource.cache.clear(),e.current.dataSource.fetchRows()),()=>{l.current+=1}},[e,t.dataSource,n]),{api:{public:x},debouncedFetchRows:b,strategyProcessor:{strategyName:Pb.Default,group:"dataSourceRowsUpdate",processor:h},setStrategyAvailability:o,cacheChunkManager:c,cache:p,events:{strategyAvailabilityChange:m,sortModelChange:vs(a,()=>b()),filterModelChange:vs(a,()=>b()),paginationModelChange:vs(a,()=>b())}}};var a8e=(e,t)=>{let{api:r,strategyProcessor:o,events:n,setStrategyAvailability:i}=n8e(e,t);It(e,r.public,"public"),fv(e,o.strategyName,o.group,o.processor),Object.entries(n).forEach(([a,s])=>{ot(e,a,s)}),i8e.useEffect(()=>{i()},[i])};var l8e=(e,t,r)=>{V3e(e,t),MWe(e,t),CWe(e),_a(F3e,e,t),_a(RWe,e,t),_a(Z3e,e,t),_a(wWe,e,t),_a(hWe,e,t),_a(SWe,e,t),_a(uWe,e,t),_a(IWe,e,t),_a(vWe,e,t),_a(sWe,e,t),_a(QWe,e,t),_a(K3e,e,t),_a(qWe,e,t),_a(j3e,e,t),_a($We,e,t),_a(E4e,e,t),_a(NWe,e,t),_a(z4e,e,t),_a(e8e,e,t),fWe(e,t),EWe(e,t),q3e(e,t),_We(e,t,r),JWe(e,t),PWe(e,t,r),UWe(e),BWe(e,t),TWe(e,t,r),cWe(e,t),yWe(e,t),lWe(e,t,r),DWe(e,t),X3e(e,t),KWe(e,t),gWe(e,t),kWe(e,t),W3e(e),eWe(e,t),nWe(e,t),H3e(e,t),zWe(e,t),AWe(e,t),FWe(e),M4e(e,t),t8e(e,t),a8e(e,t),Qu(()=>{e.current.runAppliersForPendingProcessors()}),s8e.useEffect(()=>{e.current.runAppliersForPendingProcessors()})};var OR=z(K(),1);var _9o=z(K(),1);var qc=z(K(),1);gt();var ph=z(K(),1);var u8e=z(Q(),1),iVt=e=>{let{classes:t,headerAlign:r,isDragging:o,isLastColumn:n,showLeftBorder:i,showRightBorder:a,groupId:s,pinnedPosition:l}=e,u={root:["columnHeader",r==="left"&&"columnHeader--alignLeft",r==="center"&&"columnHeader--alignCenter",r==="right"&&"columnHeader--alignRight",o&&"columnHeader--moving",a&&"columnHeader--withRightBorder",i&&"columnHeader--withLeftBorder","withBorderColor",s===null?"columnHeader--emptyGroup":"columnHeader--filledGroup",l===dr.LEFT&&"columnHeader--pinnedLeft",l===dr.RIGHT&&"columnHeader--pinnedRight",n&&"columnHeader--last"],draggableContainer:["columnHeaderDraggableContainer"],titleContainer:["columnHeaderTitleContainer","withBorderColor"],titleContainerContent:["columnHeaderTitleContainerContent"]};return ce(u,yt,t)};function c8e(e){let{groupId:t,width:r,depth:o,maxDepth:n,fields:i,height:a,colIndex:s,hasFocus:l,tabIndex:u,isLastColumn:c,pinnedPosition:p,pinnedOffset:f}=e,d=he(),m=ro(),h=ph.useRef(null),g=st(),v=Se(g,t5),y=t?v[t]:{},{headerName:x=t??"",description:b="",headerAlign:S=void 0}=y,T,w=t&&v[t]?.renderHeaderGroup,C=ph.useMemo(()=>({groupId:t,headerName:x,description:b,depth:o,maxDepth:n,fields:i,colIndex:s,isLastColumn:c}),[t,x,b,o,n,i,s,c]);t&&w&&(T=w(C));let P=A({},e,{classes:d.classes,headerAlign:S,depth:o,isDragging:!1}),R=x??t,M=Jt(),E=t===null?`empty-group-cell-${M}`:t,I=iVt(P);ph.useLayoutEffect(()=>{if(l){let B=h.current.querySelector('[tabindex="0"]')||h.current;if(!B)return;if(cb())B.focus({preventScroll:!0});else{let $=g.current.getScrollPosition();B.focus(),g.current.scroll($)}}},[g,l]);let k=ph.useCallback(V=>B=>{sh(B)||g.current.publishEvent(V,C,B)},[g,C]),N=ph.useMemo(()=>({onKeyDown:k("columnGroupHeaderKeyDown"),onFocus:k("columnGroupHeaderFocus"),onBlur:k("columnGroupHeaderBlur")}),[k]),O=typeof y.headerClassName=="function"?y.headerClassName(C):y.headerClassName,F=ph.useMemo(()=>pb(A({},e.style),m,p,f),[p,f,e.style,m]);return(0,u8e.jsx)(_5,A({ref:h,classes:I,columnMenuOpen:!1,colIndex:s,height:a,isResizing:!1,sortDirection:null,hasFocus:!1,tabIndex:u,isDraggable:!1,headerComponent:T,headerClassName:O,description:b,elementId:E,width:r,columnMenuIconButton:null,columnTitleIconButtons:null,resizable:!1,label:R,"aria-colspan":i.length,"data-fields":`|-${i.join("-|-")}-|`,style:F},N))}gt();var f8e=z(Q(),1),p8e={root:Z.scrollbarFiller,pinnedRight:Z["scrollbarFiller--pinnedRight"]};function d8e({pinnedRight:e}){return(0,f8e.jsx)("div",{role:"presentation",className:le(p8e.root,e&&p8e.pinnedRight)})}var fh=z(Q(),1),m8e=ne("div",{name:"MuiDataGrid",slot:"ColumnHeaderRow"})({display:"flex"}),h8e=e=>{let{visibleColumns:t,sortColumnLookup:r,filterColumnLookup:o,columnHeaderTabIndexState:n,columnGroupHeaderTabIndexState:i,columnHeaderFocus:a,columnGroupHeaderFocus:s,headerGroupingMaxDepth:l,columnMenuState:u,columnVisibility:c,columnGroupsHeaderStructure:p,hasOtherElementInTabSequence:f}=e,[d,m]=qc.useState(""),[h,g]=qc.useState(""),v=Go(),y=he(),x=Se(v,e5),b=Se(v,nu),S=Se(v,D4e),T=Se(v,iv),w=Se(v,ys),C=kue(b,S,T.left.length),P=Se(v,MT),R=Se(v,s4),M=Se(v,eHe),E=Se(v,tHe),I=Se(v,l4),k=qc.useCallback(ee=>g(ee.field),[]),N=qc.useCallback(()=>g(""),[]),O=qc.useCallback(ee=>m(ee.field),[]),F=qc.useCallback(()=>m(""),[]),V=qc.useMemo(()=>T.left.length?{firstColumnIndex:0,lastColumnIndex:T.left.length}:null,[T.left.length]),B=qc.useMemo(()=>T.right.length?{firstColumnIndex:t.length-T.right.length,lastColumnIndex:t.length}:null,[T.right.length,t.length]);ot(v,"columnResizeStart",k),ot(v,"columnResizeStop",N),ot(v,"columnHeaderDragStart",O),ot(v,"columnHeaderDragEndNative",F);let $=ee=>{let{renderContext:de=S}=ee||{},fe=de.firstColumnIndex,ie=Math.min(de.lastColumnIndex,t.length);return{renderedColumns:t.slice(fe,ie),firstColumnToRender:fe,lastColumnToRender:ie}},G=(ee,de,fe,ie=!1)=>{let ue=ee?.position===dr.RIGHT,pe=ee?.position===void 0,ye=T.right.length>0&&ue||T.right.length===0&&pe,ze=C-fe;return(0,fh.jsxs)(qc.Fragment,{children:[pe&&(0,fh.jsx)("div",{role:"presentation",style:{width:ze}}),de,pe&&(0,fh.jsx)("div",{role:"presentation",className:le(Z.filler,ie&&Z["filler--borderBottom"])}),ye&&(0,fh.jsx)(d8e,{pinnedRight:ue})]})},W=(ee,de={})=>{let{renderedColumns:fe,firstColumnToRender:ie}=$(ee),ue=[];for(let pe=0;pe<fe.length;pe+=1){let ye=fe[pe],ze=ie+pe,Ee=ze===0,Pe=n!==null&&n.field===ye.field||Ee&&!f?0:-1,Ye=a!==null&&a.field===ye.field,_e=u.open&&u.field===ye.field,be=ee?.position,He=xb(be,ye.computedWidth,ze,b,P,I),qe=be===dr.RIGHT?fe[pe-1]:fe[pe+1],bt=qe?a!==null&&a.field===qe.field:!1,rt=pe,mr=fe.length,Ze=YT(be,rt,y.showColumnVerticalBorder,y.pinnedColumnsSectionSeparator),zt=WT(be,rt,mr,y.showColumnVerticalBorder,R,y.pinnedColumnsSectionSeparator);ue.push((0,fh.jsx)(V5e,A({},r[ye.field],{columnMenuOpen:_e,filterItemsCounter:o[ye.field]&&o[ye.field].length,headerHeight:M,isDragging:ye.field===d,colDef:ye,colIndex:ze,isResizing:h===ye.field,isLast:ze===b.length-1,hasFocus:Ye,tabIndex:Pe,pinnedPosition:be,pinnedOffset:He,isSiblingFocused:bt,showLeftBorder:Ze,showRightBorder:zt},de),ye.field))}return G(ee,ue,0)},j=()=>(0,fh.jsxs)(m8e,{role:"row","aria-rowindex":l+1,ownerState:y,className:Z["row--borderBottom"],style:{height:M},children:[V&&W({position:dr.LEFT,renderContext:V},{disableReorder:!0}),W({renderContext:S}),B&&W({position:dr.RIGHT,renderContext:B},{disableReorder:!0,separatorSide:w5.Left})]}),X=({depth:ee,params:de})=>{let fe=$(de);if(fe.renderedColumns.length===0)return null;let{firstColumnToRender:ie,lastColumnToRender:ue}=fe,pe=p[ee],ye=t[ie].field,ze=x[ye]?.[ee]??null,Ee=pe.findIndex(({groupId:Ze,columnFields:zt})=>Ze===ze&&zt.includes(ye)),Pe=t[ue-1].field,Ye=x[Pe]?.[ee]??null,_e=pe.findIndex(({groupId:Ze,columnFields:zt})=>Ze===Ye&&zt.includes(Pe)),be=pe.slice(Ee,_e+1).map(Ze=>A({},Ze,{columnFields:Ze.columnFields.filter(zt=>c[zt]!==!1)})).filter(Ze=>Ze.columnFields.length>0),He=be[0].columnFields.indexOf(ye),bt=be[0].columnFields.slice(0,He).reduce((Ze,zt)=>{let Lt=w[zt];return Ze+(Lt.computedWidth??0)},0),rt=ie,mr=be.map(({groupId:Ze,columnFields:zt},Lt)=>{let qt=s!==null&&s.depth===ee&&zt.includes(s.field),Dt=i!==null&&i.depth===ee&&zt.includes(i.field)?0:-1,ht={groupId:Ze,width:zt.reduce((ir,ar)=>ir+w[ar].computedWidth,0),fields:zt,colIndex:rt,hasFocus:qt,tabIndex:Dt},Bt=de.position,je=xb(Bt,ht.width,rt,b,P,I);rt+=zt.length;let Et=Lt;return Bt===dr.LEFT&&(Et=rt-1),(0,fh.jsx)(c8e,{groupId:Ze,width:ht.width,fields:ht.fields,colIndex:ht.colIndex,depth:ee,isLastColumn:Lt===be.length-1,maxDepth:l,height:E,hasFocus:qt,tabIndex:Dt,pinnedPosition:Bt,pinnedOffset:je,showLeftBorder:YT(Bt,Et,y.showColumnVerticalBorder,y.pinnedColumnsSectionSeparator),showRightBorder:WT(Bt,Et,be.length,y.showColumnVerticalBorder,R,y.pinnedColumnsSectionSeparator)},Lt)});return G(de,mr,bt)};return{renderContext:S,leftRenderContext:V,rightRenderContext:B,pinnedColumns:T,visibleColumns:t,columnPositions:b,getFillers:G,getColumnHeadersRow:j,getColumnsToRender:$,getColumnGroupHeadersRows:()=>{if(l===0)return null;let ee=[];for(let de=0;de<l;de+=1)ee.push((0,fh.jsxs)(m8e,{role:"row","aria-rowindex":de+1,ownerState:y,style:{height:E},children:[V&&X({depth:de,params:{position:dr.LEFT,renderContext:V,maxLastColumn:V.lastColumnIndex}}),X({depth:de,params:{renderContext:S}}),B&&X({depth:de,params:{position:dr.RIGHT,renderContext:B,maxLastColumn:B.lastColumnIndex}})]},de));return ee},getPinnedCellOffset:xb,isDragging:!!d,getInnerProps:()=>({role:"rowgroup"})}};var m9o=z(K(),1);gt();var g8e=z(Q(),1),aVt=["className"],sVt=e=>{let{classes:t}=e;return ce({root:["columnHeaders"]},yt,t)},lVt=Kt("div",{name:"MuiDataGrid",slot:"ColumnHeaders"})({display:"flex",flexDirection:"column",borderTopLeftRadius:"var(--unstable_DataGrid-radius)",borderTopRightRadius:"var(--unstable_DataGrid-radius)"}),v8e=Ke(function(t,r){let{className:o}=t,n=ve(t,aVt),i=he(),a=sVt(i);return(0,g8e.jsx)(lVt,A({className:le(a.root,o),ownerState:i},n,{role:"presentation",ref:r}))});var y8e=z(Q(),1),uVt=["className","visibleColumns","sortColumnLookup","filterColumnLookup","columnHeaderTabIndexState","columnGroupHeaderTabIndexState","columnHeaderFocus","columnGroupHeaderFocus","headerGroupingMaxDepth","columnMenuState","columnVisibility","columnGroupsHeaderStructure","hasOtherElementInTabSequence"],cVt=Ke(function(t,r){let{visibleColumns:o,sortColumnLookup:n,filterColumnLookup:i,columnHeaderTabIndexState:a,columnGroupHeaderTabIndexState:s,columnHeaderFocus:l,columnGroupHeaderFocus:u,headerGroupingMaxDepth:c,columnMenuState:p,columnVisibility:f,columnGroupsHeaderStructure:d,hasOtherElementInTabSequence:m}=t,h=ve(t,uVt),{getInnerProps:g,getColumnHeadersRow:v,getColumnGroupHeadersRows:y}=h8e({visibleColumns:o,sortColumnLookup:n,filterColumnLookup:i,columnHeaderTabIndexState:a,columnGroupHeaderTabIndexState:s,columnHeaderFocus:l,columnGroupHeaderFocus:u,headerGroupingMaxDepth:c,columnMenuState:p,columnVisibility:f,columnGroupsHeaderStructure:d,hasOtherElementInTabSequence:m});return(0,y8e.jsxs)(v8e,A({},h,g(),{ref:r,children:[y(),v()]}))}),x8e=Wa(cVt);function b8e(e){return null}function S8e(e){return null}var T8e=z(Q(),1),w8e=Ke(function(t,r){let n=st().current.getLocaleText("noResultsOverlayLabel");return(0,T8e.jsx)(db,A({},t,{ref:r,children:n}))});var F9o=z(K(),1);gt();var _8e=z(Q(),1),pVt=()=>ce({root:["bottomContainer"]},yt,{}),fVt=Kt("div",{slot:"internal",shouldForwardProp:void 0})({position:"sticky",zIndex:40,bottom:"calc(var(--DataGrid-hasScrollX) * var(--DataGrid-scrollbarSize))"});function C8e(e){let t=pVt();return(0,_8e.jsx)(fVt,A({},e,{className:le(t.root,Z["container--bottom"]),role:"presentation"}))}var P8e=A({},WGe,{cell:j4e,skeletonCell:q4e,columnHeaderFilterIconButton:W5e,columnHeaderSortIcon:H5e,columnMenu:s6e,columnHeaders:x8e,detailPanels:b8e,bottomContainer:C8e,footer:e3e,footerRowCount:u3e,toolbar:X6e,pinnedRows:S8e,loadingOverlay:o3e,noResultsOverlay:w8e,noRowsOverlay:i3e,noColumnsOverlay:a3e,pagination:lce,filterPanel:oce,columnsPanel:u6e,columnsManagement:T6e,panel:c6e,row:v3e});var dVt={disableMultipleColumnsFiltering:!0,disableMultipleColumnsSorting:!0,throttleRowsMs:void 0,hideFooterRowCount:!1,pagination:!0,checkboxSelectionVisibleOnly:!1,disableColumnReorder:!0,keepColumnPositionIfDraggedOutside:!1,signature:"DataGrid",listView:!1},mVt=e=>A({},dVt,e.dataSource?{filterMode:"server",sortingMode:"server",paginationMode:"server"}:{}),hVt=P8e,R8e=e=>{let t=lo(),r=OR.useMemo(()=>Jh({props:e,theme:t,name:"MuiDataGrid"}),[t,e]),o=OR.useMemo(()=>A({},lHe,r.localeText),[r.localeText]),n=OR.useMemo(()=>G4e({defaultSlots:hVt,slots:r.slots}),[r.slots]),i=OR.useMemo(()=>Object.keys($T).reduce((a,s)=>(a[s]=r[s]??$T[s],a),{}),[r]);return OR.useMemo(()=>A({},r,i,{localeText:o,slots:n},mVt(r)),[r,o,n,i])};var dh=z(K(),1);var _A=class{maxListeners=20;warnOnce=!1;events={};on(t,r,o={}){let n=this.events[t];n||(n={highPriority:new Map,regular:new Map},this.events[t]=n),o.isFirst?n.highPriority.set(r,!0):n.regular.set(r,!0)}removeListener(t,r){this.events[t]&&(this.events[t].regular.delete(r),this.events[t].highPriority.delete(r))}removeAllListeners(){this.events={}}emit(t,...r){let o=this.events[t];if(!o)return;let n=Array.from(o.highPriority.keys()),i=Array.from(o.regular.keys());for(let a=n.length-1;a>=0;a-=1){let s=n[a];o.highPriority.has(s)&&s.apply(this,r)}for(let a=0;a<i.length;a+=1){let s=i[a];o.regular.has(s)&&s.apply(this,r)}}once(t,r){let o=this;this.on(t,function n(...i){o.removeListener(t,n),r.apply(o,i)})}};var M8e=Symbol("mui.api_private"),gVt=e=>e.isPropagationStopped!==void 0;var E8e=0;function vVt(e){let t=e.current?.[M8e];if(t)return t;let r={},o={state:r,store:q1.create(r),instanceId:{id:E8e}};return E8e+=1,o.getPublicApi=()=>e.current,o.register=(n,i)=>{Object.keys(i).forEach(a=>{let s=i[a],l=o[a];if(l?.spying===!0?l.target=s:o[a]=s,n==="public"){let u=e.current,c=u[a];c?.spying===!0?c.target=s:u[a]=s}})},o.register("private",{caches:{},eventManager:new _A}),o}function yVt(e){return{get state(){return e.current.state},get store(){return e.current.store},get instanceId(){return e.current.instanceId},[M8e]:e.current}}function I8e(e,t){let r=dh.useRef(null),o=dh.useRef(null);o.current||(o.current=vVt(r)),r.current||(r.current=yVt(o));let n=dh.useCallback((...a)=>{let[s,l,u={}]=a;if(u.defaultMuiPrevented=!1,gVt(u)&&u.isPropagationStopped())return;let c=t.signature===qs.DataGridPro||t.signature===qs.DataGridPremium?{api:o.current.getPublicApi()}:{};o.current.eventManager.emit(s,l,u,c)},[o,t.signature]),i=dh.useCallback((a,s,l)=>{o.current.eventManager.on(a,s,l);let u=o.current;return()=>{u.eventManager.removeListener(a,s)}},[o]);return It(o,{subscribeEvent:i,publishEvent:n},"public"),e&&!e.current?.state&&(e.current=r.current),dh.useImperativeHandle(e,()=>r.current,[r]),dh.useEffect(()=>{let a=o.current;return()=>{a.publishEvent("unmount")}},[o]),o}var xce=z(Q(),1),D8e={hooks:{useCSSVariables:$Ge,useGridAriaAttributes:y3e,useGridRowAriaAttributes:b3e,useGridRowsOverridableMethods:S3e,useGridParamsOverridableMethods:T3e,useIsCellEditable:_3e,useCellAggregationResult:()=>null,useFilterValueGetter:e=>e.current.getRowValue}},k8e=function(t,r){let o=R8e(t),n=I8e(o.apiRef,o);return l8e(n,o,D8e),(0,xce.jsx)(P3e,{privateApiRef:n,configuration:D8e,props:o,children:(0,xce.jsx)(a5e,A({className:o.className,style:o.style,sx:o.sx},o.slotProps?.root,{ref:r}))})},A8e=O8e.memo(Ke(k8e));k8e.propTypes={apiRef:me.default.shape({current:me.default.object}),"aria-label":me.default.string,"aria-labelledby":me.default.string,autoHeight:me.default.bool,autoPageSize:me.default.bool,autosizeOnMount:me.default.bool,autosizeOptions:me.default.shape({columns:me.default.arrayOf(me.default.string),disableColumnVirtualization:me.default.bool,expand:me.default.bool,includeHeaders:me.default.bool,includeOutliers:me.default.bool,outliersFactor:me.default.number}),cellModesModel:me.default.object,checkboxSelection:me.default.bool,classes:me.default.object,className:me.default.string,clipboardCopyCellDelimiter:me.default.string,columnBufferPx:me.default.number,columnFilterDebounceMs:me.default.number,columnGroupHeaderHeight:me.default.number,columnGroupingModel:me.default.arrayOf(me.default.object),columnHeaderHeight:me.default.number,columns:me.default.arrayOf(me.default.object).isRequired,columnVisibilityModel:me.default.object,dataSource:me.default.shape({getRows:me.default.func.isRequired,updateRow:me.default.func}),dataSourceCache:me.default.shape({clear:me.default.func.isRequired,get:me.default.func.isRequired,set:me.default.func.isRequired}),density:me.default.oneOf(["comfortable","compact","standard"]),disableAutosize:me.default.bool,disableColumnFilter:me.default.bool,disableColumnMenu:me.default.bool,disableColumnResize:me.default.bool,disableColumnSelector:me.default.bool,disableColumnSorting:me.default.bool,disableDensitySelector:me.default.bool,disableEval:me.default.bool,disableMultipleRowSelection:me.default.bool,disableRowSelectionExcludeModel:me.default.bool,disableRowSelectionOnClick:me.default.bool,disableVirtualization:me.default.bool,editMode:me.default.oneOf(["cell","row"]),estimatedRowCount:me.default.number,experimentalFeatures:me.default.shape({warnIfFocusStateIsNotSynced:me.default.bool}),filterDebounceMs:me.default.number,filterMode:me.default.oneOf(["client","server"]),filterModel:me.default.shape({items:me.default.arrayOf(me.default.shape({field:me.default.string.isRequired,id:me.default.oneOfType([me.default.number,me.default.string]),operator:me.default.string.isRequired,value:me.default.any})).isRequired,logicOperator:me.default.oneOf(["and","or"]),quickFilterExcludeHiddenColumns:me.default.bool,quickFilterLogicOperator:me.default.oneOf(["and","or"]),quickFilterValues:me.default.array}),getCellClassName:me.default.func,getDetailPanelContent:me.default.func,getEstimatedRowHeight:me.default.func,getRowClassName:me.default.func,getRowHeight:me.default.func,getRowId:me.default.func,getRowSpacing:me.default.func,hideFooter:me.default.bool,hideFooterPagination:me.default.bool,hideFooterSelectedRowCount:me.default.bool,ignoreDiacritics:me.default.bool,ignoreValueFormatterDuringExport:me.default.oneOfType([me.default.shape({clipboardExport:me.default.bool,csvExport:me.default.bool}),me.default.bool]),initialState:me.default.object,isCellEditable:me.default.func,isRowSelectable:me.default.func,keepNonExistentRowsSelected:me.default.bool,label:me.default.string,loading:me.default.bool,localeText:me.default.object,logger:me.default.shape({debug:me.default.func.isRequired,error:me.default.func.isRequired,info:me.default.func.isRequired,warn:me.default.func.isRequired}),logLevel:me.default.oneOf(["debug","error","info","warn",!1]),nonce:me.default.string,onCellClick:me.default.func,onCellDoubleClick:me.default.func,onCellEditStart:me.default.func,onCellEditStop:me.default.func,onCellKeyDown:me.default.func,onCellModesModelChange:me.default.func,onClipboardCopy:me.default.func,onColumnHeaderClick:me.default.func,onColumnHeaderContextMenu:me.default.func,onColumnHeaderDoubleClick:me.default.func,onColumnHeaderEnter:me.default.func,onColumnHeaderLeave:me.default.func,onColumnHeaderOut:me.default.func,onColumnHeaderOver:me.default.func,onColumnOrderChange:me.default.func,onColumnResize:me.default.func,onColumnVisibilityModelChange:me.default.func,onColumnWidthChange:me.default.func,onDataSourceError:me.default.func,onDensityChange:me.default.func,onFilterModelChange:me.default.func,onMenuClose:me.default.func,onMenuOpen:me.default.func,onPaginationMetaChange:me.default.func,onPaginationModelChange:me.default.func,onPreferencePanelClose:me.default.func,onPreferencePanelOpen:me.default.func,onProcessRowUpdateError:me.default.func,onResize:me.default.func,onRowClick:me.default.func,onRowCountChange:me.default.func,onRowDoubleClick:me.default.func,onRowEditStart:me.default.func,onRowEditStop:me.default.func,onRowModesModelChange:me.default.func,onRowSelectionModelChange:me.default.func,onSortModelChange:me.default.func,onStateChange:me.default.func,pageSizeOptions:me.default.arrayOf(me.default.oneOfType([me.default.number,me.default.shape({label:me.default.string.isRequired,value:me.default.number.isRequired})]).isRequired),pagination:me.default.oneOf([!0]),paginationMeta:me.default.shape({hasNextPage:me.default.bool}),paginationMode:me.default.oneOf(["client","server"]),paginationModel:me.default.shape({page:me.default.number.isRequired,pageSize:me.default.number.isRequired}),processRowUpdate:me.default.func,resizeThrottleMs:me.default.number,rowBufferPx:me.default.number,rowCount:me.default.number,rowHeight:me.default.number,rowModesModel:me.default.object,rows:me.default.arrayOf(me.default.object),rowSelection:me.default.bool,rowSelectionModel:me.default.shape({ids:me.default.instanceOf(Set).isRequired,type:me.default.oneOf(["exclude","include"]).isRequired}),rowSpacingType:me.default.oneOf(["border","margin"]),rowSpanning:me.default.bool,scrollbarSize:me.default.number,showCellVerticalBorder:me.default.bool,showColumnVerticalBorder:me.default.bool,showToolbar:me.default.bool,slotProps:me.default.object,slots:me.default.object,sortingMode:me.default.oneOf(["client","server"]),sortingOrder:me.default.arrayOf(me.default.oneOf(["asc","desc"])),sortModel:me.default.arrayOf(me.default.shape({field:me.default.string.isRequired,sort:me.default.oneOf(["asc","desc"])})),style:me.default.object,sx:me.default.oneOfType([me.default.arrayOf(me.default.oneOfType([me.default.func,me.default.object,me.default.bool])),me.default.func,me.default.object]),virtualizeColumnsWithAutoRowHeight:me.default.bool};function L8e(e){let t=L6(),r=ul();r.set("currency",e.targetCurrency),r.set("group_by",e.groupBy);let o=`investments_stream?${r}`;return ws({queryKey:[o],queryFn:async()=>{let n=t.getQueryData([o])===void 0,i=[];for await(let a of Vl(o))i.push(a),n&&t.setQueryData([o],{investments:[...i]});return{investments:i}}})}var bce=z(Q());function Z5(){let{t:e}=Nr();return{returns:{label:e("Returns"),unit:"percent",supportSeries:!0},irr:{label:e("Internal Rate of Return"),unit:"percent",supportSeries:!1},mdm:{label:e("Modified Dietz Method"),unit:"percent",supportSeries:!1},twr:{label:e("Time-Weighted Rate of Return"),unit:"percent",supportSeries:!0},pnl:{label:e("Total Profit and Loss"),unit:"currency",supportSeries:!0},volatility:{label:e("Volatility"),unit:"percent",supportSeries:!1},mdd:{label:e("Maximum Drawdown"),unit:"percent",supportSeries:!0}}}function CA(e){return Z5()[e]}function kR({options:e,value:t,setValue:r}){let o=Z5();return(0,bce.jsx)(wp,{value:t,onChange:n=>r(n.target.value),displayEmpty:!0,size:"small",children:e.map(n=>(0,bce.jsx)(Uf,{value:n,children:o[n].label},n))})}var Pa=z(Q()),xVt=Hr.object({liquidated:Hr.boolean().default(!1).catch(!1)}),Sce=Nn({getParentRoute:()=>$n,path:"investments",validateSearch:xVt,search:{middlewares:[Qa({liquidated:!1})]},staticData:{showInvestmentsSelection:!1},component:bVt});function bVt(){let{t:e}=Nr(),[t,r]=za(Sce,"liquidated");return(0,Pa.jsx)(ps,{children:(0,Pa.jsx)(Bn,{children:(0,Pa.jsx)(Uo,{title:e("Investments"),help:e("Lists the investments defined in the beangrow configuration file."),children:(0,Pa.jsx)(Tce,{groupBy:"currency",includeLiquidated:t,setIncludeLiquidated:r})})})})}function Tce({groupBy:e,includeLiquidated:t,setIncludeLiquidated:r}){let{t:o}=Nr(),n=lo(),{targetCurrency:i}=gi(),a=Zj(),s=Bx({fixed:!0}),{isPending:l,isFetching:x,error:u,data:c}=L8e({targetCurrency:i,groupBy:e}),p=Z5();if(l)return(0,Pa.jsx)(ja,{});if(u)return(0,Pa.jsx)(un,{severity:"error",children:u.message});if(Object.keys(c.investments).length===0)return(0,Pa.jsx)(un,{severity:"info",children:o(e==="group"?"No groups defined in the beangrow configuration.":"No investments defined in the beangrow configuration.")});let f=c.investments;t||(f=f.filter(h=>h.marketValue>0));let d=h=>Math.abs(h)>=.01,m=[{field:"name",headerName:o("Name"),flex:1,renderCell:({row:h})=>(0,Pa.jsx)(Ia,{to:"/portfolio",search:{investments:h.id,currency:h.currency},children:h.name})},{field:"units",headerName:o("Units"),headerAlign:"center",align:"right",minWidth:130,renderCell:({row:h})=>(0,Pa.jsx)("div",{children:h.units.map((g,v)=>(0,Pa.jsxs)("span",{children:[a(g.number)," ",g.currency,(0,Pa.jsx)("br",{})]},v))})},{field:"costValue",headerName:o("Cost Value"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>d(g.costValue)?`${a(g.costValue)} ${g.currency}`:""},{field:"marketValue",headerName:o("Market Value"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>d(g.marketValue)?`${a(g.marketValue)} ${g.currency}`:""},{field:"realizedPnl",headerName:o("Realized P/L"),description:o("Realized Profit and Loss: P&L from sold assets"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>d(g.realizedPnl)?`${a(g.realizedPnl)} ${g.currency}`:"",cellClassName:({row:h})=>h.realizedPnl>=0?"positive":"negative"},{field:"unrealizedPnl",headerName:o("Unrealized P/L"),description:o("Unrealized Profit and Loss: P&L from open positions (excluding fees)"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>d(g.unrealizedPnl)?`${a(g.unrealizedPnl)} ${g.currency}`:"",cellClassName:({row:h})=>h.unrealizedPnl>=0?"positive":"negative"},{field:"totalPnl",headerName:o("Total P/L"),description:o("Total Profit and Loss"),headerAlign:"center",align:"right",minWidth:130,valueFormatter:(h,g)=>`${a(g.totalPnl)} ${g.currency}`,cellClassName:({row:h})=>h.totalPnl>=0?"positive":"negative"},{field:"irr",headerName:o("IRR"),description:p.irr.label,headerAlign:"center",align:"right",minWidth:80,valueFormatter:(h,g)=>s(g.irr),cellClassName:({row:h})=>h.irr>=0?"positive":"negative"},{field:"mdm",headerName:o("MDM"),description:p.mdm.label,headerAlign:"center",align:"right",minWidth:80,valueFormatter:(h,g)=>s(g.mdm),cellClassName:({row:h})=>h.mdm>=0?"positive":"negative"},{field:"twr",headerName:o("TWR"),description:p.twr.label,headerAlign:"center",align:"right",minWidth:80,valueFormatter:(h,g)=>s(g.twr),cellClassName:({row:h})=>h.twr>=0?"positive":"negative"},{field:"mdd",headerName:o("MDD"),description:o("Maximum Drawdown"),headerAlign:"center",align:"right",minWidth:80,valueFormatter:(h,g)=>s(g.mdd)}];return(0,Pa.jsxs)(Pa.Fragment,{children:[(0,Pa.jsx)(A8e,{columns:m,rows:f,density:"compact",getRowHeight:()=>"auto",getRowClassName:h=>h.indexRelativeToCurrentPage%2===0?"even":"odd",rowSelection:!1,loading:x,slotProps:{loadingOverlay:{variant:"linear-progress"}},initialState:{sorting:{sortModel:[{field:"name",sort:"asc"}]}},sx:{"& p":{margin:0},".MuiDataGrid-cell":{px:1,py:.5},".MuiDataGrid-cell:not([data-field='name'])":{fontFamily:"var(--font-family-monospaced)"},".even":{backgroundColor:n.palette.action.hover},".MuiDataGrid-row:hover":{backgroundColor:Nl(n.palette.action.hover,.1)},".positive":{color:n.pnl.profit},".negative":{color:n.pnl.loss}}}),(0,Pa.jsx)(WC,{children:(0,Pa.jsx)(yg,{control:(0,Pa.jsx)(pm,{checked:t,onChange:(h,g)=>r(g)}),label:o("Include liquidated investments")})})]})}var PA=z(Q()),SVt=Hr.object({liquidated:Hr.boolean().default(!1).catch(!1)}),wce=Nn({getParentRoute:()=>$n,path:"groups",validateSearch:SVt,search:{middlewares:[Qa({liquidated:!1})]},staticData:{showInvestmentsSelection:!1,showCurrencySelection:!1},component:TVt});function TVt(){let{t:e}=Nr(),[t,r]=za(wce,"liquidated");return(0,PA.jsx)(ps,{children:(0,PA.jsx)(Bn,{children:(0,PA.jsx)(Uo,{title:e("Groups"),help:e("Lists the groups defined in the beangrow configuration file."),children:(0,PA.jsx)(Tce,{groupBy:"group",includeLiquidated:t,setIncludeLiquidated:r})})})})}var io=z(Q()),N8e=Nn({getParentRoute:()=>$n,path:"help",staticData:{showInvestmentsSelection:!1,showDateRangeSelection:!1,showCurrencySelection:!1},component:wVt});function wVt(){let{t:e}=Nr(),t=[{id:"calculating-portfolio-returns",title:e("Calculating Portfolio Returns"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"fava-portfolio-returns supports multiple ways to calculate the portfolio performance."})}),children:[{id:"returns",title:e("Returns"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Returns compares market value to cost value. In the Performance chart, the percentage difference between market value and cost value is calculated at each price or volume change. The values are aligned at 0% to make them comparable with the performance of other groups and commodities."})})},{id:"total-profit-and-loss",title:e("Total Profit and Loss"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Total Profit and Loss computes the difference between the market value and the invested capital (sum of incoming and outgoing cash flows, including dividends and fees)."})})},{id:"irr",title:e("Internal Rate of Return (IRR)"),body:(0,io.jsxs)(Zd,{children:[(0,io.jsx)("p",{children:"Internal Rate of Return (IRR) accounts for the timing and magnitude of cash flows."}),(0,io.jsxs)("p",{children:["For example, you invest 100 USD on the first day of January, and an additional 20 USD on the first day of February. At the end of February, the investment is worth 200 USD. In other words, you invested 100 USD for two months (59 days), and 20 USD for one month (28 days). IRR calculates ",(0,io.jsx)("code",{children:"x"})," of the following formula: ",(0,io.jsx)("code",{children:"100*(1+x)^(59/365) + 20*(1+x)^(28/365) = 200"}),"."]}),(0,io.jsx)("p",{children:"This metric is recommended when you are in control of the cash flows."})]})},{id:"mdm",title:e("Modified Dietz Method (MDM)"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Modified Dietz Method (MDM) accounts for the timing and magnitude of cash flows. It approximates the Internal Rate of Return."})})},{id:"twr",title:e("Time-Weighted Rate of Return (TWR)"),body:(0,io.jsxs)(Zd,{children:[(0,io.jsx)("p",{children:"Time-Weighted Return (TWR) eliminates the effects of cash flows."}),(0,io.jsxs)("p",{children:["For example, you invest 100 USD in January. In June, your investment is worth 150 USD. The returns on this investment are 50% (",(0,io.jsx)("code",{children:"150/100-1"}),"). Because of these returns, you decide to invest an additional 100 USD. Now, the returns dropped to 25% (",(0,io.jsx)("code",{children:"250/200-1"}),"), even though the price of the commodity did not change. The TWR eliminates this effect, which allows us to compare different portfolios without the effects of cash flows. TWR includes dividends and fees."]}),(0,io.jsx)("p",{children:"This metric is recommended for comparing two funds or portfolios."})]})}]},{id:"risk-metrics",title:e("Risk Metrics"),children:[{id:"volatility",title:e("Volatility"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Volatility measures how strongly returns vary over time. It is based on period returns from the Time-Weighted Rate of Return (TWR), so the effects of cash flows are eliminated. The value shown is annualized: higher volatility means larger return swings (more risk), lower volatility means more stable returns."})})},{id:"mdd",title:e("Maximum Drawdown (MDD)"),body:(0,io.jsx)(Zd,{children:(0,io.jsx)("p",{children:"Maximum Drawdown computes the maximum decline from a historical peak. It is based on the TWR (i.e. effects of cash flows are eliminated) by tracking the running peak of the TWR and comparing the current value to the peak."})})}]}],r=(n,i)=>(0,io.jsx)("ul",{style:{paddingLeft:`${n}em`},children:i.map(a=>(0,io.jsxs)("li",{style:{listStyle:"none"},children:[(0,io.jsx)(Ia,{to:".",hash:a.id,children:n==0?(0,io.jsx)("strong",{children:a.title}):a.title}),a.children&&r(n+1,a.children)]},a.id))}),o=(n,i)=>i.map(a=>(0,io.jsxs)("section",{"aria-labelledby":a.id,children:[n==0?(0,io.jsx)("h2",{id:a.id,children:a.title}):(0,io.jsx)("h3",{id:a.id,children:a.title}),a.body,a.children&&o(n+1,a.children)]},a.id));return(0,io.jsxs)("div",{className:"help-text",children:[(0,io.jsxs)("nav",{"aria-label":e("Table of contents"),children:[(0,io.jsx)("h2",{children:e("Table of contents")}),r(0,t)]}),o(0,t)]})}function q5(e){let t=ul();t.set("investments",e.investmentFilter.join(",")),t.set("currency",e.targetCurrency),t.set("metric",e.metric),t.set("interval",e.interval);let r=`metric_values?${t}`;return ws({queryKey:[r],queryFn:()=>ll(r)})}var Wn=z(Q()),z8e=["volatility","mdd"],_Vt=Hr.object({metric:Hr.enum(z8e).default("volatility").catch("volatility")}),_ce=Nn({getParentRoute:()=>$n,path:"metrics",validateSearch:_Vt,search:{middlewares:[Qa({metric:"volatility"})]},component:CVt});function CVt(){let{t:e}=Nr(),[t,r]=za(_ce,"metric"),o=CA(t),n=o.supportSeries?o.label:e("{{metricName}} (rolling 1y)",{metricName:o.label});return(0,Wn.jsxs)(ps,{children:[(0,Wn.jsx)(Bn,{sx:{justifyContent:"flex-end"},children:(0,Wn.jsx)(kR,{options:z8e,value:t,setValue:r})}),(0,Wn.jsx)(Bn,{children:(0,Wn.jsx)(Uo,{title:n,children:(0,Wn.jsx)(PVt,{metric:t})})}),(0,Wn.jsx)(Bn,{children:(0,Wn.jsx)(Uo,{title:e("Monthly Heatmap"),children:(0,Wn.jsx)(Cce,{metric:t})})}),(0,Wn.jsxs)(Bn,{children:[(0,Wn.jsx)(Uo,{title:e("Years"),children:(0,Wn.jsx)(RA,{metric:t,interval:"yearly"})}),(0,Wn.jsx)(Uo,{title:e("Periods"),children:(0,Wn.jsx)(RA,{metric:t,interval:"periods"})})]})]})}function PVt({metric:e}){let{investmentFilter:t,targetCurrency:r}=gi(),o=CA(e),n=Qp(r,{integer:!0}),i=Bx(),a=o.unit==="currency"?n:i,{isPending:s,error:l,data:u}=q5({investmentFilter:t,targetCurrency:r,metric:e,interval:o.supportSeries?"series":"rolling_1y"});if(s)return(0,Wn.jsx)(ja,{});if(l)return(0,Wn.jsx)(un,{severity:"error",children:l.message});let c={tooltip:{trigger:"axis",valueFormatter:eu(a)},grid:{left:120,right:100},xAxis:{type:"time"},yAxis:{type:"value",axisLabel:{formatter:a}},series:{type:"line",name:o.label,showSymbol:!1,data:u.series}};return(0,Wn.jsx)(qu,{height:"400px",option:c})}function Cce({metric:e}){let{t}=Nr(),r=lo(),{investmentFilter:o,targetCurrency:n}=gi(),i=CA(e),a=Qp(n,{integer:!0}),s=Bx(),l=i.unit==="currency"?a:s,{isPending:u,error:c,data:p}=q5({investmentFilter:o,targetCurrency:n,metric:e,interval:"heatmap"});if(u)return(0,Wn.jsx)(ja,{});if(c)return(0,Wn.jsx)(un,{severity:"error",children:c.message});let f=Math.max(...p.series.map(([y,x])=>y.includes("-")?Math.abs(x):0)),d=Math.round(f*100)/100,m=new Intl.DateTimeFormat(void 0,{month:"short"}).format,h={tooltip:{position:"top",valueFormatter:eu(l)},grid:{bottom:100},xAxis:{type:"category"},yAxis:{type:"category"},visualMap:{min:-d,max:d,calculable:!0,orient:"horizontal",left:"center",bottom:0,itemHeight:400,inRange:{color:[r.pnl.loss,"#fff",r.pnl.profit]},formatter:eu(l)},series:[{type:"heatmap",data:p.series.map(([y,x])=>{if(!y.includes("-"))return[t("Entire Year"),y,x];let[b,S]=y.split("-"),T=m(new Date(parseInt(b),parseInt(S)-1,1)),w=Math.round((x+Number.EPSILON)*1e4)/1e4+0;return[T,b,w]}),label:{show:!0,formatter:({data:y})=>l(y[2])},emphasis:{itemStyle:{shadowBlur:10,shadowColor:"rgba(0, 0, 0, 0.5)"}}}]},v=170+p.series.filter(([y])=>!y.includes("-")).length*40;return(0,Wn.jsx)(qu,{height:`${v}px`,option:h})}function RA({metric:e,interval:t}){let{t:r}=Nr(),o=lo(),{investmentFilter:n,targetCurrency:i}=gi(),a=CA(e),s=Qp(i,{integer:!0}),l=Bx(),u=a.unit==="currency"?s:l,{isPending:c,error:p,data:f}=q5({investmentFilter:n,targetCurrency:i,metric:e,interval:t});if(c)return(0,Wn.jsx)(ja,{});if(p)return(0,Wn.jsx)(un,{severity:"error",children:p.message});let d={tooltip:{trigger:"axis",valueFormatter:eu(u)},xAxis:{type:"category"},yAxis:{type:"value",axisLabel:{formatter:u}},series:[{type:"bar",name:r("Returns"),data:f.series,itemStyle:{color:m=>m.data[1]>=0?o.pnl.profit:o.pnl.loss}}]};return(0,Wn.jsx)(qu,{height:"400px",option:d})}function F8e(){let t=`missing_prices?${ul()}`;return ws({queryKey:[t],queryFn:()=>ll(t)})}var li=z(Q()),U8e=Nn({getParentRoute:()=>$n,path:"missing_prices",staticData:{showInvestmentsSelection:!1,showDateRangeSelection:!1,showCurrencySelection:!1},component:RVt});function RVt(){let{t:e}=Nr(),{isPending:t,error:r,data:o}=F8e();if(t)return(0,li.jsx)(ja,{});if(r)return(0,li.jsx)(un,{severity:"error",children:r.message});if(o.missingPrices.length===0)return(0,li.jsx)(un,{severity:"info",children:e("All required prices are available in the ledger.")});let n=i=>{let a=i.currentTarget,s=new Range;s.setStart(a,0),s.setEnd(a,1),window.getSelection()?.removeAllRanges(),window.getSelection()?.addRange(s)};return(0,li.jsxs)(ps,{children:[(0,li.jsx)(Bn,{children:(0,li.jsx)(Uo,{title:e("Fetch Required Prices"),help:e("Run the following commands and append the output to your ledger:"),children:(0,li.jsx)("pre",{onDoubleClick:n,children:o.commands.join(`
 `)})})}),(0,li.jsx)(Bn,{children:(0,li.jsx)(Uo,{title:e("Missing Prices"),help:e("This table shows dates where no accurate price directive was found."),children:(0,li.jsxs)("table",{children:[(0,li.jsx)("thead",{children:(0,li.jsxs)("tr",{children:[(0,li.jsx)("th",{children:e("Currency")}),(0,li.jsx)("th",{children:e("Required date")}),(0,li.jsx)("th",{children:e("Closest date in ledger")}),(0,li.jsx)("th",{children:e("Days late")})]})}),(0,li.jsx)("tbody",{children:o.missingPrices.map((i,a)=>(0,li.jsxs)("tr",{children:[(0,li.jsxs)("td",{children:[" ",i.currency," "]}),(0,li.jsx)("td",{children:i.requiredDate}),(0,li.jsx)("td",{children:i.actualDate??""}),(0,li.jsx)("td",{children:i.daysLate??""})]},a))})]})})})]})}function V8e(e){let t=ul();t.set("investments",e.investmentFilter.join(",")),t.set("currency",e.targetCurrency),t.set("metric",e.metric),t.set("compareWith",e.compareWith.join(","));let r=`compare?${t}`;return ws({queryKey:[r],queryFn:()=>ll(r)})}var Ra=z(Q()),B8e=["returns","twr"],EVt=Hr.object({metric:Hr.enum(B8e).default("returns").catch("returns"),compareWith:Hr.string().optional(),buySellPoints:Hr.boolean().default(!1).catch(!1),symbolScaling:Hr.enum(["linear","logarithmic"]).default("linear").catch("linear")}),AR=Nn({getParentRoute:()=>$n,path:"performance",validateSearch:EVt,search:{middlewares:[Qa({metric:"returns",buySellPoints:!1,symbolScaling:"linear"})]},component:MVt});function MVt(){let{t:e}=Nr(),[t,r]=za(AR,"metric"),[o,n]=wV(za(AR,"compareWith")),[i,a]=za(AR,"buySellPoints"),[s,l]=za(AR,"symbolScaling");return(0,Ra.jsx)(ps,{children:(0,Ra.jsx)(Bn,{children:(0,Ra.jsxs)(Uo,{title:e("Performance"),help:e('The performance chart compares the relative performance of the currently selected investments (comprising a part of your portfolio filtered using the "Investments Filter") against single groups, accounts or commodities selected in the "Compare with" box below.'),topRightElem:(0,Ra.jsx)(kR,{options:B8e,value:t,setValue:r}),children:[(0,Ra.jsx)(IVt,{metric:t,investments:o,showBuySellPoints:i,symbolScaling:s}),(0,Ra.jsx)(_c,{sx:{display:"flex",justifyContent:"center",marginTop:3},children:(0,Ra.jsx)(PV,{label:e("Compare with"),types:["Group","Account","Currency"],includeAllCurrencies:!0,investments:o,setInvestments:n})}),(0,Ra.jsx)(_c,{sx:{display:"flex",justifyContent:"center",marginTop:3},children:(0,Ra.jsxs)(Iy,{component:"fieldset",variant:"outlined",children:[(0,Ra.jsx)(YC,{component:"legend",children:e("Buy/Sell points")}),(0,Ra.jsxs)(WC,{children:[(0,Ra.jsx)(yg,{label:e("Show"),control:(0,Ra.jsx)(pm,{checked:i,onChange:(u,c)=>a(c)})}),(0,Ra.jsx)(yg,{label:e("Logarithmic Scaling"),control:(0,Ra.jsx)(pm,{checked:s==="logarithmic",disabled:!i,onChange:(u,c)=>l(c?"logarithmic":"linear")})})]})]})})]})})})}function IVt({metric:e,investments:t,showBuySellPoints:r,symbolScaling:o}){let{t:n}=Nr(),i=lo(),{investmentFilter:a,targetCurrency:s}=gi(),l=Bx(),{isPending:u,error:c,data:p}=V8e({investmentFilter:a,targetCurrency:s,metric:e,compareWith:t});if(u)return(0,Ra.jsx)(ja,{});if(c)return(0,Ra.jsx)(un,{severity:"error",children:c.message});let f={tooltip:{trigger:"axis",valueFormatter:eu(l)},legend:{top:10},grid:{left:80,right:80},xAxis:{type:"time"},yAxis:{type:"value",axisLabel:{formatter:l}},dataZoom:[{type:"slider",handleLabel:{show:!0}}],series:p.series.map(d=>({type:"line",name:d.name==="portfolio"?n("Portfolio"):d.name,showSymbol:!1,data:d.data,markPoint:r?{data:OVt(i,d,o),label:{show:!1}}:void 0}))};return(0,Ra.jsx)(qu,{height:"500px",option:f})}var[K5,$8e]=[8,16];function X5(e){return e>0?Math.log(e):0}function DVt(e,t,r,o){if(r-t===0)return K5+($8e-K5)/2;let n;switch(o){case"linear":n=(e-t)/(r-t);break;case"logarithmic":n=(X5(e)-X5(t))/(X5(r)-X5(t));break}return K5+($8e-K5)*n}function OVt(e,t,r){let o=t.cashFlows.map(([s,l])=>Math.abs(l)),n=Math.min(...o),i=Math.max(...o),a=new Map;for(let[s,l]of t.data)a.set(s,l);return t.cashFlows.map(([s,l])=>{let u=a.get(s);if(!u)return null;let c=DVt(Math.abs(l),n,i,r);return{name:s,coord:[s,u],value:l,symbol:"triangle",symbolSize:c,symbolRotate:l<=0?0:180,itemStyle:{color:l<=0?e.pnl.profit:e.pnl.loss}}}).filter(s=>s!==null)}function Q5(e){let t=ul();t.set("investments",e.investmentFilter.join(",")),t.set("currency",e.targetCurrency);let r=`portfolio?${t}`;return ws({queryKey:[r],queryFn:()=>ll(r)})}var Dn=z(Q()),kVt=Hr.object({chart:Hr.enum(["performance","value"]).default("performance").catch("performance")}),Pce=Nn({getParentRoute:()=>$n,path:"portfolio",validateSearch:kVt,search:{middlewares:[Qa({chart:"performance"})]},component:AVt});function AVt(){let{t:e}=Nr(),[t,r]=za(Pce,"chart");return(0,Dn.jsx)(ps,{children:(0,Dn.jsxs)(Bn,{children:[(0,Dn.jsxs)(nP,{active:t,setActive:r,children:[(0,Dn.jsx)(_g,{id:"performance",label:e("Performance"),children:(0,Dn.jsx)(Uo,{title:e("Performance"),help:e("The performance chart shows the total profit and loss of the portfolio."),sx:{flex:2},children:(0,Dn.jsx)(LVt,{})})}),(0,Dn.jsx)(_g,{id:"value",label:e("Portfolio Value"),children:(0,Dn.jsx)(Uo,{title:e("Portfolio Value"),help:e("The portfolio value chart compares the market value with the cost value of the portfolio."),sx:{flex:2},children:(0,Dn.jsx)(NVt,{})})})]}),(0,Dn.jsx)(Uo,{title:e("Allocation"),children:(0,Dn.jsx)(zVt,{})})]})})}function LVt(){let{t:e}=Nr(),t=lo(),{investmentFilter:r,targetCurrency:o}=gi(),n=Qp(o),{isPending:i,error:a,data:s}=Q5({investmentFilter:r,targetCurrency:o});if(i)return(0,Dn.jsx)(ja,{});if(a)return(0,Dn.jsx)(un,{severity:"error",children:a.message});let l=s.performanceChart,u=l.length>0?l[0][1]:0,p=(l.length>0?l[l.length-1][1]:0)>=u?t.trend.positive:t.trend.negative,f={tooltip:{trigger:"axis",valueFormatter:eu(n)},grid:{left:100,right:20},xAxis:{type:"time",axisPointer:{label:{formatter:d=>Tle(d.value)}}},yAxis:{type:"value",axisLabel:{formatter:n}},series:{type:"line",name:e("Total P/L"),showSymbol:!1,data:l,lineStyle:{color:p()},itemStyle:{color:p()},areaStyle:{color:{type:"linear",x:0,y:0,x2:0,y2:1,colorStops:[{offset:0,color:p(.2)},{offset:1,color:p(0)}]}}}};return(0,Dn.jsx)(qu,{height:"400px",option:f})}function NVt(){let{t:e}=Nr(),{investmentFilter:t,targetCurrency:r}=gi(),o=Qp(r),{isPending:n,error:i,data:a}=Q5({investmentFilter:t,targetCurrency:r});if(n)return(0,Dn.jsx)(ja,{});if(i)return(0,Dn.jsx)(un,{severity:"error",children:i.message});let s={tooltip:{trigger:"axis",valueFormatter:eu(o)},legend:{bottom:0},grid:{left:100,right:20},xAxis:{type:"time",axisPointer:{label:{formatter:l=>Tle(l.value)}}},yAxis:{type:"value",axisLabel:{formatter:o}},dataset:{source:a.valueChart},series:[{type:"line",name:e("Market Value"),showSymbol:!1,encode:{x:"date",y:"market"}},{type:"line",name:e("Cost Value"),showSymbol:!1,encode:{x:"date",y:"cost"},step:"end",lineStyle:{type:"dotted"}}]};return(0,Dn.jsx)(qu,{height:"400px",option:s})}function zVt(){let{investmentFilter:e,setInvestmentFilter:t,targetCurrency:r}=gi(),o=Qp(r,{integer:!0}),{isPending:n,error:i,data:a}=Q5({investmentFilter:e,targetCurrency:r});if(n)return(0,Dn.jsx)(ja,{});if(i)return(0,Dn.jsx)(un,{severity:"error",children:i.message});let s={tooltip:{confine:!0,valueFormatter:eu(o)},series:[{type:"treemap",left:0,top:0,right:0,bottom:0,breadcrumb:{show:!1},itemStyle:{borderRadius:3,gapWidth:2},label:{formatter:({data:l})=>{let u=l;return`{currency|${u.currency}}
 ${o(u.marketValue)}`},rich:{currency:{fontWeight:"bold"}}},labelLayout:l=>({y:l.labelRect.y,align:"center"}),data:a.allocation.map(l=>({...l,name:l.name,value:l.marketValue}))}],onClick:({data:l})=>{t([l.id])}};return(0,Dn.jsxs)(Dn.Fragment,{children:[(0,Dn.jsx)("p",{children:"\xA0"}),(0,Dn.jsx)(qu,{height:"400px",option:s})]})}var Kc=z(Q()),G8e=["irr","mdm","twr","pnl"],FVt=Hr.object({metric:Hr.enum(G8e).default("irr").catch("irr")}),Rce=Nn({getParentRoute:()=>$n,path:"returns",validateSearch:FVt,search:{middlewares:[Qa({metric:"irr"})]},component:UVt});function UVt(){let{t:e}=Nr(),[t,r]=za(Rce,"metric");return(0,Kc.jsxs)(ps,{children:[(0,Kc.jsx)(Bn,{sx:{justifyContent:"flex-end"},children:(0,Kc.jsx)(kR,{options:G8e,value:t,setValue:r})}),(0,Kc.jsx)(Bn,{children:(0,Kc.jsx)(Uo,{title:e("Monthly Returns"),children:(0,Kc.jsx)(Cce,{metric:t})})}),(0,Kc.jsxs)(Bn,{children:[(0,Kc.jsx)(Uo,{title:e("Yearly Returns"),children:(0,Kc.jsx)(RA,{metric:t,interval:"yearly"})}),(0,Kc.jsx)(Uo,{title:e("Returns over Periods"),children:(0,Kc.jsx)(RA,{metric:t,interval:"periods"})})]})]})}var LR=BVt(),VVt=$n.addChildren([s1e,Pce,AR,Rce,_ce,_le,wle,wce,Sce,U8e,N8e]),$Vt=nL({createHref:e=>{if(!e.startsWith(LR))return e;let t=new URL(e,location.href),r=t.pathname.substring(LR.length+1);return t.searchParams.append("path",r),`${LR}/?${t.searchParams}`},parseLocation:()=>{let e=new URL(location.href);if(!e.pathname.startsWith(LR))return xv(`${e.pathname}${e.search}${e.hash}`,history.state);let t=e.searchParams.get("path")??"";e.searchParams.delete("path");let r=`${LR}/${t}`;return xv(`${r}${e.search}${e.hash}`,history.state)}}),H8e=O3({routeTree:VVt,history:$Vt,basepath:LR});function BVt(){return`${JSON.parse(document.getElementById("ledger-data")?.textContent??"{}").base_url??""}extension/FavaPortfolioReturns`}var EA=z(Q()),J5=null;function Y8e(e){J5||(J5=document.createElement("div"),(0,W8e.createRoot)(J5).render((0,EA.jsx)(j8e.StrictMode,{children:(0,EA.jsx)(HVt,{})}))),e.replaceChildren(J5)}var GVt=new P6({defaultOptions:{queries:{retry:!1}}});function HVt(){return(0,EA.jsx)(N6,{client:GVt,children:(0,EA.jsx)(k3,{router:H8e})})}var d7o={onExtensionPageLoad(){let e=document.getElementById("favaPortfolioReturnsApp");Y8e(e)}};export{d7o as default};
 /*! Bundled license information:
@@ -1,11 +1,21 @@
 import datetime
 import functools
+import hashlib
 import logging
 import os
+import pickle
+import threading
 import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
+from typing import Any
+from typing import Iterator
 from typing import Literal
 from typing import Optional
 from typing import Sequence
@@ -16,24 +26,36 @@ from fava.beans.abc import Directive as FavaDirective
 from fava.beans.abc import Price
 from fava.beans.abc import Transaction
 from fava.context import g
+from fava.core import FavaLedger
+from fava.core import FilteredLedger
 from fava.ext import FavaExtensionBase
 from fava.ext import extension_endpoint
 from fava.helpers import FavaAPIError
+from flask import Response
+from flask import current_app
 from flask import request
+from flask import stream_with_context
+from werkzeug.http import quote_etag
 
 from fava_portfolio_returns.api.cash_flows import cash_flows_chart
 from fava_portfolio_returns.api.cash_flows import cash_flows_table
 from fava_portfolio_returns.api.cash_flows import dividends_chart
 from fava_portfolio_returns.api.compare import compare_chart
+from fava_portfolio_returns.api.investments import init_worker
 from fava_portfolio_returns.api.investments import investments_group_by_currency
 from fava_portfolio_returns.api.investments import investments_group_by_group
 from fava_portfolio_returns.api.portfolio import portfolio_allocation
 from fava_portfolio_returns.api.portfolio import portfolio_values
+from fava_portfolio_returns.core.cache import ResponseCache
+from fava_portfolio_returns.core.cache import SingleFlight
 from fava_portfolio_returns.core.intervals import intervals_heatmap
 from fava_portfolio_returns.core.intervals import intervals_periods
 from fava_portfolio_returns.core.intervals import intervals_yearly
+from fava_portfolio_returns.core.portfolio import ExecutorKind
 from fava_portfolio_returns.core.portfolio import FilteredPortfolio
 from fava_portfolio_returns.core.portfolio import Portfolio
+from fava_portfolio_returns.core.portfolio import StickyProcessPool
+from fava_portfolio_returns.core.timeline import Engine
 from fava_portfolio_returns.metrics.pnl import TotalPNL
 from fava_portfolio_returns.metrics.registry import get_metric
 
@@ -41,11 +63,23 @@ logger = logging.getLogger(__name__)
 if loglevel := os.environ.get("LOGLEVEL"):
     logger.setLevel(loglevel.upper())
 
+# Maximum number of cached date ranges of filtered ledgers (Fava keeps the 16 most recently used filtered ledgers).
+LEDGER_DURATION_CACHE_SIZE = 16
+
 
 @dataclass(frozen=True)
-class ExtConfig:
+class ExtConfig:  # pylint: disable=too-many-instance-attributes
     beangrow_config_path: Path
     beangrow_debug_dir: Optional[Path]
+    incremental_reload: bool
+    engine: Engine
+    extract_executor: Optional[ExecutorKind]
+    extract_workers: Optional[int]
+    investments_executor: Optional[ExecutorKind]
+    investments_workers: Optional[int]
+    response_cache_size: int
+    prewarm: bool
+    cache_dir: Optional[Path]
     pnl_color_scheme: Optional[str]
     language: Optional[str]
     locale: Optional[str]
@@ -63,41 +97,166 @@ class ToolbarContext:
 
 
 def api_response(func):
-    """return {success: true, data: ...} or {success: false, error: ...}"""
+    """return {success: true, data: ...} or {success: false, error: ...}
+
+    Successful responses carry a strong ETag of the ledger generation and the request.
+    Requests with a matching If-None-Match header are answered with 304 Not Modified, without computing the response.
+    If-None-Match uses the weak comparison (RFC 9110), e.g. proxies which compress the response mark the ETag as weak.
+    """
+
+    @functools.wraps(func)
+    def decorator(self: "FavaPortfolioReturns", *args, **kwargs):
+        etag = self.response_etag()
+        # the response must be revalidated on every request, as the ledger can be reloaded at any time
+        headers = {"ETag": quote_etag(etag), "Cache-Control": "no-cache"}
+        if request.if_none_match.contains_weak(etag):
+            return "", 304, headers
+
+        try:
+            data = func(self, *args, **kwargs)
+            return {"success": True, "data": data}, headers
+        except FavaAPIError as e:
+            return {"success": False, "error": e.message}, 500
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            traceback.print_exception(e)
+            return {"success": False, "error": str(e)}, 500
+
+    return decorator
+
+
+def ndjson_response(func):
+    """stream the rows returned by func as newline-delimited JSON, one {success: true, data: row} object per line
+
+    Errors before the stream starts are returned like in api_response. Errors while streaming the rows are sent
+    as last line {success: false, error: ...}, because the status code was already sent.
+    """
 
     @functools.wraps(func)
-    def decorator(*args, **kwargs):
+    def decorator(self: "FavaPortfolioReturns", *args, **kwargs):
+        etag = self.response_etag()
+        headers = {"ETag": quote_etag(etag), "Cache-Control": "no-cache"}
+        if request.if_none_match.contains_weak(etag):
+            return "", 304, headers
+
         try:
-            data = func(*args, **kwargs)
-            return {"success": True, "data": data}
+            rows = func(self, *args, **kwargs)
         except FavaAPIError as e:
             return {"success": False, "error": e.message}, 500
         except Exception as e:  # pylint: disable=broad-exception-caught
             traceback.print_exception(e)
             return {"success": False, "error": str(e)}, 500
 
+        def lines() -> Iterator[str]:
+            try:
+                for row in rows:
+                    yield current_app.json.dumps({"success": True, "data": row}) + "\n"
+            except FavaAPIError as e:
+                yield current_app.json.dumps({"success": False, "error": e.message}) + "\n"
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                traceback.print_exception(e)
+                yield current_app.json.dumps({"success": False, "error": str(e)}) + "\n"
+
+        return Response(stream_with_context(lines()), mimetype="application/x-ndjson", headers=headers)
+
+    return decorator
+
+
+def cached_response(func):
+    """return the cached response, keyed on the ledger generation, the endpoint and the request parameters
+
+    The request parameters include the Fava filters, the investment filter and the currency.
+    """
+
+    @functools.wraps(func)
+    def decorator(self: "FavaPortfolioReturns"):
+        cache = self.get_response_cache()
+        if cache is None:
+            return func(self)
+
+        key = self.response_cache_key(func.__name__)
+        response = cache.get(key)
+        if response is None:
+            response = func(self)
+            cache.put(key, response)
+        logger.debug("Response cache statistics: %s", cache.stats())
+        return response
+
     return decorator
 
 
-class FavaPortfolioReturns(FavaExtensionBase):
+class FavaPortfolioReturns(FavaExtensionBase):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     report_title = "Portfolio Returns"
     has_js_module = True
-    cached_portfolio: Optional[Portfolio]
+    # (ledger generation, portfolio of this generation)
+    cached_portfolio: Optional[tuple[int, Portfolio]] = None
+    # portfolio of the previous ledger load, used for incremental updates
+    previous_portfolio: Optional[Portfolio] = None
+    # number of ledger loads, part of the response cache key
+    generation = 0
+    response_cache: Optional[ResponseCache] = None
+    prewarm_executor: Optional[ThreadPoolExecutor] = None
+    # worker pool of the investments table and the portfolio its workers were initialized with
+    investments_pool: Optional[tuple[Portfolio, Executor]] = None
+
+    def __init__(self, ledger: FavaLedger, config: Optional[str] = None):
+        super().__init__(ledger, config)
+        # the generation starts at zero on every start of Fava, therefore the ETags also include a unique instance id
+        self.instance_id = uuid.uuid4().hex
+        self.portfolio_lock = threading.Lock()
+        # concurrent requests after a ledger load share a single portfolio build
+        self.portfolio_flight = SingleFlight()
+        # id of filtered ledger -> (filtered ledger, date range)
+        self.ledger_durations: OrderedDict[int, tuple[FilteredLedger, tuple[date, date]]] = OrderedDict()
+        self.ledger_durations_lock = threading.Lock()
+        self.investments_pool_lock = threading.Lock()
 
     def after_load_file(self) -> None:
         """Fava hook which runs after a ledger file has been (re-)loaded"""
+        ext_config = self.read_ext_config()
+        # bump the generation first: a build of the previous ledger which finishes now is not cached anymore
+        self.generation += 1
+        cached = self.cached_portfolio
+        if ext_config.incremental_reload and cached:
+            self.previous_portfolio = cached[1]
         # clear cache
         self.cached_portfolio = None
+        if self.response_cache:
+            self.response_cache.clear()
+        with self.ledger_durations_lock:
+            self.ledger_durations.clear()
+        with self.investments_pool_lock:
+            if self.investments_pool:
+                # running requests of the previous ledger load finish their rows
+                self.investments_pool[1].shutdown(wait=False)
+                self.investments_pool = None
+
+        if ext_config.prewarm:
+            if not self.prewarm_executor:
+                self.prewarm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="portfolio-prewarm")
+            future = self.prewarm_executor.submit(self.prewarm_portfolio, self.generation)
+            future.add_done_callback(log_prewarm_error)
 
     def read_ext_config(self) -> ExtConfig:
         cfg = self.config if isinstance(self.config, dict) else {}
         beangrow_debug_dir = cfg.get("beangrow_debug_dir")
         if beangrow_debug_dir:
             beangrow_debug_dir = self.ledger.join_path(beangrow_debug_dir)
+        cache_dir = cfg.get("cache_dir")
+        if cache_dir:
+            cache_dir = self.ledger.join_path(cache_dir)
 
         return ExtConfig(
             beangrow_config_path=self.ledger.join_path(cfg.get("beangrow_config", "beangrow.pbtxt")),
             beangrow_debug_dir=beangrow_debug_dir,
+            incremental_reload=cfg.get("incremental_reload", False),
+            engine=cfg.get("engine", "decimal"),
+            extract_executor=cfg.get("extract_executor"),
+            extract_workers=cfg.get("extract_workers"),
+            investments_executor=cfg.get("investments_executor"),
+            investments_workers=cfg.get("investments_workers"),
+            response_cache_size=cfg.get("response_cache_size", 0),
+            prewarm=cfg.get("prewarm", False),
+            cache_dir=cache_dir,
             pnl_color_scheme=cfg.get("pnl_color_scheme"),
             language=cfg.get("language", self.ledger.fava_options.language),
             locale=cfg.get("locale", self.ledger.fava_options.locale),
@@ -115,7 +274,7 @@ class FavaPortfolioReturns(FavaExtensionBase):
             filter_first = g.filtered.date_range.begin
             filter_last = g.filtered.date_range.end - datetime.timedelta(days=1)
             # Use filtered ledger here, as another filter (e.g. tag filter) could be applied.
-            ledger_date_first, ledger_date_last = get_ledger_duration(g.filtered.entries_with_all_prices)
+            ledger_date_first, ledger_date_last = self.get_filtered_ledger_duration(g.filtered)
             # Adjust the dates to align with ledger data.
             date_first, date_last = clamp_to_ledger_range(
                 filter_first, filter_last, ledger_date_first, ledger_date_last
@@ -123,7 +282,7 @@ class FavaPortfolioReturns(FavaExtensionBase):
         else:
             # No time filter applied.
             # Use filtered ledger here, as another filter (e.g. tag filter) could be applied.
-            date_first, date_last = get_ledger_duration(g.filtered.entries_with_all_prices)
+            date_first, date_last = self.get_filtered_ledger_duration(g.filtered)
 
         return ToolbarContext(
             investment_filter=sel_investments,
@@ -132,16 +291,127 @@ class FavaPortfolioReturns(FavaExtensionBase):
             end_date=date_last,
         )
 
+    def get_filtered_ledger_duration(self, filtered: FilteredLedger) -> tuple[date, date]:
+        """returns the date range of a filtered ledger, cached per filtered ledger
+
+        Fava reuses the filtered ledgers until the ledger is reloaded. The cache holds a reference to the
+        filtered ledger, therefore its id() is not reused while it is cached.
+        """
+        with self.ledger_durations_lock:
+            cached = self.ledger_durations.get(id(filtered))
+            if cached is not None and cached[0] is filtered:
+                self.ledger_durations.move_to_end(id(filtered))
+                return cached[1]
+
+        duration = get_filtered_ledger_duration(filtered.entries, self.ledger.all_entries_by_type.Price)
+        with self.ledger_durations_lock:
+            self.ledger_durations[id(filtered)] = (filtered, duration)
+            while len(self.ledger_durations) > LEDGER_DURATION_CACHE_SIZE:
+                self.ledger_durations.popitem(last=False)
+        return duration
+
     def get_portfolio(self) -> Portfolio:
-        if not self.cached_portfolio:
-            ext_config = self.read_ext_config()
-            self.cached_portfolio = Portfolio(
-                cast(list[Directive], list(self.ledger.all_entries)),
-                self.ledger.options,
-                ext_config.beangrow_config_path,
-                beangrow_debug_dir=ext_config.beangrow_debug_dir,
-            )
-        return self.cached_portfolio
+        generation = self.generation
+        cached = self.cached_portfolio
+        if cached and cached[0] == generation:
+            return cached[1]
+
+        # build the portfolio only once per ledger generation, other requests wait for this build
+        portfolio = self.portfolio_flight.do(generation, functools.partial(self.load_portfolio, generation))
+        logger.debug("Portfolio builds coalesced: %d", self.portfolio_flight.coalesced)
+        return portfolio
+
+    def load_portfolio(self, generation: int) -> Portfolio:
+        """returns the cached portfolio, or builds the portfolio of the ledger generation"""
+        with self.portfolio_lock:
+            cached = self.cached_portfolio
+            if cached and cached[0] == generation:
+                return cached[1]
+
+            portfolio = self.build_portfolio()
+            if generation == self.generation:
+                self.cached_portfolio = (generation, portfolio)
+            elif self.read_ext_config().incremental_reload:
+                # the ledger was reloaded meanwhile, the next build updates this portfolio
+                self.previous_portfolio = portfolio
+            return portfolio
+
+    def build_portfolio(self) -> Portfolio:
+        """build the portfolio of the current ledger entries, must be called with portfolio_lock held"""
+        ext_config = self.read_ext_config()
+        portfolio = Portfolio(
+            cast(list[Directive], list(self.ledger.all_entries)),
+            self.ledger.options,
+            ext_config.beangrow_config_path,
+            beangrow_debug_dir=ext_config.beangrow_debug_dir,
+            previous=self.previous_portfolio,
+            engine=ext_config.engine,
+            executor=ext_config.extract_executor,
+            max_workers=ext_config.extract_workers,
+            cache_dir=ext_config.cache_dir,
+        )
+        self.previous_portfolio = None
+        return portfolio
+
+    def prewarm_portfolio(self, generation: int) -> None:
+        """build the portfolio after a ledger load, and precompute the values of the unfiltered portfolio
+        in each operating currency (which fills the price cache)"""
+        portfolio = self.portfolio_flight.do(generation, functools.partial(self.load_portfolio, generation))
+
+        try:
+            start_date, end_date = get_ledger_duration(cast(Sequence[FavaDirective], portfolio.entries))
+            for currency in self.ledger.options["operating_currency"]:
+                p = portfolio.filter([], currency)
+                portfolio_values(p, start_date, end_date)
+                TotalPNL().series(p, start_date, end_date)
+        except FavaAPIError as e:
+            logger.debug("Skipping precomputation of the portfolio values: %s", e.message)
+
+    def response_etag(self) -> str:
+        """returns the ETag of the response to the current request"""
+        args = sorted(request.args.items(multi=True))
+        key = f"{self.instance_id}:{self.generation}:{request.path}:{args}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get_response_cache(self) -> Optional[ResponseCache]:
+        """returns the response cache, or None if it is disabled"""
+        if self.response_cache is None:
+            size = self.read_ext_config().response_cache_size
+            if size <= 0:
+                return None
+            self.response_cache = ResponseCache(max_bytes=size * 1024 * 1024)
+        return self.response_cache
+
+    def response_cache_key(self, name: str) -> tuple[Any, ...]:
+        """returns the key of the cached response of an endpoint to the current request"""
+        return (self.generation, name, tuple(sorted(request.args.items(multi=True))))
+
+    def get_investments_executor(self, portfolio: Portfolio) -> Optional[Executor]:
+        """returns the worker pool of the investments table, or None if the rows are computed serially
+
+        The worker processes receive a copy of the portfolio when the pool is created, therefore the pool is
+        recreated for every new portfolio. Each investment filter is always computed by the same worker process,
+        which has the timelines of the filtered portfolio in its cache.
+        """
+        ext_config = self.read_ext_config()
+        if not ext_config.investments_executor:
+            return None
+
+        with self.investments_pool_lock:
+            if self.investments_pool and self.investments_pool[0] is portfolio:
+                return self.investments_pool[1]
+            if self.investments_pool:
+                self.investments_pool[1].shutdown(wait=False)
+
+            executor: Executor
+            if ext_config.investments_executor == "process":
+                executor = StickyProcessPool(
+                    ext_config.investments_workers, initializer=init_worker, initargs=(pickle.dumps(portfolio),)
+                )
+            else:
+                executor = ThreadPoolExecutor(max_workers=ext_config.investments_workers)
+            self.investments_pool = (portfolio, executor)
+            return executor
 
     def get_filtered_portfolio(self, toolbar_ctx: ToolbarContext) -> FilteredPortfolio:
         return self.get_portfolio().filter(toolbar_ctx.investment_filter, toolbar_ctx.target_currency)
@@ -166,6 +436,7 @@ class FavaPortfolioReturns(FavaExtensionBase):
 
     @extension_endpoint("portfolio")
     @api_response
+    @cached_response
     def api_portfolio(self):
         toolbar_ctx = self.get_toolbar_ctx()
         p = self.get_filtered_portfolio(toolbar_ctx)
@@ -182,6 +453,7 @@ class FavaPortfolioReturns(FavaExtensionBase):
 
     @extension_endpoint("compare")
     @api_response
+    @cached_response
     def api_compare(self):
         toolbar_ctx = self.get_toolbar_ctx()
         p = self.get_filtered_portfolio(toolbar_ctx)
@@ -194,6 +466,7 @@ class FavaPortfolioReturns(FavaExtensionBase):
 
     @extension_endpoint("metric_values")
     @api_response
+    @cached_response
     def api_metric_values(self):
         toolbar_ctx = self.get_toolbar_ctx()
         p = self.get_filtered_portfolio(toolbar_ctx)
@@ -201,10 +474,10 @@ class FavaPortfolioReturns(FavaExtensionBase):
         interval = request.args.get("interval", "")
 
         metric = get_metric(metric_name)
-        cash_flows = p.cash_flows()
-        if cash_flows and toolbar_ctx.start_date <= cash_flows[0].date <= toolbar_ctx.end_date:
+        first_cash_flow = p.cash_flow_columns().first_date()
+        if first_cash_flow and toolbar_ctx.start_date <= first_cash_flow <= toolbar_ctx.end_date:
             # skip time before first cash flow
-            start_date = cash_flows[0].date
+            start_date = first_cash_flow
         else:
             start_date = toolbar_ctx.start_date
         end_date = toolbar_ctx.end_date
@@ -224,6 +497,7 @@ class FavaPortfolioReturns(FavaExtensionBase):
 
     @extension_endpoint("dividends")
     @api_response
+    @cached_response
     def api_dividends(self):
         toolbar_ctx = self.get_toolbar_ctx()
         p = self.get_filtered_portfolio(toolbar_ctx)
@@ -239,6 +513,7 @@ class FavaPortfolioReturns(FavaExtensionBase):
 
     @extension_endpoint("cash_flows")
     @api_response
+    @cached_response
     def api_cash_flows(self):
         toolbar_ctx = self.get_toolbar_ctx()
         p = self.get_filtered_portfolio(toolbar_ctx)
@@ -254,28 +529,56 @@ class FavaPortfolioReturns(FavaExtensionBase):
             "table": table,
         }
 
-    @extension_endpoint("investments")
-    @api_response
-    def api_investments(self):
+    def investments_rows(self) -> Iterator[dict[str, Any]]:
+        """returns an iterator over the rows of the investments table, which computes the rows on demand"""
         p = self.get_portfolio()
         toolbar_ctx = self.get_toolbar_ctx()
         group_by = request.args.get("group_by", "group")
+        executor = self.get_investments_executor(p)
 
         if group_by == "group":
-            return {"investments": list(investments_group_by_group(p, toolbar_ctx.start_date, toolbar_ctx.end_date))}
+            return investments_group_by_group(p, toolbar_ctx.start_date, toolbar_ctx.end_date, executor)
         elif group_by == "currency":
-            return {
-                "investments": list(
-                    investments_group_by_currency(
-                        p, toolbar_ctx.target_currency, toolbar_ctx.start_date, toolbar_ctx.end_date
-                    )
-                )
-            }
+            return investments_group_by_currency(
+                p, toolbar_ctx.target_currency, toolbar_ctx.start_date, toolbar_ctx.end_date, executor
+            )
         else:
             raise FavaAPIError(f"Invalid group by {group_by}")
 
+    @extension_endpoint("investments")
+    @api_response
+    @cached_response
+    def api_investments(self):
+        return {"investments": list(self.investments_rows())}
+
+    @extension_endpoint("investments_stream")
+    @ndjson_response
+    def api_investments_stream(self):
+        """streams each row of the investments table as soon as it is computed
+
+        The streamed rows are cached as response of the investments endpoint, and a cached response is streamed at once.
+        """
+        cache = self.get_response_cache()
+        key = self.response_cache_key(self.api_investments.__name__)
+        response = cache.get(key) if cache else None
+        if response is not None:
+            return iter(response["investments"])
+
+        rows = self.investments_rows()
+
+        def cache_rows():
+            investments = []
+            for row in rows:
+                investments.append(row)
+                yield row
+            if cache:
+                cache.put(key, {"investments": investments})
+
+        return cache_rows()
+
     @extension_endpoint("missing_prices")
     @api_response
+    @cached_response
     def api_missing_prices(self):
         p = self.get_portfolio()
 
@@ -283,7 +586,14 @@ class FavaPortfolioReturns(FavaExtensionBase):
         return {"missingPrices": missing_prices, "commands": commands}
 
 
-def get_ledger_duration(entries: Sequence[FavaDirective]) -> tuple[date, date]:
+def log_prewarm_error(future: Future) -> None:
+    """log the exception of the background build, which would otherwise be lost in the prewarm thread"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Building the portfolio in the background failed", exc_info=future.exception())
+
+
+def get_ledger_duration_or_none(entries: Sequence[FavaDirective]) -> tuple[Optional[date], Optional[date]]:
+    """returns the date of the first transaction and the date of the last transaction or price"""
     date_first = None
     date_last = None
     for entry in entries:
@@ -294,6 +604,22 @@ def get_ledger_duration(entries: Sequence[FavaDirective]) -> tuple[date, date]:
         if isinstance(entry, (Transaction, Price)):
             date_last = entry.date
             break
+    return (date_first, date_last)
+
+
+def get_ledger_duration(entries: Sequence[FavaDirective]) -> tuple[date, date]:
+    date_first, date_last = get_ledger_duration_or_none(entries)
+    if not date_first or not date_last:
+        raise FavaAPIError("no transactions found")
+    return (date_first, date_last)
+
+
+def get_filtered_ledger_duration(entries: Sequence[FavaDirective], prices: Sequence[Price]) -> tuple[date, date]:
+    """returns the same date range as get_ledger_duration() of the filtered entries with all prices added back in
+    (FilteredLedger.entries_with_all_prices), without merging and sorting these lists"""
+    date_first, date_last = get_ledger_duration_or_none(entries)
+    if prices and (not date_last or prices[-1].date > date_last):
+        date_last = prices[-1].date
     if not date_first or not date_last:
         raise FavaAPIError("no transactions found")
     return (date_first, date_last)
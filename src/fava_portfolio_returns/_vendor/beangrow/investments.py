@@ -14,7 +14,9 @@ from os import path
 from pprint import pprint
 from typing import Dict, List, Optional, Set, Tuple
 from functools import partial
+from concurrent.futures import Executor
 import collections
+import itertools
 import copy
 import datetime
 import enum
@@ -101,6 +103,8 @@ AccountData = typing.NamedTuple("AccountData", [
     ('transactions', List[data.Transaction]),
     ('balance', Inventory),
     ('catmap', Dict[Account, Cat]),
+    # Categories of the postings of each transaction, aligned with 'transactions'.
+    ('categories', List[Tuple[Cat, ...]]),
 ])
 
 
@@ -131,24 +135,37 @@ def categorize_accounts(config: InvestmentConfig,
     return catmap
 
 
-def categorize_entry(catmap: Dict[Account, Cat],
-                     entry: data.Directive) -> Tuple[Cat]:
-    """Assigns metadata to each posting."""
-    postings = []
+def posting_categories(catmap: Dict[Account, Cat],
+                       entry: data.Transaction) -> Tuple[Cat, ...]:
+    """Categorize each posting of a transaction."""
+    categories = []
     for posting in entry.postings:
         category = catmap[posting.account]
         if category is None:
             category = Cat.OTHER if posting.cost is None else Cat.OTHERASSET
+        categories.append(category)
+    return tuple(categories)
+
+
+def categorize_entry(catmap: Dict[Account, Cat],
+                     entry: data.Directive) -> data.Directive:
+    """Returns a copy of the entry with the category of each posting and the
+    signature of the transaction as metadata. Only used by the explicit
+    handlers and for debugging, the original entry stays untouched."""
+    categories = posting_categories(catmap, entry)
+    postings = []
+    for posting, category in zip(entry.postings, categories):
         meta = posting.meta.copy() if posting.meta else {}
         meta["category"] = category
         postings.append(posting._replace(meta=meta))
-    return entry._replace(postings=postings)
+    meta = entry.meta.copy()
+    meta["signature"] = compute_transaction_signature(categories)
+    return entry._replace(meta=meta, postings=postings)
 
 
-def compute_transaction_signature(entry: data.Directive) -> Tuple[Cat]:
+def compute_transaction_signature(categories: Tuple[Cat, ...]) -> str:
     """Compute a unique signature for each transaction."""
-    categories = set(posting.meta["category"] for posting in entry.postings)
-    sigtuple = tuple(sorted(categories, key=lambda item: item.value))
+    sigtuple = tuple(sorted(set(categories), key=lambda item: item.value))
     return "_".join(s.name for s in sigtuple)
 
 
@@ -168,25 +185,22 @@ def get_description(signature):
 
 
 def produce_cash_flows_general(entry: data.Directive,
-                               account: Account) -> List[CashFlow]:
+                               account: Account,
+                               categories: Tuple[Cat, ...]) -> List[CashFlow]:
     """Produce cash flows using a generalized rule."""
-    has_dividend = any(posting.meta["category"] == Cat.DIVIDEND
-                       for posting in entry.postings)
+    has_dividend = Cat.DIVIDEND in categories
     flows = []
-    for posting in entry.postings:
-        category = posting.meta["category"]
+    for posting, category in zip(entry.postings, categories):
         if category == Cat.CASH:
             assert not posting.cost
             cf = CashFlow(entry.date, convert.get_weight(posting), has_dividend,
                           "cash", account, entry)
-            posting.meta["flow"] = cf
             flows.append(cf)
 
         elif category == Cat.OTHERASSET:
             # If the account deposits other assets, count this as an outflow.
             cf = CashFlow(entry.date, convert.get_weight(posting), False,
                           "other", account, entry)
-            posting.meta["flow"] = cf
             flows.append(cf)
 
         elif category == Cat.ASSET and has_dividend:
@@ -195,11 +209,9 @@ def produce_cash_flows_general(entry: data.Directive,
             # and one for the reinvestment            # 
             cf = CashFlow(entry.date, convert.get_weight(posting), has_dividend,
                           "dividend", account, entry)
-            posting.meta["flow"] = cf
             flows.append(cf)
             cf = CashFlow(entry.date, -convert.get_weight(posting), False,
                           "reinvest", account, entry)
-            posting.meta["flow"] = cf
             flows.append(cf)
 
     return flows
@@ -367,16 +379,55 @@ def extract_transactions_for_account(entries: data.Entries,
                    for posting in entry.postings)]
 
 
+class EntriesIndex:
+    """Transactions by account, commodities and open/close directives of a list
+    of entries, built in a single scan and shared by all investments."""
+
+    def __init__(self, entries: data.Entries):
+        self.transactions = list(data.filter_txns(entries))
+        self.transaction_indices: Dict[Account, List[int]] = collections.defaultdict(list)
+        for i, entry in enumerate(self.transactions):
+            for account in {posting.account for posting in entry.postings}:
+                self.transaction_indices[account].append(i)
+        self.commodity_map = getters.get_commodity_directives(entries)
+        self.open_close_map = getters.get_account_open_close(entries)
+
+    def transactions_for_account(self, config: Investment) -> List[data.Transaction]:
+        """Get the list of transactions affecting an investment account."""
+        match_accounts = set([config.asset_account])
+        match_accounts.update(config.dividend_accounts)
+        match_accounts.update(config.match_accounts)
+        indices = set()
+        for account in match_accounts:
+            indices.update(self.transaction_indices.get(account, []))
+        return [self.transactions[i] for i in sorted(indices)]
+
+    def entries_for_account(self, config: Investment) -> data.Entries:
+        """Get the transactions, commodity and open/close directives required to
+        process an investment account."""
+        entries: data.Entries = list(self.transactions_for_account(config))
+        if config.currency in self.commodity_map:
+            entries.append(self.commodity_map[config.currency])
+        if config.asset_account in self.open_close_map:
+            entries.extend(entry
+                           for entry in self.open_close_map[config.asset_account]
+                           if entry is not None)
+        return entries
+
+
 def process_account_entries(entries: data.Entries,
                             config: InvestmentConfig,
                             investment: Investment,
-                            check_explicit_flows: bool) -> AccountData:
+                            check_explicit_flows: bool,
+                            index: Optional[EntriesIndex] = None) -> AccountData:
     """Process a single account."""
     account = investment.asset_account
     logging.debug("Processing account: %s", account)
+    if index is None:
+        index = EntriesIndex(entries)
 
     # Extract the relevant transactions.
-    transactions = extract_transactions_for_account(entries, investment)
+    transactions = index.transactions_for_account(investment)
     if not transactions:
         logging.warning("No transactions for %s; skipping.", account)
         return None
@@ -387,30 +438,23 @@ def process_account_entries(entries: data.Entries,
                      for posting in entry.postings}
     catmap = categorize_accounts(config, investment, seen_accounts)
 
-    # Process each of the transactions, adding derived values as metadata.
+    # Process each of the transactions. The categories of the postings are
+    # stored in a side-table, the ledger entries are shared and not copied.
     cash_flows = []
-    balance = Inventory()
-    decorated_transactions = []
+    categories = []
     for entry in transactions:
 
-        # Compute the signature of the transaction.
-        entry = categorize_entry(catmap, entry)
-        signature = compute_transaction_signature(entry)
-        entry.meta["signature"] = signature
-
-        # TODO(blais): Cache balance in every transaction to speed up
-        # computation? Do this later.
-        if False:
-            # Update the total position in the asset we're interested in.
-            for posting in entry.postings:
-                if posting.meta["category"] is Cat.ASSET:
-                    balance.add_position(posting)
+        # Categorize the postings of the transaction.
+        entry_categories = posting_categories(catmap, entry)
 
         # Compute the cash flows associated with the transaction.
-        flows_general = produce_cash_flows_general(entry, account)
+        flows_general = produce_cash_flows_general(entry, account, entry_categories)
         if check_explicit_flows:
-            # Attempt the explicit method.
-            flows_explicit = produce_cash_flows_explicit(entry, account)
+            # Attempt the explicit method, which reads the categories and
+            # signature from the metadata of a copy of the entry.
+            decorated_entry = categorize_entry(catmap, entry)
+            flows_explicit = [flow._replace(transaction=entry)
+                              for flow in produce_cash_flows_explicit(decorated_entry, account)]
             if flows_explicit != flows_general:
                 print("Differences found between general and explicit methods:")
                 print("Explicit handlers:")
@@ -422,24 +466,22 @@ def process_account_entries(entries: data.Entries,
                 raise ValueError("Differences found between general and explicit methods:")
 
         cash_flows.extend(flows_general)
-        decorated_transactions.append(entry)
+        categories.append(entry_categories)
 
     cost_currencies = set(cf.amount.currency for cf in cash_flows)
     #assert len(cost_currencies) == 1, str(cost_currencies)
     cost_currency = cost_currencies.pop() if cost_currencies else None
 
     currency = investment.currency
-    commodity_map = getters.get_commodity_directives(entries)
-    comm = commodity_map[currency] if currency else None
+    comm = index.commodity_map[currency] if currency else None
 
-    open_close_map = getters.get_account_open_close(entries)
-    opn, cls = open_close_map[account]
+    opn, cls = index.open_close_map[account]
 
     # Compute the final balance.
-    balance = compute_balance_at(decorated_transactions)
+    balance = compute_balance_at(transactions, categories)
 
     return AccountData(account, currency, cost_currency, comm, opn, cls,
-                       cash_flows, decorated_transactions, balance, catmap)
+                       cash_flows, transactions, balance, catmap, categories)
 
 
 def prune_entries(entries: data.Entries, config: Config) -> data.Entries:
@@ -466,14 +508,15 @@ def prune_entries(entries: data.Entries, config: Config) -> data.Entries:
 
 
 def compute_balance_at(transactions: data.Entries,
+                       categories: List[Tuple[Cat, ...]],
                        date: Optional[Date] = None) -> Inventory:
     """Compute the balance before a specific date."""
     balance = Inventory()
-    for entry in transactions:
+    for entry, entry_categories in zip(transactions, categories):
         if date is not None and entry.date >= date:
             break
-        for posting in entry.postings:
-            if posting.meta["category"] is Cat.ASSET:
+        for posting, category in zip(entry.postings, entry_categories):
+            if category is Cat.ASSET:
                 balance.add_position(posting)
     return balance
 
@@ -506,7 +549,7 @@ def write_account_file(dcontext: display_context.DisplayContext,
 
         fprint("** Transactions\n")
         for entry in account_data.transactions:
-            fprint(epr(entry))
+            fprint(epr(categorize_entry(account_data.catmap, entry)))
         fprint("\n\n")
 
         # Flatten cash flows to a table.
@@ -545,6 +588,7 @@ def write_transactions_by_type(output_signatures: str,
     signature_map = collections.defaultdict(list)
     for accdata in account_data:
         for entry in accdata.transactions:
+            entry = categorize_entry(accdata.catmap, entry)
             signature_map[entry.meta['signature']].append(entry)
 
     # Render them to files, for debugging.
@@ -569,12 +613,44 @@ def write_transactions_by_type(output_signatures: str,
                 fprint()
 
 
+def process_serialized_account_entries(entries: data.Entries,
+                                       config: bytes,
+                                       investment: bytes,
+                                       check_explicit_flows: bool) -> AccountData:
+    """Process a single account, given the serialized configuration.
+    The generated config messages cannot be pickled for a process pool."""
+    return process_account_entries(entries,
+                                   InvestmentConfig.FromString(config),
+                                   Investment.FromString(investment),
+                                   check_explicit_flows)
+
+
+def process_investments(index: EntriesIndex,
+                        config: InvestmentConfig,
+                        investments: List[Investment],
+                        check_explicit_flows: bool,
+                        executor: Optional[Executor] = None) -> List[AccountData]:
+    """Process a list of accounts, optionally in parallel.
+
+    The workers of the executor only receive the entries of their investment.
+    The results are returned in the order of the investments."""
+    if executor is None:
+        return [process_account_entries([], config, investment, check_explicit_flows, index)
+                for investment in investments]
+    return list(executor.map(process_serialized_account_entries,
+                             [index.entries_for_account(investment) for investment in investments],
+                             itertools.repeat(config.SerializeToString()),
+                             [investment.SerializeToString() for investment in investments],
+                             itertools.repeat(check_explicit_flows)))
+
+
 def extract(entries: data.Entries,
             dcontext: display_context.DisplayContext,
             config: Config,
             end_date: Date,
             check_explicit_flows: bool,
-            output_dir: str) -> Dict[Account, AccountData]:
+            output_dir: str,
+            executor: Optional[Executor] = None) -> Dict[Account, AccountData]:
     """Extract data from the list of entries."""
     # Note: It might be useful to have an option for "the end of its history"
     # for Ledger that aren't updated up to today.
@@ -587,11 +663,12 @@ def extract(entries: data.Entries,
 
     # Prune the list of entries for performance.
     pruned_entries = prune_entries(entries, config)
+    index = EntriesIndex(pruned_entries)
 
     # Process all the accounts.
-    account_data = [process_account_entries(pruned_entries, config.investments, aconfig,
-                                            check_explicit_flows)
-                    for aconfig in config.investments.investment]
+    account_data = process_investments(index, config.investments,
+                                       list(config.investments.investment),
+                                       check_explicit_flows, executor)
     account_data = list(filter(None, account_data))
     account_data_map = {ad.account: ad for ad in account_data}
 
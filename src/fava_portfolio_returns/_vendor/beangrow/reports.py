@@ -234,8 +234,13 @@ def write_returns_html(  # noqa: PLR0913
             cash_flows, pricer, target_currency, end_date, dietz=True
         )
 
-        transactions = data.sorted(
-            [txn for ad in account_data for txn in ad.transactions]
+        transactions = sorted(
+            [
+                (txn, categories)
+                for ad in account_data
+                for txn, categories in zip(ad.transactions, ad.categories)
+            ],
+            key=lambda item: data.entry_sortkey(item[0]),
         )
 
         # Note: This is where the vast majority of the time is spent.
@@ -440,7 +445,7 @@ def plot_flows(  # noqa: PLR0915, PLR0913
     price_map: prices.PriceMap,
     target_currency: Currency,
     flows: List[CashFlow],
-    transactions: data.Entries,
+    transactions: List[Tuple[data.Transaction, Tuple[investments.Cat, ...]]],
     returns_rate: float,
 ) -> Dict[str, str]:
     """Produce plots from cash flows and returns, and more."""
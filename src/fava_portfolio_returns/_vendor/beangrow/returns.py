@@ -6,6 +6,7 @@ __license__ = "GNU GPLv2"
 
 import collections
 import datetime
+import heapq
 import itertools
 import logging
 import typing
@@ -281,7 +282,7 @@ def truncate_cash_flows( # noqa: C901
 
     if date_start is not None:
         # Truncate before the start date.
-        balance = compute_balance_at(account_data.transactions, date_start)
+        balance = compute_balance_at(account_data.transactions, account_data.categories, date_start)
         if not balance.is_empty():
             cost_balance = balance.reduce(pricer.get_value, date_start)
             cost_position = cost_balance.get_only_position()
@@ -301,7 +302,7 @@ def truncate_cash_flows( # noqa: C901
         # Truncate after the end date.
         # Note: Avoid redundant balance iteration by computing it once and
         # caching it on every single transaction.
-        balance = compute_balance_at(account_data.transactions, date_end)
+        balance = compute_balance_at(account_data.transactions, account_data.categories, date_end)
         if not balance.is_empty():
             cost_balance = balance.reduce(pricer.get_value, date_end - ONE_DAY)
             cost_position = cost_balance.get_only_position()
@@ -344,23 +345,27 @@ def truncate_and_merge_cash_flows(
     date_end: Optional[Date],
 ) -> List[CashFlow]:
     """Truncate and merge the cash flows for given list of account data."""
-    cash_flows = []
-    for ad in account_data_list:
-        cash_flows.extend(truncate_cash_flows(pricer, ad, date_start, date_end))
-    cash_flows.sort(key=lambda item: item[0])
-    return cash_flows
+    # The truncated cash flows of each account are sorted by date, merge them
+    # instead of sorting them again (the merge is stable, like the sort).
+    return list(heapq.merge(
+        *(truncate_cash_flows(pricer, ad, date_start, date_end) for ad in account_data_list),
+        key=lambda item: item[0],
+    ))
 
 
 def compute_portfolio_values(
-    price_map: prices.PriceMap, target_currency: Currency, transactions: data.Entries
+    price_map: prices.PriceMap,
+    target_currency: Currency,
+    transactions: List[Tuple[data.Transaction, Tuple[Cat, ...]]],
 ) -> Tuple[List[Date], List[float]]:
-    """Compute a serie of portfolio values over time."""
+    """Compute a serie of portfolio values over time, given the sorted
+    transactions and the categories of their postings."""
 
     # Infer the list of required prices.
     currency_pairs = set()
-    for entry in transactions:
-        for posting in entry.postings:
-            if posting.meta["category"] is Cat.ASSET and posting.cost:
+    for entry, categories in transactions:
+        for posting, category in zip(entry.postings, categories):
+            if category is Cat.ASSET and posting.cost:
                 currency_pairs.add((posting.units.currency, posting.cost.currency))
 
     first = lambda x: x[0]  # noqa: E731
@@ -371,7 +376,7 @@ def compute_portfolio_values(
                 for pair in currency_pairs
                 for date, _ in prices.get_all_prices(price_map, pair)
             ),
-            ((entry.date, entry) for entry in transactions),
+            ((entry.date, (entry, categories)) for entry, categories in transactions),
         ),
         key=first,
     )
@@ -382,11 +387,12 @@ def compute_portfolio_values(
     balance = Inventory()
     for date, group in itertools.groupby(price_dates, key=first):
         # Update balances.
-        for _, entry in group:
-            if entry is None:
+        for _, transaction in group:
+            if transaction is None:
                 continue
-            for posting in entry.postings:
-                if posting.meta["category"] is Cat.ASSET:
+            entry, categories = transaction
+            for posting, category in zip(entry.postings, categories):
+                if category is Cat.ASSET:
                     balance.add_position(posting)
 
         # Convert to market value.
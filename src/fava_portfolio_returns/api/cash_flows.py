@@ -8,8 +8,6 @@ from beancount.core.number import ZERO
 
 from fava_portfolio_returns.core.intervals import truncate_date_fn
 from fava_portfolio_returns.core.portfolio import FilteredPortfolio
-from fava_portfolio_returns.core.utils import convert_cash_flows_to_currency
-from fava_portfolio_returns.core.utils import filter_cash_flows_by_date
 
 
 @dataclass
@@ -22,29 +20,27 @@ class CashFlowChartValue:
 def cash_flows_chart(
     p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date, interval: Literal["monthly", "yearly"]
 ) -> list[CashFlowChartValue]:
-    cash_flows = p.cash_flows()
-    cash_flows = filter_cash_flows_by_date(cash_flows, start_date, end_date)
-    cash_flows = convert_cash_flows_to_currency(p.pricer, p.target_currency, cash_flows)
+    cash_flows = p.cash_flow_columns().between(start_date, end_date)
+    amounts = cash_flows.convert(p.pricer, p.target_currency)
 
     truncate_date = truncate_date_fn(interval)
     # ex. {"2025": {"date": "2025", "div": 5, "exdiv": 3}}
     chart: dict[str, CashFlowChartValue] = {}
-    for flow in cash_flows:
-        date = truncate_date(flow.date)
+    for flow_date, is_dividend, amount in zip(cash_flows.dates(), cash_flows.dividend.tolist(), amounts):
+        date = truncate_date(flow_date)
         if date not in chart:
             chart[date] = CashFlowChartValue(date=date, div=ZERO, exdiv=ZERO)
 
-        if flow.is_dividend:
-            chart[date].div += flow.amount.number or ZERO
+        if is_dividend:
+            chart[date].div += amount
         else:
-            chart[date].exdiv += flow.amount.number or ZERO
+            chart[date].exdiv += amount
 
     return sorted(chart.values(), key=lambda x: x.date)
 
 
 def cash_flows_table(p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date):
-    cash_flows = p.cash_flows()
-    cash_flows = filter_cash_flows_by_date(cash_flows, start_date, end_date)
+    cash_flows = p.cash_flow_columns().between(start_date, end_date).to_cash_flows()
     cash_flows = sorted(cash_flows, key=lambda x: x.date, reverse=True)
     return [
         {
@@ -67,10 +63,8 @@ def dividends_chart(
     end_date: datetime.date,
     interval: Literal["monthly", "yearly"],
 ) -> list[dict[str, str | Decimal]]:
-    cash_flows = p.cash_flows()
-    cash_flows = filter_cash_flows_by_date(cash_flows, start_date, end_date)
-    cash_flows = [flow for flow in cash_flows if flow.is_dividend]
-    cash_flows = convert_cash_flows_to_currency(p.pricer, p.target_currency, cash_flows)
+    cash_flows = p.cash_flow_columns().between(start_date, end_date).dividends()
+    amounts = cash_flows.convert(p.pricer, p.target_currency)
 
     currency_name_by_currency = {cur.currency: cur.name for cur in p.portfolio.investments_config.currencies}
     # use currency name if account has a single currency, otherwise use account name
@@ -84,13 +78,13 @@ def dividends_chart(
     truncate_date = truncate_date_fn(interval)
     # ex. {"2025": {"_date": "2025", "Investment1": 5, "Investment2": 3}}
     chart: dict[str, dict[str, str | Decimal]] = {}
-    for flow in cash_flows:
-        date = truncate_date(flow.date)
-        label = label_by_account[flow.account]
+    for flow_date, account, amount in zip(cash_flows.dates(), cash_flows.accounts(), amounts):
+        date = truncate_date(flow_date)
+        label = label_by_account[account]
 
         if date not in chart:
             chart[date] = defaultdict(Decimal)
             chart[date]["_date"] = date
-        chart[date][label] += flow.amount.number  # type: ignore[operator]
+        chart[date][label] += amount  # type: ignore[operator]
 
     return sorted(chart.values(), key=lambda x: x["_date"])
@@ -6,8 +6,6 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 from fava_portfolio_returns.core.portfolio import FilteredPortfolio
-from fava_portfolio_returns.core.utils import convert_cash_flows_to_currency
-from fava_portfolio_returns.core.utils import filter_cash_flows_by_date
 from fava_portfolio_returns.core.utils import get_prices
 from fava_portfolio_returns.metrics.base import Series
 from fava_portfolio_returns.metrics.registry import get_metric
@@ -24,15 +22,14 @@ class NamedSeries:
 
 def get_series_cash_flows(p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date):
     """Get filtered cash flows (excluding dividends)"""
-    cash_flows = p.cash_flows()
-    cash_flows = filter_cash_flows_by_date(cash_flows, start_date, end_date)
-    cash_flows = convert_cash_flows_to_currency(p.pricer, p.target_currency, cash_flows)
+    cash_flows = p.cash_flow_columns().between(start_date, end_date)
+    amounts = cash_flows.convert(p.pricer, p.target_currency)
 
     # Aggregate by date, excluding dividends
     daily_flows: dict[datetime.date, Decimal] = defaultdict(Decimal)
-    for flow in cash_flows:
-        if not flow.is_dividend and flow.amount.number is not None:  # Exclude dividends and handle None values
-            daily_flows[flow.date] += flow.amount.number
+    for flow_date, is_dividend, amount in zip(cash_flows.dates(), cash_flows.dividend.tolist(), amounts):
+        if not is_dividend:
+            daily_flows[flow_date] += amount
 
     return sorted(daily_flows.items(), key=lambda x: x[0])
 
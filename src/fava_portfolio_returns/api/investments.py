@@ -1,24 +1,60 @@
 import datetime
+import functools
+import itertools
 import logging
+import pickle
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from typing import Optional
+from typing import Sequence
 
 from beancount.core import convert
 
+from fava_portfolio_returns._vendor.beangrow.investments import Currency
+from fava_portfolio_returns._vendor.beangrow.returns import compute_dietz
 from fava_portfolio_returns.core.intervals import ONE_DAY
 from fava_portfolio_returns.core.portfolio import FilteredPortfolio
+from fava_portfolio_returns.core.portfolio import InvestmentId
 from fava_portfolio_returns.core.portfolio import Portfolio
+from fava_portfolio_returns.core.utils import convert_cash_flows_to_currency
 from fava_portfolio_returns.core.utils import cost_value_of_inv
 from fava_portfolio_returns.core.utils import market_value_of_inv
-from fava_portfolio_returns.metrics.irr import IRR
-from fava_portfolio_returns.metrics.mdd import MDD
-from fava_portfolio_returns.metrics.mdm import ModifiedDietzMethod
-from fava_portfolio_returns.metrics.pnl import TotalPNL
+from fava_portfolio_returns.metrics.irr import IrrProblem
+from fava_portfolio_returns.metrics.irr import cash_flows_irr_problem
+from fava_portfolio_returns.metrics.irr import compute_irr_batch
+from fava_portfolio_returns.metrics.mdd import drawdowns
 from fava_portfolio_returns.metrics.twr import TWR
 
 logger = logging.getLogger(__name__)
 
+# Number of rows of the investments table computed per task. The IRR problems of these rows are solved in a single
+# batch, and the rows are streamed once all rows of the task are computed.
+ROWS_PER_TASK = 8
+
 
 def group_stats(p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date):
+    """returns the stats of a group"""
+    return groups_stats([p], start_date, end_date)[0]
+
+
+def groups_stats(portfolios: Sequence[FilteredPortfolio], start_date: datetime.date, end_date: datetime.date):
+    """returns the stats of many groups, solving the IRR problems of all groups in a single batch"""
+    stats_and_problems = [group_stats_and_irr_problem(p, start_date, end_date) for p in portfolios]
+    irrs = compute_irr_batch([problem for _, problem in stats_and_problems])
+    for (stats, _), irr in zip(stats_and_problems, irrs):
+        stats["irr"] = irr
+    return [stats for stats, _ in stats_and_problems]
+
+
+def group_stats_and_irr_problem(
+    p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date
+) -> tuple[dict, IrrProblem]:
+    """returns the stats of a group without the IRR, and the IRR problem of the group
+
+    All columns are computed in a single pass, which shares the balances and values at the start and end
+    of the date range (P/L), the truncated cash flows (IRR and MDM), and the TWR series (TWR and MDD).
+    """
     # compute unrealized P/L at start_date
     balance_start = p.balance_at(start_date - ONE_DAY)
     cost_value_start = cost_value_of_inv(p.pricer, p.target_currency, balance_start)
@@ -37,51 +73,119 @@ def group_stats(p: FilteredPortfolio, start_date: datetime.date, end_date: datet
     units = balance.reduce(convert.get_units)
     unrealized_pnl_end = market_value - cost_value
 
-    total_pnl = Decimal(TotalPNL().single(p, start_date, end_date))
+    # see TotalPNL
+    start_returns = market_value_start - p.cash_at(start_date - ONE_DAY)
+    end_returns = market_value - p.cash_at(end_date)
+    total_pnl = Decimal(float(end_returns - start_returns))
     unrealized_pnl = unrealized_pnl_end - unrealized_pnl_start
     realized_pnl = total_pnl - unrealized_pnl
-    irr = IRR().single(p, start_date, end_date)
-    mdm = ModifiedDietzMethod().single(p, start_date, end_date)
-    twr = TWR().single(p, start_date, end_date)
-    mdd = MDD().single(p, start_date, end_date)
 
-    return {
+    # see IRR and ModifiedDietzMethod; in beangrow the end date is exclusive, therefore add one day
+    cash_flows = p.truncated_cash_flows(start_date, end_date + ONE_DAY)
+    cash_flows = convert_cash_flows_to_currency(p.pricer, p.target_currency, cash_flows)
+    irr_problem = cash_flows_irr_problem(cash_flows, start_date, end_date)
+    mdm = compute_dietz(cash_flows, p.pricer, p.target_currency, end_date + ONE_DAY)
+
+    # see TWR and MDD
+    twr_series = TWR().series(p, start_date, end_date)
+    twr = twr_series[-1][1] if twr_series else 0.0
+    mdd = min((drawdown for _, drawdown in drawdowns(twr_series)), default=0.0)
+
+    stats = {
         "units": [pos.units for pos in units],
         "costValue": cost_value,
         "marketValue": market_value,
         "totalPnl": total_pnl,
         "realizedPnl": realized_pnl,
         "unrealizedPnl": unrealized_pnl,
-        "irr": irr,
+        "irr": 0.0,  # see groups_stats()
         "mdm": mdm,
         "twr": twr,
         "mdd": mdd,
     }
+    return stats, irr_problem
+
+
+# portfolio of the worker processes, see init_worker()
+worker_portfolio: Optional[Portfolio] = None  # pylint: disable=invalid-name
+
 
+def init_worker(pickled_portfolio: bytes) -> None:
+    """initializer of the worker processes, which receive the portfolio once instead of once per row
 
-def investments_group_by_group(p: Portfolio, start_date: datetime.date, end_date: datetime.date):
-    for group in p.investments_config.groups:
-        logger.debug("calculating stats for %s", group.name)
-        fp = p.filter([group.id], group.currency)
+    The portfolio is passed pickled, because forked workers would otherwise inherit its locks in any state.
+    """
+    global worker_portfolio  # pylint: disable=global-statement
+    worker_portfolio = pickle.loads(pickled_portfolio)
+
+
+def filtered_groups_stats(
+    p: Optional[Portfolio],
+    start_date: datetime.date,
+    end_date: datetime.date,
+    rows: Sequence[tuple[InvestmentId, Optional[Currency]]],
+):
+    """returns the target currency and the stats of the filtered portfolio of each (investment filter, target currency)
+
+    If p is None, the portfolio of the worker process is used.
+    """
+    portfolio = p or worker_portfolio
+    assert portfolio is not None, "the worker process was not initialized with init_worker()"
+    fps = [portfolio.filter([investment_filter], target_currency) for investment_filter, target_currency in rows]
+    return [(fp.target_currency, stats) for fp, stats in zip(fps, groups_stats(fps, start_date, end_date))]
+
+
+def map_group_stats(
+    p: Portfolio,
+    rows: Sequence[tuple[InvestmentId, Optional[Currency]]],
+    start_date: datetime.date,
+    end_date: datetime.date,
+    executor: Optional[Executor],
+):
+    """returns an iterator over the stats of each (investment filter, target currency) row, in the order of the rows
+
+    The rows are computed in tasks of ROWS_PER_TASK rows. With an executor, the tasks are computed concurrently.
+    The workers of a StickyProcessPool must be initialized with init_worker().
+    """
+    # worker processes use their copy of the portfolio, instead of receiving the portfolio with every task
+    portfolio = p if executor is None or isinstance(executor, ThreadPoolExecutor) else None
+    compute = functools.partial(filtered_groups_stats, portfolio, start_date, end_date)
+    # a StickyProcessPool assigns the tasks to its workers by their arguments, which must be hashable
+    tasks = [tuple(rows[i : i + ROWS_PER_TASK]) for i in range(0, len(rows), ROWS_PER_TASK)]
+    if executor is None:
+        return itertools.chain.from_iterable(map(compute, tasks))
+    return itertools.chain.from_iterable(executor.map(compute, tasks))
+
+
+def investments_group_by_group(
+    p: Portfolio, start_date: datetime.date, end_date: datetime.date, executor: Optional[Executor] = None
+):
+    groups = p.investments_config.groups
+    rows = [(group.id, group.currency) for group in groups]
+    for group, (currency, stats) in zip(groups, map_group_stats(p, rows, start_date, end_date, executor)):
+        logger.debug("calculated stats for %s", group.name)
         yield {
             "id": group.id,
             "name": group.name,
-            "currency": fp.target_currency,
-            **group_stats(fp, start_date, end_date),
+            "currency": currency,
+            **stats,
         }
 
 
 def investments_group_by_currency(
-    p: Portfolio, target_currency: str, start_date: datetime.date, end_date: datetime.date
+    p: Portfolio,
+    target_currency: str,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    executor: Optional[Executor] = None,
 ):
-    for currency in p.investments_config.currencies:
-        if not currency.isInvestment:
-            continue
-        logger.debug("calculating stats for %s", currency.name)
-        fp = p.filter([currency.id], target_currency)
+    currencies = [currency for currency in p.investments_config.currencies if currency.isInvestment]
+    rows = [(currency.id, target_currency) for currency in currencies]
+    for currency, (fp_currency, stats) in zip(currencies, map_group_stats(p, rows, start_date, end_date, executor)):
+        logger.debug("calculated stats for %s", currency.name)
         yield {
             "id": currency.id,
             "name": currency.name,
-            "currency": fp.target_currency,
-            **group_stats(fp, start_date, end_date),
+            "currency": fp_currency,
+            **stats,
         }
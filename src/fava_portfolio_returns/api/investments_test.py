@@ -1,10 +1,24 @@
 import datetime
+import pickle
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal as D
+from pathlib import Path
+from unittest import mock
 
 from beancount.core.amount import Amount
 
 from fava_portfolio_returns.api.investments import group_stats
+from fava_portfolio_returns.api.investments import init_worker
+from fava_portfolio_returns.api.investments import investments_group_by_currency
+from fava_portfolio_returns.api.investments import investments_group_by_group
+from fava_portfolio_returns.core.portfolio import StickyProcessPool
+from fava_portfolio_returns.metrics.irr import IRR
+from fava_portfolio_returns.metrics.irr import compute_irr_batch
+from fava_portfolio_returns.metrics.mdd import MDD
+from fava_portfolio_returns.metrics.mdm import ModifiedDietzMethod
+from fava_portfolio_returns.metrics.pnl import TotalPNL
+from fava_portfolio_returns.metrics.twr import TWR
 from fava_portfolio_returns.test.test import approx2
 from fava_portfolio_returns.test.test import load_portfolio_file
 
@@ -107,3 +121,51 @@ class TestInvestments(unittest.TestCase):
             "twr": approx2(1.82),
             "mdd": approx2(-0.34),
         }
+
+    def test_group_stats_matches_metrics(self):
+        p = load_portfolio_file(Path("example/example.beancount"))
+        for start_date, end_date in [
+            (datetime.date(2020, 1, 1), datetime.date(2022, 12, 31)),
+            (datetime.date(2021, 3, 15), datetime.date(2021, 9, 30)),
+        ]:
+            for group in p.portfolio.investments_config.groups:
+                fp = p.portfolio.filter([group.id], group.currency)
+                stats = group_stats(fp, start_date, end_date)
+                assert stats["totalPnl"] == D(TotalPNL().single(fp, start_date, end_date))
+                assert stats["irr"] == IRR().single(fp, start_date, end_date)
+                assert stats["mdm"] == ModifiedDietzMethod().single(fp, start_date, end_date)
+                assert stats["twr"] == TWR().single(fp, start_date, end_date)
+                assert stats["mdd"] == MDD().single(fp, start_date, end_date)
+
+    def test_investments_executor(self):
+        p = load_portfolio_file(Path("example/example.beancount")).portfolio
+        start_date, end_date = datetime.date(2020, 1, 1), datetime.date(2022, 12, 31)
+        by_group = list(investments_group_by_group(p, start_date, end_date))
+        by_currency = list(investments_group_by_currency(p, "USD", start_date, end_date))
+        assert [row["id"] for row in by_group] == [group.id for group in p.investments_config.groups]
+
+        # the rows computed in a worker pool are equal to the serially computed rows, in the same order
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert list(investments_group_by_group(p, start_date, end_date, executor)) == by_group
+            assert list(investments_group_by_currency(p, "USD", start_date, end_date, executor)) == by_currency
+        with StickyProcessPool(2, initializer=init_worker, initargs=(pickle.dumps(p),)) as pool:
+            assert list(investments_group_by_group(p, start_date, end_date, pool)) == by_group
+            assert list(investments_group_by_currency(p, "USD", start_date, end_date, pool)) == by_currency
+            # a repeated task is computed by the same worker process
+            workers = dict(pool.assigned_workers)
+            assert list(investments_group_by_group(p, start_date, end_date, pool)) == by_group
+            assert pool.assigned_workers == workers
+            assert sorted(set(workers.values())) == [0, 1]
+
+    def test_investments_irr_batch(self):
+        p = load_portfolio_file(Path("example/example.beancount")).portfolio
+        start_date, end_date = datetime.date(2020, 1, 1), datetime.date(2022, 12, 31)
+        rows = list(investments_group_by_group(p, start_date, end_date))
+
+        # the IRR problems of the rows of a task are solved in a single batch
+        with (
+            mock.patch("fava_portfolio_returns.api.investments.ROWS_PER_TASK", 4),
+            mock.patch("fava_portfolio_returns.api.investments.compute_irr_batch", wraps=compute_irr_batch) as mocked,
+        ):
+            assert list(investments_group_by_group(p, start_date, end_date)) == rows
+        assert [len(call.args[0]) for call in mocked.call_args_list] == [4, len(rows) - 4]
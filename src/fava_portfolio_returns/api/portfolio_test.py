@@ -55,6 +55,12 @@ class TestPortfolio(unittest.TestCase):
             },
         ]
 
+        # the portfolios of each currency are interned, i.e. a second call does not build new ones
+        filtered_portfolios = dict(p.portfolio.filtered_portfolios)
+        assert len(filtered_portfolios) > len(allocation)
+        assert portfolio_allocation(p, datetime.date(2023, 1, 1)) == allocation
+        assert all(fp is filtered_portfolios[key] for key, fp in p.portfolio.filtered_portfolios.items())
+
     def test_portfolio_values_price_before_first_txn(self):
         p = load_portfolio_str(
             """
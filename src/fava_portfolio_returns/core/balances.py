@@ -0,0 +1,98 @@
+import bisect
+import copy
+import datetime
+from typing import Optional
+
+from beancount.core.data import Transaction
+from beancount.core.inventory import Inventory
+
+from fava_portfolio_returns._vendor.beangrow.investments import AccountData
+from fava_portfolio_returns._vendor.beangrow.investments import Cat
+
+# Store a copy of the balance every N transactions. A balance is restored from the nearest checkpoint,
+# which bounds the memory usage for accounts with many lots (e.g. savings plans) and the work per lookup.
+CHECKPOINT_INTERVAL = 32
+
+# a transaction and the categories of its postings (see AccountData.categories)
+CategorizedTransaction = tuple[Transaction, tuple[Cat, ...]]
+
+
+class BalanceIndex:
+    """Cumulative balances and cash flows of an investment, indexed by date."""
+
+    account_data: AccountData
+
+    def __init__(
+        self,
+        account_data: AccountData,
+        previous: Optional["BalanceIndex"] = None,
+        unchanged_before: Optional[datetime.date] = None,
+    ):
+        """Build the index of an investment.
+
+        If the index of a previous load of the ledger is given, its checkpoints and cash balances
+        before unchanged_before are reused, and only the later transactions and cash flows are processed.
+        """
+        self.account_data = account_data
+
+        # date of every transaction, and the balance after every CHECKPOINT_INTERVAL transactions
+        self.dates: list[datetime.date] = [entry.date for entry in account_data.transactions]
+        self.checkpoints: list[Inventory] = []
+        if previous and unchanged_before:
+            n = bisect.bisect_left(self.dates, unchanged_before)
+            if previous.dates[:n] == self.dates[:n]:
+                # checkpoint i is the balance before transaction i * CHECKPOINT_INTERVAL
+                self.checkpoints = previous.checkpoints[: n // CHECKPOINT_INTERVAL + 1]
+
+        start = max(len(self.checkpoints) - 1, 0) * CHECKPOINT_INTERVAL
+        balance = copy.copy(self.checkpoints[-1]) if self.checkpoints else Inventory()
+        for i in range(start, len(account_data.transactions)):
+            if i % CHECKPOINT_INTERVAL == 0 and i // CHECKPOINT_INTERVAL == len(self.checkpoints):
+                self.checkpoints.append(copy.copy(balance))
+            add_asset_postings(balance, account_data.transactions[i], account_data.categories[i])
+
+        # date of every cash flow, and the cumulative sum of all cash flows until this date
+        self.cash_dates: list[datetime.date] = []
+        self.cash_balances: list[Inventory] = []
+        flows = account_data.cash_flows
+        if previous and unchanged_before:
+            n = bisect.bisect_left(previous.cash_dates, unchanged_before)
+            self.cash_dates = previous.cash_dates[:n]
+            self.cash_balances = previous.cash_balances[:n]
+            flows = flows[bisect.bisect_left(flows, unchanged_before, key=lambda flow: flow.date) :]
+
+        cash = copy.copy(self.cash_balances[-1]) if self.cash_balances else Inventory()
+        for flow in flows:
+            cash.add_amount(flow.amount)
+            if self.cash_dates and self.cash_dates[-1] == flow.date:
+                self.cash_balances[-1] = copy.copy(cash)
+            else:
+                self.cash_dates.append(flow.date)
+                self.cash_balances.append(copy.copy(cash))
+
+    def balance_at(self, date: datetime.date) -> Inventory:
+        """returns the inventory at the end of the given date; the returned inventory must not be modified"""
+        if not self.checkpoints:
+            return Inventory()
+
+        n = bisect.bisect_right(self.dates, date)
+        checkpoint = min(n // CHECKPOINT_INTERVAL, len(self.checkpoints) - 1)
+        start = checkpoint * CHECKPOINT_INTERVAL
+        if start == n:
+            return self.checkpoints[checkpoint]
+
+        balance = copy.copy(self.checkpoints[checkpoint])
+        for entry, categories in zip(self.account_data.transactions[start:n], self.account_data.categories[start:n]):
+            add_asset_postings(balance, entry, categories)
+        return balance
+
+    def cash_at(self, date: datetime.date) -> Inventory:
+        """returns the sum of all cash flows until the end of the given date; the returned inventory must not be modified"""
+        n = bisect.bisect_right(self.cash_dates, date)
+        return self.cash_balances[n - 1] if n > 0 else Inventory()
+
+
+def add_asset_postings(balance: Inventory, entry: Transaction, categories: tuple[Cat, ...]):
+    for posting, category in zip(entry.postings, categories):
+        if category is Cat.ASSET:
+            balance.add_position(posting)
@@ -0,0 +1,54 @@
+import datetime
+import unittest
+from pathlib import Path
+
+from beancount.core.inventory import Inventory
+
+from fava_portfolio_returns._vendor.beangrow.investments import compute_balance_at
+from fava_portfolio_returns.core.balances import CHECKPOINT_INTERVAL
+from fava_portfolio_returns.core.balances import BalanceIndex
+from fava_portfolio_returns.core.intervals import ONE_DAY
+from fava_portfolio_returns.test.test import load_portfolio_file
+
+
+class TestBalanceIndex(unittest.TestCase):
+    def test_balance_at(self):
+        p = load_portfolio_file(Path("example/example.beancount"))
+        account_data = max(p.account_data_list, key=lambda ad: len(ad.transactions))
+        assert len(account_data.transactions) > 2 * CHECKPOINT_INTERVAL
+
+        index = BalanceIndex(account_data)
+        assert index.balance_at(account_data.transactions[0].date - ONE_DAY) == Inventory()
+        for entry in account_data.transactions:
+            # compute_balance_at() excludes the given date
+            expected = compute_balance_at(account_data.transactions, account_data.categories, entry.date + ONE_DAY)
+            assert index.balance_at(entry.date) == expected
+        assert index.balance_at(datetime.date(2100, 1, 1)) == account_data.balance
+
+    def test_cash_at(self):
+        p = load_portfolio_file(Path("example/example.beancount"))
+        account_data = max(p.account_data_list, key=lambda ad: len(ad.cash_flows))
+
+        index = BalanceIndex(account_data)
+        assert index.cash_at(account_data.cash_flows[0].date - ONE_DAY) == Inventory()
+        for flow in account_data.cash_flows:
+            expected = Inventory()
+            for f in account_data.cash_flows:
+                if f.date <= flow.date:
+                    expected.add_amount(f.amount)
+            assert index.cash_at(flow.date) == expected
+
+    def test_reuse_previous_index(self):
+        p = load_portfolio_file(Path("example/example.beancount"))
+        account_data = max(p.account_data_list, key=lambda ad: len(ad.transactions))
+        previous = BalanceIndex(account_data)
+        unchanged_before = account_data.transactions[2 * CHECKPOINT_INTERVAL + 5].date
+
+        index = BalanceIndex(account_data, previous, unchanged_before)
+        expected = BalanceIndex(account_data)
+        assert index.dates == expected.dates
+        assert index.checkpoints == expected.checkpoints
+        assert index.cash_dates == expected.cash_dates
+        assert index.cash_balances == expected.cash_balances
+        # checkpoints before the changed date are shared
+        assert index.checkpoints[1] is previous.checkpoints[1]
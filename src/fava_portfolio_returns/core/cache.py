@@ -0,0 +1,96 @@
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class ResponseCache:
+    """LRU cache of API responses, bounded by the total size of the pickled responses.
+
+    The responses are stored pickled, which bounds the memory usage and
+    returns a fresh copy on every hit, i.e. callers can't modify cached responses.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """returns the cached response, or None"""
+        with self.lock:
+            data = self.entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return pickle.loads(data)
+
+    def put(self, key: Hashable, response: Any) -> None:
+        data = pickle.dumps(response, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self.entries[key] = data
+            self.size += len(data)
+            # evict least recently used responses
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries), "bytes": self.size}
+
+
+class SingleFlight:
+    """Runs a function at most once at a time per key.
+
+    Concurrent callers with the same key wait for the running call and share its result (or exception).
+    """
+
+    def __init__(self) -> None:
+        self.calls: dict[Hashable, Future] = {}
+        self.coalesced = 0
+        self.lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        with self.lock:
+            running = self.calls.get(key)
+            if running is not None:
+                self.coalesced += 1
+            else:
+                future: Future[T] = Future()
+                self.calls[key] = future
+        if running is not None:
+            return running.result()
+
+        try:
+            result = func()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
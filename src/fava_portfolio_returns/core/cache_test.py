@@ -0,0 +1,88 @@
+import pickle
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from fava_portfolio_returns.core.cache import ResponseCache
+from fava_portfolio_returns.core.cache import SingleFlight
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_get_put(self):
+        cache = ResponseCache(max_bytes=1024)
+        assert cache.get("a") is None
+        cache.put("a", {"series": [1, 2, 3]})
+
+        response = cache.get("a")
+        assert response == {"series": [1, 2, 3]}
+        # every hit returns a copy
+        response["series"].append(4)
+        assert cache.get("a") == {"series": [1, 2, 3]}
+        assert cache.stats() == {
+            "hits": 2,
+            "misses": 1,
+            "entries": 1,
+            "bytes": len(pickle.dumps({"series": [1, 2, 3]}, protocol=pickle.HIGHEST_PROTOCOL)),
+        }
+
+    def test_evict_least_recently_used(self):
+        size = len(pickle.dumps("x" * 100, protocol=pickle.HIGHEST_PROTOCOL))
+        cache = ResponseCache(max_bytes=2 * size)
+        cache.put("a", "x" * 100)
+        cache.put("b", "x" * 100)
+        cache.get("a")
+        cache.put("c", "x" * 100)
+
+        assert list(cache.entries) == ["a", "c"]
+        assert cache.size == 2 * size
+
+        # responses larger than the cache are not cached
+        cache.put("d", "x" * 1000)
+        assert cache.get("d") is None
+        assert list(cache.entries) == ["a", "c"]
+
+        cache.clear()
+        assert cache.get("a") is None
+        assert cache.size == 0
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_coalesce_concurrent_calls(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def build():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return object()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(flight.do, 1, build)
+            started.wait()
+            others = [executor.submit(flight.do, 1, build) for _ in range(3)]
+            while flight.coalesced < 3:
+                time.sleep(0.01)
+            release.set()
+            results = [first.result()] + [future.result() for future in others]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.coalesced == 3
+
+        # the next call with the same key runs again
+        assert flight.do(1, lambda: 2) == 2
+        assert flight.calls == {}
+
+    def test_exception(self):
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("build failed")
+
+        with self.assertRaises(ValueError):
+            flight.do(1, fail)
+        assert flight.calls == {}
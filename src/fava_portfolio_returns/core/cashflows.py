@@ -0,0 +1,179 @@
+import datetime
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+from beancount.core.amount import Amount
+from beancount.core.number import ZERO
+
+from fava_portfolio_returns._vendor.beangrow.investments import AccountData
+from fava_portfolio_returns._vendor.beangrow.investments import CashFlow
+from fava_portfolio_returns._vendor.beangrow.investments import Currency
+from fava_portfolio_returns.core.pricer import CurrencyConversionException
+from fava_portfolio_returns.core.pricer import Pricer
+
+# sources of cash flows (see beangrow), stored as index into this tuple
+SOURCES = ("cash", "other", "dividend", "reinvest", "open", "close")
+SOURCE_CODES = {source: i for i, source in enumerate(SOURCES)}
+
+
+@dataclass(frozen=True)
+class CashFlowColumns:  # pylint: disable=too-many-instance-attributes
+    """Cash flows of one or more investments in a columnar layout, ordered by date.
+
+    Every column has one row per cash flow. The amounts are a plain list of exact Decimal numbers, because the API
+    returns sums of them and a NumPy array of Decimal objects is neither compact nor vectorized. The other columns
+    are NumPy arrays: currencies, sources and investments are stored as codes,
+    and the source transaction as index into the transactions of the investment (-1 if there is none).
+    CashFlow objects are only created on demand, see to_cash_flows().
+    """
+
+    account_data_list: list[AccountData]
+    currencies: list[Currency]
+    ordinals: np.ndarray  # date.toordinal() of the cash flow
+    numbers: list[Decimal]  # amounts, in the currency given by currency_codes
+    currency_codes: np.ndarray  # index into currencies
+    dividend: np.ndarray
+    source_codes: np.ndarray  # index into SOURCES
+    account_codes: np.ndarray  # index into account_data_list
+    transaction_indices: np.ndarray  # index into AccountData.transactions
+
+    @staticmethod
+    def from_account_data(account_data: AccountData) -> "CashFlowColumns":
+        flows = account_data.cash_flows
+        n = len(flows)
+        transaction_indices = {id(txn): i for i, txn in enumerate(account_data.transactions)}
+        currencies = sorted({flow.amount.currency for flow in flows})
+        currency_codes = {currency: i for i, currency in enumerate(currencies)}
+
+        columns = CashFlowColumns(
+            account_data_list=[account_data],
+            currencies=currencies,
+            ordinals=np.fromiter((flow.date.toordinal() for flow in flows), dtype=np.int64, count=n),
+            numbers=[flow.amount.number if flow.amount.number is not None else ZERO for flow in flows],
+            currency_codes=np.fromiter((currency_codes[flow.amount.currency] for flow in flows), np.int32, n),
+            dividend=np.fromiter((flow.is_dividend for flow in flows), dtype=np.bool_, count=n),
+            source_codes=np.fromiter((SOURCE_CODES[flow.source] for flow in flows), dtype=np.int8, count=n),
+            account_codes=np.zeros(n, dtype=np.int32),
+            transaction_indices=np.fromiter(
+                (transaction_indices.get(id(flow.transaction), -1) for flow in flows), dtype=np.int64, count=n
+            ),
+        )
+        return columns.take(np.argsort(columns.ordinals, kind="stable"))
+
+    @staticmethod
+    def concat(parts: list["CashFlowColumns"]) -> "CashFlowColumns":
+        """merges the cash flows of multiple investments, ordered by date and by investment for the same date"""
+        currencies = sorted({currency for part in parts for currency in part.currencies})
+        currency_codes = {currency: i for i, currency in enumerate(currencies)}
+
+        account_data_list: list[AccountData] = []
+        part_currency_codes = []
+        part_account_codes = []
+        for part in parts:
+            recode = np.array([currency_codes[currency] for currency in part.currencies], dtype=np.int32)
+            part_currency_codes.append(recode[part.currency_codes])
+            part_account_codes.append(part.account_codes + len(account_data_list))
+            account_data_list.extend(part.account_data_list)
+
+        def concat_column(name: str, dtype) -> np.ndarray:
+            if not parts:
+                return np.empty(0, dtype=dtype)
+            return np.concatenate([getattr(part, name) for part in parts])
+
+        columns = CashFlowColumns(
+            account_data_list=account_data_list,
+            currencies=currencies,
+            ordinals=concat_column("ordinals", np.int64),
+            numbers=[number for part in parts for number in part.numbers],
+            currency_codes=np.concatenate(part_currency_codes) if parts else np.empty(0, dtype=np.int32),
+            dividend=concat_column("dividend", np.bool_),
+            source_codes=concat_column("source_codes", np.int8),
+            account_codes=np.concatenate(part_account_codes) if parts else np.empty(0, dtype=np.int32),
+            transaction_indices=concat_column("transaction_indices", np.int64),
+        )
+        # The cash flows of each part are already ordered by date. The stable sort of NumPy (Timsort for integers)
+        # finds these runs and merges them, i.e. this is a k-way merge rather than a full sort.
+        return columns.take(np.argsort(columns.ordinals, kind="stable"))
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def take(self, rows: slice | np.ndarray) -> "CashFlowColumns":
+        """returns the given rows (a slice, or an array of indices)"""
+        return CashFlowColumns(
+            account_data_list=self.account_data_list,
+            currencies=self.currencies,
+            ordinals=self.ordinals[rows],
+            numbers=self.numbers[rows] if isinstance(rows, slice) else [self.numbers[i] for i in rows.tolist()],
+            currency_codes=self.currency_codes[rows],
+            dividend=self.dividend[rows],
+            source_codes=self.source_codes[rows],
+            account_codes=self.account_codes[rows],
+            transaction_indices=self.transaction_indices[rows],
+        )
+
+    def between(self, start_date: datetime.date, end_date: datetime.date) -> "CashFlowColumns":
+        """returns the cash flows between start_date and end_date (both inclusive)"""
+        start = np.searchsorted(self.ordinals, start_date.toordinal(), side="left")
+        end = np.searchsorted(self.ordinals, end_date.toordinal(), side="right")
+        return self.take(slice(start, end))
+
+    def dividends(self) -> "CashFlowColumns":
+        return self.take(np.flatnonzero(self.dividend))
+
+    def first_date(self) -> Optional[datetime.date]:
+        return datetime.date.fromordinal(int(self.ordinals[0])) if len(self) else None
+
+    def dates(self) -> list[datetime.date]:
+        return [datetime.date.fromordinal(ordinal) for ordinal in self.ordinals.tolist()]
+
+    def accounts(self) -> list[str]:
+        return [self.account_data_list[code].account for code in self.account_codes.tolist()]
+
+    def convert(self, pricer: Pricer, target_currency: Currency) -> list[Decimal]:
+        """returns the amounts converted to the target currency at the date of each cash flow
+
+        The conversion rate is looked up once per currency and date. Like Pricer.convert_amount,
+        the amounts are multiplied with the rate, and the first cash flow which cannot be converted raises an exception.
+        """
+        if not len(self):
+            return []
+
+        keys = self.ordinals * len(self.currencies) + self.currency_codes
+        unique_keys, first_rows, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        rates: list[Decimal] = [ZERO] * len(unique_keys)
+        for k in np.argsort(first_rows, kind="stable").tolist():
+            row = first_rows[k]
+            currency = self.currencies[self.currency_codes[row]]
+            date = datetime.date.fromordinal(int(self.ordinals[row]))
+            _, rate = pricer.cache.get_price(currency, target_currency, date)
+            if rate is None:
+                raise CurrencyConversionException(currency, target_currency, date)
+            rates[k] = rate
+        return [number * rates[k] for number, k in zip(self.numbers, inverse.reshape(-1).tolist())]
+
+    def to_cash_flows(self) -> list[CashFlow]:
+        cash_flows = []
+        for ordinal, number, currency_code, dividend, source_code, account_code, transaction_index in zip(
+            self.ordinals.tolist(),
+            self.numbers,
+            self.currency_codes.tolist(),
+            self.dividend.tolist(),
+            self.source_codes.tolist(),
+            self.account_codes.tolist(),
+            self.transaction_indices.tolist(),
+        ):
+            account_data = self.account_data_list[account_code]
+            cash_flows.append(
+                CashFlow(
+                    date=datetime.date.fromordinal(ordinal),
+                    amount=Amount(number, self.currencies[currency_code]),
+                    is_dividend=dividend,
+                    source=SOURCES[source_code],
+                    account=account_data.account,
+                    transaction=account_data.transactions[transaction_index] if transaction_index >= 0 else None,
+                )
+            )
+        return cash_flows
@@ -0,0 +1,89 @@
+import datetime
+import unittest
+from pathlib import Path
+
+from fava_portfolio_returns._vendor.beangrow.returns import truncate_and_merge_cash_flows
+from fava_portfolio_returns._vendor.beangrow.returns import truncate_cash_flows
+from fava_portfolio_returns.core.pricer import CurrencyConversionException
+from fava_portfolio_returns.core.utils import convert_cash_flows_to_currency
+from fava_portfolio_returns.test.test import BEANGROW_CONFIG_CORPAB
+from fava_portfolio_returns.test.test import load_portfolio_file
+from fava_portfolio_returns.test.test import load_portfolio_str
+
+
+def summarize(cash_flows):
+    return [(f.date, f.amount, f.is_dividend, f.source, f.account, id(f.transaction)) for f in cash_flows]
+
+
+class TestCashFlowColumns(unittest.TestCase):
+    def test_cash_flows(self):
+        p = load_portfolio_file(Path("example/example.beancount"))
+        expected = sorted((f for ad in p.account_data_list for f in ad.cash_flows), key=lambda f: f.date)
+
+        columns = p.cash_flow_columns()
+        # the merged cash flows are shared by all callers
+        assert p.cash_flow_columns() is columns
+        assert len(columns) == len(expected)
+        assert summarize(columns.to_cash_flows()) == summarize(expected)
+
+        start_date, end_date = datetime.date(2022, 1, 1), datetime.date(2022, 12, 31)
+        in_range = [f for f in expected if start_date <= f.date <= end_date]
+        assert summarize(columns.between(start_date, end_date).to_cash_flows()) == summarize(in_range)
+        assert summarize(columns.dividends().to_cash_flows()) == summarize([f for f in expected if f.is_dividend])
+
+        converted = convert_cash_flows_to_currency(p.pricer, "USD", in_range)
+        assert columns.between(start_date, end_date).convert(p.pricer, "USD") == [f.amount.number for f in converted]
+
+    def test_truncate_and_merge_cash_flows(self):
+        p = load_portfolio_file(Path("example/example.beancount"))
+        start_date, end_date = datetime.date(2021, 6, 1), datetime.date(2023, 1, 1)
+
+        expected = []
+        for account_data in p.account_data_list:
+            expected.extend(truncate_cash_flows(p.pricer, account_data, start_date, end_date))
+        expected.sort(key=lambda f: f.date)
+        merged = truncate_and_merge_cash_flows(p.pricer, p.account_data_list, start_date, end_date)
+        assert summarize(merged) == summarize(expected)
+
+        # the opening and closing cash flows are computed from the balance indices
+        for start, end in [(start_date, end_date), (datetime.date(2021, 1, 1), datetime.date(2021, 12, 1))]:
+            merged = truncate_and_merge_cash_flows(p.pricer, p.account_data_list, start, end)
+            assert {f.source for f in merged} >= {"open", "close"}
+            assert summarize(p.truncated_cash_flows(start, end)) == summarize(merged)
+
+    def test_convert_missing_price(self):
+        p = load_portfolio_str(
+            """
+2020-01-01 open Assets:Cash
+2020-01-01 open Assets:CORPA
+2020-01-01 open Assets:CORPB
+
+2020-01-01 commodity CORPA
+2020-01-01 commodity CORPB
+
+2020-02-01 price USD 0.8 GBP
+
+2020-01-01 * "Buy"
+  Assets:CORPA                     1 CORPA {10 USD}
+  Assets:Cash                    -10 USD
+
+2020-02-01 * "Buy"
+  Assets:CORPB                     1 CORPB {10 USD}
+  Assets:Cash                    -10 USD
+
+2020-03-01 * "Buy"
+  Assets:CORPA                     1 CORPA {10 USD}
+  Assets:Cash                    -10 USD
+""",
+            BEANGROW_CONFIG_CORPAB,
+        )
+        columns = p.cash_flow_columns()
+        assert columns.accounts() == ["Assets:CORPA", "Assets:CORPB", "Assets:CORPA"]
+
+        # the conversion fails at the first cash flow without a price, like Pricer.convert_amount
+        with self.assertRaises(CurrencyConversionException) as ctx:
+            columns.convert(p.pricer, "GBP")
+        assert ctx.exception.date == datetime.date(2020, 1, 1)
+
+        converted = columns.between(datetime.date(2020, 2, 1), datetime.date(2020, 3, 1)).convert(p.pricer, "GBP")
+        assert [str(amount) for amount in converted] == ["-8.0", "-8.0"]
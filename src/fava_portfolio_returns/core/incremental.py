@@ -0,0 +1,152 @@
+import bisect
+import datetime
+from dataclasses import dataclass
+from typing import Any
+from typing import Optional
+from typing import TypeVar
+
+from beancount.core.data import Close
+from beancount.core.data import Commodity
+from beancount.core.data import Directive
+from beancount.core.data import Open
+from beancount.core.data import Price
+from beancount.core.data import Transaction
+from beancount.core.number import ONE
+from beancount.core.number import ZERO
+from beancount.core.prices import PriceMap
+
+from fava_portfolio_returns._vendor.beangrow.investments import Account
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class EntriesDiff:
+    """entries which were added or removed between two loads of a ledger"""
+
+    added: list[Directive]
+    removed: list[Directive]
+
+    @property
+    def changed(self) -> list[Directive]:
+        return self.added + self.removed
+
+
+def diff_entries(old_entries: list[Directive], new_entries: list[Directive]) -> EntriesDiff:
+    """diff two sorted lists of entries by stripping the common prefix and suffix
+
+    A ledger reload typically appends entries at the end (for example new price directives),
+    in which case the diff contains only the appended entries.
+    """
+    n = min(len(old_entries), len(new_entries))
+    start = 0
+    while start < n and old_entries[start] == new_entries[start]:
+        start += 1
+    end = 0
+    while end < n - start and old_entries[-1 - end] == new_entries[-1 - end]:
+        end += 1
+    return EntriesDiff(
+        added=new_entries[start : len(new_entries) - end],
+        removed=old_entries[start : len(old_entries) - end],
+    )
+
+
+def touched_investments(beangrow_cfg: Any, diff: EntriesDiff) -> set[Account]:
+    """returns the asset accounts of all investments affected by the changed entries"""
+    investments_by_account: dict[Account, set[Account]] = {}
+    investments_by_currency: dict[str, set[Account]] = {}
+    for investment in beangrow_cfg.investments.investment:
+        asset_account = investment.asset_account
+        for account in [asset_account, *investment.dividend_accounts, *investment.match_accounts]:
+            investments_by_account.setdefault(account, set()).add(asset_account)
+        investments_by_currency.setdefault(investment.currency, set()).add(asset_account)
+
+    touched: set[Account] = set()
+    for entry in diff.changed:
+        if isinstance(entry, Transaction):
+            for posting in entry.postings:
+                touched.update(investments_by_account.get(posting.account, ()))
+        elif isinstance(entry, Commodity):
+            touched.update(investments_by_currency.get(entry.currency, ()))
+        elif isinstance(entry, (Open, Close)):
+            touched.update(investments_by_account.get(entry.account, ()))
+    return touched
+
+
+def earliest_change(beangrow_cfg: Any, diff: EntriesDiff) -> Optional[datetime.date]:
+    """returns the date of the earliest changed transaction of an investment or price directive, or None
+
+    All values of the investments before this date are unchanged.
+    """
+    accounts: set[Account] = set()
+    for investment in beangrow_cfg.investments.investment:
+        accounts.update([investment.asset_account, *investment.dividend_accounts, *investment.match_accounts])
+
+    dates = [
+        entry.date
+        for entry in diff.changed
+        if isinstance(entry, Price)
+        or (isinstance(entry, Transaction) and any(posting.account in accounts for posting in entry.postings))
+    ]
+    return min(dates, default=None)
+
+
+def carry_over(
+    reusable: dict[K, tuple[V, datetime.date]], results: dict[K, V], unchanged_before: Optional[datetime.date]
+) -> dict[K, tuple[V, datetime.date]]:
+    """returns the results of the previous load of a ledger, and the date before which they are still valid
+
+    Results carried over from earlier loads of the ledger, which were not used since, are kept
+    and are valid before the earliest change of all reloads.
+    """
+    if unchanged_before is None:
+        return {}
+    carried = {key: (value, min(valid_before, unchanged_before)) for key, (value, valid_before) in reusable.items()}
+    for key, value in results.items():
+        carried.pop(key, None)
+        carried[key] = (value, unchanged_before)
+    return carried
+
+
+def extend_price_map(price_map: PriceMap, diff: EntriesDiff) -> bool:
+    """add new price directives to a price map in place
+
+    Mirrors beancount.core.prices.build_price_map for the common case of prices on new dates.
+    Returns False if the price map cannot be updated in place and must be rebuilt.
+    """
+    if any(isinstance(entry, Price) for entry in diff.removed):
+        return False
+
+    new_prices = [entry for entry in diff.added if isinstance(entry, Price)]
+    forward_pairs_list: list[tuple[str, str]] = price_map.forward_pairs  # type: ignore[attr-defined]
+    forward_pairs = set(forward_pairs_list)
+    new_dates: set[tuple[str, str, datetime.date]] = set()
+    for price in new_prices:
+        base_quote = (price.currency, price.amount.currency)
+        if base_quote not in forward_pairs and base_quote in price_map:
+            # price of an inverted pair, build_price_map would merge it into the pair with more price points
+            return False
+
+        # multiple prices on the same day: the order of the entries decides which one is kept
+        key = (*base_quote, price.date)
+        if key in new_dates:
+            return False
+        new_dates.add(key)
+        price_list = price_map.get(base_quote, [])
+        i = bisect.bisect_left(price_list, price.date, key=lambda x: x[0])
+        if i < len(price_list) and price_list[i][0] == price.date:
+            return False
+
+    for price in new_prices:
+        base, quote = price.currency, price.amount.currency
+        if (base, quote) not in forward_pairs:
+            forward_pairs.add((base, quote))
+            forward_pairs_list.append((base, quote))
+            price_map[(base, quote)] = []
+            price_map[(quote, base)] = []
+        number = price.amount.number or ZERO
+        bisect.insort(price_map[(base, quote)], (price.date, number))
+        if number != ZERO:
+            bisect.insort(price_map[(quote, base)], (price.date, ONE / number))
+    return True
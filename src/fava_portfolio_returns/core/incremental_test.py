@@ -0,0 +1,139 @@
+import datetime
+import unittest
+
+from beancount import loader
+from beancount.core import prices
+
+from fava_portfolio_returns._vendor.beangrow.config import read_config_from_string
+from fava_portfolio_returns.core.incremental import carry_over
+from fava_portfolio_returns.core.incremental import diff_entries
+from fava_portfolio_returns.core.incremental import earliest_change
+from fava_portfolio_returns.core.incremental import extend_price_map
+from fava_portfolio_returns.core.incremental import touched_investments
+from fava_portfolio_returns.test.test import BEANGROW_CONFIG_CORPAB
+
+LEDGER = """
+plugin "beancount.plugins.auto_accounts"
+
+2020-01-01 commodity CORPA
+2020-01-01 commodity CORPB
+
+2020-01-01 * "Buy 100 CORPA @ 1 USD"
+  Assets:Cash                           -100.00 USD
+  Assets:CORPA                              100 CORPA {1 USD}
+
+2020-01-01 * "Buy 100 CORPB @ 1 USD"
+  Assets:Cash                           -100.00 USD
+  Assets:CORPB                              100 CORPB {1 USD}
+
+2020-02-01 price CORPA 2 USD
+2020-02-01 price EUR 1.1 USD
+"""
+
+
+def load(ledger: str):
+    entries, errors, _options_map = loader.load_string(ledger)
+    if errors:
+        raise ValueError(errors)
+    return entries
+
+
+class TestIncremental(unittest.TestCase):
+    def test_diff_appended_entries(self):
+        old_entries = load(LEDGER)
+        new_entries = load(LEDGER + "\n2020-03-01 price CORPA 3 USD\n2020-03-01 price USD 0.9 EUR\n")
+
+        diff = diff_entries(old_entries, new_entries)
+        assert [(e.date.isoformat(), e.currency) for e in diff.added] == [
+            ("2020-03-01", "CORPA"),
+            ("2020-03-01", "USD"),
+        ]
+        assert diff.removed == []
+
+    def test_diff_unchanged(self):
+        diff = diff_entries(load(LEDGER), load(LEDGER))
+        assert diff.added == []
+        assert diff.removed == []
+
+    def test_touched_investments(self):
+        old_entries = load(LEDGER)
+        new_entries = load(
+            LEDGER
+            + """
+2020-03-01 * "Buy 100 CORPB @ 2 USD"
+  Assets:Cash                           -200.00 USD
+  Assets:CORPB                              100 CORPB {2 USD}
+"""
+        )
+        config = read_config_from_string(BEANGROW_CONFIG_CORPAB, [], ["Assets:CORPA", "Assets:CORPB"])
+
+        diff = diff_entries(old_entries, new_entries)
+        assert touched_investments(config, diff) == {"Assets:CORPB"}
+
+        # the open and close directives of an asset account are part of its account data
+        diff = diff_entries(old_entries, load(LEDGER + "2020-03-01 close Assets:CORPA"))
+        assert touched_investments(config, diff) == {"Assets:CORPA"}
+
+    def test_earliest_change(self):
+        config = read_config_from_string(BEANGROW_CONFIG_CORPAB, [], ["Assets:CORPA", "Assets:CORPB"])
+        old_entries = load(LEDGER)
+        new_entries = load(
+            LEDGER
+            + """
+2020-02-15 * "Transfer"
+  Assets:Cash                           -100.00 USD
+  Assets:Checking                        100.00 USD
+
+2020-03-01 price CORPA 3 USD
+
+2020-04-01 * "Buy 100 CORPB @ 2 USD"
+  Assets:Cash                           -200.00 USD
+  Assets:CORPB                              100 CORPB {2 USD}
+"""
+        )
+
+        # the transfer is not a transaction of an investment
+        assert earliest_change(config, diff_entries(old_entries, new_entries)) == datetime.date(2020, 3, 1)
+        assert earliest_change(config, diff_entries(new_entries, new_entries)) is None
+
+    def test_carry_over(self):
+        day1, day2 = datetime.date(2020, 1, 1), datetime.date(2020, 2, 1)
+        carried = carry_over({"a": (1, day1), "b": (2, day2)}, {"b": 3, "c": 4}, day2)
+        assert carried == {"a": (1, day1), "b": (3, day2), "c": (4, day2)}
+        assert carry_over(carried, {}, day1) == {"a": (1, day1), "b": (3, day1), "c": (4, day1)}
+
+        # nothing is valid after a full rebuild
+        assert carry_over(carried, {"d": 5}, None) == {}
+
+    def test_extend_price_map(self):
+        old_entries = load(LEDGER)
+        new_entries = load(
+            LEDGER
+            + """
+2020-03-01 price CORPA 3 USD
+2020-03-01 price CORPB 4 USD
+2020-04-01 price CORPA 0 USD
+"""
+        )
+
+        price_map = prices.build_price_map(old_entries)
+        assert extend_price_map(price_map, diff_entries(old_entries, new_entries))
+
+        expected = prices.build_price_map(new_entries)
+        assert price_map == expected
+        assert sorted(price_map.forward_pairs) == sorted(expected.forward_pairs)
+
+    def test_extend_price_map_requires_rebuild(self):
+        old_entries = load(LEDGER)
+        price_map = prices.build_price_map(old_entries)
+
+        # second price on an existing date
+        new_entries = load(LEDGER + "\n2020-02-01 price CORPA 3 USD\n")
+        assert not extend_price_map(price_map, diff_entries(old_entries, new_entries))
+
+        # price of an inverted pair
+        new_entries = load(LEDGER + "\n2020-03-01 price USD 0.9 EUR\n")
+        assert not extend_price_map(price_map, diff_entries(old_entries, new_entries))
+
+        # removed price
+        assert not extend_price_map(price_map, diff_entries(old_entries, old_entries[:-1]))
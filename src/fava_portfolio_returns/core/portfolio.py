@@ -1,10 +1,23 @@
+import bisect
 import datetime
+import hashlib
+import heapq
 import itertools
+import logging
+import os
+import threading
+from collections import OrderedDict
 from collections import defaultdict
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
+from typing import Callable
+from typing import Literal
 from typing import Optional
 from typing import TypeAlias
 
@@ -18,16 +31,57 @@ from fava.helpers import FavaAPIError
 
 from fava_portfolio_returns._vendor.beangrow.config import read_config
 from fava_portfolio_returns._vendor.beangrow.config import read_config_from_string
+from fava_portfolio_returns._vendor.beangrow.config_pb2 import Config  # type: ignore[attr-defined]
 from fava_portfolio_returns._vendor.beangrow.investments import Account
 from fava_portfolio_returns._vendor.beangrow.investments import AccountData
 from fava_portfolio_returns._vendor.beangrow.investments import CashFlow
-from fava_portfolio_returns._vendor.beangrow.investments import Cat
 from fava_portfolio_returns._vendor.beangrow.investments import Currency
+from fava_portfolio_returns._vendor.beangrow.investments import EntriesIndex
 from fava_portfolio_returns._vendor.beangrow.investments import extract
+from fava_portfolio_returns._vendor.beangrow.investments import process_investments
+from fava_portfolio_returns._vendor.beangrow.investments import prune_entries
+from fava_portfolio_returns.core.balances import BalanceIndex
+from fava_portfolio_returns.core.cashflows import CashFlowColumns
+from fava_portfolio_returns.core.incremental import carry_over
+from fava_portfolio_returns.core.incremental import diff_entries
+from fava_portfolio_returns.core.incremental import earliest_change
+from fava_portfolio_returns.core.incremental import extend_price_map
+from fava_portfolio_returns.core.incremental import touched_investments
+from fava_portfolio_returns.core.intervals import ONE_DAY
+from fava_portfolio_returns.core.pricer import CurrencyConversionException
 from fava_portfolio_returns.core.pricer import Pricer
+from fava_portfolio_returns.core.snapshot import SnapshotStore
+from fava_portfolio_returns.core.snapshot import ledger_key
+from fava_portfolio_returns.core.timeline import Engine
+from fava_portfolio_returns.core.timeline import Timeline
 from fava_portfolio_returns.core.utils import inv_to_currency
+from fava_portfolio_returns.core.utils import market_value_of_inv
+
+logger = logging.getLogger(__name__)
 
 InvestmentId: TypeAlias = str
+# (currency, required date) -> {(cost currency, actual date, rate), ...}
+RequiredPrices: TypeAlias = dict[tuple[Currency, datetime.date], set[tuple[Currency, Optional[datetime.date], Any]]]
+ExecutorKind: TypeAlias = Literal["thread", "process"]
+# (sorted investment filter, requested target currency)
+FilterKey: TypeAlias = tuple[tuple[InvestmentId, ...], Optional[Currency]]
+# (metric, target currency, start date, end date)
+MetricKey: TypeAlias = tuple[str, Currency, datetime.date, datetime.date]
+
+# Maximum number of filtered portfolios (per investment filter and target currency) kept by a portfolio.
+FILTERED_PORTFOLIO_CACHE_SIZE = 128
+# Maximum number of metric values (per metric, target currency and interval) kept by a filtered portfolio.
+METRIC_VALUES_CACHE_SIZE = 2048
+
+
+@dataclass(frozen=True)
+class ReusableResults:
+    """derived data of a filtered portfolio, kept for the portfolio of the next load of the ledger"""
+
+    accounts: list[Account]
+    target_currency: Currency
+    timeline: Optional[Timeline]
+    metric_values: dict[MetricKey, float]
 
 
 @dataclass(frozen=True)
@@ -63,10 +117,19 @@ class InvestmentsConfig:
 class Portfolio:
     """Like a ledger, but for a portfolio of investments."""
 
+    entries: list[Directive]
+    accounts: set[Account]
+    commodities: list[Commodity]
     pricer: Pricer
     beangrow_cfg: Any
     account_data_map: dict[Account, AccountData]  # list of investments defined in beangrow config
     investments_config: InvestmentsConfig
+    balance_indices: dict[Account, BalanceIndex]
+    # balance indices and filtered portfolio results of previous loads, and the date before which they are valid
+    reusable_balance_indices: dict[Account, tuple[BalanceIndex, datetime.date]]
+    reusable_results: dict[FilterKey, tuple[ReusableResults, datetime.date]]
+    cash_flow_stores: dict[Account, CashFlowColumns]
+    engine: Engine
 
     def __init__(
         self,
@@ -74,35 +137,190 @@ class Portfolio:
         options_map: BeancountOptions,
         beangrow_config: Path | str,
         beangrow_debug_dir: Optional[Path] = None,
+        previous: Optional["Portfolio"] = None,
+        engine: Engine = "decimal",
+        executor: Optional[ExecutorKind] = None,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
     ):
+        """Build a portfolio from the ledger entries.
+
+        If the portfolio of a previous load of the ledger is given, the portfolio is updated incrementally:
+        only investments affected by changed entries are re-extracted, and new prices are added to the existing price map.
+        The balances, timelines and metric values of the previous portfolio before the earliest changed entry are reused.
+        If an executor is given, the investments are extracted in parallel in a thread or process pool.
+        If a cache directory is given, the timelines are stored on disk and reused after restarts of Fava,
+        as long as the ledger files and the beangrow config are unchanged.
+        """
         dcontext = options_map["dcontext"]
-        accounts = getters.get_accounts(entries)
-        price_map = prices.build_price_map(entries)
-        self.pricer = Pricer(price_map)
+        self.engine = engine
+        diff = diff_entries(previous.entries, entries) if previous and not beangrow_debug_dir else None
+
+        self.entries = entries
+        if previous and diff is not None and not diff.removed:
+            self.accounts = previous.accounts | getters.get_accounts(diff.added)
+        else:
+            self.accounts = getters.get_accounts(entries)
 
         if isinstance(beangrow_config, Path):
             try:
-                self.beangrow_cfg = read_config(beangrow_config.as_posix(), [], list(accounts))
+                self.beangrow_cfg = read_config(beangrow_config.as_posix(), [], list(self.accounts))
             except Exception as ex:
                 raise FavaAPIError(
                     f"Cannot read beangrow configuration file {beangrow_config.as_posix()}: {ex}"
                 ) from ex
         else:
-            self.beangrow_cfg = read_config_from_string(beangrow_config, [], list(accounts))
-
-        beangrow_debug_dir_str = str(beangrow_debug_dir) if beangrow_debug_dir else ""
-        self.account_data_map = extract(
-            entries, dcontext, self.beangrow_cfg, entries[-1].date, False, beangrow_debug_dir_str
-        )
+            self.beangrow_cfg = read_config_from_string(beangrow_config, [], list(self.accounts))
+
+        if previous and diff is not None and previous.beangrow_cfg == self.beangrow_cfg:
+            logger.debug("Updating portfolio: %d entries added, %d removed", len(diff.added), len(diff.removed))
+            price_map = previous.pricer.price_map
+            # a rebuilt price map can convert differently (e.g. inverted currency pairs), therefore nothing is reused
+            unchanged_before: Optional[datetime.date] = None
+            if extend_price_map(price_map, diff):
+                unchanged_before = earliest_change(self.beangrow_cfg, diff) or datetime.date.max
+            else:
+                price_map = prices.build_price_map(entries)
+            self.pricer = Pricer(price_map)
+
+            touched = touched_investments(self.beangrow_cfg, diff)
+            with create_executor(executor, max_workers) as pool:
+                self.account_data_map = update_account_data(
+                    previous.account_data_map, entries, self.beangrow_cfg, touched, pool
+                )
+            # indices of untouched investments are still valid, indices of touched investments are partially valid
+            self.balance_indices = {a: index for a, index in previous.balance_indices.items() if a not in touched}
+            self.reusable_balance_indices = carry_over(
+                previous.reusable_balance_indices,
+                {a: index for a, index in previous.balance_indices.items() if a in touched},
+                unchanged_before,
+            )
+            self.cash_flow_stores = dict(previous.cash_flow_stores)
+            self.reusable_results = carry_over(
+                previous.reusable_results,
+                previous.results(),
+                unchanged_before if previous.engine == engine else None,
+            )
+            # keep the results of the most recently used filtered portfolios
+            for key in list(self.reusable_results)[:-FILTERED_PORTFOLIO_CACHE_SIZE]:
+                del self.reusable_results[key]
+
+            if any(isinstance(e, Commodity) for e in diff.changed):
+                self.commodities = [e for e in entries if isinstance(e, Commodity)]
+            else:
+                self.commodities = previous.commodities
+        else:
+            price_map = prices.build_price_map(entries)
+            self.pricer = Pricer(price_map)
 
-        commodities = [e for e in entries if isinstance(e, Commodity)]
-        self.investments_config = build_investments_config(self.beangrow_cfg, self.account_data_map, commodities)
+            beangrow_debug_dir_str = str(beangrow_debug_dir) if beangrow_debug_dir else ""
+            with create_executor(executor, max_workers) as pool:
+                self.account_data_map = extract(
+                    entries, dcontext, self.beangrow_cfg, entries[-1].date, False, beangrow_debug_dir_str, pool
+                )
+            self.commodities = [e for e in entries if isinstance(e, Commodity)]
+            self.balance_indices = {}
+            self.reusable_balance_indices = {}
+            self.cash_flow_stores = {}
+            self.reusable_results = {}
+
+        self.investments_config = build_investments_config(self.beangrow_cfg, self.account_data_map, self.commodities)
+
+        self.snapshots: Optional[SnapshotStore] = None
+        if cache_dir and not beangrow_debug_dir and (ledger_hash := ledger_key(options_map, beangrow_config)):
+            self.snapshots = SnapshotStore(cache_dir, options_map, ledger_hash)
+
+        self.filtered_portfolios: OrderedDict[FilterKey, FilteredPortfolio]
+        self.filtered_portfolios = OrderedDict()
+        self.filtered_portfolios_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """returns the state sent to worker processes, without the ledger entries and the filtered portfolios"""
+        state = self.__dict__.copy()
+        state["entries"] = []
+        # the generated config messages cannot be pickled
+        state["beangrow_cfg"] = self.beangrow_cfg.SerializeToString()
+        state["filtered_portfolios"] = OrderedDict()
+        state["reusable_results"] = {}
+        state["reusable_balance_indices"] = {}
+        del state["filtered_portfolios_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.beangrow_cfg = Config.FromString(state["beangrow_cfg"])
+        self.filtered_portfolios_lock = threading.Lock()
+
+    def filter(self, investment_filter: list[InvestmentId], target_currency: Optional[Currency]) -> "FilteredPortfolio":
+        """returns the portfolio filtered by investments
+
+        The filtered portfolios are interned per investment filter and target currency, i.e. their derived data
+        (timeline, merged cash flows) is shared by all endpoints and requests until the ledger is reloaded.
+        """
+        key = (tuple(sorted(investment_filter)), target_currency)
+        with self.filtered_portfolios_lock:
+            p = self.filtered_portfolios.get(key)
+            if p is not None:
+                self.filtered_portfolios.move_to_end(key)
+                return p
 
-    def filter(self, investment_filter: list[InvestmentId], target_currency: Optional[Currency]):
         account_data_list = filter_investments(self.investments_config, self.account_data_map, investment_filter)
         if not target_currency:
             target_currency = get_target_currency(account_data_list)
-        return FilteredPortfolio(self, account_data_list, target_currency)
+        with self.filtered_portfolios_lock:
+            reusable = self.reusable_results.pop(key, None)
+        p = FilteredPortfolio(self, account_data_list, target_currency, reusable)
+
+        with self.filtered_portfolios_lock:
+            p = self.filtered_portfolios.setdefault(key, p)
+            self.filtered_portfolios.move_to_end(key)
+            # evict least recently used filtered portfolios
+            while len(self.filtered_portfolios) > FILTERED_PORTFOLIO_CACHE_SIZE:
+                self.filtered_portfolios.popitem(last=False)
+        return p
+
+    def balance_index(self, account_data: AccountData) -> BalanceIndex:
+        """returns the (lazily built) balance index of an investment"""
+        index = self.balance_indices.get(account_data.account)
+        if index is None or index.account_data is not account_data:
+            previous, unchanged_before = self.reusable_balance_indices.pop(account_data.account, (None, None))
+            index = BalanceIndex(account_data, previous, unchanged_before)
+            self.balance_indices[account_data.account] = index
+        return index
+
+    def results(self) -> dict[FilterKey, ReusableResults]:
+        """returns the derived data of the filtered portfolios, to be reused by the portfolio of the next load"""
+        with self.filtered_portfolios_lock:
+            filtered_portfolios = list(self.filtered_portfolios.items())
+
+        return {key: results for key, p in filtered_portfolios if (results := p.results())}
+
+    def cash_flow_columns(self, account_data: AccountData) -> CashFlowColumns:
+        """returns the (lazily built) columnar cash flows of an investment"""
+        columns = self.cash_flow_stores.get(account_data.account)
+        if columns is None or columns.account_data_list[0] is not account_data:
+            columns = CashFlowColumns.from_account_data(account_data)
+            self.cash_flow_stores[account_data.account] = columns
+        return columns
+
+    def required_prices(self) -> RequiredPrices:
+        """returns the prices required to compute the market values of all investments
+
+        The required prices are collected in a dedicated pass with a tracking pricer,
+        which is discarded afterwards: at every price and volume change of each investment, and at the end of the ledger.
+        """
+        pricer = Pricer(self.pricer.price_map, track_required_prices=True)
+        end_date = self.entries[-1].date if self.entries else datetime.date.today()
+        for account_data in self.account_data_map.values():
+            if not account_data.cost_currency:
+                continue
+            Timeline(pricer, [account_data], account_data.cost_currency)
+            balance = self.balance_index(account_data).balance_at(end_date)
+            try:
+                market_value_of_inv(pricer, account_data.cost_currency, balance, end_date)
+            except CurrencyConversionException:
+                pass
+        return pricer.required_prices
 
     def get_missing_prices(self) -> tuple[list[dict], list[str]]:
         commodity_sources: dict[str, Optional[str]] = {}
@@ -111,45 +329,52 @@ class Portfolio:
             if commodity.currency not in commodity_sources:
                 commodity_sources[commodity.currency] = commodity.meta.get("price")
 
-        # required_prices: [((source_currency, required_date), {(cost_currency, actual_date, rate), ...}), ...]
-        # actual_date/rate is None when no price is available.
-        # sort by date and currency
-        required_prices = sorted(self.pricer.required_prices.items(), key=lambda x: (x[0][1], x[0][0]))
-
-        today = datetime.date.today()
-        missing_prices: list[dict] = []
-        commands: list[str] = []
-        for date, group in itertools.groupby(required_prices, key=lambda x: x[0][1]):
-            sources = []
-            for (currency, required_date), found_dates in group:
-                if len(found_dates) != 1:
-                    raise ValueError(f"Found multiple prices for {currency} on {required_date}: {found_dates}")
-
-                if required_date > today:
+        return missing_prices_report(self.required_prices(), commodity_sources)
+
+
+def missing_prices_report(
+    required_prices: RequiredPrices, commodity_sources: dict[str, Optional[str]]
+) -> tuple[list[dict], list[str]]:
+    """returns the missing (or outdated) prices, and the bean-price commands to fetch them"""
+    # required_prices: [((source_currency, required_date), {(cost_currency, actual_date, rate), ...}), ...]
+    # actual_date/rate is None when no price is available.
+    # sort by date and currency
+    sorted_required_prices = sorted(required_prices.items(), key=lambda x: (x[0][1], x[0][0]))
+
+    today = datetime.date.today()
+    missing_prices: list[dict] = []
+    commands: list[str] = []
+    for date, group in itertools.groupby(sorted_required_prices, key=lambda x: x[0][1]):
+        sources = []
+        for (currency, required_date), found_dates in group:
+            if len(found_dates) != 1:
+                raise ValueError(f"Found multiple prices for {currency} on {required_date}: {found_dates}")
+
+            if required_date > today:
+                continue
+
+            _cost_currency, actual_date, _rate = list(found_dates)[0]
+            if actual_date is None:
+                days_late = None
+            else:
+                days_late = (required_date - actual_date).days
+                if days_late < 5:
                     continue
 
-                _cost_currency, actual_date, _rate = list(found_dates)[0]
-                if actual_date is None:
-                    days_late = None
-                else:
-                    days_late = (required_date - actual_date).days
-                    if days_late < 5:
-                        continue
-
-                missing_prices.append(
-                    {
-                        "currency": currency,
-                        "requiredDate": required_date,
-                        "actualDate": actual_date,
-                        "daysLate": days_late,
-                    }
-                )
-                source = commodity_sources.get(currency)
-                if source:
-                    sources.append(f"'{source}'")
-            if sources:
-                commands.append(f"bean-price -d '{date}' -e {' '.join(sources)}")
-        return missing_prices, commands
+            missing_prices.append(
+                {
+                    "currency": currency,
+                    "requiredDate": required_date,
+                    "actualDate": actual_date,
+                    "daysLate": days_late,
+                }
+            )
+            source = commodity_sources.get(currency)
+            if source:
+                sources.append(f"'{source}'")
+        if sources:
+            commands.append(f"bean-price -d '{date}' -e {' '.join(sources)}")
+    return missing_prices, commands
 
 
 class FilteredPortfolio:
@@ -165,43 +390,152 @@ class FilteredPortfolio:
     account_data_list: list[AccountData]
     target_currency: Currency
 
-    def __init__(self, portfolio: Portfolio, account_data_list: list[AccountData], target_currency: Currency):
+    def __init__(
+        self,
+        portfolio: Portfolio,
+        account_data_list: list[AccountData],
+        target_currency: Currency,
+        reusable: Optional[tuple[ReusableResults, datetime.date]] = None,
+    ):
         self.portfolio = portfolio
         self.account_data_list = account_data_list
         self.target_currency = target_currency
+        self._timeline: Optional[Timeline] = None
+        self._cash_flow_columns: Optional[CashFlowColumns] = None
+        # metric values per interval, see MetricBase.intervals()
+        self.metric_values: OrderedDict[MetricKey, float] = OrderedDict()
+        self.metric_values_lock = threading.Lock()
+
+        # the results of the previous load of the ledger are valid before the given date
+        self._previous_timeline: Optional[tuple[Timeline, datetime.date]] = None
+        if reusable:
+            results, unchanged_before = reusable
+            accounts = sorted(account_data.account for account_data in account_data_list)
+            if results.accounts == accounts and results.target_currency == target_currency:
+                self.metric_values = OrderedDict(
+                    (k, v) for k, v in results.metric_values.items() if k[3] < unchanged_before
+                )
+                if results.timeline:
+                    self._previous_timeline = (results.timeline, unchanged_before)
 
     @property
     def pricer(self) -> Pricer:
         return self.portfolio.pricer
 
-    def cash_flows(self) -> list[CashFlow]:
-        """returns a list of all cash flows"""
-        cash_flows: list[CashFlow] = []
+    def timeline(self) -> Timeline:
+        """returns the portfolio values of the entire ledger, computed once and shared by all metrics"""
+        if self._timeline is None or self._timeline.target_currency != self.target_currency:
+            self._timeline = self.load_or_compute_timeline()
+        return self._timeline
+
+    def load_or_compute_timeline(self) -> Timeline:
+        snapshots = self.portfolio.snapshots
+        if not snapshots:
+            return self.compute_timeline()
+
+        accounts = sorted(account_data.account for account_data in self.account_data_list)
+        key = f"{accounts}:{self.target_currency}:{self.portfolio.engine}"
+        name = "timeline-" + hashlib.sha256(key.encode()).hexdigest()[:16]
+        timeline = snapshots.load(name)
+        if isinstance(timeline, Timeline):
+            return timeline
+
+        timeline = self.compute_timeline()
+        snapshots.save(name, timeline)
+        return timeline
+
+    def compute_timeline(self) -> Timeline:
+        previous, unchanged_before = self._previous_timeline or (None, None)
+        self._previous_timeline = None
+        return Timeline(
+            self.pricer,
+            self.account_data_list,
+            self.target_currency,
+            engine=self.portfolio.engine,
+            previous=previous,
+            unchanged_before=unchanged_before,
+        )
+
+    def get_metric_values(self, keys: list[MetricKey]) -> dict[MetricKey, float]:
+        """returns the stored metric values of the given keys, see MetricBase.intervals()"""
+        values = {}
+        with self.metric_values_lock:
+            for key in keys:
+                value = self.metric_values.get(key)
+                if value is not None:
+                    self.metric_values.move_to_end(key)
+                    values[key] = value
+        return values
+
+    def put_metric_values(self, values: dict[MetricKey, float]) -> None:
+        """stores metric values, evicting the least recently used values"""
+        with self.metric_values_lock:
+            for key, value in values.items():
+                self.metric_values[key] = value
+                self.metric_values.move_to_end(key)
+            while len(self.metric_values) > METRIC_VALUES_CACHE_SIZE:
+                self.metric_values.popitem(last=False)
+
+    def results(self) -> Optional[ReusableResults]:
+        with self.metric_values_lock:
+            metric_values = self.metric_values.copy()
+        if self._timeline is None and not metric_values:
+            return None
+        return ReusableResults(
+            accounts=sorted(account_data.account for account_data in self.account_data_list),
+            target_currency=self.target_currency,
+            timeline=self._timeline,
+            metric_values=metric_values,
+        )
+
+    def cash_flow_columns(self) -> CashFlowColumns:
+        """returns all cash flows in a columnar layout, ordered by date, merged once and shared by all endpoints"""
+        if self._cash_flow_columns is None:
+            self._cash_flow_columns = CashFlowColumns.concat(
+                [self.portfolio.cash_flow_columns(ad) for ad in self.account_data_list]
+            )
+        return self._cash_flow_columns
+
+    def truncated_cash_flows(self, start_date: datetime.date, end_date: datetime.date) -> list[CashFlow]:
+        """returns the cash flows from start_date until end_date (exclusive), like beangrow's truncate_and_merge_cash_flows
+
+        The value of each investment before start_date and at end_date is added as opening and closing cash flow.
+        The balances are looked up in the balance indices, instead of summing up the transactions of the investment.
+        """
+        parts = []
         for account_data in self.account_data_list:
-            cash_flows.extend(account_data.cash_flows)
-        cash_flows.sort(key=lambda flow: flow.date)
-        return cash_flows
+            index = self.portfolio.balance_index(account_data)
+            flows = account_data.cash_flows
+            start = bisect.bisect_left(flows, start_date, key=lambda flow: flow.date)
+            end = bisect.bisect_left(flows, end_date, lo=start, key=lambda flow: flow.date)
+
+            part = []
+            balance = index.balance_at(start_date - ONE_DAY)
+            if not balance.is_empty():
+                cost_position = balance.reduce(self.pricer.get_value, start_date).get_only_position()
+                if cost_position:
+                    part.append(CashFlow(start_date, -cost_position.units, False, "open", account_data.account, None))
+            part.extend(flows[start:end])
+            balance = index.balance_at(end_date - ONE_DAY)
+            if not balance.is_empty():
+                cost_position = balance.reduce(self.pricer.get_value, end_date - ONE_DAY).get_only_position()
+                if cost_position:
+                    part.append(CashFlow(end_date, cost_position.units, False, "close", account_data.account, None))
+            parts.append(part)
+        return list(heapq.merge(*parts, key=lambda flow: flow.date))
 
     def balance_at(self, date: datetime.date) -> Inventory:
         """returns the inventory at the given date"""
         balance = Inventory()
         for account_data in self.account_data_list:
-            for entry in account_data.transactions:
-                if entry.date > date:
-                    break
-                for posting in entry.postings:
-                    if posting.meta and posting.meta["category"] is Cat.ASSET:
-                        balance.add_position(posting)
+            balance.add_inventory(self.portfolio.balance_index(account_data).balance_at(date))
         return balance
 
     def cash_at(self, date: datetime.date) -> Decimal:
         """returns the sum of all cash flows until the given date"""
         balance = Inventory()
         for account_data in self.account_data_list:
-            for cash_flow in account_data.cash_flows:
-                if cash_flow.date > date:
-                    break
-                balance.add_amount(cash_flow.amount)
+            balance.add_inventory(self.portfolio.balance_index(account_data).cash_at(date))
         return -inv_to_currency(self.pricer, self.target_currency, balance, date)
 
 
@@ -217,6 +551,73 @@ def get_target_currency(account_data_list: list[AccountData]) -> str:
     return cost_currencies.pop()
 
 
+def create_executor(kind: Optional[ExecutorKind], max_workers: Optional[int]) -> Executor | nullcontext[None]:
+    """returns a thread or process pool, or a context returning None for serial processing"""
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    return nullcontext()
+
+
+class StickyProcessPool(Executor):
+    """Pool of worker processes, which runs all calls with the same arguments in the same worker process.
+
+    Worker processes keep their own caches (e.g. of filtered portfolios). In a ProcessPoolExecutor, repeated calls
+    would run in any worker and miss these caches. The calls are assigned round-robin to the workers on first use.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: tuple[Any, ...] = (),
+    ):
+        self.workers = [
+            ProcessPoolExecutor(max_workers=1, initializer=initializer, initargs=initargs)
+            for _ in range(max_workers or os.cpu_count() or 1)
+        ]
+        self.assigned_workers: dict[tuple[Any, ...], int] = {}
+        self.lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self.lock:
+            worker = self.assigned_workers.setdefault(args, len(self.assigned_workers) % len(self.workers))
+        return self.workers[worker].submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        for worker in self.workers:
+            worker.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def update_account_data(
+    account_data_map: dict[Account, AccountData],
+    entries: list[Directive],
+    beangrow_cfg: Any,
+    touched: set[Account],
+    executor: Optional[Executor] = None,
+) -> dict[Account, AccountData]:
+    """re-extract the touched investments and reuse the account data of all other investments"""
+    investments = [i for i in beangrow_cfg.investments.investment if i.asset_account in touched]
+    extracted: dict[Account, Optional[AccountData]] = {}
+    if investments:
+        index = EntriesIndex(prune_entries(entries, beangrow_cfg))
+        account_data_list = process_investments(index, beangrow_cfg.investments, investments, False, executor)
+        extracted = {i.asset_account: account_data for i, account_data in zip(investments, account_data_list)}
+
+    updated_map: dict[Account, AccountData] = {}
+    for investment in beangrow_cfg.investments.investment:
+        account = investment.asset_account
+        account_data: Optional[AccountData]
+        if account in touched:
+            account_data = extracted[account]
+        else:
+            account_data = account_data_map.get(account)
+        if account_data:
+            updated_map[account_data.account] = account_data
+    return updated_map
+
+
 def build_investments_config(
     beangrow_cfg: Any, account_data_map: dict[str, AccountData], commodities: list[Commodity]
 ) -> InvestmentsConfig:
@@ -1,15 +1,28 @@
 import datetime
 import unittest
+from pathlib import Path
+from unittest import mock
 
+from beancount import loader
+from beancount.core import data
+from beancount.core import getters
 from beancount.core.inventory import Inventory
 
+from fava_portfolio_returns._vendor.beangrow.config import read_config
 from fava_portfolio_returns._vendor.beangrow.config import read_config_from_string
+from fava_portfolio_returns._vendor.beangrow.investments import EntriesIndex
+from fava_portfolio_returns._vendor.beangrow.investments import extract_transactions_for_account
+from fava_portfolio_returns._vendor.beangrow.investments import prune_entries
 from fava_portfolio_returns.core.portfolio import InvestmentAccount
 from fava_portfolio_returns.core.portfolio import InvestmentGroup
 from fava_portfolio_returns.core.portfolio import InvestmentsConfig
 from fava_portfolio_returns.core.portfolio import LedgerCurrency
+from fava_portfolio_returns.core.portfolio import Portfolio
 from fava_portfolio_returns.core.portfolio import build_investments_config
+from fava_portfolio_returns.core.portfolio import missing_prices_report
+from fava_portfolio_returns.core.timeline import compute_values
 from fava_portfolio_returns.test.test import BEANGROW_CONFIG_CORP
+from fava_portfolio_returns.test.test import BEANGROW_CONFIG_CORPAB
 from fava_portfolio_returns.test.test import load_portfolio_str
 
 LEDGER_CORP_WITH_PRICE = """
@@ -108,6 +121,24 @@ plugin "beancount.plugins.implicit_prices"
         )
         assert p.balance_at(datetime.date(2020, 2, 1)) == Inventory.from_string("50 CORP {2 USD, 2020-01-01}")
 
+    def test_get_missing_prices(self):
+        p_filtered = load_portfolio_str(
+            LEDGER_CORP_WITH_PRICE + "\n2020-12-31 price EUR 1.1 USD\n", BEANGROW_CONFIG_CORP
+        )
+        p = p_filtered.portfolio
+
+        missing_prices, _commands = p.get_missing_prices()
+        assert missing_prices == [
+            {
+                "currency": "CORP",
+                "requiredDate": datetime.date(2020, 12, 31),
+                "actualDate": datetime.date(2020, 11, 1),
+                "daysLate": 60,
+            }
+        ]
+        # the prices are collected in a dedicated pass, the pricer of the portfolio doesn't track them
+        assert len(p.pricer.required_prices) == 0
+
     def test_get_missing_prices_none_actual_date(self):
         """get_missing_prices should not crash when beancount found no price at all (actual_date=None).
 
@@ -120,10 +151,11 @@ plugin "beancount.plugins.implicit_prices"
         # Simulate a commodity where beancount found no price at all (actual_date=None).
         # This mirrors what beancount stores when prices.get_price() returns (None, None).
         required_date = datetime.date(2019, 6, 1)
-        p.pricer.required_prices[("CORP", required_date)].add(("USD", None, None))
+        required_prices = p.required_prices()
+        required_prices[("CORP", required_date)] = {("USD", None, None)}
 
         # Should not raise TypeError: unsupported operand type(s) for -: 'datetime.date' and 'NoneType'
-        missing_prices, _commands = p.get_missing_prices()
+        missing_prices, _commands = missing_prices_report(required_prices, {})
 
         none_date_entries = [mp for mp in missing_prices if mp["currency"] == "CORP" and mp["actualDate"] is None]
         assert len(none_date_entries) == 1
@@ -136,9 +168,10 @@ plugin "beancount.plugins.implicit_prices"
         p = p_filtered.portfolio
 
         future_date = datetime.date.today() + datetime.timedelta(days=30)
-        p.pricer.required_prices[("CORP", future_date)].add(("USD", None, None))
+        required_prices = p.required_prices()
+        required_prices[("CORP", future_date)] = {("USD", None, None)}
 
-        missing_prices, _commands = p.get_missing_prices()
+        missing_prices, _commands = missing_prices_report(required_prices, {})
 
         future_entries = [mp for mp in missing_prices if mp["requiredDate"] == future_date]
         assert len(future_entries) == 0
@@ -162,3 +195,169 @@ plugin "beancount.plugins.implicit_prices"
             BEANGROW_CONFIG_CORP,
         )
         assert p.cash_at(datetime.date(2020, 2, 1)) == 107
+
+    def test_incremental_update(self):
+        ledger = """
+plugin "beancount.plugins.auto_accounts"
+
+2020-01-01 commodity CORPA
+2020-01-01 commodity CORPB
+
+2020-01-01 * "Buy 100 CORPA @ 1 USD"
+  Assets:Cash                           -100.00 USD
+  Assets:CORPA                              100 CORPA {1 USD}
+
+2020-01-01 * "Buy 100 CORPB @ 1 USD"
+  Assets:Cash                           -100.00 USD
+  Assets:CORPB                              100 CORPB {1 USD}
+
+2020-02-01 price CORPA 2 USD
+"""
+        appended = """
+2020-03-01 price CORPA 3 USD
+
+2020-03-01 * "Buy 100 CORPB @ 2 USD"
+  Assets:Cash                           -200.00 USD
+  Assets:CORPB                              100 CORPB {2 USD}
+"""
+        entries, _, options_map = loader.load_string(ledger)
+        previous = Portfolio(entries, options_map, BEANGROW_CONFIG_CORPAB)
+        previous_corpa = previous.account_data_map["Assets:CORPA"]
+
+        entries, _, options_map = loader.load_string(ledger + appended)
+        p = Portfolio(entries, options_map, BEANGROW_CONFIG_CORPAB, previous=previous)
+        expected = Portfolio(entries, options_map, BEANGROW_CONFIG_CORPAB)
+
+        # untouched investments are reused
+        assert p.account_data_map["Assets:CORPA"] is previous_corpa
+        assert summarize_account_data(p) == summarize_account_data(expected)
+        assert p.pricer.price_map == expected.pricer.price_map
+        assert p.investments_config == expected.investments_config
+
+    def test_incremental_update_close(self):
+        ledger = """
+2020-01-01 open Assets:Cash
+2020-01-01 open Assets:CORPA
+2020-01-01 open Assets:CORPB
+2020-01-01 commodity CORPA
+2020-01-01 commodity CORPB
+
+2020-01-01 * "Buy 100 CORPA @ 1 USD"
+  Assets:Cash                           -100.00 USD
+  Assets:CORPA                              100 CORPA {1 USD}
+
+2020-01-01 * "Buy 100 CORPB @ 1 USD"
+  Assets:Cash                           -100.00 USD
+  Assets:CORPB                              100 CORPB {1 USD}
+
+2020-02-01 * "Sell 100 CORPB @ 1 USD"
+  Assets:Cash                            100.00 USD
+  Assets:CORPB                             -100 CORPB {1 USD}
+"""
+        entries, _, options_map = loader.load_string(ledger)
+        previous = Portfolio(entries, options_map, BEANGROW_CONFIG_CORPAB)
+
+        # the close directive of the asset account is part of the account data
+        entries, _, options_map = loader.load_string(ledger + "2020-03-01 close Assets:CORPB")
+        p = Portfolio(entries, options_map, BEANGROW_CONFIG_CORPAB, previous=previous)
+        expected = Portfolio(entries, options_map, BEANGROW_CONFIG_CORPAB)
+        assert summarize_account_data(p) == summarize_account_data(expected)
+
+    def test_incremental_update_reuses_results(self):
+        ledger_path = Path("example/example.beancount")
+        entries, _, options_map = loader.load_file(ledger_path)
+        beangrow_config = ledger_path.parent / "beangrow.pbtxt"
+        appended, _, _ = loader.load_string("2100-01-01 price VHT 200 USD")
+
+        previous = Portfolio(entries, options_map, beangrow_config)
+        fp = previous.filter([], "USD")
+        previous_timeline = fp.timeline()
+        fp.metric_values[("TWR", "USD", datetime.date(2020, 1, 1), datetime.date(2020, 12, 31))] = 0.1
+        fp.metric_values[("TWR", "USD", datetime.date(2020, 1, 1), datetime.date(2100, 12, 31))] = 0.2
+
+        new_entries = sorted(entries + appended, key=data.entry_sortkey)
+        p = Portfolio(new_entries, options_map, beangrow_config, previous=previous)
+        fp = p.filter([], "USD")
+        # only the metric values of intervals ending before the new price are kept
+        assert fp.metric_values == {("TWR", "USD", datetime.date(2020, 1, 1), datetime.date(2020, 12, 31)): 0.1}
+
+        with mock.patch("fava_portfolio_returns.core.timeline.compute_values", wraps=compute_values) as mocked:
+            timeline = fp.timeline()
+        assert [date for date, _ in mocked.call_args.args[2]] == [datetime.date(2100, 1, 1)]
+        assert timeline.values[:-1] == previous_timeline.values
+
+        expected = Portfolio(new_entries, options_map, beangrow_config).filter([], "USD").timeline()
+        assert timeline.dates == expected.dates
+        assert timeline.values == expected.values
+
+    def test_entries_index(self):
+        ledger_path = Path("example/example.beancount")
+        entries, _, _ = loader.load_file(ledger_path)
+        beangrow_cfg = read_config(
+            (ledger_path.parent / "beangrow.pbtxt").as_posix(), [], list(getters.get_accounts(entries))
+        )
+        pruned_entries = prune_entries(entries, beangrow_cfg)
+
+        # the single scan finds the same transactions, in the same order, as a full scan per investment
+        index = EntriesIndex(pruned_entries)
+        for investment in beangrow_cfg.investments.investment:
+            assert index.transactions_for_account(investment) == extract_transactions_for_account(
+                pruned_entries, investment
+            )
+
+    def test_parallel_extract(self):
+        ledger_path = Path("example/example.beancount")
+        entries, _, options_map = loader.load_file(ledger_path)
+        beangrow_config = ledger_path.parent / "beangrow.pbtxt"
+        expected = Portfolio(entries, options_map, beangrow_config)
+
+        for executor in ("thread", "process"):
+            p = Portfolio(entries, options_map, beangrow_config, executor=executor, max_workers=2)
+            assert list(p.account_data_map) == list(expected.account_data_map)
+            assert summarize_account_data(p) == summarize_account_data(expected)
+
+    def test_shared_entries(self):
+        ledger_path = Path("example/example.beancount")
+        entries, _, options_map = loader.load_file(ledger_path)
+        p = Portfolio(entries, options_map, ledger_path.parent / "beangrow.pbtxt")
+
+        # the transactions of the ledger are shared, and the categories of the postings are stored separately
+        entry_ids = {id(entry) for entry in entries}
+        for ad in p.account_data_map.values():
+            assert len(ad.categories) == len(ad.transactions)
+            for txn, categories in zip(ad.transactions, ad.categories):
+                assert id(txn) in entry_ids
+                assert len(categories) == len(txn.postings)
+                assert all("category" not in posting.meta for posting in txn.postings)
+
+    def test_filter_interned(self):
+        ledger_path = Path("example/example.beancount")
+        entries, _, options_map = loader.load_file(ledger_path)
+        p = Portfolio(entries, options_map, ledger_path.parent / "beangrow.pbtxt")
+
+        fp = p.filter([], "USD")
+        assert p.filter([], "USD") is fp
+        assert p.filter([], "EUR") is not fp
+        groups = [group.id for group in p.investments_config.groups][:2]
+        assert p.filter(groups, "USD") is p.filter(list(reversed(groups)), "USD")
+
+        # least recently used filtered portfolios are evicted
+        with mock.patch("fava_portfolio_returns.core.portfolio.FILTERED_PORTFOLIO_CACHE_SIZE", 2):
+            p.filter([], "USD")
+            p.filter([groups[0]], "USD")
+            assert list(p.filtered_portfolios) == [((), "USD"), ((groups[0],), "USD")]
+        assert p.filter([], "USD") is fp
+
+
+def summarize_account_data(p: Portfolio):
+    return [
+        (
+            ad.account,
+            ad.balance,
+            [(txn.date, txn.narration) for txn in ad.transactions],
+            ad.categories,
+            [(flow.date, flow.amount, flow.source) for flow in ad.cash_flows],
+            ad.close,
+        )
+        for ad in p.account_data_map.values()
+    ]
@@ -1,10 +1,13 @@
 import datetime
+from decimal import Decimal
 from typing import Optional
 
 from beancount import Amount
 from beancount import Currency
 from beancount import Position
-from beancount.core import convert
+from beancount.core import prices
+from beancount.core.position import Cost
+from beancount.core.prices import PriceMap
 from fava.helpers import FavaAPIError
 
 from fava_portfolio_returns._vendor.beangrow.returns import Pricer as BeangrowPricer
@@ -13,24 +16,113 @@ from fava_portfolio_returns._vendor.beangrow.returns import Pricer as BeangrowPr
 class CurrencyConversionException(FavaAPIError):
     def __init__(self, source: str, target: str, date: Optional[datetime.date] = None):
         date = date or datetime.date.today()
+        self.source = source
+        self.target = target
+        self.date = date
         super().__init__(
             f"Could not convert {source} to {target} on {date}."
             f" Please add a price directive '{date} price {source} <conversion_rate> {target}' to your ledger."
         )
 
+    def __reduce__(self):
+        return (CurrencyConversionException, (self.source, self.target, self.date))
+
+
+# Maximum number of memoized price lookups. The cache is cleared when it is full,
+# which bounds the memory usage of a long-running Fava instance.
+PRICE_CACHE_SIZE = 100_000
+
+
+class PriceCache:
+    """Memoized price lookups of a price map, keyed by (base, quote, date)."""
+
+    def __init__(self, price_map: PriceMap):
+        self.price_map = price_map
+        self.prices: dict[
+            tuple[Currency, Currency, Optional[datetime.date]], tuple[Optional[datetime.date], Optional[Decimal]]
+        ] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_price(
+        self, base: Currency, quote: Currency, date: Optional[datetime.date]
+    ) -> tuple[Optional[datetime.date], Optional[Decimal]]:
+        """returns the (date, rate) of the latest price on or before date, see beancount.core.prices.get_price"""
+        key = (base, quote, date)
+        price = self.prices.get(key)
+        if price is not None:
+            self.hits += 1
+            return price
+
+        self.misses += 1
+        if len(self.prices) >= PRICE_CACHE_SIZE:
+            self.prices.clear()
+        price = prices.get_price(self.price_map, (base, quote), date)
+        self.prices[key] = price
+        return price
+
 
 class Pricer(BeangrowPricer):
+    """A price database with memoized price lookups.
+
+    The price lookups are cached per pricer, i.e. per portfolio, and therefore invalidated when the ledger is reloaded.
+    The conversions mirror beancount.core.convert, including the order of the multiplications,
+    so that the results are identical.
+
+    The queried prices are only recorded in required_prices if tracking is enabled,
+    otherwise a long-lived pricer would grow with every request.
+    """
+
+    def __init__(self, price_map: PriceMap, track_required_prices: bool = False):
+        super().__init__(price_map)
+        self.track_required_prices = track_required_prices
+        self.cache = PriceCache(price_map)
+
+    def get_value(self, pos: Position, date: datetime.date) -> Amount:
+        units = pos.units
+        value_currency = get_value_currency(pos)
+        if value_currency:
+            price_date, price_number = self.cache.get_price(units.currency, value_currency, date)
+            if self.track_required_prices:
+                found_currency = value_currency if price_number is not None else units.currency
+                self.required_prices[(units.currency, date)].add((found_currency, price_date, price_number))
+            if price_number is not None:
+                return Amount(units.number * price_number, value_currency)  # type: ignore[operator]
+
+        # We failed to infer a conversion rate; return the units.
+        return units
+
     def convert_amount(self, amount: Amount, target_currency: Currency, date: datetime.date) -> Amount:
-        # convert_amount silently returns the original amount if conversion is not possible; throw an exception instead
-        target_amt = super().convert_amount(amount, target_currency, date)
-        if target_amt.currency != target_currency:
-            raise CurrencyConversionException(target_amt.currency, target_currency, date)
-        return target_amt
+        _, rate = self.cache.get_price(amount.currency, target_currency, date)
+        if rate is None:
+            raise CurrencyConversionException(amount.currency, target_currency, date)
+        return Amount(amount.number * rate, target_currency)  # type: ignore[operator]
 
     def convert_position(
         self, pos: Position, target_currency: Currency, date: Optional[datetime.date] = None
-    ) -> Position:
-        target_pos = convert.convert_position(pos, target_currency, self.price_map, date)
-        if target_pos.currency != target_currency:
-            raise CurrencyConversionException(target_pos.currency, target_currency, date)
-        return target_pos
+    ) -> Amount:
+        units = pos.units
+        _, rate = self.cache.get_price(units.currency, target_currency, date)
+        if rate is not None:
+            return Amount(units.number * rate, target_currency)  # type: ignore[operator]
+
+        # A price is unavailable, attempt to convert via cost/price currency hop.
+        value_currency = get_value_currency(pos)
+        if value_currency and value_currency != target_currency:
+            _, rate1 = self.cache.get_price(units.currency, value_currency, date)
+            if rate1 is not None:
+                _, rate2 = self.cache.get_price(value_currency, target_currency, date)
+                if rate2 is not None:
+                    return Amount(units.number * rate1 * rate2, target_currency)  # type: ignore[operator]
+
+        raise CurrencyConversionException(units.currency, target_currency, date)
+
+
+def get_value_currency(pos: Position) -> Optional[Currency]:
+    """returns the cost currency or price currency of a position or posting"""
+    if isinstance(pos.cost, Cost) and pos.cost.currency:
+        return pos.cost.currency
+    price = getattr(pos, "price", None)
+    if price and price.currency:
+        return price.currency
+    return None
@@ -4,6 +4,8 @@ from decimal import Decimal as D
 
 from beancount import Amount
 from beancount import Position
+from beancount.core import convert
+from beancount.core.position import Cost
 
 from fava_portfolio_returns.core.pricer import CurrencyConversionException
 from fava_portfolio_returns.test.test import BEANGROW_CONFIG_CORP
@@ -47,3 +49,33 @@ class TestPricer(unittest.TestCase):
         )
         assert p.pricer.convert_position(Position(units=oneUSD), "EUR", datetime.date(2020, 1, 2)) == halfEUR
         assert p.pricer.convert_position(Position(units=oneUSD), "EUR", datetime.date(2020, 1, 3)) == halfEUR
+
+    def test_convert_post_via_cost_currency(self):
+        p = load_portfolio_str(
+            """
+2020-01-02 price CORP 4 USD
+2020-01-02 price EUR 2 USD
+            """,
+            BEANGROW_CONFIG_CORP,
+        )
+
+        position = Position(units=Amount(D(1), "CORP"), cost=Cost(D(3), "USD", datetime.date(2020, 1, 1), None))
+        assert p.pricer.convert_position(position, "EUR", datetime.date(2020, 1, 2)) == Amount(D(2), "EUR")
+        assert p.pricer.convert_position(position, "EUR", datetime.date(2020, 1, 2)) == convert.convert_position(
+            position, "EUR", p.pricer.price_map, datetime.date(2020, 1, 2)
+        )
+
+    def test_price_cache(self):
+        p = load_portfolio_str(
+            """
+2020-01-02 price EUR 2 USD
+            """,
+            BEANGROW_CONFIG_CORP,
+        )
+
+        assert p.pricer.convert_amount(oneUSD, "EUR", datetime.date(2020, 1, 2)) == halfEUR
+        assert (p.pricer.cache.hits, p.pricer.cache.misses) == (0, 1)
+        assert p.pricer.convert_amount(oneUSD, "EUR", datetime.date(2020, 1, 2)) == halfEUR
+        assert (p.pricer.cache.hits, p.pricer.cache.misses) == (1, 1)
+        assert p.pricer.convert_amount(oneUSD, "EUR", datetime.date(2020, 1, 3)) == halfEUR
+        assert (p.pricer.cache.hits, p.pricer.cache.misses) == (1, 2)
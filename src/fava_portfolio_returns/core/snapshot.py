@@ -0,0 +1,87 @@
+import hashlib
+import importlib.metadata
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Optional
+
+import beancount
+from fava.beans.types import BeancountOptions
+
+logger = logging.getLogger(__name__)
+
+# increment if the layout of the stored objects changes
+SNAPSHOT_VERSION = 2
+
+
+def ledger_key(options_map: BeancountOptions, beangrow_config: Path | str) -> Optional[str]:
+    """returns a hash of the ledger source files, the beangrow config and the software versions,
+    or None if the ledger was not loaded from files"""
+    source_files = sorted(options_map.get("include", []))
+    if not source_files:
+        return None
+
+    h = hashlib.sha256()
+    try:
+        package_version = importlib.metadata.version("fava-portfolio-returns")
+    except importlib.metadata.PackageNotFoundError:
+        package_version = "unknown"
+    h.update(f"{SNAPSHOT_VERSION}:{package_version}:{beancount.__version__}\n".encode())
+
+    try:
+        for source_file in source_files:
+            h.update(f"{source_file}\n".encode())
+            h.update(Path(source_file).read_bytes())
+        if isinstance(beangrow_config, Path):
+            h.update(beangrow_config.read_bytes())
+        else:
+            h.update(beangrow_config.encode())
+    except OSError as e:
+        logger.debug("Cannot compute the ledger hash: %s", e)
+        return None
+    return h.hexdigest()
+
+
+class SnapshotStore:
+    """Pickled snapshots of derived portfolio data on disk, which survive restarts of Fava.
+
+    The snapshots are only valid for unchanged ledger source files and beangrow config.
+    Snapshots of previous versions of the ledger are removed when a new snapshot is saved.
+    """
+
+    def __init__(self, cache_dir: Path, options_map: BeancountOptions, ledger_hash: str):
+        self.cache_dir = cache_dir
+        # the first source file is the main ledger file
+        self.prefix = "portfolio-" + hashlib.sha256(options_map["include"][0].encode()).hexdigest()[:16]
+        self.ledger_hash = ledger_hash
+
+    def path(self, name: str) -> Path:
+        return self.cache_dir / f"{self.prefix}-{self.ledger_hash}-{name}.pickle"
+
+    def load(self, name: str) -> Optional[Any]:
+        path = self.path(name)
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Ignoring invalid snapshot %s: %s", path, e)
+            return None
+
+    def save(self, name: str, obj: Any) -> None:
+        """write the snapshot atomically, and remove the snapshots of previous versions of the ledger"""
+        path = self.path(name)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=".tmp-", delete=False) as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, path)
+            for outdated in self.cache_dir.glob(f"{self.prefix}-*.pickle"):
+                if not outdated.name.startswith(f"{self.prefix}-{self.ledger_hash}-"):
+                    outdated.unlink(missing_ok=True)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning("Cannot write snapshot %s: %s", path, e)
@@ -0,0 +1,51 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from beancount import loader
+
+from fava_portfolio_returns.core.portfolio import Portfolio
+from fava_portfolio_returns.core.snapshot import ledger_key
+
+LEDGER_PATH = Path("example/example.beancount")
+BEANGROW_CONFIG = LEDGER_PATH.parent / "beangrow.pbtxt"
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_timeline_snapshot(self):
+        entries, _, options_map = loader.load_file(LEDGER_PATH)
+        expected = Portfolio(entries, options_map, BEANGROW_CONFIG).filter([], "USD").timeline()
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            p = Portfolio(entries, options_map, BEANGROW_CONFIG, cache_dir=Path(cache_dir))
+            p.filter([], "USD").timeline()
+            p.filter([], "EUR").timeline()
+            assert len(list(Path(cache_dir).glob("portfolio-*.pickle"))) == 2
+
+            # a portfolio of the same ledger, e.g. after a restart of Fava, loads the timeline from disk
+            p = Portfolio(entries, options_map, BEANGROW_CONFIG, cache_dir=Path(cache_dir))
+            with mock.patch("fava_portfolio_returns.core.timeline.compute_values") as compute_values:
+                timeline = p.filter([], "USD").timeline()
+            compute_values.assert_not_called()
+
+            assert timeline.dates == expected.dates
+            assert timeline.values == expected.values
+            assert timeline.visible_from == expected.visible_from
+
+            # snapshots of a previous version of the ledger are removed
+            p = Portfolio(entries, options_map, BEANGROW_CONFIG, cache_dir=Path(cache_dir))
+            p.snapshots.ledger_hash = "changed"
+            p.filter([], "USD").timeline()
+            assert [path.name.split("-")[2] for path in Path(cache_dir).glob("portfolio-*.pickle")] == ["changed"]
+
+    def test_ledger_key(self):
+        _, _, options_map = loader.load_file(LEDGER_PATH)
+        key = ledger_key(options_map, BEANGROW_CONFIG)
+        assert key is not None
+        assert ledger_key(options_map, BEANGROW_CONFIG) == key
+        assert ledger_key(options_map, BEANGROW_CONFIG.read_text() + "\n") != key
+
+        # ledgers which are not loaded from files have no snapshots
+        _, _, options_map = loader.load_string("2020-01-01 open Assets:Cash")
+        assert ledger_key(options_map, BEANGROW_CONFIG) is None
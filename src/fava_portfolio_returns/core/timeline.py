@@ -0,0 +1,389 @@
+import bisect
+import copy
+import datetime
+import functools
+import itertools
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable
+from typing import Literal
+from typing import Optional
+
+from beancount.core.inventory import Inventory
+from beancount.core.number import ZERO
+
+from fava_portfolio_returns._vendor.beangrow.investments import AccountData
+from fava_portfolio_returns._vendor.beangrow.investments import Cat
+from fava_portfolio_returns._vendor.beangrow.investments import Currency
+from fava_portfolio_returns._vendor.beangrow.investments import produce_cash_flows_general
+from fava_portfolio_returns.core.balances import CategorizedTransaction
+from fava_portfolio_returns.core.balances import add_asset_postings
+from fava_portfolio_returns.core.pricer import CurrencyConversionException
+from fava_portfolio_returns.core.pricer import Pricer
+from fava_portfolio_returns.core.utils import cost_value_of_inv
+from fava_portfolio_returns.core.utils import get_prices
+from fava_portfolio_returns.core.utils import market_value_of_inv
+from fava_portfolio_returns.core.vectorized import vectorized_values
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioValue:
+    date: datetime.date
+    # market value
+    market: Decimal
+    # cost value (excl. fees)
+    cost: Decimal
+    # cumulative value of cash flows, i.e. cost value incl. fees
+    cash: Decimal
+
+
+Engine = Literal["decimal", "numpy"]
+
+# values, conversion errors per data point, and the error converting a cash flow (see Timeline)
+TimelineValues = tuple[
+    list[PortfolioValue],
+    dict[int, CurrencyConversionException],
+    Optional[tuple[datetime.date, CurrencyConversionException]],
+]
+
+
+@dataclass(frozen=True)
+class TimelineCheckpoint:
+    """state after the last data point of a timeline, to append later data points"""
+
+    date: datetime.date
+    # balance after the last data point, must not be modified
+    balance: Inventory
+    # sum of all cash flows converted to the target currency
+    cf_balance_converted: Decimal
+    # required currency pairs, and the date of the first transaction requiring them
+    currency_pairs: dict[tuple[Currency, Currency], datetime.date]
+
+
+class Timeline:
+    """Market, cost and cash value of a portfolio on every price and volume change of the entire ledger.
+
+    The timeline is computed once and sliced by date range afterwards.
+    The values are computed either with exact Decimal arithmetic (default), or with float arithmetic on NumPy arrays.
+    A price date is only part of a slice if the commodity (or currency) was bought before the end of the slice,
+    i.e. slicing gives the same result as computing the values only from the transactions until the end date.
+
+    Therefore the data points before the earliest changed entry of a reloaded ledger are unchanged. If the timeline
+    of the previous load of the ledger is given, these values are reused and only the remaining values are computed.
+    If all changes are after the last data point (e.g. a daily price import), the timeline is extended from its
+    checkpoint, and only the new transactions and price dates are processed.
+    """
+
+    target_currency: Currency
+    dates: list[datetime.date]
+    values: list[PortfolioValue]
+    # a data point is only visible in slices ending on or after this date
+    visible_from: list[datetime.date]
+    # conversion errors of data points, raised if a slice contains the data point
+    errors: dict[int, CurrencyConversionException]
+    # currency pairs without any prices (and the date they are required), raised if a slice contains this date
+    missing_prices: list[tuple[datetime.date, CurrencyConversionException]]
+    # error converting a cash flow, raised if a slice contains this date
+    cash_error: Optional[tuple[datetime.date, CurrencyConversionException]]
+    # state after the last data point (decimal engine only)
+    checkpoint: Optional["TimelineCheckpoint"]
+
+    def __init__(
+        self,
+        pricer: Pricer,
+        account_data_list: list[AccountData],
+        target_currency: Currency,
+        engine: Engine = "decimal",
+        previous: Optional["Timeline"] = None,
+        unchanged_before: Optional[datetime.date] = None,
+    ):
+        self.target_currency = target_currency
+        self.dates = []
+        self.values = []
+        self.visible_from = []
+        self.errors = {}
+        self.missing_prices = []
+        self.cash_error = None
+        self.checkpoint = None
+
+        checkpoint = self.resumable_checkpoint(previous, unchanged_before) if engine == "decimal" else None
+        transactions = categorized_transactions(account_data_list, checkpoint.date if checkpoint else None)
+        currency_pairs = required_currency_pairs(
+            transactions, target_currency, checkpoint.currency_pairs if checkpoint else {}
+        )
+        if checkpoint and has_prices_until(
+            pricer, currency_pairs.keys() - checkpoint.currency_pairs.keys(), checkpoint.date
+        ):
+            # prices of newly required currency pairs before the checkpoint are additional data points
+            checkpoint = None
+            transactions = categorized_transactions(account_data_list)
+            currency_pairs = required_currency_pairs(transactions, target_currency, {})
+
+        def first(x):
+            return x[0]
+
+        # Get dates of price directives, and the earliest date from which on they are required.
+        price_dates: dict[datetime.date, datetime.date] = {}
+        for (source, target), required_from in currency_pairs.items():
+            try:
+                prices = get_prices(pricer, source, target)
+            except CurrencyConversionException as ex:
+                self.missing_prices.append((required_from, ex))
+                continue
+            if checkpoint:
+                prices = prices[bisect.bisect_right(prices, checkpoint.date, key=first) :]
+            for date, _ in prices:
+                price_dates[date] = min(price_dates.get(date, required_from), required_from)
+
+        # Get dates of transactions and price directives
+        entry_dates: list[tuple[datetime.date, Optional[CategorizedTransaction]]] = sorted(
+            itertools.chain(
+                ((date, None) for date in price_dates),
+                ((item[0].date, item) for item in transactions),
+            ),
+            key=first,
+        )
+
+        # Skip price dates before first purchase of commodity (first transaction)
+        if not checkpoint:
+            for i, entry_date in enumerate(entry_dates):
+                if entry_date[1] is not None:
+                    entry_dates = entry_dates[i:]
+                    break
+
+        # Every date is a data point.
+        points: list[tuple[datetime.date, list[CategorizedTransaction]]] = []
+        for date, group in itertools.groupby(entry_dates, key=first):
+            point_transactions = [entry for _, entry in group if entry is not None]
+            points.append((date, point_transactions))
+            self.dates.append(date)
+            self.visible_from.append(date if point_transactions else max(date, price_dates[date]))
+
+        if engine == "numpy":
+            self.values, self.errors, self.cash_error = compute_values_vectorized(pricer, target_currency, points)
+        else:
+            if previous and checkpoint:
+                # the new data points are appended to all data points of the previous timeline
+                k = len(previous.values)
+                self.dates = previous.dates + self.dates
+                self.visible_from = previous.visible_from + self.visible_from
+                balance = copy.copy(checkpoint.balance)
+                cf_balance_converted = checkpoint.cf_balance_converted
+            else:
+                k = self.reusable_points(previous, unchanged_before) if previous and unchanged_before else 0
+                # restore the balance after the reused data points, the cash value is the negated sum of the cash flows
+                balance = Inventory()
+                for _, point_transactions in points[:k]:
+                    for entry, categories in point_transactions:
+                        add_asset_postings(balance, entry, categories)
+                cf_balance_converted = -previous.values[k - 1].cash if previous and k else ZERO
+                points = points[k:]
+
+            values, errors, self.cash_error = compute_values(
+                pricer, target_currency, points, balance, cf_balance_converted
+            )
+            self.values = (previous.values[:k] if previous else []) + values
+            self.errors = {i: ex for i, ex in previous.errors.items() if i < k} if previous else {}
+            self.errors.update((k + i, ex) for i, ex in errors.items())
+            if self.values and self.cash_error is None:
+                self.checkpoint = TimelineCheckpoint(
+                    date=self.values[-1].date,
+                    balance=balance,
+                    cf_balance_converted=-self.values[-1].cash,
+                    currency_pairs=currency_pairs,
+                )
+        # data points after a failing cash flow conversion are never part of a slice
+        del self.dates[len(self.values) :]
+        del self.visible_from[len(self.values) :]
+
+    def resumable_checkpoint(
+        self, previous: Optional["Timeline"], unchanged_before: Optional[datetime.date]
+    ) -> Optional["TimelineCheckpoint"]:
+        """returns the checkpoint of the previous timeline, if all changes are after its last data point"""
+        if not previous or not unchanged_before or not previous.checkpoint:
+            return None
+        if previous.target_currency != self.target_currency or previous.checkpoint.date >= unchanged_before:
+            return None
+        return previous.checkpoint
+
+    def reusable_points(self, previous: "Timeline", unchanged_before: datetime.date) -> int:
+        """returns the number of leading data points whose values can be taken from the previous timeline"""
+        if previous.target_currency != self.target_currency:
+            return 0
+        n = min(bisect.bisect_left(self.dates, unchanged_before), len(previous.values))
+        k = 0
+        while k < n and previous.dates[k] == self.dates[k] and previous.visible_from[k] == self.visible_from[k]:
+            k += 1
+        return k
+
+    @functools.cached_property
+    def growth_factors(self) -> list[Optional[float]]:
+        """cashflow-adjusted growth factor from the previous data point to each data point, computed once"""
+        factors: list[Optional[float]] = [None]
+        for current, next_value in itertools.pairwise(self.values):
+            factors.append(compute_growth_factor(current, next_value))
+        return factors
+
+    def slice(self, start_date: datetime.date, end_date: datetime.date) -> list[PortfolioValue]:
+        """returns all data points between start_date and end_date, and the last data point before start_date
+
+        The first data point can be before start_date and must be clamped by the caller.
+        """
+        return [self.values[i] for i in self.slice_indices(start_date, end_date)]
+
+    def slice_indices(self, start_date: datetime.date, end_date: datetime.date) -> list[int]:
+        """returns the indices of the data points of slice()"""
+        for required_from, ex in self.missing_prices:
+            if required_from <= end_date:
+                raise ex
+        if self.cash_error and self.cash_error[0] <= end_date:
+            raise self.cash_error[1]
+
+        end = bisect.bisect_right(self.dates, end_date)
+
+        # Get first data point of series, either before or on start_date.
+        first = bisect.bisect_right(self.dates, start_date, hi=end) - 1
+        while first >= 0 and self.visible_from[first] > end_date:
+            first -= 1
+        if first < 0:
+            # the first data point is always a transaction
+            first = 0
+
+        indices: list[int] = []
+        for i in range(first, end):
+            if self.visible_from[i] > end_date:
+                continue
+            if i in self.errors and self.dates[i] >= start_date:
+                raise self.errors[i]
+            indices.append(i)
+        return indices
+
+
+def categorized_transactions(
+    account_data_list: list[AccountData], after: Optional[datetime.date] = None
+) -> list[CategorizedTransaction]:
+    """returns the transactions of all investments (after the given date) with the categories of their postings"""
+    transactions: list[CategorizedTransaction] = []
+    for ad in account_data_list:
+        start = bisect.bisect_right(ad.transactions, after, key=lambda entry: entry.date) if after else 0
+        transactions.extend(zip(ad.transactions[start:], ad.categories[start:]))
+    return transactions
+
+
+def required_currency_pairs(
+    transactions: list[CategorizedTransaction],
+    target_currency: Currency,
+    currency_pairs: dict[tuple[Currency, Currency], datetime.date],
+) -> dict[tuple[Currency, Currency], datetime.date]:
+    """Infer the list of required prices, and the date of the first transaction requiring them.
+
+    Returns a copy of the given currency pairs, updated with the currency pairs of the transactions.
+    """
+    currency_pairs = dict(currency_pairs)
+    for transaction, categories in transactions:
+        for posting, category in zip(transaction.postings, categories):
+            if category is Cat.ASSET and posting.cost and posting.units and posting.cost.currency:
+                # ex. (CORP, USD)
+                pairs = [(posting.units.currency, posting.cost.currency)]
+                # also add data points for indirect conversion to target currency
+                if posting.cost.currency != target_currency:
+                    pairs.append((posting.cost.currency, target_currency))
+                for pair in pairs:
+                    currency_pairs[pair] = min(currency_pairs.get(pair, transaction.date), transaction.date)
+    return currency_pairs
+
+
+def has_prices_until(pricer: Pricer, currency_pairs: Iterable[tuple[Currency, Currency]], date: datetime.date) -> bool:
+    """returns True if any of the currency pairs has a price on or before the given date"""
+    for source, target in currency_pairs:
+        try:
+            prices = get_prices(pricer, source, target)
+        except CurrencyConversionException:
+            continue
+        if prices and prices[0][0] <= date:
+            return True
+    return False
+
+
+def compute_values(
+    pricer: Pricer,
+    target_currency: Currency,
+    points: list[tuple[datetime.date, list[CategorizedTransaction]]],
+    balance: Optional[Inventory] = None,
+    cf_balance_converted: Decimal = ZERO,
+) -> TimelineValues:
+    """computes the market, cost and cash value of all data points with exact Decimal arithmetic
+
+    The computation starts with the given balance and sum of converted cash flows (empty by default).
+    """
+    values: list[PortfolioValue] = []
+    errors: dict[int, CurrencyConversionException] = {}
+    if balance is None:
+        balance = Inventory()
+    for date, transactions in points:
+        # Update balances.
+        for entry, categories in transactions:
+            add_asset_postings(balance, entry, categories)
+            for flow in produce_cash_flows_general(entry, "", categories):
+                # Convert flow amount to the target_currency at the date of the flow
+                try:
+                    cash_amount_converted = pricer.convert_amount(flow.amount, target_currency, date)
+                except CurrencyConversionException as ex:
+                    # all following data points depend on this cash flow
+                    return values, errors, (date, ex)
+                cf_balance_converted += cash_amount_converted.number or ZERO
+
+        try:
+            market = market_value_of_inv(pricer, target_currency, balance, date)
+            cost = cost_value_of_inv(pricer, target_currency, balance, date)
+        except CurrencyConversionException as ex:
+            errors[len(values)] = ex
+            market = cost = ZERO
+        cash = -cf_balance_converted  # sum of cash flows
+        values.append(PortfolioValue(date=date, market=market, cost=cost, cash=cash))
+    return values, errors, None
+
+
+def compute_values_vectorized(
+    pricer: Pricer, target_currency: Currency, points: list[tuple[datetime.date, list[CategorizedTransaction]]]
+) -> TimelineValues:
+    """computes the market, cost and cash value of all data points with float arithmetic on NumPy arrays
+
+    Data points which cannot be computed with arrays (e.g. because of missing prices) use the exact Decimal arithmetic.
+    """
+    arrays = vectorized_values(pricer, target_currency, points)
+    values: list[PortfolioValue] = []
+    errors: dict[int, CurrencyConversionException] = {}
+    replay = bool(arrays.exact.any())
+    balance = Inventory()
+    for i, (date, transactions) in enumerate(points[: len(arrays.market)]):
+        if replay:
+            for entry, categories in transactions:
+                add_asset_postings(balance, entry, categories)
+
+        if arrays.exact[i]:
+            try:
+                market = market_value_of_inv(pricer, target_currency, balance, date)
+                cost = cost_value_of_inv(pricer, target_currency, balance, date)
+            except CurrencyConversionException as ex:
+                errors[i] = ex
+                market = cost = ZERO
+        else:
+            market = Decimal(str(arrays.market[i]))
+            cost = Decimal(str(arrays.cost[i]))
+        cash = Decimal(str(arrays.cash[i]))
+        values.append(PortfolioValue(date=date, market=market, cost=cost, cash=cash))
+    return values, errors, arrays.cash_error
+
+
+def compute_growth_factor(current: PortfolioValue, next_value: PortfolioValue) -> Optional[float]:
+    """cashflow-adjusted growth factor between two data points, or None if the market value of the first is zero"""
+    # https://en.wikipedia.org/wiki/Time-weighted_return#Time-weighted_return_compensating_for_external_flows
+    # portfolio is valued immediately after each external flow
+    cashflow = next_value.cash - current.cash
+    begin = current.market
+    end = next_value.market - cashflow  # market value of next period excl. cashflow
+
+    if begin == ZERO:
+        return None
+    return float(end) / float(begin)
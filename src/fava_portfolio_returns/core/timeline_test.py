@@ -0,0 +1,239 @@
+import datetime
+import unittest
+from decimal import Decimal as D
+from pathlib import Path
+from unittest import mock
+
+from fava_portfolio_returns.core.timeline import PortfolioValue
+from fava_portfolio_returns.core.timeline import Timeline
+from fava_portfolio_returns.core.timeline import compute_values
+from fava_portfolio_returns.test.test import BEANGROW_CONFIG_CORPAB
+from fava_portfolio_returns.test.test import approx3
+from fava_portfolio_returns.test.test import load_portfolio_file
+from fava_portfolio_returns.test.test import load_portfolio_str
+
+
+class TestTimeline(unittest.TestCase):
+    def test_slice_excludes_prices_of_later_purchases(self):
+        p = load_portfolio_str(
+            """
+plugin "beancount.plugins.auto_accounts"
+plugin "beancount.plugins.implicit_prices"
+
+2020-01-01 commodity CORPA
+2020-01-01 commodity CORPB
+
+2020-01-01 * "Buy 1 CORPA"
+  Assets:Cash                                      -10.00 USD
+  Assets:CORPA                                          1 CORPA {10 USD}
+
+2020-02-01 price CORPA                                 12 USD
+2020-02-15 price CORPB                                 30 USD
+
+2020-03-01 * "Buy 1 CORPB"
+  Assets:Cash                                      -20.00 USD
+  Assets:CORPB                                          1 CORPB {20 USD}
+            """,
+            BEANGROW_CONFIG_CORPAB,
+        )
+        timeline = p.timeline()
+        assert timeline.dates == [
+            datetime.date(2020, 1, 1),
+            datetime.date(2020, 2, 1),
+            datetime.date(2020, 2, 15),
+            datetime.date(2020, 3, 1),
+        ]
+
+        # CORPB was bought after the end date, therefore its price on 2020-02-15 is not a data point
+        assert timeline.slice(datetime.date(2020, 1, 1), datetime.date(2020, 2, 20)) == [
+            PortfolioValue(date=datetime.date(2020, 1, 1), market=D(10), cost=D(10), cash=D(10)),
+            PortfolioValue(date=datetime.date(2020, 2, 1), market=D(12), cost=D(10), cash=D(10)),
+        ]
+        assert timeline.slice(datetime.date(2020, 2, 10), datetime.date(2020, 3, 1)) == [
+            PortfolioValue(date=datetime.date(2020, 2, 1), market=D(12), cost=D(10), cash=D(10)),
+            PortfolioValue(date=datetime.date(2020, 2, 15), market=D(12), cost=D(10), cash=D(10)),
+            PortfolioValue(date=datetime.date(2020, 3, 1), market=D(32), cost=D(30), cash=D(30)),
+        ]
+        assert timeline.slice(datetime.date(2019, 1, 1), datetime.date(2019, 12, 31)) == []
+
+    def test_timeline_is_shared(self):
+        p = load_portfolio_str(
+            """
+plugin "beancount.plugins.auto_accounts"
+
+2020-01-01 commodity CORPA
+2020-01-01 commodity CORPB
+
+2020-01-01 * "Buy 1 CORPA"
+  Assets:Cash                                      -10.00 USD
+  Assets:CORPA                                          1 CORPA {10 USD}
+
+2020-02-01 price CORPA                                 12 USD
+2020-02-01 price USD                                  0.9 EUR
+            """,
+            BEANGROW_CONFIG_CORPAB,
+        )
+        timeline = p.timeline()
+        assert p.timeline() is timeline
+
+        p.target_currency = "EUR"
+        assert p.timeline() is not timeline
+        assert p.timeline().target_currency == "EUR"
+
+    def test_growth_factors(self):
+        p = load_portfolio_str(
+            """
+plugin "beancount.plugins.auto_accounts"
+plugin "beancount.plugins.implicit_prices"
+
+2020-01-01 commodity CORPA
+
+2020-01-01 * "Buy 1 CORPA"
+  Assets:Cash                                      -10.00 USD
+  Assets:CORPA                                          1 CORPA {10 USD}
+
+2020-02-01 price CORPA                                 12 USD
+
+2020-03-01 * "Buy 1 CORPA"
+  Assets:Cash                                      -15.00 USD
+  Assets:CORPA                                          1 CORPA {15 USD}
+            """,
+            BEANGROW_CONFIG_CORPAB,
+        )
+        # the cash flow of the second purchase is excluded from the growth factor
+        assert p.timeline().growth_factors == [None, 1.2, 1.25]
+
+    def test_reuse_previous_timeline(self):
+        ledger = """
+plugin "beancount.plugins.auto_accounts"
+
+2020-01-01 commodity CORPA
+2020-01-01 commodity CORPB
+
+2020-01-01 * "Buy 1 CORPA"
+  Assets:Cash                                      -10.00 USD
+  Assets:CORPA                                          1 CORPA {10 USD}
+
+2020-02-01 price CORPA                                 12 USD
+2020-03-01 price CORPA                                 14 USD
+"""
+        appended = """
+2020-03-01 * "Buy 1 CORPB"
+  Assets:Cash                                      -20.00 USD
+  Assets:CORPB                                          1 CORPB {20 USD}
+
+2020-04-01 price CORPA                                 15 USD
+"""
+        previous = load_portfolio_str(ledger, BEANGROW_CONFIG_CORPAB).timeline()
+        p = load_portfolio_str(ledger + appended, BEANGROW_CONFIG_CORPAB)
+        expected = Timeline(p.pricer, p.account_data_list, "USD")
+
+        with mock.patch("fava_portfolio_returns.core.timeline.compute_values", wraps=compute_values) as mocked:
+            timeline = Timeline(
+                p.pricer, p.account_data_list, "USD", previous=previous, unchanged_before=datetime.date(2020, 3, 1)
+            )
+        # only the data points on or after the changed date are computed
+        assert [date for date, _ in mocked.call_args.args[2]] == [
+            datetime.date(2020, 3, 1),
+            datetime.date(2020, 4, 1),
+        ]
+        assert timeline.values[:2] == previous.values[:2]
+        assert timeline.dates == expected.dates
+        assert timeline.values == expected.values
+        assert timeline.visible_from == expected.visible_from
+
+    def test_extend_from_checkpoint(self):
+        ledger = """
+plugin "beancount.plugins.auto_accounts"
+
+2020-01-01 commodity CORPA
+2020-01-01 commodity CORPB
+
+2020-01-01 * "Buy 1 CORPA"
+  Assets:Cash                                      -10.00 USD
+  Assets:CORPA                                          1 CORPA {10 USD}
+
+2020-01-15 price CORPB                                 18 USD
+
+2020-02-01 price CORPA                                 12 USD
+"""
+        appended = """
+2020-03-01 price CORPA                                 14 USD
+2020-04-01 * "Buy 1 CORPA"
+  Assets:Cash                                      -14.00 USD
+  Assets:CORPA                                          1 CORPA {14 USD}
+"""
+        previous = load_portfolio_str(ledger, BEANGROW_CONFIG_CORPAB).timeline()
+        assert previous.dates == [datetime.date(2020, 1, 1), datetime.date(2020, 2, 1)]
+        assert previous.checkpoint is not None
+        assert previous.checkpoint.date == datetime.date(2020, 2, 1)
+
+        p = load_portfolio_str(ledger + appended, BEANGROW_CONFIG_CORPAB)
+        expected = Timeline(p.pricer, p.account_data_list, "USD")
+        with mock.patch("fava_portfolio_returns.core.timeline.compute_values", wraps=compute_values) as mocked:
+            timeline = Timeline(
+                p.pricer, p.account_data_list, "USD", previous=previous, unchanged_before=datetime.date(2020, 3, 1)
+            )
+        # only the new data points are processed
+        points = mocked.call_args.args[2]
+        assert [(date, len(transactions)) for date, transactions in points] == [
+            (datetime.date(2020, 3, 1), 0),
+            (datetime.date(2020, 4, 1), 1),
+        ]
+        assert timeline.dates == expected.dates
+        assert timeline.values == expected.values
+        assert timeline.visible_from == expected.visible_from
+        assert timeline.checkpoint is not None
+        assert timeline.checkpoint.balance == expected.checkpoint.balance
+
+        # the first purchase of CORPB adds the (hidden) data point of the earlier CORPB price
+        appended += """
+2020-05-01 * "Buy 1 CORPB"
+  Assets:Cash                                      -20.00 USD
+  Assets:CORPB                                          1 CORPB {20 USD}
+"""
+        p = load_portfolio_str(ledger + appended, BEANGROW_CONFIG_CORPAB)
+        expected = Timeline(p.pricer, p.account_data_list, "USD")
+        timeline = Timeline(
+            p.pricer, p.account_data_list, "USD", previous=previous, unchanged_before=datetime.date(2020, 3, 1)
+        )
+        assert timeline.dates[1] == datetime.date(2020, 1, 15)
+        assert timeline.dates == expected.dates
+        assert timeline.values == expected.values
+        assert timeline.visible_from == expected.visible_from
+
+    def test_numpy_engine(self):
+        p = load_portfolio_file(Path("example/example.beancount"))
+        expected = Timeline(p.pricer, p.account_data_list, "USD")
+        timeline = Timeline(p.pricer, p.account_data_list, "USD", engine="numpy")
+
+        assert timeline.dates == expected.dates
+        assert len(timeline.values) == len(expected.values)
+        for value, expected_value in zip(timeline.values, expected.values):
+            assert value.date == expected_value.date
+            assert float(value.market) == approx3(float(expected_value.market))
+            assert float(value.cost) == approx3(float(expected_value.cost))
+            assert float(value.cash) == approx3(float(expected_value.cash))
+
+    def test_numpy_engine_missing_price(self):
+        p = load_portfolio_str(
+            """
+plugin "beancount.plugins.auto_accounts"
+
+2020-01-01 commodity CORPA
+
+2020-01-01 * "Buy 1 CORPA"
+  Assets:Cash                                      -10.00 EUR
+  Assets:CORPA                                          1 CORPA {10 EUR}
+
+2020-02-01 price EUR                                  1.2 USD
+2020-02-01 price CORPA                                 12 EUR
+            """,
+            BEANGROW_CONFIG_CORPAB,
+        )
+        timeline = Timeline(p.pricer, p.account_data_list, "USD", engine="numpy")
+
+        # no EUR/USD exchange rate on 2020-01-01
+        assert timeline.cash_error is not None
+        assert timeline.cash_error[0] == datetime.date(2020, 1, 1)
+        assert timeline.values == []
@@ -44,12 +44,6 @@ def convert_cash_flows_to_currency(pricer: Pricer, target_currency: str, flows:
     return target_flows
 
 
-def filter_cash_flows_by_date(
-    cash_flows: list[CashFlow], start_date: datetime.date, end_date: datetime.date
-) -> list[CashFlow]:
-    return [flow for flow in cash_flows if start_date <= flow.date <= end_date]
-
-
 def get_prices(pricer: Pricer, source: str, target: str) -> list[tuple[datetime.date, Decimal]]:
     """
     :param tuple pair:  (currency, target_currency), e.g. (CORP, USD)
@@ -0,0 +1,140 @@
+import datetime
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+from beancount.core import convert
+from beancount.core.number import ZERO
+
+from fava_portfolio_returns._vendor.beangrow.investments import Cat
+from fava_portfolio_returns._vendor.beangrow.investments import Currency
+from fava_portfolio_returns._vendor.beangrow.investments import produce_cash_flows_general
+from fava_portfolio_returns.core.balances import CategorizedTransaction
+from fava_portfolio_returns.core.pricer import CurrencyConversionException
+from fava_portfolio_returns.core.pricer import Pricer
+
+
+@dataclass
+class VectorizedValues:
+    # market, cost and cash value of each data point in the target currency
+    market: np.ndarray
+    cost: np.ndarray
+    cash: np.ndarray
+    # data points which must be computed with the exact Decimal arithmetic, e.g. because of missing prices
+    exact: np.ndarray
+    # error converting a cash flow; the arrays end before the data point of this cash flow
+    cash_error: Optional[tuple[datetime.date, CurrencyConversionException]]
+
+
+def vectorized_values(
+    pricer: Pricer, target_currency: Currency, points: list[tuple[datetime.date, list[CategorizedTransaction]]]
+) -> VectorizedValues:
+    """computes the market, cost and cash value of all data points with NumPy array operations
+
+    The holdings are tracked in a dense (data point x (commodity, cost currency)) matrix, which is multiplied
+    by a matrix of forward-filled prices in the cost currency and the forward-filled exchange rate
+    of the cost currency to the target currency.
+    """
+    n = len(points)
+    ordinals = np.array([date.toordinal() for date, _ in points], dtype=np.int64)
+
+    # Track the cumulative units and cost of each (commodity, cost currency) pair with exact arithmetic,
+    # to make sure that sold positions are exactly zero.
+    # Positions without cost are valued at their units (see convert.get_cost), i.e. with a price of 1.
+    units_sum: dict[tuple[str, str], Decimal] = defaultdict(Decimal)
+    cost_sum: dict[tuple[str, str], Decimal] = defaultdict(Decimal)
+    units_changes: dict[tuple[str, str], dict[int, Decimal]] = defaultdict(dict)
+    cost_changes: dict[tuple[str, str], dict[int, Decimal]] = defaultdict(dict)
+    flow_rows: list[int] = []
+    flow_currencies: list[str] = []
+    flow_amounts: list[float] = []
+    for i, (_, transactions) in enumerate(points):
+        for entry, categories in transactions:
+            for posting, category in zip(entry.postings, categories):
+                if not (category is Cat.ASSET and posting.units):
+                    continue
+                cost_amount = convert.get_cost(posting)
+                pair = (posting.units.currency, cost_amount.currency)
+                units_sum[pair] += posting.units.number or ZERO
+                cost_sum[pair] += cost_amount.number or ZERO
+                units_changes[pair][i] = units_sum[pair]
+                cost_changes[pair][i] = cost_sum[pair]
+
+            for flow in produce_cash_flows_general(entry, "", categories):
+                flow_rows.append(i)
+                flow_currencies.append(flow.amount.currency)
+                flow_amounts.append(float(flow.amount.number or ZERO))
+
+    pairs = list(units_sum)
+    units_matrix = np.zeros((n, len(pairs)))
+    cost_matrix = np.zeros((n, len(pairs)))
+    price_matrix = np.ones((n, len(pairs)))
+    for k, (currency, cost_currency) in enumerate(pairs):
+        units_matrix[:, k] = forward_fill(units_changes[(currency, cost_currency)], n)
+        cost_matrix[:, k] = forward_fill(cost_changes[(currency, cost_currency)], n)
+        price_matrix[:, k] = forward_filled_rates(pricer, currency, cost_currency, ordinals)
+
+    # A missing price is only relevant if the pair is held at this data point.
+    held = (units_matrix != 0.0) | (cost_matrix != 0.0)
+    value_matrix = np.where(held, units_matrix * price_matrix, 0.0)
+    exact = (held & np.isnan(price_matrix)).any(axis=1)
+
+    market = np.zeros(n)
+    cost = np.zeros(n)
+    for cost_currency in sorted(set(cost_currency for _, cost_currency in pairs)):
+        columns = [k for k, pair in enumerate(pairs) if pair[1] == cost_currency]
+        rates = forward_filled_rates(pricer, cost_currency, target_currency, ordinals)
+        currency_held = held[:, columns].any(axis=1)
+        exact |= currency_held & np.isnan(rates)
+        market += np.where(currency_held, value_matrix[:, columns].sum(axis=1) * rates, 0.0)
+        cost += np.where(currency_held, cost_matrix[:, columns].sum(axis=1) * rates, 0.0)
+
+    # Convert the cash flows at the date of the flow, and sum them up per data point.
+    rows = np.array(flow_rows, dtype=np.int64)
+    converted = np.array(flow_amounts)
+    currencies = np.array(flow_currencies, dtype=object)
+    for currency in set(flow_currencies):
+        mask = currencies == currency
+        converted[mask] *= forward_filled_rates(pricer, currency, target_currency, ordinals[rows[mask]])
+
+    cash_error = None
+    missing = np.isnan(converted)
+    if missing.any():
+        # all following data points depend on this cash flow
+        j = int(np.argmax(missing))
+        date = points[rows[j]][0]
+        cash_error = (date, CurrencyConversionException(flow_currencies[j], target_currency, date))
+        n = int(rows[j])
+        converted[missing] = 0.0
+    cash = -np.cumsum(np.bincount(rows, weights=converted, minlength=len(points)))
+
+    return VectorizedValues(market=market[:n], cost=cost[:n], cash=cash[:n], exact=exact[:n], cash_error=cash_error)
+
+
+def forward_fill(changes: dict[int, Decimal], n: int) -> np.ndarray:
+    """returns an array of length n with the value of the last change on or before each row, or zero"""
+    change_rows = np.fromiter(changes.keys(), dtype=np.int64, count=len(changes))
+    values = np.array([float(value) for value in changes.values()])
+    idx = np.searchsorted(change_rows, np.arange(n), side="right") - 1
+    return np.where(idx >= 0, values[np.maximum(idx, 0)], 0.0)
+
+
+def forward_filled_rates(pricer: Pricer, base: Currency, quote: Currency, ordinals: np.ndarray) -> np.ndarray:
+    """returns the latest conversion rate on or before each date, or NaN if there is none"""
+    if base == quote:
+        return np.ones(len(ordinals))
+
+    price_list = pricer.price_map.get((base, quote))
+    if price_list is not None:
+        rates = np.array([float(rate) for _, rate in price_list])
+    else:
+        price_list = pricer.price_map.get((quote, base), [])
+        rates = np.array([1.0 / float(rate) for _, rate in price_list])
+    if not price_list:
+        return np.full(len(ordinals), np.nan)
+
+    price_dates = np.array([date.toordinal() for date, _ in price_list], dtype=np.int64)
+    idx = np.searchsorted(price_dates, ordinals, side="right") - 1
+    return np.where(idx >= 0, rates[np.maximum(idx, 0)], np.nan)
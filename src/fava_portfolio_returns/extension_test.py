@@ -0,0 +1,63 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from fava.application import create_app
+
+LEDGER_PATH = Path("example/example.beancount")
+
+
+class TestExtension(unittest.TestCase):
+    def setUp(self):
+        app = create_app([str(LEDGER_PATH.absolute())])
+        app.testing = True
+        self.client = app.test_client()
+        slug, ledger = next(iter(app.config["LEDGERS"].ledgers_by_slug.items()))
+        self.base = f"/{slug}/extension/FavaPortfolioReturns"
+        self.extension = ledger.extensions.get_extension("FavaPortfolioReturns")
+
+    def test_conditional_get(self):
+        for endpoint in ["config", "investments_stream?group_by=group&currency=USD"]:
+            response = self.client.get(f"{self.base}/{endpoint}")
+            assert response.status_code == 200
+            etag = response.headers["ETag"]
+            assert etag.startswith('"')
+
+            assert self.client.get(f"{self.base}/{endpoint}", headers={"If-None-Match": etag}).status_code == 304
+            # proxies which compress the response send the ETag back as weak validator
+            response = self.client.get(f"{self.base}/{endpoint}", headers={"If-None-Match": f"W/{etag}"})
+            assert response.status_code == 304
+            assert response.headers["ETag"] == etag
+            response = self.client.get(f"{self.base}/{endpoint}", headers={"If-None-Match": '"other"'})
+            assert response.status_code == 200
+
+    def test_portfolio_of_previous_generation(self):
+        generation = self.extension.generation
+        portfolio = self.extension.get_portfolio()
+        assert self.extension.get_portfolio() is portfolio
+
+        # a build of the previous ledger load which stores its result after the reload is not served
+        self.extension.after_load_file()
+        self.extension.cached_portfolio = (generation, portfolio)
+        new_portfolio = self.extension.get_portfolio()
+        assert new_portfolio is not portfolio
+        assert self.extension.cached_portfolio == (generation + 1, new_portfolio)
+
+    def test_prewarm_error(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ledger_path = Path(tmp_dir) / "ledger.beancount"
+            ledger_path.write_text(
+                """
+option "operating_currency" "USD"
+2020-01-01 custom "fava-extension" "fava_portfolio_returns" "{'prewarm': True, 'beangrow_config': 'missing.pbtxt'}"
+"""
+            )
+
+            # the error of the background build is logged
+            with self.assertLogs("fava_portfolio_returns", level="ERROR") as logs:
+                app = create_app([str(ledger_path)])
+                ledger = next(iter(app.config["LEDGERS"].ledgers_by_slug.values()))
+                ledger.extensions.get_extension("FavaPortfolioReturns").prewarm_executor.shutdown(wait=True)
+            assert logs.output[0].startswith(
+                "ERROR:fava_portfolio_returns:Building the portfolio in the background failed"
+            )
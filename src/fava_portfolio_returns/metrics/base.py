@@ -1,5 +1,6 @@
 import abc
 import datetime
+from typing import Callable
 
 from fava_portfolio_returns._vendor.beangrow.reports import Interval
 from fava_portfolio_returns.core.portfolio import FilteredPortfolio
@@ -19,9 +20,12 @@ class MetricBase(abc.ABC):
         raise NotImplementedError("rebase() is not implemented for this metric")
 
     def intervals(self, p: FilteredPortfolio, intervals: list[Interval]) -> list[tuple[str, float]]:
-        return [
-            (interval_name, self.single(p, start_date, end_date)) for interval_name, start_date, end_date in intervals
-        ]
+        return memoized_intervals(
+            self,
+            p,
+            intervals,
+            lambda missing: [self.single(p, start_date, end_date) for _, start_date, end_date in missing],
+        )
 
     def rolling_window(
         self,
@@ -31,14 +35,49 @@ class MetricBase(abc.ABC):
         window_days: int = 365,
         max_points: int = 20,
     ) -> Series:
-        window_delta = datetime.timedelta(days=window_days)
+        return [
+            (date, self.single(p, window_start, date))
+            for window_start, date in rolling_window_dates(p, start_date, end_date, window_days, max_points)
+        ]
+
+
+def memoized_intervals(
+    metric: MetricBase,
+    p: FilteredPortfolio,
+    intervals: list[Interval],
+    compute: Callable[[list[Interval]], list[float]],
+) -> list[tuple[str, float]]:
+    """returns the metric values of the intervals, computing only the values which are not stored in the portfolio
+
+    The value of an interval depends only on the ledger until the end of the interval,
+    therefore the stored values are kept when the ledger is reloaded with changes after the end of the interval.
+    The values are stored per target currency, as the target currency of a portfolio can be changed.
+    """
+    name = type(metric).__name__
+    keys = [(name, p.target_currency, start_date, end_date) for _, start_date, end_date in intervals]
+    values = p.get_metric_values(keys)
+    missing = [interval for interval, key in zip(intervals, keys) if key not in values]
+    computed = {
+        (name, p.target_currency, start_date, end_date): value
+        for (_, start_date, end_date), value in zip(missing, compute(missing))
+    }
+    p.put_metric_values(computed)
+    values.update(computed)
+    return [(interval_name, values[key]) for (interval_name, _, _), key in zip(intervals, keys)]
+
+
+def rolling_window_dates(
+    p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date, window_days: int, max_points: int
+) -> list[tuple[datetime.date, datetime.date]]:
+    """returns the (start, end) dates of the rolling windows"""
+    window_delta = datetime.timedelta(days=window_days)
 
-        cash_flows = p.cash_flows()
-        if cash_flows and start_date - window_delta < cash_flows[0].date:
-            # make sure window starts after first cash flow
-            start_date = cash_flows[0].date + window_delta
+    first_cash_flow = p.cash_flow_columns().first_date()
+    if first_cash_flow and start_date - window_delta < first_cash_flow:
+        # make sure window starts after first cash flow
+        start_date = first_cash_flow + window_delta
 
-        num_days = (end_date - start_date).days
-        step = max(num_days // max_points, 1)
-        dates = (start_date + datetime.timedelta(n) for n in range(0, num_days, step))
-        return [(date, self.single(p, date - window_delta, date)) for date in dates]
+    num_days = (end_date - start_date).days
+    step = max(num_days // max_points, 1)
+    dates = (start_date + datetime.timedelta(n) for n in range(0, num_days, step))
+    return [(date - window_delta, date) for date in dates]
@@ -1,15 +1,26 @@
 import datetime
 import logging
+from collections import defaultdict
 
-from fava_portfolio_returns._vendor.beangrow.returns import compute_irr
-from fava_portfolio_returns._vendor.beangrow.returns import truncate_and_merge_cash_flows
-from fava_portfolio_returns.api.cash_flows import convert_cash_flows_to_currency
+import numpy as np
+from scipy.optimize import fsolve  # type: ignore[import-untyped]
+
+from fava_portfolio_returns._vendor.beangrow.investments import CashFlow
+from fava_portfolio_returns._vendor.beangrow.reports import Interval
+from fava_portfolio_returns._vendor.beangrow.returns import net_present_value
 from fava_portfolio_returns.core.intervals import ONE_DAY
 from fava_portfolio_returns.core.portfolio import FilteredPortfolio
+from fava_portfolio_returns.core.utils import convert_cash_flows_to_currency
 from fava_portfolio_returns.metrics.base import MetricBase
+from fava_portfolio_returns.metrics.base import Series
+from fava_portfolio_returns.metrics.base import memoized_intervals
+from fava_portfolio_returns.metrics.base import rolling_window_dates
 
 logger = logging.getLogger(__name__)
 
+# (cash flows in target currency, time of the cash flows in years relative to the end date)
+IrrProblem = tuple[np.ndarray, np.ndarray]
+
 
 class IRR(MetricBase):
     """
@@ -19,15 +30,101 @@ class IRR(MetricBase):
     """
 
     def single(self, p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date) -> float:
-        # in beangrow the end date is exclusive, therefore add one day
-        cash_flows = truncate_and_merge_cash_flows(p.pricer, p.account_data_list, start_date, end_date + ONE_DAY)
-        cash_flows = convert_cash_flows_to_currency(p.pricer, p.target_currency, cash_flows)
-
-        if logger.isEnabledFor(logging.DEBUG):
-            parts = []
-            for flow in cash_flows:
-                years = (end_date - flow.date).days / 365
-                parts.append(f"{-(flow.amount.number or 0):.2f}*(1+x)^{years:.2f}")
-            logger.debug("Calculating IRR from %s to %s: %s = 0", start_date, end_date, " + ".join(parts))
-
-        return compute_irr(cash_flows, p.pricer, p.target_currency, end_date + ONE_DAY)
+        return compute_irr_batch([irr_problem(p, start_date, end_date)])[0]
+
+    def multiple(self, queries: list[tuple[FilteredPortfolio, datetime.date, datetime.date]]) -> list[float]:
+        """compute the IRR of many portfolios and date ranges with a single solver pass"""
+        return compute_irr_batch([irr_problem(p, start_date, end_date) for p, start_date, end_date in queries])
+
+    def intervals(self, p: FilteredPortfolio, intervals: list[Interval]) -> list[tuple[str, float]]:
+        return memoized_intervals(
+            self,
+            p,
+            intervals,
+            lambda missing: self.multiple([(p, start_date, end_date) for _, start_date, end_date in missing]),
+        )
+
+    def rolling_window(
+        self,
+        p: FilteredPortfolio,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        window_days: int = 365,
+        max_points: int = 20,
+    ) -> Series:
+        windows = rolling_window_dates(p, start_date, end_date, window_days, max_points)
+        irrs = self.multiple([(p, window_start, date) for window_start, date in windows])
+        return [(date, irr) for (_, date), irr in zip(windows, irrs)]
+
+
+def irr_problem(p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date) -> IrrProblem:
+    # in beangrow the end date is exclusive, therefore add one day
+    cash_flows = p.truncated_cash_flows(start_date, end_date + ONE_DAY)
+    cash_flows = convert_cash_flows_to_currency(p.pricer, p.target_currency, cash_flows)
+    return cash_flows_irr_problem(cash_flows, start_date, end_date)
+
+
+def cash_flows_irr_problem(
+    cash_flows: list[CashFlow], start_date: datetime.date, end_date: datetime.date
+) -> IrrProblem:
+    """returns the IRR problem of cash flows (converted to the target currency and truncated to the date range)"""
+    if logger.isEnabledFor(logging.DEBUG):
+        parts = []
+        for flow in cash_flows:
+            years = (end_date - flow.date).days / 365
+            parts.append(f"{-(flow.amount.number or 0):.2f}*(1+x)^{years:.2f}")
+        logger.debug("Calculating IRR from %s to %s: %s = 0", start_date, end_date, " + ".join(parts))
+
+    return (
+        np.array([float(flow.amount.number or 0) for flow in cash_flows]),
+        np.array([(flow.date - (end_date + ONE_DAY)).days / 365 for flow in cash_flows]),
+    )
+
+
+def compute_irr_batch(problems: list[IrrProblem], max_iterations: int = 50) -> list[float]:
+    """Compute the irregularly spaced IRR of many problems at once.
+
+    Problems with the same number of cash flows are stacked into an array and solved with a vectorized Newton iteration.
+    The problems are not padded, as padding changes the order of the floating-point sums: the result of a problem
+    is the same in every batch. Problems which do not converge or leave the domain IRR > -1 are solved individually
+    with fsolve, like beangrow's compute_irr.
+    """
+    irrs = [0.0] * len(problems)
+
+    problems_by_length = defaultdict(list)
+    for i, (cash_flows, _) in enumerate(problems):
+        # Require at least two cash flows (incoming + outgoing) to compute IRR.
+        if len(cash_flows) >= 2:
+            problems_by_length[len(cash_flows)].append(i)
+
+    for indices in problems_by_length.values():
+        cash_flows = np.array([problems[i][0] for i in indices], dtype=float)
+        years = np.array([problems[i][1] for i in indices], dtype=float)
+
+        # Start with something reasonably normal.
+        estimated_irr = 0.2 * np.sign(np.sum(cash_flows, axis=1))
+        irr = estimated_irr.copy()
+        converged = np.zeros(len(indices), dtype=bool)
+        failed = np.zeros(len(indices), dtype=bool)
+        with np.errstate(all="ignore"):
+            for _ in range(max_iterations):
+                # 1 + irr > 0 for all active problems, therefore the sign of (1 + irr) in the NPV equation can be omitted
+                r = 1.0 + irr[:, np.newaxis]
+                npv = np.sum(cash_flows * r**-years, axis=1)
+                npv_derivative = np.sum(-years * cash_flows * r ** (-years - 1.0), axis=1)
+                step = np.where(converged | failed, 0.0, npv / npv_derivative)
+                irr = irr - step
+                converged |= np.abs(step) <= 1e-12 * np.maximum(1.0, np.abs(irr))
+                failed |= ~np.isfinite(irr) | (irr <= -1.0)
+                if (converged | failed).all():
+                    break
+        valid = converged & ~failed
+
+        for row, i in enumerate(indices):
+            if valid[row]:
+                irrs[i] = float(irr[row])
+            else:
+                # Solve for the root of the NPV equation.
+                problem_irr, *_ = fsolve(net_present_value, x0=estimated_irr[row], args=problems[i], full_output=True)
+                irrs[i] = float(np.maximum(problem_irr.item(), -1))
+    return irrs
@@ -2,8 +2,11 @@ import datetime
 import unittest
 from pathlib import Path
 
+import numpy as np
+
 from fava_portfolio_returns.core.intervals import intervals_yearly
 from fava_portfolio_returns.metrics.irr import IRR
+from fava_portfolio_returns.metrics.irr import compute_irr_batch
 from fava_portfolio_returns.test.test import BEANGROW_CONFIG_CORP
 from fava_portfolio_returns.test.test import approx3
 from fava_portfolio_returns.test.test import load_portfolio_file
@@ -99,3 +102,29 @@ plugin "beancount.plugins.implicit_prices"
         )
         result = IRR().single(p, datetime.date(2020, 1, 1), datetime.date(2020, 6, 1))
         assert result == 0
+
+    def test_compute_irr_batch(self):
+        irrs = compute_irr_batch(
+            [
+                # 100 USD invested for 1 year = 110 USD
+                (np.array([-100.0, 110.0]), np.array([-1.0, 0.0])),
+                # a single cash flow
+                (np.array([-100.0]), np.array([-1.0])),
+                # 100 USD invested for 2 years, and 100 USD for 1 year = 231 USD
+                (np.array([-100.0, -100.0, 231.0]), np.array([-2.0, -1.0, 0.0])),
+                # 107.50 USD invested for 1 day = 100 USD
+                (np.array([-107.5, 100.0]), np.array([-1 / 365, 0.0])),
+            ]
+        )
+        assert irrs == [approx3(0.1), 0.0, approx3(0.1), approx3(-0.999)]
+
+    def test_multiple(self):
+        p = load_portfolio_file(Path("example/example.beancount"))
+        intervals = intervals_yearly(datetime.date(2018, 1, 1), datetime.date(2023, 1, 1))
+        queries = [(p, start_date, end_date) for _, start_date, end_date in intervals]
+        expected = [IRR().single(p, start_date, end_date) for p, start_date, end_date in queries]
+        assert IRR().multiple(queries) == expected
+
+        # the result of a problem does not depend on the other problems of the batch
+        for query in queries:
+            assert IRR().multiple([query, queries[0]]) == [IRR().single(*query), expected[0]]
@@ -18,19 +18,20 @@ class MDD(MetricBase):
     """
 
     def single(self, p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date) -> float:
-        drawdowns = self.series(p, start_date, end_date)
-        return min((v for _, v in drawdowns), default=0.0)
+        return min((v for _, v in self.series(p, start_date, end_date)), default=0.0)
 
     def series(self, p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date) -> Series:
-        twr_series = TWR().series(p, start_date, end_date)
-
-        drawdowns: Series = []
-        peak = 1.0
-        for date, twr in twr_series:
-            wealth_index = 1.0 + twr
-            peak = max(peak, wealth_index)
-            drawdown = (wealth_index - peak) / peak
-            logger.debug("MDD: date=%s wealth_index=%.2f peak=%.2f drawdown=%.2f", date, wealth_index, peak, drawdown)
-            drawdowns.append((date, drawdown))
-
-        return drawdowns
+        return drawdowns(TWR().series(p, start_date, end_date))
+
+
+def drawdowns(twr_series: Series) -> Series:
+    """returns the decline from the historical peak of a TWR series"""
+    series: Series = []
+    peak = 1.0
+    for date, twr in twr_series:
+        wealth_index = 1.0 + twr
+        peak = max(peak, wealth_index)
+        drawdown = (wealth_index - peak) / peak
+        logger.debug("MDD: date=%s wealth_index=%.2f peak=%.2f drawdown=%.2f", date, wealth_index, peak, drawdown)
+        series.append((date, drawdown))
+    return series
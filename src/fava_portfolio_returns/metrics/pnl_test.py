@@ -26,7 +26,8 @@ class TestTotalPNL(unittest.TestCase):
             ("2020-11", 0.0),
             ("2020-12", 0.0),
         ]
-        assert len(p.pricer.required_prices) == 12
+        # the queried prices are only tracked by get_missing_prices()
+        assert len(p.pricer.required_prices) == 0
 
     def test_heatmap_example_stock(self):
         p = load_portfolio_file("example_stock")
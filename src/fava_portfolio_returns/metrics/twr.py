@@ -4,10 +4,9 @@ import logging
 import math
 from typing import Generator
 
-from beancount.core.number import ZERO
-
-from fava_portfolio_returns.api.portfolio import portfolio_values
+from fava_portfolio_returns.api.portfolio import clamp_start_date
 from fava_portfolio_returns.core.portfolio import FilteredPortfolio
+from fava_portfolio_returns.core.timeline import compute_growth_factor
 from fava_portfolio_returns.metrics.base import MetricBase
 from fava_portfolio_returns.metrics.base import Series
 
@@ -42,28 +41,26 @@ class TWR(MetricBase):
 def subperiod_returns(
     p: FilteredPortfolio, start_date: datetime.date, end_date: datetime.date
 ) -> Generator[tuple[datetime.date, float], None, None]:
-    values = portfolio_values(p, start_date, end_date)
+    timeline = p.timeline()
+    indices = timeline.slice_indices(start_date, end_date)
+    values = clamp_start_date(p, [timeline.values[i] for i in indices], start_date)
 
     if values:
         yield (values[0].date, 1.0)
 
-    for current, next_value in itertools.pairwise(values):
-        # https://en.wikipedia.org/wiki/Time-weighted_return#Time-weighted_return_compensating_for_external_flows
-        # portfolio is valued immediately after each external flow
-        cashflow = next_value.cash - current.cash
-        begin = current.market
-        end = next_value.market - cashflow  # market value of next period excl. cashflow
+    # The growth factors between adjacent data points of the timeline are computed once and shared
+    # by all date ranges (e.g. all cells of the heatmap); only the growth factor of a clamped first data point,
+    # or of data points with hidden price dates in between (see Timeline), is computed for this date range.
+    growth_factors = timeline.growth_factors
+    for k, (current, next_value) in enumerate(itertools.pairwise(values)):
+        i, j = indices[k], indices[k + 1]
+        if j == i + 1 and current is timeline.values[i]:
+            returns = growth_factors[j]
+        else:
+            returns = compute_growth_factor(current, next_value)
 
-        if begin == ZERO:
+        if returns is None:
             continue
 
-        returns = float(end) / float(begin)
-        logger.debug(
-            "Subperiod from %s to %s: begin=%.2f end=%.2f returns=%.2f%%",
-            current.date,
-            next_value.date,
-            begin,
-            end,
-            returns - 1,
-        )
+        logger.debug("Subperiod from %s to %s: returns=%.2f%%", current.date, next_value.date, returns - 1)
         yield (next_value.date, returns)
@@ -1,5 +1,6 @@
 import datetime
 import unittest
+from unittest import mock
 
 from fava_portfolio_returns.metrics.twr import TWR
 from fava_portfolio_returns.test.test import BEANGROW_CONFIG_CORP_CASH_FLOWS
@@ -56,6 +57,18 @@ plugin "beancount.plugins.implicit_prices"
             (datetime.date(2020, 4, 1), 1.5),
         ]
 
+    def test_intervals_memoized(self):
+        p = load_portfolio_file("linear_growth_stock")
+        intervals = [(str(month), datetime.date(2020, month, 1), datetime.date(2020, 12, 31)) for month in range(1, 7)]
+        expected = [(name, TWR().single(p, start_date, end_date)) for name, start_date, end_date in intervals]
+
+        # the least recently used values are evicted
+        with mock.patch("fava_portfolio_returns.core.portfolio.METRIC_VALUES_CACHE_SIZE", 4):
+            assert TWR().intervals(p, intervals) == expected
+            assert [key[2].month for key in p.metric_values] == [3, 4, 5, 6]
+            assert TWR().intervals(p, intervals[3:4]) == expected[3:4]
+            assert [key[2].month for key in p.metric_values] == [3, 5, 6, 4]
+
     def test_twr_with_changing_target_currency(self):
         portfolio_str = """
 plugin "beancount.plugins.auto_accounts"
@@ -151,3 +164,10 @@ plugin "beancount.plugins.implicit_prices"
             # CURRENCY_BASE
             (datetime.date(2020, 3, 20), -0.25),
         ]
+
+        # the memoized interval values are not shared between target currencies
+        intervals = [("2020", datetime.date(2020, 1, 1), datetime.date(2020, 3, 10))]
+        p_single.target_currency = "CURRENCY_BASE"
+        assert TWR().intervals(p_single, intervals) == [("2020", 0.5)]
+        p_single.target_currency = "CURRENCY_TARGET"
+        assert TWR().intervals(p_single, intervals) == [("2020", 0.125)]